@@ -3,18 +3,30 @@ import logging
 from dotenv import load_dotenv
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
 
 # .env 파일 로드
 load_dotenv()
-from fastapi.responses import FileResponse, HTMLResponse
-from fastapi.staticfiles import StaticFiles
-
+from fastapi.responses import HTMLResponse, PlainTextResponse
+
+from .common.business.aps.auth_service import AuthService
+from .common.business.aps.predict_service import PredictService
+from .common.core.admission import (DEFAULT_ROUTE_LIMITS, AdmissionController,
+                                    AdmissionMiddleware)
+from .common.core.compression import (CompressionMiddleware,
+                                      PrecompressedStaticFiles)
+from .common.core.uploads import UPLOAD_MAX_REQUEST_BYTES, UploadLimitMiddleware
+from .common.core.container import (get_auth_service, get_json_cache,
+                                    get_llm_telemetry, get_predict_service,
+                                    get_template_cache, lifespan)
+from .common.core.http_cache import (TemplateCache, TTLCache,
+                                     cached_json_response)
+from .common.llm.telemetry import LLMTelemetry, LLMTelemetryMiddleware
 from .common.transfer.auth_dto import LoginRequestDto
 from .common.web.account_controller import router as account_router
 from .common.web.auth_controller import auth_controller
 from .common.web.auth_controller import router as auth_router
-from .common.web.predict_controller import predict_controller
+from .common.web.image_controller import router as image_router
 from .common.web.predict_controller import router as predict_router
 from .common.web.account_controller import account_controller
 from .common.web.account_controller import router as account_router
@@ -29,13 +41,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# FastAPI 앱 생성
-app = FastAPI(title="AI Bootcamp API")
+# FastAPI 앱 생성 (DAO/서비스는 lifespan 컨테이너가 워커당 한 번 생성)
+app = FastAPI(title="AI Bootcamp API", lifespan=lifespan)
+
+# LLM 호출을 엔드포인트별로 집계하도록 요청 scope 를 contextvar 에 보관
+app.add_middleware(LLMTelemetryMiddleware)
+
+# 응답 압축 (gzip / brotli, 크기 임계값 이하 응답은 그대로 전송)
+app.add_middleware(CompressionMiddleware)
+
+# 업로드 엔드포인트 요청 본문 상한 (Content-Length 로 먼저 거절, 없으면 받은 바이트 수로 중단)
+app.add_middleware(
+    UploadLimitMiddleware,
+    limits={"/demo/prac02/analyze-image": UPLOAD_MAX_REQUEST_BYTES},
+)
+
+# 과부하 시 라우트별 동시성/대기 예산을 넘는 요청은 503 + Retry-After 로 즉시 거절
+# (/health, 인증, 정적 파일은 제외) - 가장 바깥에서 먼저 판단하도록 마지막에 등록
+admission_controller = AdmissionController(DEFAULT_ROUTE_LIMITS)
+app.state.admission = admission_controller
+app.add_middleware(AdmissionMiddleware, controller=admission_controller)
 
-# 정적 파일 서빙 설정
+# 정적 파일 서빙 설정 (.br / .gz 사전 압축 파일이 있으면 우선 서빙)
 static_path = Path(__file__).parent.parent / "resources" / "static"
 if static_path.exists():
-    app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
+    app.mount(
+        "/static",
+        PrecompressedStaticFiles(directory=str(static_path)),
+        name="static",
+    )
 
 # 이미지 파일을 static 디렉토리 내부에 저장하도록 설정
 images_path = static_path / "images"
@@ -46,6 +80,7 @@ if not images_path.exists():
 app.include_router(auth_router)
 app.include_router(predict_router)
 app.include_router(account_router)
+app.include_router(image_router)
 app.include_router(demo_router)
 app.include_router(demo_prac02_router)
 app.include_router(langchain_router)
@@ -54,19 +89,13 @@ app.include_router(langchain_api_router)
 
 # 루트 페이지 - 로그인 페이지로 리다이렉트
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(
+    request: Request, template_cache: TemplateCache = Depends(get_template_cache)
+):
     """루트 페이지 - 로그인 페이지로 리다이렉트"""
     logger.info("IN: root() - 루트 페이지 요청")
     try:
-        response = FileResponse(
-            str(
-                Path(__file__).parent.parent
-                / "resources"
-                / "templates"
-                / "login"
-                / "index.html"
-            )
-        )
+        response = template_cache.response(request, "login/index.html")
         logger.info("OUT: root() - 로그인 페이지 반환 성공")
         return response
     except Exception as e:
@@ -76,11 +105,13 @@ async def root():
 
 # 기존 엔드포인트들 (하위 호환성을 위해 유지)
 @app.get("/login", response_class=HTMLResponse)
-async def login_page():
+async def login_page(
+    request: Request, template_cache: TemplateCache = Depends(get_template_cache)
+):
     """로그인 페이지"""
     logger.info("IN: login_page() - 로그인 페이지 요청")
     try:
-        response = await auth_controller.login_page()
+        response = await auth_controller.login_page(request, template_cache)
         logger.info("OUT: login_page() - 로그인 페이지 반환 성공")
         return response
     except Exception as e:
@@ -89,11 +120,13 @@ async def login_page():
 
 
 @app.post("/login")
-async def login(request: LoginRequestDto):
+async def login(
+    request: LoginRequestDto, auth_service: AuthService = Depends(get_auth_service)
+):
     """로그인 처리"""
     logger.info(f"IN: login() - 로그인 요청: username={request.username}")
     try:
-        response = await auth_controller.login(request)
+        response = await auth_controller.login(request, auth_service)
         logger.info(f"OUT: login() - 로그인 처리 완료: username={request.username}")
         return response
     except Exception as e:
@@ -104,11 +137,13 @@ async def login(request: LoginRequestDto):
 
 
 @app.get("/dashboard", response_class=HTMLResponse)
-async def dashboard():
+async def dashboard(
+    request: Request, template_cache: TemplateCache = Depends(get_template_cache)
+):
     """대시보드 페이지"""
     logger.info("IN: dashboard() - 대시보드 페이지 요청")
     try:
-        response = await auth_controller.dashboard()
+        response = await auth_controller.dashboard(request, template_cache)
         logger.info("OUT: dashboard() - 대시보드 페이지 반환 성공")
         return response
     except Exception as e:
@@ -117,11 +152,13 @@ async def dashboard():
 
 
 @app.get("/accounts", response_class=HTMLResponse)
-async def accounts_page():
+async def accounts_page(
+    request: Request, template_cache: TemplateCache = Depends(get_template_cache)
+):
     """계정 관리 페이지"""
     logger.info("IN: accounts_page() - 계정 관리 페이지 요청")
     try:
-        response = await account_controller.accounts_page()
+        response = await account_controller.accounts_page(request, template_cache)
         logger.info("OUT: accounts_page() - 계정 관리 페이지 반환 성공")
         return response
     except Exception as e:
@@ -130,11 +167,11 @@ async def accounts_page():
 
 
 @app.post("/logout")
-async def logout():
+async def logout(auth_service: AuthService = Depends(get_auth_service)):
     """로그아웃 처리"""
     logger.info("IN: logout() - 로그아웃 요청")
     try:
-        response = await auth_controller.logout()
+        response = await auth_controller.logout(auth_service)
         logger.info("OUT: logout() - 로그아웃 처리 완료")
         return response
     except Exception as e:
@@ -143,11 +180,11 @@ async def logout():
 
 
 @app.get("/health")
-def health():
+def health(predict_service: PredictService = Depends(get_predict_service)):
     """헬스 체크"""
     logger.info("IN: health() - 헬스 체크 요청")
     try:
-        config = predict_controller.predict_service.get_system_config()
+        config = predict_service.get_system_config()
         response = {
             "status": "ok",
             "mlflow_tracking_uri": config["mlflow_tracking_uri"],
@@ -160,12 +197,22 @@ def health():
         raise
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics(telemetry: LLMTelemetry = Depends(get_llm_telemetry)):
+    """LLM 호출 메트릭 (Prometheus 텍스트 형식)"""
+    return PlainTextResponse(
+        telemetry.render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.post("/predict")
-def predict(request):
+def predict(
+    request, predict_service: PredictService = Depends(get_predict_service)
+):
     """예측 처리"""
     logger.info(f"IN: predict() - 예측 요청: {request}")
     try:
-        response = predict_controller.predict_service.predict_text(request)
+        response = predict_service.predict_text(request)
         logger.info("OUT: predict() - 예측 처리 완료")
         return response
     except Exception as e:
@@ -174,11 +221,17 @@ def predict(request):
 
 
 @app.get("/config")
-def get_config():
+def get_config(
+    request: Request,
+    predict_service: PredictService = Depends(get_predict_service),
+    json_cache: TTLCache = Depends(get_json_cache),
+):
     """환경 설정 정보를 반환하는 엔드포인트"""
     logger.info("IN: get_config() - 설정 정보 요청")
     try:
-        response = predict_controller.predict_service.get_system_config()
+        response = cached_json_response(
+            request, json_cache, "predict:config", predict_service.get_system_config
+        )
         logger.info("OUT: get_config() - 설정 정보 반환 완료")
         return response
     except Exception as e:
@@ -5,7 +5,7 @@ Account Service (APS)
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from ...transfer.account_dto import (
     AccountListResponseDto,
@@ -27,21 +27,22 @@ logger = logging.getLogger(__name__)
 class AccountService:
     """계정 관리 서비스"""
 
-    def __init__(self):
+    def __init__(self, account_dc=None):
         logger.info("IN: AccountService.__init__() - AccountService 초기화")
-        from ..dc.account_dc import AccountDC
-        self.account_dc = AccountDC()
+        if account_dc is None:
+            from ..dc.account_dc import AccountDC
+            account_dc = AccountDC()
+        self.account_dc = account_dc
         logger.info("OUT: AccountService.__init__() - AccountService 초기화 완료")
 
     async def get_account_list(self) -> AccountListResponseDto:
         """계정 목록 조회"""
         logger.info("IN: AccountService.get_account_list() - 계정 목록 조회 요청")
         try:
-            accounts = self.account_dc.get_all_accounts()
+            accounts = await self.account_dc.get_all_accounts()
             logger.info(f"AccountService.get_account_list() - accounts type: {type(accounts)}, count: {len(accounts)}")
-            logger.info(f"AccountService.get_account_list() - accounts data: {accounts}")
-            
-            response = AccountListResponseDto(
+
+            response = AccountListResponseDto.model_construct(
                 accounts=accounts,
                 total_count=len(accounts),
                 status="success"
@@ -52,11 +53,23 @@ class AccountService:
             logger.error(f"OUT: AccountService.get_account_list() - 오류 발생: {e}")
             raise
 
+    async def get_account_list_payload(self) -> Dict[str, Any]:
+        """계정 목록 조회 (AccountListResponseDto 스키마의 dict - 고속 JSON 응답용)"""
+        logger.info("IN: AccountService.get_account_list_payload() - 계정 목록 조회 요청")
+        try:
+            rows = await self.account_dc.get_all_account_rows()
+            response = {"accounts": rows, "total_count": len(rows), "status": "success"}
+            logger.info(f"OUT: AccountService.get_account_list_payload() - 계정 목록 조회 성공: {len(rows)}개")
+            return response
+        except Exception as e:
+            logger.error(f"OUT: AccountService.get_account_list_payload() - 오류 발생: {e}")
+            raise
+
     async def get_account_detail(self, account_id: str) -> AccountDetailResponseDto:
         """계정 상세 조회"""
         logger.info(f"IN: AccountService.get_account_detail() - 계정 상세 조회 요청: account_id={account_id}")
         try:
-            account = self.account_dc.get_account_by_id(account_id)
+            account = await self.account_dc.get_account_by_id(account_id)
             if not account:
                 response = AccountDetailResponseDto(
                     account=None,
@@ -80,7 +93,7 @@ class AccountService:
         """계정 생성"""
         logger.info(f"IN: AccountService.create_account() - 계정 생성 요청: name={request.name}")
         try:
-            account = self.account_dc.create_account(
+            account = await self.account_dc.create_account(
                 name=request.name,
                 company=request.company,
                 password=request.password,
@@ -101,7 +114,7 @@ class AccountService:
         """계정 수정"""
         logger.info(f"IN: AccountService.update_account() - 계정 수정 요청: account_id={account_id}")
         try:
-            account = self.account_dc.update_account(
+            account = await self.account_dc.update_account(
                 account_id=account_id,
                 name=request.name,
                 company=request.company,
@@ -132,7 +145,7 @@ class AccountService:
         """계정 삭제"""
         logger.info(f"IN: AccountService.delete_account() - 계정 삭제 요청: account_id={account_id}")
         try:
-            success = self.account_dc.delete_account(account_id)
+            success = await self.account_dc.delete_account(account_id)
             if not success:
                 response = AccountResponseDto(
                     account=None,
@@ -153,6 +166,4 @@ class AccountService:
             logger.error(f"OUT: AccountService.delete_account() - 오류 발생: {e}")
             raise
 
-
-# 서비스 인스턴스 생성
-account_service = AccountService() 
\ No newline at end of file
+ 
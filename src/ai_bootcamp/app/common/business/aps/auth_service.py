@@ -15,10 +15,15 @@ logger = logging.getLogger(__name__)
 class AuthService:
     """인증 관련 비즈니스 로직"""
 
-    def __init__(self):
-        self.auth_dc = AuthDC()
-        self.auth_dao = AuthDAO()
-        self.account_dao = AccountDAO()
+    def __init__(
+        self,
+        auth_dc: Optional[AuthDC] = None,
+        auth_dao: Optional[AuthDAO] = None,
+        account_dao: Optional[AccountDAO] = None,
+    ):
+        self.auth_dc = auth_dc or AuthDC()
+        self.auth_dao = auth_dao or AuthDAO()
+        self.account_dao = account_dao or AccountDAO()
 
     def login(self, request: LoginRequestDto) -> LoginResponseDto:
         """로그인 처리"""
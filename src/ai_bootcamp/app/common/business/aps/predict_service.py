@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import HTTPException
 
 from ...transfer.predict_dto import PredictRequestDto, PredictResponseDto
@@ -8,9 +10,13 @@ from ..dc.repository.predict_dao import PredictDAO
 class PredictService:
     """예측 관련 비즈니스 로직"""
 
-    def __init__(self):
-        self.predict_dc = PredictDC()
-        self.predict_dao = PredictDAO()
+    def __init__(
+        self,
+        predict_dc: Optional[PredictDC] = None,
+        predict_dao: Optional[PredictDAO] = None,
+    ):
+        self.predict_dc = predict_dc or PredictDC()
+        self.predict_dao = predict_dao or PredictDAO()
 
     def predict_text(self, request: PredictRequestDto) -> PredictResponseDto:
         """텍스트 예측 처리"""
@@ -24,7 +30,10 @@ class PredictService:
         # 예측 결과 DB 저장
         self.predict_dao.save_prediction(request.text, result["label"], result["score"])
 
-        return PredictResponseDto(label=result["label"], score=result["score"])
+        # DC 가 반환한 값은 이미 타입이 확정되어 있으므로 재검증 없이 생성
+        return PredictResponseDto.model_construct(
+            label=result["label"], score=result["score"]
+        )
 
     def get_model_info(self) -> dict:
         """모델 정보 조회"""
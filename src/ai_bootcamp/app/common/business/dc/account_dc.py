@@ -5,7 +5,7 @@ Account Domain Component (DC)
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from ...transfer.account_dto import AccountDto
 
@@ -20,28 +20,36 @@ logger = logging.getLogger(__name__)
 class AccountDC:
     """계정 도메인 컴포넌트"""
 
-    def __init__(self):
+    def __init__(self, account_dao=None):
         logger.info("IN: AccountDC.__init__() - AccountDC 초기화")
-        from .repository.account_dao import AccountDAO
-        self.account_dao = AccountDAO()
+        if account_dao is None:
+            from .repository.account_dao import AccountDAO
+            account_dao = AccountDAO()
+        self.account_dao = account_dao
         logger.info("OUT: AccountDC.__init__() - AccountDC 초기화 완료")
 
+    async def get_all_account_rows(self) -> List[Dict[str, Any]]:
+        """모든 계정 조회 (DTO 변환 없이 DAO 행 그대로 - 고속 직렬화 경로용)"""
+        logger.info("IN: AccountDC.get_all_account_rows() - 모든 계정 행 조회 요청")
+        try:
+            # DAO 가 AccountDto 와 동일한 키/타입(비밀번호 제외)으로 행을 반환
+            rows = self.account_dao.get_all_accounts()
+            logger.info(f"OUT: AccountDC.get_all_account_rows() - 계정 행 조회 성공: {len(rows)}개")
+            return rows
+        except Exception as e:
+            logger.error(f"OUT: AccountDC.get_all_account_rows() - 오류 발생: {e}")
+            raise
+
     async def get_all_accounts(self) -> List[AccountDto]:
         """모든 계정 조회"""
         logger.info("IN: AccountDC.get_all_accounts() - 모든 계정 조회 요청")
         try:
             account_dicts = self.account_dao.get_all_accounts()
-            accounts = []
-            for account_dict in account_dicts:
-                account = AccountDto(
-                    id=account_dict["id"],
-                    name=account_dict["name"],
-                    company=account_dict.get("company"),
-                    juso=account_dict.get("juso"),
-                    created_at=account_dict.get("created_at"),
-                    updated_at=account_dict.get("updated_at")
-                )
-                accounts.append(account)
+            # DB 스키마로 타입이 보장되므로 Pydantic 재검증 없이 생성
+            accounts = [
+                AccountDto.model_construct(**account_dict)
+                for account_dict in account_dicts
+            ]
             logger.info(f"OUT: AccountDC.get_all_accounts() - 계정 조회 성공: {len(accounts)}개")
             return accounts
         except Exception as e:
@@ -150,6 +158,4 @@ class AccountDC:
             logger.error(f"OUT: AccountDC.validate_account() - 오류 발생: {e}")
             raise
 
-
-# DC 인스턴스 생성
-account_dc = AccountDC() 
\ No newline at end of file
+ 
@@ -0,0 +1 @@
+# Core 패키지 - 애플리케이션 공통 인프라 (컨테이너, 캐시, 미들웨어)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Admission Control
+라우트별 동시성 제한 + 대기 시간 예산 + 지연 시간 기반 적응형 부하 차단(load shedding)
+
+과부하 시 요청을 무한정 쌓지 않고 즉시 503 + Retry-After 로 거절하여
+/health, 인증 등 가벼운 요청이 계속 응답할 수 있도록 한다.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .fast_json import dumps
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+
+# 항상 통과시키는 경로 (헬스 체크, 인증, 정적 파일)
+DEFAULT_EXEMPT_PREFIXES = (
+    "/health",
+    "/login",
+    "/logout",
+    "/auth",
+    "/static",
+    "/api/langchain/health",
+)
+
+
+@dataclass(frozen=True)
+class RouteLimit:
+    """라우트(경로 prefix)별 수용 정책"""
+
+    prefix: str
+    max_concurrency: int
+    max_queue: int = 32
+    queue_timeout: float = 1.0  # 대기열에서 기다릴 수 있는 최대 시간(초)
+    target_latency: float = 1.0  # 이 값을 넘으면 동시성 한도를 줄임(초)
+    min_concurrency: int = 1
+
+
+class AdaptiveLimiter:
+    """AIMD 방식으로 동시성 한도를 조절하는 대기열 있는 세마포어"""
+
+    EWMA_ALPHA = 0.2
+    DECREASE_FACTOR = 0.9
+
+    def __init__(self, policy: RouteLimit):
+        self.policy = policy
+        self.limit = float(policy.max_concurrency)
+        self.in_flight = 0
+        self.ewma_latency = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.shed = 0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def estimated_wait(self) -> float:
+        """현재 대기열이 빠지는 데 걸릴 예상 시간(초)"""
+        if self.ewma_latency <= 0:
+            return 0.0
+        return self.ewma_latency * (self.queued + 1) / max(int(self.limit), 1)
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(max(self.estimated_wait(), self.policy.queue_timeout)))
+
+    async def acquire(self) -> bool:
+        """슬롯 획득 (대기 예산 내에 못 얻으면 False)"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+
+        # 대기열이 가득 찼거나 예상 대기 시간이 예산을 넘으면 즉시 거절
+        if (
+            self.queued >= self.policy.max_queue
+            or self.estimated_wait() > self.policy.queue_timeout
+        ):
+            self.shed += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=self.policy.queue_timeout)
+        except asyncio.CancelledError:
+            # 대기 중 클라이언트 연결 종료
+            self._abandon(waiter)
+            raise
+        if waiter.done() and not waiter.cancelled():
+            self.admitted += 1
+            return True
+
+        # 대기 예산 초과 - 대기열에서 제거
+        self._abandon(waiter)
+        self.shed += 1
+        return False
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        if waiter.done() and not waiter.cancelled():
+            # 슬롯을 넘겨받았지만 사용하지 않음 - 다음 대기자에게 반환
+            self.in_flight -= 1
+            self._wake()
+            return
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, latency: float) -> None:
+        """슬롯 반환 + 관측 지연 시간으로 한도 조정"""
+        if self.ewma_latency <= 0:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += self.EWMA_ALPHA * (latency - self.ewma_latency)
+
+        if self.ewma_latency > self.policy.target_latency:
+            self.limit = max(
+                float(self.policy.min_concurrency), self.limit * self.DECREASE_FACTOR
+            )
+        else:
+            self.limit = min(
+                float(self.policy.max_concurrency), self.limit + 1.0 / self.limit
+            )
+
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "ewma_latency_ms": round(self.ewma_latency * 1000, 1),
+            "admitted": self.admitted,
+            "shed": self.shed,
+        }
+
+
+class AdmissionController:
+    """경로별 AdaptiveLimiter 를 관리"""
+
+    def __init__(
+        self,
+        limits: Iterable[RouteLimit],
+        exempt_prefixes: Tuple[str, ...] = DEFAULT_EXEMPT_PREFIXES,
+    ):
+        # 긴 prefix 가 먼저 매칭되도록 정렬
+        self.limiters: List[Tuple[str, AdaptiveLimiter]] = sorted(
+            ((limit.prefix, AdaptiveLimiter(limit)) for limit in limits),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.exempt_prefixes = exempt_prefixes
+
+    def match(self, path: str) -> Optional[AdaptiveLimiter]:
+        if path.startswith(self.exempt_prefixes):
+            return None
+        for prefix, limiter in self.limiters:
+            if path.startswith(prefix):
+                return limiter
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {prefix: limiter.get_stats() for prefix, limiter in self.limiters}
+
+
+class AdmissionMiddleware:
+    """AdmissionController 로 요청 수용 여부를 결정하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not ADMISSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.controller.match(scope["path"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            logger.warning(
+                f"AdmissionMiddleware - 요청 거절(503): path={scope['path']}, stats={limiter.get_stats()}"
+            )
+            await self._reject(send, limiter.retry_after())
+            return
+
+        started = time.perf_counter()
+        first_byte: Optional[float] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal first_byte
+            if message["type"] == "http.response.start" and first_byte is None:
+                # 스트리밍 응답도 공정하게 비교하도록 첫 바이트까지의 시간을 지연 시간으로 사용
+                first_byte = time.perf_counter() - started
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            limiter.release(
+                first_byte if first_byte is not None else time.perf_counter() - started
+            )
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: int) -> None:
+        body = dumps(
+            {
+                "detail": "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.",
+                "retry_after": retry_after,
+            }
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+# 기본 라우트 정책 (LLM / 이미지 호출은 느리므로 동시성을 낮게, 대기 예산을 짧게)
+DEFAULT_ROUTE_LIMITS = (
+    # SSE 스트리밍은 응답이 끝날 때까지 슬롯을 잡고 있으므로 일반 /api/langchain 요청과
+    # 한도를 나눔 (열린 스트림이 번역 / 대화 / 통계 요청을 503 으로 밀어내지 않도록)
+    RouteLimit(
+        "/api/langchain/translate/stream",
+        max_concurrency=8,
+        max_queue=8,
+        queue_timeout=2.0,
+        target_latency=15.0,
+    ),
+    RouteLimit(
+        "/api/langchain/chat/stream",
+        max_concurrency=8,
+        max_queue=8,
+        queue_timeout=2.0,
+        target_latency=15.0,
+    ),
+    RouteLimit(
+        "/api/langchain",
+        max_concurrency=8,
+        max_queue=16,
+        queue_timeout=2.0,
+        target_latency=15.0,
+    ),
+    RouteLimit(
+        "/demo/prac02/generate-image",
+        max_concurrency=4,
+        max_queue=8,
+        queue_timeout=2.0,
+        target_latency=30.0,
+    ),
+    RouteLimit(
+        "/demo/prac02/analyze-image",
+        max_concurrency=4,
+        max_queue=8,
+        queue_timeout=2.0,
+        target_latency=30.0,
+    ),
+    RouteLimit("/api/accounts", max_concurrency=32, max_queue=64, target_latency=0.5),
+    RouteLimit("/predict", max_concurrency=32, max_queue=64, target_latency=0.5),
+)
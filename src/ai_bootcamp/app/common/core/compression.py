@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Response Compression
+gzip / brotli 응답 압축 미들웨어 + 사전 압축된(.gz/.br) 정적 파일 서빙
+
+사전 압축 파일 생성 (빌드 시 1회):
+    python -m ai_bootcamp.app.common.core.compression
+"""
+
+import gzip
+import logging
+import os
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 의존성 (pip install brotli)
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))
+
+# 압축 대상 Content-Type (이미 압축된 이미지/바이너리는 제외)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+# 스트리밍 응답은 버퍼링되면 안 되므로 제외
+EXCLUDED_TYPES = ("text/event-stream",)
+
+# 사전 압축 대상 확장자
+PRECOMPRESS_SUFFIXES = (".css", ".js", ".html", ".svg", ".json", ".txt", ".png")
+# 원본 대비 이 비율 이상 줄지 않으면 사전 압축 파일을 만들지 않음 (PNG 등)
+PRECOMPRESS_MIN_SAVING = 0.1
+
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {encoding: q} 로 파싱"""
+    result: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        result[name.strip().lower()] = q
+    return result
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """클라이언트가 허용하는 최선의 인코딩 선택 (br > gzip)"""
+    accepted = parse_accept_encoding(accept_encoding)
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def is_compressible(content_type: str) -> bool:
+    if not content_type or content_type.startswith(EXCLUDED_TYPES):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress_bytes(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """바이트 전체를 한 번에 압축"""
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if level is None else level)
+    return gzip.compress(data, compresslevel=9 if level is None else level, mtime=0)
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """압축한 본문은 원본과 바이트가 다르므로 upstream 의 strong ETag 를 weak 로 바꿈"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _StreamCompressor:
+    """gzip / brotli 스트리밍 압축기 공통 인터페이스"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """크기 임계값 기반 gzip / brotli 응답 압축 미들웨어 (순수 ASGI)"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[_StreamCompressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                skip = (
+                    "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type", ""))
+                    or (not more_body and len(body) < self.minimum_size)
+                )
+                if skip:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _StreamCompressor(
+                    encoding, self.gzip_level, self.brotli_quality
+                )
+                headers["Content-Encoding"] = encoding
+                _add_vary(headers)
+                _weaken_etag(headers)
+                if not more_body:
+                    # 단일 본문: 한 번에 압축하고 Content-Length 갱신
+                    compressed = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                # 스트리밍 본문: 길이를 알 수 없으므로 Content-Length 제거
+                del headers["Content-Length"]
+                await send(start_message)
+
+            chunk = compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += compressor.finish()
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """같은 디렉토리에 .br / .gz 사전 압축 파일이 있으면 그대로 서빙하는 StaticFiles"""
+
+    async def get_response(self, path: str, scope: Scope):
+        response = await super().get_response(path, scope)
+        if response.status_code != 200 or not isinstance(response, FileResponse):
+            return response
+
+        scope_headers = Headers(scope=scope)
+        accepted = parse_accept_encoding(scope_headers.get("accept-encoding", ""))
+        candidates: List[Tuple[str, str]] = []
+        if accepted.get("br", 0) > 0:
+            candidates.append(("br", ".br"))
+        if accepted.get("gzip", 0) > 0:
+            candidates.append(("gzip", ".gz"))
+
+        original = Path(response.path)
+        for name, suffix in candidates:
+            sibling = original.with_name(original.name + suffix)
+            try:
+                sibling_stat = sibling.stat()
+            except OSError:
+                continue
+            # 원본이 더 최근에 수정되었으면 오래된 사전 압축본은 무시
+            if sibling_stat.st_mtime < original.stat().st_mtime:
+                continue
+            precompressed = FileResponse(
+                sibling,
+                stat_result=sibling_stat,
+                media_type=response.media_type,
+                headers={"Content-Encoding": name},
+            )
+            _add_vary(precompressed.headers)
+            # 사전 압축본은 자체 ETag 를 가지므로 조건부 요청을 다시 검사
+            if self.is_not_modified(precompressed.headers, scope_headers):
+                return NotModifiedResponse(precompressed.headers)
+            return precompressed
+        return response
+
+
+def precompress_directory(
+    root: Path, suffixes: Iterable[str] = PRECOMPRESS_SUFFIXES
+) -> Dict[str, int]:
+    """디렉토리 아래 파일마다 .gz / .br 사전 압축 파일 생성"""
+    logger.info(f"IN: precompress_directory() - 사전 압축 시작: root={root}")
+    stats = {"files": 0, "written": 0, "skipped": 0, "saved_bytes": 0}
+    encodings = [("gzip", ".gz")] + ([("br", ".br")] if brotli is not None else [])
+
+    for path in Path(root).rglob("*"):
+        if not path.is_file() or path.suffix not in suffixes:
+            continue
+        stats["files"] += 1
+        data = path.read_bytes()
+        for name, suffix in encodings:
+            target = path.with_name(path.name + suffix)
+            compressed = compress_bytes(data, name)
+            if len(compressed) > len(data) * (1 - PRECOMPRESS_MIN_SAVING):
+                stats["skipped"] += 1
+                if target.exists():
+                    target.unlink()
+                continue
+            target.write_bytes(compressed)
+            stats["written"] += 1
+            stats["saved_bytes"] += len(data) - len(compressed)
+
+    logger.info(f"OUT: precompress_directory() - 사전 압축 완료: {stats}")
+    return stats
+
+
+def main():
+    """resources/static 및 templates 디렉토리 사전 압축"""
+    resources = Path(__file__).parent.parent.parent.parent / "resources"
+    targets = [Path(p) for p in sys.argv[1:]] or [
+        resources / "static",
+        resources / "templates",
+    ]
+    if brotli is None:
+        print("brotli 미설치: .gz 파일만 생성합니다. (pip install brotli)")
+    for target in targets:
+        stats = precompress_directory(target)
+        print(f"{target}: {stats}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Application Container
+워커(프로세스)당 한 번만 DAO / DC / 서비스를 생성하고 FastAPI lifespan 으로 수명을 관리하는 컨테이너
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from fastapi import FastAPI, Request
+
+from ..business.aps.account_service import AccountService
+from ..business.aps.auth_service import AuthService
+from ..business.aps.predict_service import PredictService
+from ..business.dc.account_dc import AccountDC
+from ..business.dc.auth_dc import AuthDC
+from ..business.dc.predict_dc import PredictDC
+from ..business.dc.repository.account_dao import AccountDAO
+from ..business.dc.repository.auth_dao import AuthDAO
+from ..business.dc.repository.predict_dao import PredictDAO
+from ..llm.client_registry import LLMClientRegistry
+from ..llm.conversation import ConversationStore
+from ..llm.response_cache import LLM_SEMANTIC_CACHE, LLMResponseCache
+from ..llm.telemetry import LLMTelemetry, get_telemetry
+from .http_cache import TemplateCache, TTLCache
+from .jobs import JobQueue
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_PATH = Path(__file__).parent.parent.parent.parent / "resources" / "templates"
+
+
+class AppContainer:
+    """애플리케이션 의존성 컨테이너"""
+
+    def __init__(self, auth_db_path: str = "auth.db", predict_db_path: str = "predict.db"):
+        self.auth_db_path = auth_db_path
+        self.predict_db_path = predict_db_path
+        self._closers: List[Callable[[], Any]] = []
+        self.started = False
+
+    def startup(self) -> "AppContainer":
+        """DAO, DC, 서비스를 한 번씩만 생성"""
+        logger.info("IN: AppContainer.startup() - 컨테이너 초기화")
+        try:
+            # Repository (스키마 초기화는 DAO 생성 시 한 번만 수행)
+            self.account_dao = AccountDAO(self.auth_db_path)
+            self.auth_dao = AuthDAO(self.auth_db_path)
+            self.predict_dao = PredictDAO(self.predict_db_path)
+
+            # Domain Component
+            self.account_dc = AccountDC(account_dao=self.account_dao)
+            self.auth_dc = AuthDC()
+            self.predict_dc = PredictDC()
+
+            # Application Service
+            self.account_service = AccountService(account_dc=self.account_dc)
+            self.auth_service = AuthService(
+                auth_dc=self.auth_dc,
+                auth_dao=self.auth_dao,
+                account_dao=self.account_dao,
+            )
+            self.predict_service = PredictService(
+                predict_dc=self.predict_dc, predict_dao=self.predict_dao
+            )
+
+            # 응답 캐시 (템플릿 프리로드 + 읽기 전용 JSON TTL 캐시)
+            self.template_cache = TemplateCache(TEMPLATES_PATH)
+            self.template_cache.preload()
+            self.json_cache = TTLCache()
+
+            # LLM 클라이언트 (커넥션 풀 공유, 기본 모델 워밍업) + 응답 캐시
+            self.llm_registry = LLMClientRegistry()
+            self.llm_cache = LLMResponseCache(
+                embedder=(
+                    self.llm_registry.embed
+                    if LLM_SEMANTIC_CACHE and self.llm_registry.enabled
+                    else None
+                )
+            )
+            self.llm_registry.response_cache = self.llm_cache
+            self.llm_registry.warm_up()
+            self.conversation_store = ConversationStore()
+            self.register_closer(self.llm_registry.aclose)
+
+            # LLM 호출 텔레메트리 (스케줄러가 기록, 주기적으로 SQLite 롤업)
+            self.llm_telemetry = get_telemetry()
+            self.llm_telemetry.start()
+            self.register_closer(self.llm_telemetry.stop)
+
+            # 백그라운드 작업 큐 (이미지 생성 등, 재시작 시 미완료 작업 복구)
+            self.job_queue = JobQueue()
+            self.job_queue.start()
+            self.register_closer(self.job_queue.stop)
+
+            self.started = True
+            logger.info("OUT: AppContainer.startup() - 컨테이너 초기화 완료")
+            return self
+        except Exception as e:
+            logger.error(f"OUT: AppContainer.startup() - 컨테이너 초기화 오류: {e}")
+            raise
+
+    async def warm_up(self) -> None:
+        """네트워크 워밍업 (LLM API 연결을 미리 열어 첫 요청의 연결 비용 제거)"""
+        await self.llm_registry.warm_connections()
+
+    def register_closer(self, closer: Callable[[], Any]) -> None:
+        """종료 시 호출할 정리 함수 등록 (등록 역순으로 호출)"""
+        self._closers.append(closer)
+
+    async def shutdown(self) -> None:
+        """등록된 리소스 정리"""
+        logger.info(
+            f"IN: AppContainer.shutdown() - 컨테이너 종료: closers={len(self._closers)}"
+        )
+        while self._closers:
+            closer = self._closers.pop()
+            try:
+                result = closer()
+                if hasattr(result, "__await__"):
+                    await result
+            except Exception as e:
+                logger.error(f"AppContainer.shutdown() - 리소스 정리 오류: {e}")
+        self.started = False
+        logger.info("OUT: AppContainer.shutdown() - 컨테이너 종료 완료")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """FastAPI lifespan - 워커당 컨테이너 하나를 생성/정리"""
+    container: Optional[AppContainer] = getattr(app.state, "container", None)
+    if container is None:
+        container = AppContainer()
+        app.state.container = container
+    if not container.started:
+        container.startup()
+        await container.warm_up()
+    try:
+        yield
+    finally:
+        await container.shutdown()
+
+
+# ---------- FastAPI Depends 용 의존성 함수 ----------
+def get_container(request: Request) -> AppContainer:
+    """요청이 속한 앱의 컨테이너 조회"""
+    return request.app.state.container
+
+
+def get_account_service(request: Request) -> AccountService:
+    return get_container(request).account_service
+
+
+def get_auth_service(request: Request) -> AuthService:
+    return get_container(request).auth_service
+
+
+def get_predict_service(request: Request) -> PredictService:
+    return get_container(request).predict_service
+
+
+def get_template_cache(request: Request) -> TemplateCache:
+    return get_container(request).template_cache
+
+
+def get_json_cache(request: Request) -> TTLCache:
+    return get_container(request).json_cache
+
+
+def get_llm_registry(request: Request) -> LLMClientRegistry:
+    return get_container(request).llm_registry
+
+
+def get_llm_cache(request: Request) -> LLMResponseCache:
+    return get_container(request).llm_cache
+
+
+def get_conversation_store(request: Request) -> ConversationStore:
+    return get_container(request).conversation_store
+
+
+def get_llm_telemetry(request: Request) -> LLMTelemetry:
+    return get_container(request).llm_telemetry
+
+
+def get_job_queue(request: Request) -> JobQueue:
+    return get_container(request).job_queue
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Fast JSON Response
+orjson(선택 의존성) 기반 JSON 직렬화 - DTO 재검증 없이 바로 바이트로 인코딩
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 대체
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """orjson / json 이 모르는 타입 변환 (Pydantic DTO)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """content 를 UTF-8 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """response_model 검증을 거치지 않고 바로 인코딩하는 JSON 응답
+
+    라우트에서 이 응답을 직접 반환하면 FastAPI 의 jsonable_encoder / response_model
+    재검증 단계를 건너뛴다. 따라서 content 는 이미 DTO 스키마와 일치해야 한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
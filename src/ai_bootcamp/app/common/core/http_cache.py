@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+HTTP Response Cache
+템플릿 메모리 프리로드(사전 압축 포함) + strong ETag / Cache-Control / 304 처리, 읽기 전용 JSON GET 용 TTL 캐시
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from .compression import brotli, compress_bytes, select_encoding
+from .fast_json import dumps
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_CACHE_MAX_AGE = int(os.getenv("TEMPLATE_CACHE_MAX_AGE", "60"))
+JSON_CACHE_TTL = float(os.getenv("JSON_CACHE_TTL", "5"))
+
+
+def make_etag(body: bytes) -> str:
+    """본문 해시 기반 strong ETag 생성"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag 와 일치하는지 확인 (weak 비교 - 압축 미들웨어가 붙인 W/ 무시)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    """304 Not Modified 응답"""
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": cache_control}
+    )
+
+
+@dataclass(frozen=True)
+class CachedAsset:
+    """메모리에 올라간 정적 응답 본문"""
+
+    body: bytes
+    etag: str
+    media_type: str
+    mtime: float
+    # 사전 압축된 본문 {encoding: body}
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def variant(self, encoding: Optional[str]):
+        """인코딩별 (본문, ETag) 반환 - 인코딩마다 strong ETag 를 구분"""
+        if encoding and encoding in self.encoded:
+            return self.encoded[encoding], f'{self.etag[:-1]}-{encoding}"'
+        return self.body, self.etag
+
+
+class TemplateCache:
+    """HTML 템플릿 메모리 캐시 (프리로드 + ETag)"""
+
+    def __init__(self, templates_path: Path, max_age: int = TEMPLATE_CACHE_MAX_AGE):
+        self.templates_path = Path(templates_path)
+        self.cache_control = f"public, max-age={max_age}"
+        self._assets: Dict[str, CachedAsset] = {}
+        self._lock = threading.Lock()
+
+    def preload(self) -> int:
+        """templates 디렉토리의 모든 HTML 을 메모리에 적재"""
+        logger.info(
+            f"IN: TemplateCache.preload() - 템플릿 프리로드: path={self.templates_path}"
+        )
+        count = 0
+        for path in self.templates_path.rglob("*.html"):
+            self._load(path.relative_to(self.templates_path).as_posix())
+            count += 1
+        logger.info(f"OUT: TemplateCache.preload() - 템플릿 프리로드 완료: {count}개")
+        return count
+
+    def _load(self, relative_path: str) -> CachedAsset:
+        path = self.templates_path / relative_path
+        body = path.read_bytes()
+        encoded = {"gzip": compress_bytes(body, "gzip")}
+        if brotli is not None:
+            encoded["br"] = compress_bytes(body, "br")
+        asset = CachedAsset(
+            body=body,
+            etag=make_etag(body),
+            media_type="text/html; charset=utf-8",
+            mtime=path.stat().st_mtime,
+            encoded=encoded,
+        )
+        with self._lock:
+            self._assets[relative_path] = asset
+        return asset
+
+    def get(self, relative_path: str) -> CachedAsset:
+        """캐시된 템플릿 조회 (없으면 디스크에서 읽어 적재)"""
+        asset = self._assets.get(relative_path)
+        if asset is None:
+            asset = self._load(relative_path)
+        return asset
+
+    def response(self, request: Request, relative_path: str) -> Response:
+        """ETag 검증 후 200 또는 304 응답 반환 (사전 압축본 우선)"""
+        asset = self.get(relative_path)
+        encoding = select_encoding(request.headers.get("accept-encoding", ""))
+        body, etag = asset.variant(encoding)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, self.cache_control)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if body is not asset.body:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type=asset.media_type, headers=headers)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._assets.clear()
+
+
+class TTLCache:
+    """크기 제한이 있는 짧은 TTL 캐시 (멱등 JSON GET 용)"""
+
+    def __init__(self, ttl: float = JSON_CACHE_TTL, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: str, producer: Callable[[], Any]) -> Any:
+        """캐시에 없으면 producer 로 생성하여 저장"""
+        value = self.get(key)
+        if value is None:
+            value = producer()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+def cached_json_response(
+    request: Request,
+    cache: TTLCache,
+    key: str,
+    producer: Callable[[], Any],
+) -> Response:
+    """TTL 캐시된 JSON 본문을 ETag / Cache-Control 과 함께 반환"""
+    asset = cache.get(key)
+    if asset is None:
+        body = dumps(producer())
+        asset = CachedAsset(
+            body=body,
+            etag=make_etag(body),
+            media_type="application/json",
+            mtime=time.time(),
+        )
+        cache.set(key, asset)
+
+    cache_control = f"private, max-age={int(cache.ttl)}"
+    if is_not_modified(request, asset.etag):
+        return not_modified_response(asset.etag, cache_control)
+    return Response(
+        content=asset.body,
+        media_type=asset.media_type,
+        headers={"ETag": asset.etag, "Cache-Control": cache_control},
+    )
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Content-addressed Image Store
+생성 / 업로드 이미지를 내용 해시(SHA-256) 이름으로 저장하는 저장소
+
+- 경로는 해시만으로 정해진다: {root}/ab/cd/abcd....png (2단계 샤딩으로 디렉토리당 파일 수 제한).
+  같은 이미지를 다시 넣으면 새 파일을 만들지 않고 기존 항목을 돌려준다 (중복 제거).
+- 썸네일 / 축소본은 요청 시 만들어 원본 옆에 {digest}_w{width}.{ext} 로 캐시한다.
+  허용 폭은 IMAGE_VARIANT_WIDTHS 로 제한 (임의 크기 요청으로 캐시가 불어나지 않도록).
+- 메타데이터(형식, 크기, 마지막 접근 시각)는 SQLite 에 두고, 전체 용량이 IMAGE_STORE_MAX_BYTES 를
+  넘으면 가장 오래 쓰이지 않은 파일부터 지운다 (원본을 지우면 그 축소본도 함께 삭제).
+- 해시 이름이라 내용이 바뀌지 않으므로 응답에 immutable 캐시 헤더를 붙일 수 있다.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from PIL import Image
+
+from .uploads import mmap_file
+
+logger = logging.getLogger(__name__)
+
+# 이미지는 /images 라우트로만 서빙하므로 /static 아래에 두지 않음 (메타데이터 DB 가 노출되지 않도록)
+IMAGE_STORE_DIR = os.getenv(
+    "IMAGE_STORE_DIR",
+    str(Path(__file__).parent.parent.parent.parent / "resources" / "data" / "images"),
+)
+# 비어 있으면 저장소 루트 안의 image_store.db (실행 위치와 무관하게 이미지와 함께 옮겨짐)
+IMAGE_STORE_DB = os.getenv("IMAGE_STORE_DB", "")
+IMAGE_STORE_MAX_BYTES = int(os.getenv("IMAGE_STORE_MAX_BYTES", str(512 * 1024 * 1024)))
+IMAGE_VARIANT_WIDTHS = tuple(
+    int(width) for width in os.getenv("IMAGE_VARIANT_WIDTHS", "128,256,512,1024").split(",") if width
+)
+# 마지막 접근 시각은 이 간격(초)보다 자주 기록하지 않음 (조회마다 SQLite 쓰기 방지)
+IMAGE_STORE_TOUCH_INTERVAL = float(os.getenv("IMAGE_STORE_TOUCH_INTERVAL", "60"))
+
+# 원본 항목의 variant 값
+ORIGINAL = ""
+
+_EXTENSIONS = {"PNG": "png", "JPEG": "jpg", "GIF": "gif", "WEBP": "webp"}
+
+
+class UnsupportedVariantError(ValueError):
+    """허용되지 않은 축소본 크기"""
+
+
+@dataclass
+class StoredImage:
+    digest: str
+    variant: str
+    ext: str
+    mime: str
+    width: int
+    height: int
+    size: int
+    created_at: float
+    last_access: float
+
+    @property
+    def relative_path(self) -> str:
+        suffix = f"_{self.variant}" if self.variant else ""
+        return f"{self.digest[:2]}/{self.digest[2:4]}/{self.digest}{suffix}.{self.ext}"
+
+    @property
+    def filename(self) -> str:
+        return Path(self.relative_path).name
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["filename"] = self.filename
+        return data
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """파일 내용의 SHA-256 (mmap 으로 읽어 파이썬 버퍼 복사 없이 해시)"""
+    with mmap_file(path) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+def _is_digest(value: str) -> bool:
+    return len(value) == 64 and all(c in "0123456789abcdef" for c in value)
+
+
+class ImageStore:
+    """해시 이름 이미지 저장소 (중복 제거 + 축소본 캐시 + 용량 기반 LRU 정리)"""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = IMAGE_STORE_DIR,
+        db_path: Optional[str] = None,
+        max_bytes: int = IMAGE_STORE_MAX_BYTES,
+        variant_widths: Tuple[int, ...] = IMAGE_VARIANT_WIDTHS,
+    ):
+        self.root = Path(root)
+        self.db_path = db_path or IMAGE_STORE_DB or str(self.root / "image_store.db")
+        self.max_bytes = max_bytes
+        self.variant_widths = variant_widths
+        self._lock = threading.Lock()
+        self._touched: Dict[Tuple[str, str], float] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self.variants_created = 0
+        self.evicted = 0
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / "tmp").mkdir(exist_ok=True)
+        self.init_database()
+        self.total_bytes = self._stored_bytes()
+
+    def init_database(self):
+        """이미지 메타데이터 테이블 초기화"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS images (
+                    digest TEXT NOT NULL,
+                    variant TEXT NOT NULL,
+                    ext TEXT NOT NULL,
+                    mime TEXT NOT NULL,
+                    width INTEGER NOT NULL,
+                    height INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (digest, variant)
+                )
+            """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_images_last_access ON images (last_access)")
+            conn.commit()
+
+    def _stored_bytes(self) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM images").fetchone()[0]
+
+    def path_of(self, image: StoredImage) -> Path:
+        return self.root / image.relative_path
+
+    def temp_path(self, suffix: str = ".png") -> Path:
+        """저장소와 같은 파일시스템의 임시 경로 (put_file 로 옮길 파일을 쓸 곳)"""
+        return self.root / "tmp" / f"{uuid.uuid4().hex}{suffix}"
+
+    def _select(self, conn: sqlite3.Connection, digest: str, variant: str) -> Optional[StoredImage]:
+        row = conn.execute(
+            "SELECT digest, variant, ext, mime, width, height, size, created_at, last_access "
+            "FROM images WHERE digest = ? AND variant = ?",
+            (digest, variant),
+        ).fetchone()
+        return StoredImage(*row) if row else None
+
+    def _insert(self, conn: sqlite3.Connection, image: StoredImage) -> None:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO images
+                (digest, variant, ext, mime, width, height, size, created_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                image.digest,
+                image.variant,
+                image.ext,
+                image.mime,
+                image.width,
+                image.height,
+                image.size,
+                image.created_at,
+                image.last_access,
+            ),
+        )
+
+    def _touch(self, conn: sqlite3.Connection, image: StoredImage) -> None:
+        now = time.time()
+        key = (image.digest, image.variant)
+        if now - self._touched.get(key, image.last_access) < IMAGE_STORE_TOUCH_INTERVAL:
+            return
+        self._touched[key] = now
+        image.last_access = now
+        conn.execute(
+            "UPDATE images SET last_access = ? WHERE digest = ? AND variant = ?",
+            (now, image.digest, image.variant),
+        )
+        conn.commit()
+
+    def put_file(self, source: Union[str, Path]) -> StoredImage:
+        """이미지 파일을 저장소로 옮김 (같은 내용이 이미 있으면 source 를 지우고 기존 항목 반환)
+
+        Raises:
+            PIL.UnidentifiedImageError: 이미지 파일이 아님
+        """
+        source = Path(source)
+        digest = file_digest(source)
+        with Image.open(source) as img:
+            fmt = img.format or "PNG"
+            width, height = img.size
+        ext = _EXTENSIONS.get(fmt, fmt.lower())
+        now = time.time()
+        image = StoredImage(
+            digest=digest,
+            variant=ORIGINAL,
+            ext=ext,
+            mime=Image.MIME.get(fmt, f"image/{ext}"),
+            width=width,
+            height=height,
+            size=source.stat().st_size,
+            created_at=now,
+            last_access=now,
+        )
+        destination = self.path_of(image)
+
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            existing = self._select(conn, digest, ORIGINAL)
+            if existing is not None and destination.exists():
+                source.unlink()
+                self.deduplicated += 1
+                self._touch(conn, existing)
+                logger.info(f"ImageStore.put_file() - 중복 이미지: {digest[:12]}")
+                return existing
+
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(source), destination)
+            if existing is not None:
+                # 파일만 사라졌던 항목 - 용량을 다시 세지 않도록 기존 크기를 뺌
+                self.total_bytes -= existing.size
+            self._insert(conn, image)
+            conn.commit()
+            self.total_bytes += image.size
+            self._evict(conn, keep=digest)
+        logger.info(f"ImageStore.put_file() - 이미지 저장: {digest[:12]}, bytes={image.size}")
+        return image
+
+    def get(self, digest: str) -> Optional[StoredImage]:
+        """원본 조회 (없거나 파일이 지워졌으면 None)"""
+        return self._lookup(digest, ORIGINAL)
+
+    def _lookup(self, digest: str, variant: str) -> Optional[StoredImage]:
+        if not _is_digest(digest):
+            return None
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            image = self._select(conn, digest, variant)
+            if image is None:
+                return None
+            if not self.path_of(image).exists():
+                # 밖에서 파일이 지워짐 - 메타데이터도 정리
+                self._delete(conn, image)
+                conn.commit()
+                return None
+            self._touch(conn, image)
+            return image
+
+    def variant(self, digest: str, width: int) -> Optional[StoredImage]:
+        """폭 width 인 축소본 (캐시에 없으면 원본에서 만들어 저장, 원본보다 크면 원본 반환)
+
+        Raises:
+            UnsupportedVariantError: width 가 IMAGE_VARIANT_WIDTHS 에 없음
+        """
+        if width not in self.variant_widths:
+            raise UnsupportedVariantError(
+                f"지원하지 않는 이미지 폭입니다: {width} (허용: {', '.join(map(str, self.variant_widths))})"
+            )
+        original = self.get(digest)
+        if original is None or width >= original.width:
+            return original
+
+        name = f"w{width}"
+        cached = self._lookup(digest, name)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        # 렌더링은 잠금 밖에서 (동시에 같은 축소본을 만들어도 원자적 교체라 결과는 같음)
+        self.misses += 1
+        height = max(1, round(original.height * width / original.width))
+        image = StoredImage(
+            digest=digest,
+            variant=name,
+            ext=original.ext,
+            mime=original.mime,
+            width=width,
+            height=height,
+            size=0,
+            created_at=time.time(),
+            last_access=time.time(),
+        )
+        temp = self.temp_path(f".{original.ext}")
+        with Image.open(self.path_of(original)) as img:
+            img.resize((width, height), Image.LANCZOS).save(temp, format=img.format)
+        image.size = temp.stat().st_size
+        os.replace(temp, self.path_of(image))
+
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            previous = self._select(conn, digest, name)
+            if previous is not None:
+                self.total_bytes -= previous.size
+            self._insert(conn, image)
+            conn.commit()
+            self.total_bytes += image.size
+            self.variants_created += 1
+            self._evict(conn, keep=digest)
+        logger.info(f"ImageStore.variant() - 축소본 생성: {digest[:12]} {name}, bytes={image.size}")
+        return image
+
+    def _delete(self, conn: sqlite3.Connection, image: StoredImage) -> None:
+        """항목 삭제 (원본이면 축소본까지)"""
+        if image.variant == ORIGINAL:
+            rows = conn.execute(
+                "SELECT digest, variant, ext, mime, width, height, size, created_at, last_access "
+                "FROM images WHERE digest = ?",
+                (image.digest,),
+            ).fetchall()
+            targets = [StoredImage(*row) for row in rows]
+        else:
+            targets = [image]
+        for target in targets:
+            self.path_of(target).unlink(missing_ok=True)
+            self._touched.pop((target.digest, target.variant), None)
+            conn.execute(
+                "DELETE FROM images WHERE digest = ? AND variant = ?", (target.digest, target.variant)
+            )
+            self.total_bytes -= target.size
+
+    def _evict(self, conn: sqlite3.Connection, keep: Optional[str] = None) -> int:
+        """용량 상한을 넘은 만큼 오래 쓰이지 않은 항목부터 삭제 (방금 넣은 keep 은 제외)"""
+        evicted = 0
+        while self.total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT digest, variant, ext, mime, width, height, size, created_at, last_access "
+                "FROM images WHERE digest != ? ORDER BY last_access LIMIT 32",
+                (keep or "",),
+            ).fetchall()
+            if not rows:
+                break
+            for row in rows:
+                if self.total_bytes <= self.max_bytes:
+                    break
+                image = StoredImage(*row)
+                if self._select(conn, image.digest, image.variant) is None:
+                    # 같은 배치에서 원본과 함께 이미 지워진 축소본
+                    continue
+                self._delete(conn, image)
+                evicted += 1
+        if evicted:
+            conn.commit()
+            self.evicted += evicted
+            logger.info(f"ImageStore._evict() - LRU 정리: {evicted}개, total_bytes={self.total_bytes}")
+        return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            counts: List[Tuple[str, int]] = conn.execute(
+                "SELECT variant = '', COUNT(*) FROM images GROUP BY variant = ''"
+            ).fetchall()
+        by_kind = {bool(is_original): count for is_original, count in counts}
+        return {
+            "root": str(self.root),
+            "originals": by_kind.get(True, 0),
+            "variants": by_kind.get(False, 0),
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "variant_widths": list(self.variant_widths),
+            "variant_hits": self.hits,
+            "variant_misses": self.misses,
+            "variants_created": self.variants_created,
+            "deduplicated": self.deduplicated,
+            "evicted": self.evicted,
+        }
+
+
+_default_store: Optional[ImageStore] = None
+_default_lock = threading.Lock()
+
+
+def get_image_store() -> ImageStore:
+    """프로세스 공용 이미지 저장소 (작업 워커와 요청 핸들러가 같은 저장소를 공유)"""
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = ImageStore()
+    return _default_store
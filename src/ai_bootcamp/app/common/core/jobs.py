@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Background Jobs
+오래 걸리는 작업(이미지 생성 등)을 요청과 분리해서 실행하는 작업 큐
+
+- submit() 은 작업을 SQLite 에 기록하고 바로 job id 를 돌려준다 (요청은 즉시 끝남).
+- 워커 JOB_WORKERS 개가 asyncio 큐에서 작업을 꺼내 실행한다 (동시에 실행되는 작업 수 상한).
+  대기 중인 작업이 JOB_MAX_PENDING 개를 넘으면 JobQueueFullError (호출자는 503 + Retry-After).
+- 작업마다 JOB_TIMEOUT 초 안에 끝나지 않으면 실패 처리한다 (멈춘 작업이 워커를 붙잡지 않도록).
+- 상태 변화는 SQLite 에 저장하고 구독자(SSE)에게 알린다. 완료 시 callback_url 이 있으면 결과를 POST 한다.
+  callback_url 은 JOB_CALLBACK_ALLOWED_HOSTS 에 있는 호스트만, 목록이 비어 있으면 공인 주소로
+  해석되는 호스트만 허용한다 (루프백 / 사설망 / 링크 로컬 / 메타데이터 주소로의 SSRF 차단).
+  등록할 때와 보낼 때 모두 확인하고, 리다이렉트는 따라가지 않는다.
+- 재시작 시 queued / running 상태로 남은 작업은 다시 큐에 넣고, 완료된 결과는 그대로 조회된다.
+  실행을 시작할 때마다 시도 횟수를 기록하므로, 프로세스를 죽이는 작업은 JOB_MAX_ATTEMPTS 번 이후
+  다시 넣지 않고 실패로 끝낸다.
+
+작업 종류별 실행 함수는 @job_handler("kind") 로 등록한다 (async def handler(payload) -> dict).
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+JOBS_DB = os.getenv("JOBS_DB", str(Path(__file__).parent.parent.parent.parent / "resources" / "data" / "jobs.db"))
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_MAX_PENDING = int(os.getenv("JOB_MAX_PENDING", "64"))
+# 완료된 작업 보관 기간(초) - 시작 시 오래된 작업 정리
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", str(7 * 24 * 3600)))
+JOB_CALLBACK_TIMEOUT = float(os.getenv("JOB_CALLBACK_TIMEOUT", "10"))
+# 작업 실행 제한 시간(초, 0 이면 제한 없음) / 재시작 포함 최대 실행 시도 횟수
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# 콜백 허용 호스트 (쉼표 구분, ".example.com" 은 하위 도메인 포함). 비어 있으면 공인 주소만 허용
+JOB_CALLBACK_ALLOWED_HOSTS = [
+    host.strip().lower() for host in os.getenv("JOB_CALLBACK_ALLOWED_HOSTS", "").split(",") if host.strip()
+]
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+_handlers: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """작업 종류별 실행 함수 등록 데코레이터"""
+
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+class CallbackURLError(ValueError):
+    """허용되지 않는 콜백 URL"""
+
+
+def _host_allowed(host: str, allowed_hosts: List[str]) -> bool:
+    for entry in allowed_hosts:
+        if entry.startswith("."):
+            if host.endswith(entry) or host == entry[1:]:
+                return True
+        elif host == entry:
+            return True
+    return False
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+async def check_callback_url(url: str, allowed_hosts: Optional[List[str]] = None) -> None:
+    """콜백 URL 검사 (http(s) + 허용 호스트, 허용 목록이 없으면 모든 해석 주소가 공인 주소)
+
+    Raises:
+        CallbackURLError: 허용되지 않는 URL
+    """
+    allowed_hosts = JOB_CALLBACK_ALLOWED_HOSTS if allowed_hosts is None else allowed_hosts
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise CallbackURLError("callback_url 은 http(s) URL 이어야 합니다.")
+    if parts.username or parts.password:
+        raise CallbackURLError("callback_url 에 사용자 정보를 넣을 수 없습니다.")
+    host = parts.hostname.lower()
+    if allowed_hosts:
+        if not _host_allowed(host, allowed_hosts):
+            raise CallbackURLError(f"허용되지 않은 콜백 호스트입니다: {host}")
+        return
+
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (OSError, ValueError) as e:
+        raise CallbackURLError(f"콜백 호스트를 확인할 수 없습니다: {host}") from e
+    if not infos or not all(_is_public(info[4][0]) for info in infos):
+        raise CallbackURLError(f"내부 / 사설 주소로는 콜백을 보낼 수 없습니다: {host}")
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업이 너무 많음"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"작업 대기열이 가득 찼습니다. {retry_after:.0f}초 후 다시 시도하세요.")
+        self.retry_after = retry_after
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    status: str
+    payload: Dict[str, Any]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    callback_url: Optional[str] = None
+    # 실행을 시작한 횟수 (재시작 후 재실행 포함)
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("callback_url")
+        return data
+
+
+class JobStore:
+    """작업 상태 / 결과 영속화 (SQLite)"""
+
+    def __init__(self, db_path: str = JOBS_DB):
+        self.db_path = db_path
+        self.init_database()
+
+    def init_database(self):
+        """작업 테이블 초기화"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    callback_url TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "attempts" not in columns:
+                # 이전 버전 DB
+                conn.execute("ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+            conn.commit()
+
+    def save(self, job: Job) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO jobs
+                    (job_id, kind, status, payload, result, error, callback_url, created_at, updated_at, attempts)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    job.id,
+                    job.kind,
+                    job.status,
+                    json.dumps(job.payload, ensure_ascii=False),
+                    json.dumps(job.result, ensure_ascii=False) if job.result is not None else None,
+                    job.error,
+                    job.callback_url,
+                    job.created_at,
+                    job.updated_at,
+                    job.attempts,
+                ),
+            )
+            conn.commit()
+
+    @staticmethod
+    def _to_job(row) -> Job:
+        job_id, kind, status, payload, result, error, callback_url, created_at, updated_at, attempts = row
+        return Job(
+            id=job_id,
+            kind=kind,
+            status=status,
+            payload=json.loads(payload),
+            result=json.loads(result) if result else None,
+            error=error,
+            callback_url=callback_url,
+            attempts=attempts,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT job_id, kind, status, payload, result, error, callback_url, created_at, updated_at, attempts "
+                "FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def unfinished(self) -> List[Job]:
+        """이전 프로세스에서 끝나지 않은 작업 (생성 순)"""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT job_id, kind, status, payload, result, error, callback_url, created_at, updated_at, attempts "
+                "FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (QUEUED, RUNNING),
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def prune(self, older_than: float) -> int:
+        """오래된 완료 작업 삭제"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (SUCCEEDED, FAILED, older_than),
+            )
+            conn.commit()
+            return cursor.rowcount
+
+
+class JobQueue:
+    """제한된 워커 수로 작업을 실행하는 큐 (상태 구독 + 완료 콜백)"""
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        workers: int = JOB_WORKERS,
+        max_pending: int = JOB_MAX_PENDING,
+        timeout: float = JOB_TIMEOUT,
+        max_attempts: int = JOB_MAX_ATTEMPTS,
+    ):
+        self.store = store or JobStore()
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        # 진행 중인 작업 (완료 전까지 메모리에도 보관)
+        self._active: Dict[str, Job] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._lock = threading.Lock()
+        self._durations: List[float] = []
+
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.abandoned = 0
+
+    # ---------- 수명 관리 ----------
+    def start(self) -> None:
+        """워커 시작 + 이전 프로세스에서 끝나지 않은 작업 복구 (실행 중인 이벤트 루프 필요)"""
+        logger.info(f"IN: JobQueue.start() - 작업 큐 시작: workers={self.workers}")
+        self._queue = asyncio.Queue()
+        pruned = self.store.prune(time.time() - JOB_RETENTION_SECONDS)
+
+        recovered = []
+        for job in self.store.unfinished():
+            if job.attempts >= self.max_attempts:
+                # 실행 중 프로세스가 계속 죽은 작업 - 다시 넣지 않음
+                job.status, job.error, job.updated_at = FAILED, "최대 실행 시도 횟수를 넘었습니다.", time.time()
+                self.store.save(job)
+                self.abandoned += 1
+                logger.warning(f"JobQueue.start() - 작업 포기: job_id={job.id}, attempts={job.attempts}")
+                continue
+            job.status = QUEUED
+            self._active[job.id] = job
+            self._queue.put_nowait(job.id)
+            recovered.append(job)
+
+        self._tasks = [
+            asyncio.ensure_future(self._worker(index)) for index in range(self.workers)
+        ]
+        logger.info(
+            f"OUT: JobQueue.start() - 작업 큐 시작 완료: recovered={len(recovered)}, "
+            f"abandoned={self.abandoned}, pruned={pruned}"
+        )
+
+    async def stop(self) -> None:
+        """워커 종료 (실행 중이던 작업은 running 으로 남아 다음 시작 시 다시 실행)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    # ---------- 제출 / 조회 ----------
+    @property
+    def pending(self) -> int:
+        return sum(1 for job in self._active.values() if job.status == QUEUED)
+
+    async def submit(
+        self, kind: str, payload: Dict[str, Any], callback_url: Optional[str] = None
+    ) -> Job:
+        """작업 등록 (저장 후 바로 반환, SQLite 쓰기는 스레드에서)
+
+        Raises:
+            ValueError: 등록되지 않은 작업 종류
+            JobQueueFullError: 대기 중인 작업이 max_pending 이상
+        """
+        if kind not in _handlers:
+            raise ValueError(f"등록되지 않은 작업 종류: {kind}")
+        if self._queue is None:
+            raise RuntimeError("작업 큐가 시작되지 않았습니다.")
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise JobQueueFullError(self._retry_after())
+
+        job = Job(id=uuid.uuid4().hex, kind=kind, status=QUEUED, payload=payload, callback_url=callback_url)
+        # 저장하는 동안 들어온 다른 요청도 대기열 한도를 보도록 먼저 자리를 잡음
+        self._active[job.id] = job
+        try:
+            await asyncio.to_thread(self.store.save, job)
+        except BaseException:
+            self._active.pop(job.id, None)
+            raise
+        self._queue.put_nowait(job.id)
+        self.submitted += 1
+        logger.info(f"JobQueue.submit() - 작업 등록: kind={kind}, job_id={job.id}, pending={self.pending}")
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회 (진행 중이면 메모리에서, 끝난 작업은 스레드에서 SQLite 조회)"""
+        job = self._active.get(job_id)
+        if job is not None:
+            return job
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def subscribe(self, job_id: str) -> AsyncIterator[Job]:
+        """현재 상태부터 완료될 때까지 상태가 바뀔 때마다 Job 을 전달"""
+        job = await self.get(job_id)
+        if job is None:
+            return
+        updates: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, []).append(updates)
+        try:
+            # 구독 등록 사이에 끝났을 수 있으므로 다시 조회
+            job = await self.get(job_id)
+            yield job
+            while not job.finished:
+                job = await updates.get()
+                yield job
+        finally:
+            subscribers = self._subscribers.get(job_id, [])
+            if updates in subscribers:
+                subscribers.remove(updates)
+            if not subscribers:
+                self._subscribers.pop(job_id, None)
+
+    # ---------- 실행 ----------
+    async def _update(self, job: Job, **changes: Any) -> None:
+        for name, value in changes.items():
+            setattr(job, name, value)
+        job.updated_at = time.time()
+        # SQLite 쓰기가 이벤트 루프를 막지 않도록 스레드에서 저장
+        await asyncio.to_thread(self.store.save, job)
+        for updates in self._subscribers.get(job.id, []):
+            updates.put_nowait(job)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self._active.get(job_id)
+            if job is None:
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        handler = _handlers.get(job.kind)
+        started = time.monotonic()
+        # 실행 전에 시도 횟수를 저장 (이 작업이 프로세스를 죽여도 횟수가 남음)
+        await self._update(job, status=RUNNING, attempts=job.attempts + 1)
+        logger.info(f"IN: JobQueue._run() - 작업 실행: kind={job.kind}, job_id={job.id}, attempt={job.attempts}")
+        try:
+            if handler is None:
+                raise ValueError(f"등록되지 않은 작업 종류: {job.kind}")
+            result = await asyncio.wait_for(handler(job.payload), self.timeout or None)
+            await self._update(job, status=SUCCEEDED, result=result, error=None)
+            self.succeeded += 1
+            logger.info(f"OUT: JobQueue._run() - 작업 완료: job_id={job.id}")
+        except asyncio.CancelledError:
+            # 종료 중 - running 상태로 남겨 다음 시작 시 다시 실행
+            raise
+        except asyncio.TimeoutError:
+            await self._update(job, status=FAILED, error=f"작업 시간 초과 ({self.timeout:.0f}초)")
+            self.failed += 1
+            self.timed_out += 1
+            logger.error(f"OUT: JobQueue._run() - 작업 시간 초과: job_id={job.id}, timeout={self.timeout}")
+        except Exception as e:
+            await self._update(job, status=FAILED, error=str(e))
+            self.failed += 1
+            logger.error(f"OUT: JobQueue._run() - 작업 실패: job_id={job.id}, error={e}")
+        self._active.pop(job.id, None)
+        with self._lock:
+            self._durations = (self._durations + [time.monotonic() - started])[-100:]
+        if job.callback_url:
+            await self._notify(job)
+
+    async def _notify(self, job: Job) -> None:
+        """완료 콜백 (실패해도 작업 결과에는 영향 없음)"""
+        import httpx
+
+        try:
+            # 등록 후 DNS 가 내부 주소로 바뀌었을 수 있으므로 보내기 직전에 다시 확인
+            await check_callback_url(job.callback_url)
+            async with httpx.AsyncClient(timeout=JOB_CALLBACK_TIMEOUT, follow_redirects=False) as client:
+                response = await client.post(job.callback_url, json=job.to_dict())
+                response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"JobQueue._notify() - 콜백 실패: job_id={job.id}, error={e}")
+
+    def _retry_after(self) -> float:
+        """대기열이 빠지는 데 걸릴 예상 시간 (최근 작업 평균 실행 시간 기준)"""
+        with self._lock:
+            average = sum(self._durations) / len(self._durations) if self._durations else 10.0
+        return max(1.0, average * self.pending / max(1, self.workers))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "running": sum(1 for job in self._active.values() if job.status == RUNNING),
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "abandoned": self.abandoned,
+            "timeout": self.timeout,
+            "max_attempts": self.max_attempts,
+            "kinds": sorted(_handlers),
+        }
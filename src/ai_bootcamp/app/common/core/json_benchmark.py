@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization Benchmark
+계정 목록(기본 50,000건) 응답 직렬화 경로 비교
+
+실행:
+    python -m ai_bootcamp.app.common.core.json_benchmark [건수]
+"""
+
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from ..transfer.account_dto import AccountDto, AccountListResponseDto
+from .fast_json import dumps, orjson
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """AccountDAO.get_all_accounts() 와 같은 형태의 행 생성"""
+    return [
+        {
+            "id": f"user{i}",
+            "name": f"사용자{i}",
+            "company": f"테스트회사{i % 100}",
+            "juso": "서울시 강남구",
+            "created_at": "2025-08-25 10:00:00",
+            "updated_at": "2025-08-25 10:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def default_path(rows: List[Dict[str, Any]]) -> bytes:
+    """기존 경로: 행마다 AccountDto 검증 -> 응답 DTO 검증 -> FastAPI 재검증 -> json"""
+    accounts = [AccountDto(**row) for row in rows]
+    dto = AccountListResponseDto(
+        accounts=accounts, total_count=len(accounts), status="success"
+    )
+    # FastAPI serialize_response: response_model 로 재검증 후 JSON 모드로 덤프
+    validated = AccountListResponseDto.model_validate(dto.model_dump())
+    return json.dumps(
+        validated.model_dump(mode="json"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def constructed_path(rows: List[Dict[str, Any]]) -> bytes:
+    """model_construct 로 검증을 건너뛴 DTO 를 fast_json 으로 직렬화"""
+    accounts = [AccountDto.model_construct(**row) for row in rows]
+    dto = AccountListResponseDto.model_construct(
+        accounts=accounts, total_count=len(accounts), status="success"
+    )
+    return dumps(dto)
+
+
+def fast_path(rows: List[Dict[str, Any]]) -> bytes:
+    """고속 경로: DAO 행을 그대로 응답 dict 에 담아 fast_json 으로 직렬화"""
+    return dumps({"accounts": rows, "total_count": len(rows), "status": "success"})
+
+
+def measure(func: Callable[[List[Dict[str, Any]]], bytes], rows, repeat: int = 5):
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = func(rows)
+        best = min(best, time.perf_counter() - started)
+        size = len(body)
+    return best, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rows = make_rows(count)
+
+    # 세 경로가 같은 JSON 을 만드는지 확인
+    expected = json.loads(default_path(rows[:100]))
+    for func in (constructed_path, fast_path):
+        assert json.loads(func(rows[:100])) == expected, func.__name__
+
+    print(f"계정 {count:,}건 직렬화 (encoder: {'orjson' if orjson else 'json'})")
+    baseline = None
+    for func in (default_path, constructed_path, fast_path):
+        elapsed, size = measure(func, rows)
+        baseline = baseline or elapsed
+        print(
+            f"  {func.__name__:<17} {elapsed * 1000:9.1f} ms  "
+            f"{size / 1024:9.1f} KiB  x{baseline / elapsed:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Process Pool
+CPU 작업(PIL 렌더링 / 리사이즈 / 이미지 인코딩 등)을 별도 프로세스에서 실행하는 공용 풀
+
+- 스레드에서 실행하면 GIL 을 요청 처리와 나눠 쓰게 되므로 CPU 작업은 프로세스로 보낸다.
+- fork 는 이벤트 루프 / 스레드 상태까지 복제하므로 spawn 으로 시작한다
+  (실행할 함수는 모듈 최상위 함수여야 하고, 처음 제출할 때 워커가 기동된다).
+- PROCESS_POOL_WORKERS=0 이면 기본 스레드풀에서 실행한다.
+- 종료 시 정리는 concurrent.futures 의 인터프리터 종료 훅이 담당한다.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """프로세스 공용 풀 (워커 수가 0 이면 None)"""
+    global _pool
+    if PROCESS_POOL_WORKERS <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=PROCESS_POOL_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+    return _pool
+
+
+async def run_in_process(func: Callable[..., T], *args: Any) -> T:
+    """func(*args) 를 공용 프로세스 풀에서 실행"""
+    return await asyncio.get_running_loop().run_in_executor(get_process_pool(), func, *args)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Upload Ingestion
+업로드 크기 제한 + 디스크 스풀링 계층
+
+- UploadLimitMiddleware: 경로별 요청 본문 상한. Content-Length 가 상한을 넘으면 본문을 읽기 전에 413 으로 거절하고,
+  Content-Length 가 없거나 거짓이면 실제로 받은 바이트를 세다가 넘는 순간 중단한다
+  (multipart 파싱은 엔드포인트 / Depends 보다 먼저 일어나므로 미들웨어에서 막아야 한다).
+- spool_upload(): UploadFile 을 파일 하나당 UPLOAD_MAX_BYTES 까지 청크 단위로 디스크에 옮기면서 SHA-256 을 계산
+  (UploadFile.size 를 알면 읽기 전에 거절). 복사는 스레드 한 번에서 수행해 청크마다 스레드를 오가지 않는다.
+- mmap_file(): 스풀된 파일을 mmap 으로 열어 하위 처리(해시 / 디코딩)가 페이지 캐시를 그대로 읽도록 한다.
+
+업로드 몇 개가 아주 커도 워커 메모리는 청크 크기 정도만 쓴다.
+"""
+
+import asyncio
+import hashlib
+import io
+import logging
+import mmap
+import os
+import tempfile
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple, Union
+
+from fastapi import UploadFile
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .fast_json import dumps
+
+logger = logging.getLogger(__name__)
+
+# 파일 하나 / 요청 하나 상한
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+UPLOAD_MAX_REQUEST_BYTES = int(os.getenv("UPLOAD_MAX_REQUEST_BYTES", str(100 * 1024 * 1024)))
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR", tempfile.gettempdir())
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(256 * 1024)))
+
+
+class UploadTooLargeError(ValueError):
+    """업로드가 허용 크기를 넘음"""
+
+    def __init__(self, size: int, limit: int):
+        super().__init__(f"업로드가 너무 큽니다: {size} bytes 이상 (최대 {limit} bytes)")
+        self.size = size
+        self.limit = limit
+
+
+@dataclass
+class SpooledUpload:
+    """디스크에 스풀된 업로드"""
+
+    path: Path
+    filename: str
+    content_type: Optional[str]
+    size: int
+    digest: str
+
+    def unlink(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+@contextmanager
+def mmap_file(path: Union[str, Path]) -> Iterator[Union[mmap.mmap, io.BytesIO]]:
+    """파일을 읽기 전용 mmap 으로 열기 (빈 파일은 mmap 할 수 없으므로 빈 버퍼)"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield io.BytesIO(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _copy_limited(source: BinaryIO, destination: Path, max_bytes: int, chunk_size: int) -> Tuple[int, str]:
+    """source 를 destination 으로 복사하며 크기 제한 + 해시 계산 (스레드에서 실행)"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(destination, "wb") as f:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(size, max_bytes)
+            digest.update(chunk)
+            f.write(chunk)
+    return size, digest.hexdigest()
+
+
+async def spool_upload(
+    upload: UploadFile,
+    directory: Union[str, Path] = UPLOAD_SPOOL_DIR,
+    max_bytes: int = UPLOAD_MAX_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> SpooledUpload:
+    """UploadFile 을 directory 의 임시 파일로 옮김 (호출자가 사용 후 unlink)
+
+    Raises:
+        UploadTooLargeError: 파일이 max_bytes 를 넘음
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(upload.size, max_bytes)
+    path = Path(directory) / f"upload-{uuid.uuid4().hex}{Path(upload.filename or '').suffix}"
+    await upload.seek(0)
+    try:
+        size, digest = await asyncio.to_thread(_copy_limited, upload.file, path, max_bytes, chunk_size)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return SpooledUpload(
+        path=path,
+        filename=upload.filename or path.name,
+        content_type=upload.content_type,
+        size=size,
+        digest=digest,
+    )
+
+
+class UploadLimitMiddleware:
+    """경로(prefix)별 요청 본문 크기 제한 ASGI 미들웨어 (413 Payload Too Large)"""
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, int]):
+        self.app = app
+        # 긴 prefix 가 먼저 매칭되도록 정렬
+        self.limits = sorted(limits.items(), key=lambda item: len(item[0]), reverse=True)
+        self.rejected = 0
+
+    def match(self, path: str) -> Optional[int]:
+        for prefix, limit in self.limits:
+            if path.startswith(prefix):
+                return limit
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH"):
+            await self.app(scope, receive, send)
+            return
+        limit = self.match(scope["path"])
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > limit:
+            # 본문을 한 바이트도 읽지 않고 거절
+            await self._reject(send, scope["path"], int(declared), limit)
+            return
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit and not response_started:
+                    # 413 을 먼저 보내고 앱에는 연결이 끊긴 것으로 알림
+                    # (폼 파싱 중 예외는 FastAPI 가 400 으로 바꾸므로 예외로 중단하지 않음)
+                    rejected = True
+                    await self._reject(send, scope["path"], received, limit)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                # 이미 413 을 보냈으므로 앱의 응답은 버림
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        await self.app(scope, receive_wrapper, send_wrapper)
+
+    async def _reject(self, send: Send, path: str, size: int, limit: int) -> None:
+        self.rejected += 1
+        logger.warning(f"UploadLimitMiddleware - 요청 거절(413): path={path}, bytes={size}, limit={limit}")
+        body = dumps({"error": str(UploadTooLargeError(size, limit)), "max_bytes": limit})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 413,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"connection", b"close"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1 @@
+# LLM 패키지 - LLM 클라이언트 공통 인프라 (클라이언트 풀, 호출 유틸리티)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+LLM Client Registry
+워커당 한 번 생성하는 LLM 클라이언트 레지스트리 (HTTP keep-alive 커넥션 풀 공유 + 모델별 인스턴스 재사용 + 시작 시 워밍업)
+
+요청마다 ChatOpenAI / OpenAI 클라이언트를 새로 만들면 import 조회, 클라이언트 설정,
+TLS 핸드셰이크가 매번 반복된다. 이 레지스트리는 httpx 커넥션 풀을 모든 모델이 공유하도록 하여
+요청당 비용을 모델 호출 자체로 줄인다.
+
+워밍업은 두 단계다: warm_up() 은 클라이언트 객체를 미리 만들고, warm_connections() 는 공유 풀로
+가벼운 요청(GET /models)을 보내 DNS 조회 / TCP / TLS 연결을 미리 열어 둔다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "32"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "16"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "90"))
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+LLM_EMBEDDING_MODEL = os.getenv("LLM_EMBEDDING_MODEL", "text-embedding-3-small")
+# 시작 시 비동기 풀에 미리 열어 둘 연결 수 (0 이면 연결 워밍업 생략)
+LLM_WARMUP_CONNECTIONS = int(os.getenv("LLM_WARMUP_CONNECTIONS", "2"))
+LLM_WARMUP_TIMEOUT = float(os.getenv("LLM_WARMUP_TIMEOUT", "10"))
+# true 면 get_chat_demo() 기본값이 모델 라우터("auto")
+LLM_ROUTER_DEFAULT = os.getenv("LLM_ROUTER_DEFAULT", "false").lower() == "true"
+
+
+class LLMClientRegistry:
+    """모델별 LLM 클라이언트를 캐시하고 HTTP 커넥션 풀을 공유하는 레지스트리"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        default_model: Optional[str] = None,
+        use_mock: Optional[bool] = None,
+        response_cache=None,
+    ):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.default_model = default_model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        if use_mock is None:
+            use_mock = os.getenv("USE_MOCK", "false").lower() == "true"
+        self.use_mock = use_mock
+        # LLMResponseCache (없으면 캐시하지 않음)
+        self.response_cache = response_cache
+
+        self._limits = httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        )
+        self._timeout = httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        self._openai_client = None
+        self._async_openai_client = None
+        self._chat_models: Dict[Tuple, Any] = {}
+        self._chat_demos: Dict[str, Any] = {}
+        self._router = None
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        """실제 API 호출이 가능한 상태인지 (Mock 모드가 아니고 API 키가 있음)"""
+        return not self.use_mock and bool(self.api_key)
+
+    def _require_api_key(self) -> None:
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
+
+    # ---------- 공유 HTTP 커넥션 풀 ----------
+    @property
+    def http_client(self) -> httpx.Client:
+        """동기 호출용 공유 httpx 클라이언트 (keep-alive 커넥션 풀)"""
+        if self._http_client is None:
+            with self._lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        limits=self._limits, timeout=self._timeout
+                    )
+        return self._http_client
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        """비동기 호출용 공유 httpx 클라이언트 (keep-alive 커넥션 풀)"""
+        if self._http_async_client is None:
+            with self._lock:
+                if self._http_async_client is None:
+                    self._http_async_client = httpx.AsyncClient(
+                        limits=self._limits, timeout=self._timeout
+                    )
+        return self._http_async_client
+
+    # ---------- 클라이언트 조회 ----------
+    def get_chat_model(self, model: Optional[str] = None, **kwargs: Any):
+        """모델(및 옵션)별 ChatOpenAI 인스턴스 조회 (없으면 생성 후 캐시)"""
+        self._require_api_key()
+        model = model or self.default_model
+        key = (model, tuple(sorted(kwargs.items())))
+        chat_model = self._chat_models.get(key)
+        if chat_model is not None:
+            return chat_model
+
+        from langchain_openai import ChatOpenAI
+
+        with self._lock:
+            chat_model = self._chat_models.get(key)
+            if chat_model is None:
+                logger.info(
+                    f"LLMClientRegistry.get_chat_model() - ChatOpenAI 생성: model={model}, options={kwargs}"
+                )
+                # 재시도는 LLMScheduler 가 담당하므로 SDK 자체 재시도는 끔
+                kwargs.setdefault("max_retries", 0)
+                # 스트리밍 응답도 마지막 청크에 토큰 사용량을 받아 텔레메트리에 기록
+                kwargs.setdefault("stream_usage", True)
+                chat_model = ChatOpenAI(
+                    model=model,
+                    api_key=self.api_key,
+                    http_client=self.http_client,
+                    http_async_client=self.http_async_client,
+                    **kwargs,
+                )
+                self._chat_models[key] = chat_model
+        return chat_model
+
+    def get_router(self):
+        """여러 백엔드 중 요청마다 고르는 ModelRouter (OpenAI 백엔드는 풀링된 ChatOpenAI 재사용)"""
+        self._require_api_key()
+        if self._router is None:
+            from .router import ModelRouter
+
+            with self._lock:
+                if self._router is None:
+                    self._router = ModelRouter.from_env(self)
+        return self._router
+
+    def get_chat_demo(self, model: Optional[str] = None):
+        """풀링된 ChatOpenAI 를 사용하는 LangChainChatDemo 조회 (모델별 1개, "auto" 는 모델 라우터)"""
+        from .router import ROUTER_MODEL
+
+        model = model or (ROUTER_MODEL if LLM_ROUTER_DEFAULT else self.default_model)
+        chat_demo = self._chat_demos.get(model)
+        if chat_demo is None:
+            from ...demo.prac02.langchainchat import LangChainChatDemo
+
+            routed = model == ROUTER_MODEL and not self.use_mock
+            chat_demo = LangChainChatDemo(
+                use_mock=self.use_mock,
+                model=None if self.use_mock or routed else self.get_chat_model(model),
+                model_name=model,
+                cache=self.response_cache,
+                router=self.get_router() if routed else None,
+            )
+            self._chat_demos[model] = chat_demo
+        return chat_demo
+
+    def get_openai_client(self):
+        """공유 커넥션 풀을 사용하는 동기 OpenAI 클라이언트"""
+        self._require_api_key()
+        if self._openai_client is None:
+            from openai import OpenAI
+
+            self._openai_client = OpenAI(
+                api_key=self.api_key, http_client=self.http_client, max_retries=0
+            )
+        return self._openai_client
+
+    def get_async_openai_client(self):
+        """공유 커넥션 풀을 사용하는 비동기 OpenAI 클라이언트"""
+        self._require_api_key()
+        if self._async_openai_client is None:
+            from openai import AsyncOpenAI
+
+            self._async_openai_client = AsyncOpenAI(
+                api_key=self.api_key, http_client=self.http_async_client, max_retries=0
+            )
+        return self._async_openai_client
+
+    def embed(self, text: str) -> List[float]:
+        """텍스트 임베딩 (LLMResponseCache semantic 계층용 embedder)"""
+        response = self.get_openai_client().embeddings.create(
+            model=LLM_EMBEDDING_MODEL, input=text
+        )
+        return response.data[0].embedding
+
+    # ---------- 수명 관리 ----------
+    def warm_up(self, models: Optional[Iterable[str]] = None) -> None:
+        """시작 시 모델 클라이언트를 미리 생성 (첫 요청의 import / 설정 비용 제거)"""
+        if not self.enabled:
+            logger.info(
+                f"LLMClientRegistry.warm_up() - 워밍업 생략: use_mock={self.use_mock}, api_key={bool(self.api_key)}"
+            )
+            return
+        logger.info("IN: LLMClientRegistry.warm_up() - LLM 클라이언트 워밍업")
+        try:
+            for model in models or [self.default_model]:
+                self.get_chat_demo(model)
+            self.get_openai_client()
+            self.get_async_openai_client()
+            logger.info(
+                f"OUT: LLMClientRegistry.warm_up() - 워밍업 완료: models={len(self._chat_models)}"
+            )
+        except Exception as e:
+            # 워밍업 실패는 서버 기동을 막지 않음 (첫 요청에서 다시 시도)
+            logger.error(f"OUT: LLMClientRegistry.warm_up() - 워밍업 오류: {e}")
+
+    async def warm_connections(self, connections: int = LLM_WARMUP_CONNECTIONS) -> int:
+        """공유 커넥션 풀로 GET /models 를 보내 연결을 미리 열어 둠 (연 연결 수 반환)
+
+        비동기 풀에는 connections 개를 동시에, 동기 풀에는 한 개를 연다.
+        열린 연결은 LLM_KEEPALIVE_EXPIRY 동안 유지되어 첫 요청이 DNS / TCP / TLS 비용을 내지 않는다.
+        """
+        if not self.enabled or connections <= 0:
+            return 0
+        logger.info(f"IN: LLMClientRegistry.warm_connections() - 연결 워밍업: connections={connections}")
+        async_client = self.get_async_openai_client()
+        sync_client = self.get_openai_client()
+        calls = [async_client.models.list() for _ in range(connections)]
+        calls.append(asyncio.to_thread(sync_client.models.list))
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*calls, return_exceptions=True), LLM_WARMUP_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            # 워밍업 실패는 서버 기동을 막지 않음 (첫 요청에서 연결)
+            logger.error(f"OUT: LLMClientRegistry.warm_connections() - 연결 워밍업 시간 초과: {LLM_WARMUP_TIMEOUT}s")
+            return 0
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.error(f"LLMClientRegistry.warm_connections() - 연결 워밍업 오류: {errors[0]}")
+        opened = len(results) - len(errors)
+        logger.info(f"OUT: LLMClientRegistry.warm_connections() - 연결 워밍업 완료: opened={opened}")
+        return opened
+
+    async def aclose(self) -> None:
+        """공유 HTTP 커넥션 풀 종료"""
+        logger.info("IN: LLMClientRegistry.aclose() - LLM 클라이언트 종료")
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+        if self._http_client is not None:
+            self._http_client.close()
+        self._http_client = None
+        self._http_async_client = None
+        self._openai_client = None
+        self._async_openai_client = None
+        self._chat_models.clear()
+        self._router = None
+        self._chat_demos.clear()
+        logger.info("OUT: LLMClientRegistry.aclose() - LLM 클라이언트 종료 완료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "default_model": self.default_model,
+            "chat_models": [key[0] for key in self._chat_models],
+            "max_connections": LLM_MAX_CONNECTIONS,
+        }
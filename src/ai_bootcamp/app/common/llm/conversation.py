@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Conversation Store
+서버 측 대화 세션 저장소 - 대화 ID 별 append-only 턴 기록 + 토큰 수 추적 + 임계값 초과 시 오래된 턴 요약
+
+클라이언트는 매 턴 새 메시지만 보내고, 서버는 (시스템 프롬프트 + 누적 요약 + 최근 턴) 만으로
+프롬프트를 구성하므로 대화가 길어져도 요청 크기와 프롬프트 토큰이 일정 범위로 유지된다.
+
+세션은 워커 메모리에 저장되므로 다중 워커 배포 시에는 대화 ID 기준 sticky 라우팅이 필요하다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .tokens import MESSAGE_OVERHEAD_TOKENS, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+CONVERSATION_MAX_CONTEXT_TOKENS = int(os.getenv("CONVERSATION_MAX_CONTEXT_TOKENS", "3000"))
+CONVERSATION_KEEP_RECENT_TURNS = int(os.getenv("CONVERSATION_KEEP_RECENT_TURNS", "6"))
+CONVERSATION_TTL = float(os.getenv("CONVERSATION_TTL", "3600"))
+CONVERSATION_MAX_SESSIONS = int(os.getenv("CONVERSATION_MAX_SESSIONS", "1000"))
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant. Answer in Korean."
+
+# (이전 요약, 요약할 턴 목록) -> 새 요약
+Summarizer = Callable[[str, List[Tuple[str, str]]], Awaitable[str]]
+
+
+@dataclass
+class ConversationTurn:
+    """대화 턴 한 개 (토큰 수는 추가 시 한 번만 계산)"""
+
+    role: str
+    content: str
+    tokens: int
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class ConversationSession:
+    """대화 세션 (시스템 프롬프트 + 누적 요약 + 요약되지 않은 최근 턴)"""
+
+    conversation_id: str
+    system_prompt: str
+    summary: str = ""
+    summary_tokens: int = 0
+    turns: List[ConversationTurn] = field(default_factory=list)
+    # 요약에 흡수된 턴 수 (전체 턴 수 = summarized_turns + len(turns))
+    summarized_turns: int = 0
+    updated_at: float = field(default_factory=time.time)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def turn_count(self) -> int:
+        return self.summarized_turns + len(self.turns)
+
+    @property
+    def context_tokens(self) -> int:
+        """다음 프롬프트에 들어갈 토큰 수 추정"""
+        return (
+            estimate_tokens(self.system_prompt)
+            + self.summary_tokens
+            + MESSAGE_OVERHEAD_TOKENS
+            + sum(turn.tokens + MESSAGE_OVERHEAD_TOKENS for turn in self.turns)
+        )
+
+    def to_messages(self) -> List[Tuple[str, str]]:
+        """LLM 호출용 (role, content) 메시지 목록"""
+        system = self.system_prompt
+        if self.summary:
+            system += f"\n\nSummary of the earlier conversation:\n{self.summary}"
+        return [("system", system)] + [(turn.role, turn.content) for turn in self.turns]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "conversation_id": self.conversation_id,
+            "system_prompt": self.system_prompt,
+            "summary": self.summary,
+            "turns": [{"role": t.role, "content": t.content} for t in self.turns],
+            "turn_count": self.turn_count,
+            "context_tokens": self.context_tokens,
+        }
+
+
+async def truncating_summarizer(previous_summary: str, turns: List[Tuple[str, str]]) -> str:
+    """LLM 없이 동작하는 요약기 (Mock 모드 / LLM 요약 실패 시 사용) - 각 턴 앞부분만 남김"""
+    lines = [previous_summary] if previous_summary else []
+    lines += [f"{role}: {content[:80]}" for role, content in turns]
+    # 요약 자체도 무한히 커지지 않도록 최근 부분만 유지
+    return "\n".join(lines)[-2000:]
+
+
+class ConversationStore:
+    """대화 ID 별 세션 저장소 (메모리, TTL + 최대 세션 수 제한)"""
+
+    def __init__(
+        self,
+        max_context_tokens: int = CONVERSATION_MAX_CONTEXT_TOKENS,
+        keep_recent_turns: int = CONVERSATION_KEEP_RECENT_TURNS,
+        ttl: float = CONVERSATION_TTL,
+        max_sessions: int = CONVERSATION_MAX_SESSIONS,
+    ):
+        self.max_context_tokens = max_context_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.summarizations = 0
+
+    def create(self, system_prompt: Optional[str] = None) -> ConversationSession:
+        """새 대화 세션 생성"""
+        session = ConversationSession(
+            conversation_id=uuid.uuid4().hex,
+            system_prompt=system_prompt or DEFAULT_SYSTEM_PROMPT,
+        )
+        with self._lock:
+            self._sessions[session.conversation_id] = session
+            self._evict()
+        logger.info(f"ConversationStore.create() - 대화 생성: id={session.conversation_id}")
+        return session
+
+    def get(self, conversation_id: str) -> Optional[ConversationSession]:
+        """세션 조회 (만료되었으면 None)"""
+        with self._lock:
+            session = self._sessions.get(conversation_id)
+            if session is None:
+                return None
+            if session.updated_at + self.ttl < time.time():
+                del self._sessions[conversation_id]
+                return None
+            self._sessions.move_to_end(conversation_id)
+            return session
+
+    def delete(self, conversation_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(conversation_id, None) is not None
+
+    def _evict(self) -> None:
+        now = time.time()
+        expired = [cid for cid, s in self._sessions.items() if s.updated_at + self.ttl < now]
+        for cid in expired:
+            del self._sessions[cid]
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    @staticmethod
+    def append(session: ConversationSession, role: str, content: str) -> ConversationTurn:
+        """턴 추가 (append-only)"""
+        turn = ConversationTurn(role=role, content=content, tokens=estimate_tokens(content))
+        session.turns.append(turn)
+        session.updated_at = time.time()
+        return turn
+
+    async def compact(
+        self, session: ConversationSession, summarizer: Summarizer = truncating_summarizer
+    ) -> bool:
+        """컨텍스트가 임계값을 넘으면 최근 턴을 제외한 오래된 턴을 요약에 흡수"""
+        if session.context_tokens <= self.max_context_tokens:
+            return False
+        if len(session.turns) <= self.keep_recent_turns:
+            return False
+
+        cut = len(session.turns) - self.keep_recent_turns
+        old_turns = [(turn.role, turn.content) for turn in session.turns[:cut]]
+        before = session.context_tokens
+        try:
+            summary = await summarizer(session.summary, old_turns)
+        except Exception as e:
+            logger.warning(f"ConversationStore.compact() - 요약 실패, 단순 요약으로 대체: {e}")
+            summary = await truncating_summarizer(session.summary, old_turns)
+
+        session.summary = summary
+        session.summary_tokens = estimate_tokens(summary)
+        session.turns = session.turns[cut:]
+        session.summarized_turns += cut
+        self.summarizations += 1
+        logger.info(
+            f"ConversationStore.compact() - 대화 요약: id={session.conversation_id}, "
+            f"summarized={cut}, tokens {before} -> {session.context_tokens}"
+        )
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "summarizations": self.summarizations,
+            "max_context_tokens": self.max_context_tokens,
+        }
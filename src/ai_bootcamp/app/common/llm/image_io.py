@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Image I/O
+이미지를 통째로 메모리에 올리지 않고 청크 단위로 내려받고 / base64 로 인코딩해서 보내는 유틸리티
+
+- download_to_file(): 비동기 HTTP 스트림을 청크 단위로 임시 파일에 쓰고 완료되면 이름을 바꾼다
+  (중간에 실패해도 반쯤 쓴 파일이 남지 않음). 크기 상한을 넘으면 즉시 중단한다.
+- iter_base64(): 파일을 3 의 배수 바이트 청크로 읽어 청크별로 base64 인코딩 (패딩은 마지막 청크에만 생김).
+- iter_data_url_json(): JSON 요청 본문 안의 자리표시자 위치에 data URL 을 흘려 넣는 바이트 스트림.
+  본문 길이는 미리 계산할 수 있으므로 Content-Length 를 붙여 그대로 전송한다.
+
+요청당 메모리 사용량은 이미지 크기와 관계없이 청크 크기 정도로 일정하다.
+"""
+
+import base64
+import json
+import logging
+import mimetypes
+import os
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# 읽기 / 쓰기 청크 크기 (base64 청크 경계가 맞도록 3 의 배수로 맞춤)
+IMAGE_IO_CHUNK_SIZE = int(os.getenv("IMAGE_IO_CHUNK_SIZE", str(64 * 1024))) // 3 * 3
+IMAGE_DOWNLOAD_MAX_BYTES = int(os.getenv("IMAGE_DOWNLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+IMAGE_DOWNLOAD_TIMEOUT = float(os.getenv("IMAGE_DOWNLOAD_TIMEOUT", "30"))
+
+# 파일 앞부분 시그니처로 판별하는 이미지 형식
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+Source = Union[str, Path, BinaryIO]
+
+
+class ImageTooLargeError(ValueError):
+    """이미지가 허용 크기를 넘음"""
+
+    def __init__(self, size: int, limit: int):
+        super().__init__(f"이미지가 너무 큽니다: {size} bytes (최대 {limit} bytes)")
+        self.size = size
+        self.limit = limit
+
+
+def image_mime_type(path: Union[str, Path]) -> str:
+    """이미지 MIME 타입 (파일 시그니처 우선, 없으면 확장자, 둘 다 모르면 image/jpeg)"""
+    with open(path, "rb") as f:
+        header = f.read(16)
+    for signature, mime in _SIGNATURES:
+        if header.startswith(signature):
+            return mime
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    guessed, _ = mimetypes.guess_type(str(path))
+    return guessed if guessed and guessed.startswith("image/") else "image/jpeg"
+
+
+def base64_length(size: int) -> int:
+    """size 바이트를 base64 로 인코딩한 길이"""
+    return (size + 2) // 3 * 4
+
+
+def iter_base64(source: Source, chunk_size: int = IMAGE_IO_CHUNK_SIZE) -> Iterator[bytes]:
+    """파일(경로 또는 바이너리 파일 객체)을 청크 단위로 base64 인코딩"""
+    chunk_size = max(3, chunk_size // 3 * 3)
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            yield from iter_base64(f, chunk_size)
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield base64.b64encode(chunk)
+
+
+def iter_data_url_json(
+    payload: Dict[str, Any], placeholder: str, image_path: Union[str, Path]
+) -> Tuple[int, Iterator[bytes]]:
+    """payload 를 JSON 으로 직렬화하되 placeholder 문자열 자리에 이미지 data URL 을 스트리밍
+
+    Returns:
+        Tuple[int, Iterator[bytes]]: (본문 전체 길이, 본문 바이트 스트림)
+    """
+    body = json.dumps(payload, ensure_ascii=False)
+    head, tail = body.split(placeholder, 1)
+    head_bytes = head.encode("utf-8") + f"data:{image_mime_type(image_path)};base64,".encode("ascii")
+    tail_bytes = tail.encode("utf-8")
+    length = len(head_bytes) + base64_length(os.path.getsize(image_path)) + len(tail_bytes)
+
+    def stream() -> Iterator[bytes]:
+        yield head_bytes
+        yield from iter_base64(image_path)
+        yield tail_bytes
+
+    return length, stream()
+
+
+async def download_to_file(
+    url: str,
+    destination: Union[str, Path],
+    client=None,
+    max_bytes: int = IMAGE_DOWNLOAD_MAX_BYTES,
+    chunk_size: int = IMAGE_IO_CHUNK_SIZE,
+    timeout: float = IMAGE_DOWNLOAD_TIMEOUT,
+) -> int:
+    """URL 을 청크 단위로 destination 에 저장 (임시 파일에 쓴 뒤 이름 변경)
+
+    Args:
+        client: 재사용할 httpx.AsyncClient (없으면 이번 다운로드용으로 생성)
+
+    Returns:
+        int: 저장한 바이트 수
+
+    Raises:
+        ImageTooLargeError: Content-Length 또는 실제 수신 크기가 max_bytes 초과
+        httpx.HTTPStatusError: 응답 상태 오류
+    """
+    import httpx
+
+    destination = Path(destination)
+    partial = destination.with_name(f".{destination.name}.{uuid.uuid4().hex[:8]}.part")
+    own_client = client is None
+    if own_client:
+        client = httpx.AsyncClient(timeout=timeout, follow_redirects=True)
+    written = 0
+    try:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            declared = response.headers.get("content-length")
+            if declared is not None and int(declared) > max_bytes:
+                raise ImageTooLargeError(int(declared), max_bytes)
+            # 청크 하나(기본 64KB) 쓰기는 충분히 짧으므로 이벤트 루프에서 바로 기록
+            with open(partial, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise ImageTooLargeError(written, max_bytes)
+                    f.write(chunk)
+        os.replace(partial, destination)
+        logger.info(f"download_to_file() - 다운로드 완료: {destination.name}, bytes={written}")
+        return written
+    finally:
+        if partial.exists():
+            partial.unlink()
+        if own_client:
+            await client.aclose()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+LLM Invocation
+비동기 LLM 호출 유틸리티 - 호출별 타임아웃 + 클라이언트 연결 종료 시 호출 취소
+"""
+
+import asyncio
+import logging
+import os
+from typing import Awaitable, Optional, TypeVar
+
+from fastapi import Request
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_CALL_TIMEOUT = float(os.getenv("LLM_CALL_TIMEOUT", "30"))
+# 클라이언트 연결 상태 확인 주기(초)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+class ClientDisconnectedError(Exception):
+    """LLM 응답을 기다리는 중 클라이언트 연결이 끊어짐"""
+
+
+async def run_until_disconnected(
+    request: Request,
+    awaitable: Awaitable[T],
+    timeout: Optional[float] = LLM_CALL_TIMEOUT,
+) -> T:
+    """awaitable 을 실행하되 타임아웃 또는 클라이언트 연결 종료 시 취소
+
+    Raises:
+        asyncio.TimeoutError: timeout 초 안에 끝나지 않음
+        ClientDisconnectedError: 클라이언트가 먼저 연결을 끊음
+    """
+    task = asyncio.ensure_future(awaitable)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout else None
+    try:
+        while True:
+            wait = DISCONNECT_POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(deadline - loop.time(), 0))
+            done, _ = await asyncio.wait({task}, timeout=wait)
+            if done:
+                return task.result()
+            if deadline is not None and loop.time() >= deadline:
+                logger.warning(
+                    f"run_until_disconnected() - LLM 호출 타임아웃: {timeout}s, path={request.url.path}"
+                )
+                raise asyncio.TimeoutError()
+            if await request.is_disconnected():
+                logger.info(
+                    f"run_until_disconnected() - 클라이언트 연결 종료로 LLM 호출 취소: path={request.url.path}"
+                )
+                raise ClientDisconnectedError()
+    finally:
+        if not task.done():
+            task.cancel()
@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Mock OpenAI Server
+OpenAI 호환 로컬 모의 서버 - 실제 API 없이 chat / embeddings / images 코드 경로를 그대로 부하 테스트
+
+- POST /v1/chat/completions : 일반 / 스트리밍(SSE) 응답, response_format(json_schema) 과
+  tools(function calling) 구조화 출력, stream_options.include_usage 지원
+- POST /v1/embeddings       : 단어 해시 기반 결정적 벡터 (비슷한 문장 -> 높은 코사인 유사도)
+- POST /v1/images/generations : url / b64_json 응답 (url 은 이 서버의 /mock-images 로 서빙)
+- 지연 시간 분포(fixed / uniform / normal / lognormal), 토큰 생성 속도, 429 / 5xx 주입,
+  RPM / TPM / 동시성 한도를 환경 변수 또는 POST /mock/config 로 설정
+- MOCK_OPENAI_SEED 가 같으면 같은 요청 순서에 대해 같은 지연 / 오류 / 응답을 재현
+
+실행:
+    python -m ai_bootcamp.app.common.llm.mock_server --port 8100
+
+앱이 모의 서버를 쓰도록 하려면 (USE_MOCK=false 로 실제 코드 경로 사용):
+    OPENAI_BASE_URL=http://localhost:8100/v1  OPENAI_API_KEY=sk-mock
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import random
+import re
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from ..core.fast_json import dumps
+from .tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# 이미지 입력 한 개당 프롬프트 토큰 (OpenAI low detail 기준 근사)
+IMAGE_INPUT_TOKENS = 85
+
+# 1x1 투명 PNG (Pillow 가 없을 때 사용)
+_FALLBACK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+@dataclass
+class MockServerConfig:
+    """모의 서버 동작 설정 (0 은 제한 없음)"""
+
+    # 첫 토큰까지 지연 분포 (fixed / uniform / normal / lognormal)
+    latency: str = "lognormal"
+    # 첫 토큰 지연 중앙값(초)
+    ttft: float = 0.4
+    # 분포 폭 (lognormal: sigma, normal: 표준편차(초), uniform: ± 범위(초))
+    ttft_spread: float = 0.5
+    # 응답 토큰 생성 속도 (일반 응답도 ttft + 토큰 수 / 속도 만큼 지연)
+    tokens_per_sec: float = 60.0
+    # 이미지 생성 지연 중앙값(초)
+    image_latency: float = 3.0
+    # 기본 응답 길이 (max_tokens 가 더 작으면 max_tokens)
+    completion_tokens: int = 60
+    # 요청별 오류 주입 확률
+    error_rate_429: float = 0.0
+    error_rate_500: float = 0.0
+    # 분당 한도 / 동시 처리 수 (넘으면 429, 동시성 초과분은 대기)
+    rpm: int = 0
+    tpm: int = 0
+    max_concurrency: int = 0
+    embedding_dim: int = 1536
+    seed: int = 42
+
+    @classmethod
+    def from_env(cls) -> "MockServerConfig":
+        """MOCK_OPENAI_<필드명 대문자> 환경 변수로 기본값 덮어쓰기"""
+        config = cls()
+        config.update(
+            {
+                f.name: os.environ[f"MOCK_OPENAI_{f.name.upper()}"]
+                for f in fields(cls)
+                if f"MOCK_OPENAI_{f.name.upper()}" in os.environ
+            }
+        )
+        return config
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """알려진 필드만 타입에 맞춰 갱신 (하나라도 변환할 수 없으면 아무것도 바꾸지 않음)
+
+        Raises:
+            ValueError: values 가 dict 가 아니거나 필드 타입으로 변환할 수 없는 값
+        """
+        if not isinstance(values, dict):
+            raise ValueError("설정은 JSON 객체여야 합니다.")
+        converted = {}
+        for f in fields(self):
+            if f.name in values:
+                current = getattr(self, f.name)
+                try:
+                    converted[f.name] = type(current)(values[f.name])
+                except (TypeError, ValueError):
+                    raise ValueError(
+                        f"{f.name}: {type(current).__name__} 로 변환할 수 없는 값 {values[f.name]!r}"
+                    ) from None
+        for name, value in converted.items():
+            setattr(self, name, value)
+
+
+class MockOpenAIServer:
+    """모의 서버 상태 (설정, 난수, 한도 창, 통계)"""
+
+    def __init__(self, config: Optional[MockServerConfig] = None):
+        self.config = config or MockServerConfig.from_env()
+        self.rng = random.Random(self.config.seed)
+        # 최근 60초 (시각, 토큰 수) 기록 - RPM / TPM 계산용
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_size = 0
+        self.stats = {
+            "requests": 0,
+            "rate_limited": 0,
+            "injected_429": 0,
+            "injected_500": 0,
+            "streams": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "in_flight": 0,
+        }
+
+    def reconfigure(self, values: Dict[str, Any]) -> None:
+        self.config.update(values)
+        if "seed" in values:
+            self.rng = random.Random(self.config.seed)
+
+    # ---------- 지연 / 오류 / 한도 ----------
+    def sample_delay(self, median: float) -> float:
+        """설정된 분포에서 지연 시간 추출"""
+        c = self.config
+        if c.latency == "fixed" or median <= 0:
+            return max(0.0, median)
+        if c.latency == "uniform":
+            return max(0.0, self.rng.uniform(median - c.ttft_spread, median + c.ttft_spread))
+        if c.latency == "normal":
+            return max(0.0, self.rng.gauss(median, c.ttft_spread))
+        return self.rng.lognormvariate(math.log(median), c.ttft_spread)
+
+    def _prune(self, now: float) -> None:
+        while self._window and self._window[0][0] < now - 60:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def admit(self, tokens: int) -> Optional[Response]:
+        """오류 주입 + RPM / TPM 한도 확인 (거절 시 오류 응답)"""
+        c = self.config
+        self.stats["requests"] += 1
+        roll = self.rng.random()
+        if roll < c.error_rate_429:
+            self.stats["injected_429"] += 1
+            return _error(429, "Rate limit reached (injected)", "rate_limit_error", retry_after=1)
+        if roll < c.error_rate_429 + c.error_rate_500:
+            self.stats["injected_500"] += 1
+            return _error(500, "The server had an error (injected)", "server_error")
+
+        now = time.monotonic()
+        self._prune(now)
+        over_rpm = c.rpm and len(self._window) + 1 > c.rpm
+        over_tpm = c.tpm and self._window_tokens + tokens > c.tpm
+        if over_rpm or over_tpm:
+            self.stats["rate_limited"] += 1
+            retry_after = max(1, math.ceil(self._window[0][0] + 60 - now)) if self._window else 1
+            kind = "requests" if over_rpm else "tokens"
+            return _error(
+                429, f"Rate limit reached for {kind} per min", "rate_limit_error", retry_after=retry_after
+            )
+        self._window.append((now, tokens))
+        self._window_tokens += tokens
+        return None
+
+    def rate_limit_headers(self) -> Dict[str, str]:
+        c = self.config
+        headers = {}
+        if c.rpm:
+            headers["x-ratelimit-limit-requests"] = str(c.rpm)
+            headers["x-ratelimit-remaining-requests"] = str(max(0, c.rpm - len(self._window)))
+        if c.tpm:
+            headers["x-ratelimit-limit-tokens"] = str(c.tpm)
+            headers["x-ratelimit-remaining-tokens"] = str(max(0, c.tpm - self._window_tokens))
+        return headers
+
+    def slot(self) -> "_Slot":
+        """동시 처리 슬롯 (max_concurrency 를 넘으면 대기 -> 처리량 포화 재현)"""
+        if self.config.max_concurrency != self._semaphore_size:
+            self._semaphore_size = self.config.max_concurrency
+            self._semaphore = asyncio.Semaphore(self._semaphore_size) if self._semaphore_size else None
+        return _Slot(self, self._semaphore)
+
+
+class _Slot:
+    def __init__(self, server: MockOpenAIServer, semaphore: Optional[asyncio.Semaphore]):
+        self.server = server
+        self.semaphore = semaphore
+
+    async def __aenter__(self) -> None:
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+        self.server.stats["in_flight"] += 1
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.server.stats["in_flight"] -= 1
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+
+def _error(status: int, message: str, error_type: str, retry_after: Optional[int] = None) -> Response:
+    headers = {"retry-after": str(retry_after)} if retry_after else None
+    return JSONResponse(
+        {"error": {"message": message, "type": error_type, "param": None, "code": None}},
+        status_code=status,
+        headers=headers,
+    )
+
+
+# ---------- 결정적 응답 생성 ----------
+_IMAGE_KEY_PATTERN = re.compile(r"[0-9a-f]{6,64}")
+# 번역 프롬프트의 목표 언어 ("translates English to X" 또는 "Target language: X")
+_LANGUAGE_PATTERN = re.compile(r"(?:translates? English to|Target language:) (\w+)")
+_FILLER = (
+    "this is a deterministic mock completion used for offline load testing of the "
+    "application code paths with realistic token counts and timing"
+).split()
+
+
+def _message_text(message: Dict[str, Any]) -> Tuple[str, int]:
+    """메시지 텍스트 + 이미지 입력 수 (content 가 파트 목록일 수 있음)"""
+    content = message.get("content") or ""
+    if isinstance(content, str):
+        return content, 0
+    texts, images = [], 0
+    for part in content:
+        if part.get("type") == "text":
+            texts.append(part.get("text", ""))
+        elif part.get("type") in ("image_url", "input_image"):
+            images += 1
+    return " ".join(texts), images
+
+
+def _prompt_tokens(messages: List[Dict[str, Any]]) -> Tuple[int, str, str]:
+    """(프롬프트 토큰 수, 시스템 프롬프트, 마지막 사용자 메시지)"""
+    total, system, last_user = 0, "", ""
+    for message in messages:
+        text, images = _message_text(message)
+        total += estimate_tokens(text) + 4 + images * IMAGE_INPUT_TOKENS
+        if message.get("role") in ("system", "developer"):
+            system = text
+        elif message.get("role") == "user":
+            last_user = text
+    return total, system, last_user
+
+
+def _seeded(*parts: str) -> random.Random:
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _filler_text(rng: random.Random, tokens: int) -> str:
+    words, used = [], 0
+    while used < tokens:
+        word = rng.choice(_FILLER)
+        words.append(word)
+        used += estimate_tokens(word + " ")
+    return " ".join(words) + "."
+
+
+def _chat_text(system: str, user: str, max_tokens: int) -> str:
+    """채팅 응답 본문 (번역 프롬프트면 번역 흉내, 그 외는 결정적 채움 문장)"""
+    language = _LANGUAGE_PATTERN.search(system)
+    if language:
+        return f"[{language.group(1)}] {user}"
+    return "Mock reply: " + _filler_text(_seeded(system, user), max_tokens)
+
+
+def _first_array(text: str) -> Optional[List[Any]]:
+    """사용자 메시지가 JSON 이면 처음 나오는 배열 (구조화 출력 배열 길이 / 항목 결정용)"""
+    try:
+        value = json.loads(text)
+    except (TypeError, ValueError):
+        return None
+    stack = [value]
+    while stack:
+        item = stack.pop(0)
+        if isinstance(item, list):
+            return item
+        if isinstance(item, dict):
+            stack.extend(item.values())
+    return None
+
+
+def _from_schema(schema: Dict[str, Any], defs: Dict[str, Any], source: List[Any], hint: str, label: str) -> Any:
+    """JSON 스키마에 맞는 결정적 값 생성
+
+    배열은 사용자 JSON 입력의 첫 배열과 같은 길이로 만들고, 문자열 항목은 대응 입력에 label 을 붙인다.
+    """
+    if "$ref" in schema:
+        schema = defs.get(schema["$ref"].split("/")[-1], {})
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            return _from_schema(schema[key][0], defs, source, hint, label)
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type", "object")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "string")
+    if kind == "object":
+        return {
+            name: _from_schema(prop, defs, source, f"{hint}.{name}", label)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        items = source if source else [hint] * 3
+        return [
+            _from_schema(schema.get("items", {}), defs, [], str(item), label) for item in items
+        ]
+    if kind in ("integer", "number"):
+        return 0
+    if kind == "boolean":
+        return False
+    return f"{label}{hint}".strip()
+
+
+def _structured_arguments(schema: Dict[str, Any], system: str, user: str) -> str:
+    language = _LANGUAGE_PATTERN.search(system)
+    label = f"[{language.group(1)}] " if language else "mock "
+    value = _from_schema(schema, schema.get("$defs", {}), _first_array(user) or [], "", label)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _split_tokens(text: str) -> List[str]:
+    return re.findall(r"\S+\s*", text) or [text]
+
+
+def create_mock_app(server: Optional[MockOpenAIServer] = None) -> FastAPI:
+    """모의 서버 FastAPI 앱 생성"""
+    server = server or MockOpenAIServer()
+    app = FastAPI(title="Mock OpenAI Server")
+    app.state.mock = server
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {
+            "object": "list",
+            "data": [
+                {"id": name, "object": "model", "created": 0, "owned_by": "mock"}
+                for name in ("gpt-4o", "gpt-4o-mini", "dall-e-3", "text-embedding-3-small")
+            ],
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "gpt-4o-mini")
+        messages = body.get("messages", [])
+        prompt_tokens, system, user = _prompt_tokens(messages)
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens") or server.config.completion_tokens
+
+        # 구조화 출력 (response_format json_schema / 강제된 단일 tool)
+        tool_call = None
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            text = _structured_arguments(response_format["json_schema"].get("schema", {}), system, user)
+        elif response_format.get("type") == "json_object":
+            text = json.dumps({"content": _chat_text(system, user, max_tokens)}, ensure_ascii=False)
+        elif body.get("tools") and body.get("tool_choice") not in (None, "none", "auto"):
+            function = body["tools"][0]["function"]
+            choice = body["tool_choice"]
+            if isinstance(choice, dict):
+                name = choice.get("function", {}).get("name")
+                function = next(
+                    (t["function"] for t in body["tools"] if t["function"]["name"] == name), function
+                )
+            tool_call = {
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+                "type": "function",
+                "function": {
+                    "name": function["name"],
+                    "arguments": _structured_arguments(function.get("parameters", {}), system, user),
+                },
+            }
+            text = None
+        else:
+            text = _chat_text(system, user, max_tokens)
+
+        completion_tokens = estimate_tokens(text or tool_call["function"]["arguments"])
+        rejected = server.admit(prompt_tokens + completion_tokens)
+        if rejected is not None:
+            return rejected
+        server.stats["prompt_tokens"] += prompt_tokens
+        server.stats["completion_tokens"] += completion_tokens
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        headers = server.rate_limit_headers()
+        ttft = server.sample_delay(server.config.ttft)
+        per_token = 1.0 / server.config.tokens_per_sec if server.config.tokens_per_sec > 0 else 0.0
+
+        if body.get("stream"):
+            server.stats["streams"] += 1
+            include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+
+            def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> bytes:
+                return b"data: " + dumps(
+                    {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                    }
+                ) + b"\n\n"
+
+            async def stream() -> AsyncIterator[bytes]:
+                async with server.slot():
+                    await asyncio.sleep(ttft)
+                    if tool_call is not None:
+                        yield chunk({"role": "assistant", "content": None, "tool_calls": [{"index": 0, **tool_call}]})
+                        finish_reason = "tool_calls"
+                    else:
+                        yield chunk({"role": "assistant", "content": ""})
+                        for token in _split_tokens(text):
+                            await asyncio.sleep(per_token)
+                            yield chunk({"content": token})
+                        finish_reason = "stop"
+                    yield chunk({}, finish_reason)
+                    if include_usage:
+                        yield b"data: " + dumps(
+                            {
+                                "id": completion_id,
+                                "object": "chat.completion.chunk",
+                                "created": created,
+                                "model": model,
+                                "choices": [],
+                                "usage": usage,
+                            }
+                        ) + b"\n\n"
+                    yield b"data: [DONE]\n\n"
+
+            return StreamingResponse(stream(), media_type="text/event-stream", headers=headers)
+
+        async with server.slot():
+            await asyncio.sleep(ttft + completion_tokens * per_token)
+        message: Dict[str, Any] = {"role": "assistant", "content": text, "refusal": None}
+        if tool_call is not None:
+            message["tool_calls"] = [tool_call]
+        return JSONResponse(
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": message,
+                        "finish_reason": "tool_calls" if tool_call else "stop",
+                        "logprobs": None,
+                    }
+                ],
+                "usage": usage,
+            },
+            headers=headers,
+        )
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body.get("input", "")
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        inputs = [text if isinstance(text, str) else " ".join(map(str, text)) for text in inputs]
+        dim = int(body.get("dimensions") or server.config.embedding_dim)
+        tokens = sum(estimate_tokens(text) for text in inputs)
+        rejected = server.admit(tokens)
+        if rejected is not None:
+            return rejected
+        server.stats["prompt_tokens"] += tokens
+        async with server.slot():
+            # 임베딩은 생성 단계가 없으므로 첫 토큰 지연의 일부만 적용
+            await asyncio.sleep(server.sample_delay(server.config.ttft) * 0.25)
+        return JSONResponse(
+            {
+                "object": "list",
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": _embed(text, dim)}
+                    for i, text in enumerate(inputs)
+                ],
+                "model": body.get("model", "text-embedding-3-small"),
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            },
+            headers=server.rate_limit_headers(),
+        )
+
+    @app.post("/v1/images/generations")
+    async def image_generations(request: Request):
+        body = await request.json()
+        prompt = body.get("prompt", "")
+        size = body.get("size") or "1024x1024"
+        n = int(body.get("n") or 1)
+        rejected = server.admit(0)
+        if rejected is not None:
+            return rejected
+        async with server.slot():
+            await asyncio.sleep(server.sample_delay(server.config.image_latency))
+        data = []
+        for i in range(n):
+            key = hashlib.sha256(f"{prompt}\x1f{i}".encode("utf-8")).hexdigest()[:16]
+            if body.get("response_format") == "b64_json":
+                data.append({"b64_json": base64.b64encode(_render_png(key, size)).decode("ascii"), "revised_prompt": prompt})
+            else:
+                url = str(request.base_url).rstrip("/") + f"/mock-images/{key}.png?size={size}"
+                data.append({"url": url, "revised_prompt": prompt})
+        return JSONResponse({"created": int(time.time()), "data": data}, headers=server.rate_limit_headers())
+
+    @app.get("/mock-images/{key}.png")
+    async def mock_image(key: str, size: str = "256x256"):
+        # 이미지 생성 응답이 만드는 16자리 hex 키만 허용 (색을 키에서 읽으므로)
+        if not _IMAGE_KEY_PATTERN.fullmatch(key):
+            return _error(404, f"Unknown mock image: {key}", "invalid_request_error")
+        return Response(_render_png(key, size), media_type="image/png")
+
+    @app.get("/mock/stats")
+    async def mock_stats():
+        return {"config": asdict(server.config), **server.stats}
+
+    @app.post("/mock/config")
+    async def mock_config(request: Request):
+        """실행 중 설정 변경 (예: {"error_rate_429": 0.2, "rpm": 100})"""
+        try:
+            server.reconfigure(await request.json())
+        except ValueError as e:
+            # JSON 파싱 오류(JSONDecodeError)도 ValueError
+            return _error(400, f"Invalid mock config: {e}", "invalid_request_error")
+        logger.info(f"MockOpenAIServer - 설정 변경: {asdict(server.config)}")
+        return asdict(server.config)
+
+    return app
+
+
+def _embed(text: str, dim: int) -> List[float]:
+    """단어마다 해시로 고른 몇 개 차원에 ±1 을 더한 정규화 벡터 (공유 단어가 많을수록 유사)"""
+    vector = [0.0] * dim
+    for word in re.findall(r"\w+", text.lower()) or [text]:
+        digest = hashlib.blake2b(word.encode("utf-8"), digest_size=32).digest()
+        for i in range(0, 32, 4):
+            index = int.from_bytes(digest[i : i + 3], "big") % dim
+            vector[index] += 1.0 if digest[i + 3] & 1 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def _render_png(key: str, size: str) -> bytes:
+    """key 로 색을 정한 단색 PNG (Pillow 가 없으면 1x1 PNG)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return _FALLBACK_PNG
+    try:
+        width, height = (min(int(v), 1024) for v in size.lower().split("x"))
+    except ValueError:
+        width = height = 256
+    color = tuple(bytes.fromhex(key[:6]))
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI 호환 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    server = MockOpenAIServer()
+    logger.info(f"Mock OpenAI Server 시작: http://{args.host}:{args.port}/v1, config={asdict(server.config)}")
+    uvicorn.run(create_mock_app(server), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Prompt Registry
+프롬프트 템플릿 사전 컴파일 + 공급자 측 프롬프트 캐싱(prefix caching)용 고정 접두사 관리
+
+OpenAI / Anthropic 은 요청 앞부분이 이전 요청과 토큰 단위로 같으면 캐시된 입력 토큰을 재사용한다
+(OpenAI 는 1024 토큰 이상 접두사부터 적용). 그래서 템플릿을 다음처럼 나눈다.
+
+- prefix: 변수가 없는 고정 지시문. 항상 첫 시스템 메시지의 맨 앞에 둔다 (format 하지 않는 리터럴).
+- suffix: 호출마다 달라지는 시스템 지시 (예: 목표 언어). prefix 뒤에 붙는다.
+- user: 사용자 메시지 템플릿 (입력 데이터). 항상 마지막에 둔다.
+
+suffix / user 템플릿은 등록 시 한 번 파싱해서 필드를 검증하고,
+렌더링된 시스템 메시지는 값 조합별로 캐시해서 매 호출 f-string 을 다시 만들지 않는다.
+템플릿별 호출 수 / 입력 토큰 / 캐시 적중 토큰 비율은 /api/langchain/prompts/stats 로 확인한다.
+"""
+
+import logging
+import os
+import string
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .telemetry import TokenUsage
+from .tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# 공급자가 프롬프트 캐시를 적용하는 최소 접두사 토큰 수 (OpenAI 기준)
+PROMPT_CACHE_MIN_TOKENS = int(os.getenv("PROMPT_CACHE_MIN_TOKENS", "1024"))
+# 템플릿별로 보관할 렌더링된 시스템 메시지 수
+PROMPT_RENDER_CACHE_SIZE = int(os.getenv("PROMPT_RENDER_CACHE_SIZE", "128"))
+
+_formatter = string.Formatter()
+
+
+def _field_names(template: str) -> FrozenSet[str]:
+    """format 템플릿의 필드 이름 (잘못된 템플릿이면 ValueError)"""
+    names = set()
+    for _, field_name, _, _ in _formatter.parse(template):
+        if field_name is None:
+            continue
+        if not field_name or not field_name.isidentifier():
+            raise ValueError(f"프롬프트 템플릿 필드는 이름이 있어야 합니다: {{{field_name}}}")
+        names.add(field_name)
+    return frozenset(names)
+
+
+class PromptTemplate:
+    """고정 접두사 + 변수 부분으로 나뉜 사전 컴파일 프롬프트"""
+
+    def __init__(self, name: str, prefix: str, suffix: str = "", user: str = "{input}"):
+        self.name = name
+        self.prefix = prefix.strip()
+        self.suffix = suffix.strip()
+        self.user = user
+        self.system_fields = _field_names(self.suffix)
+        self.user_fields = _field_names(self.user)
+        self.prefix_tokens = estimate_tokens(self.prefix)
+        self._render_system = lru_cache(maxsize=PROMPT_RENDER_CACHE_SIZE)(self._build_system)
+
+    def _build_system(self, values: Tuple[Tuple[str, Any], ...]) -> str:
+        if not self.suffix:
+            return self.prefix
+        return f"{self.prefix}\n\n{self.suffix.format_map(dict(values))}"
+
+    def _check(self, fields: FrozenSet[str], values: Dict[str, Any]) -> None:
+        missing = fields - values.keys()
+        if missing:
+            raise KeyError(f"프롬프트 '{self.name}' 에 필요한 값이 없습니다: {sorted(missing)}")
+
+    def system(self, **values) -> str:
+        """시스템 메시지 (고정 접두사가 항상 맨 앞)"""
+        self._check(self.system_fields, values)
+        return self._render_system(tuple(sorted((k, values[k]) for k in self.system_fields)))
+
+    def user_text(self, **values) -> str:
+        """사용자 메시지"""
+        self._check(self.user_fields, values)
+        return self.user.format_map(values)
+
+    def messages(self, **values) -> list:
+        """[SystemMessage, HumanMessage] (LangChain 메시지)"""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        return [
+            SystemMessage(content=self.system(**values)),
+            HumanMessage(content=self.user_text(**values)),
+        ]
+
+    @property
+    def cacheable(self) -> bool:
+        """고정 접두사가 공급자 캐시 최소 길이를 넘는지"""
+        return self.prefix_tokens >= PROMPT_CACHE_MIN_TOKENS
+
+
+@dataclass
+class PromptStats:
+    """템플릿별 누적 사용량"""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+
+    @property
+    def cached_ratio(self) -> float:
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
+class PromptRegistry:
+    """이름으로 템플릿을 찾고 템플릿별 캐시 적중 토큰 비율을 집계"""
+
+    def __init__(self):
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._stats: Dict[str, PromptStats] = {}
+        self._lock = threading.Lock()
+
+    def register(self, template: PromptTemplate) -> PromptTemplate:
+        """템플릿 등록 (같은 이름이면 교체, 통계는 유지)"""
+        with self._lock:
+            self._templates[template.name] = template
+            self._stats.setdefault(template.name, PromptStats())
+        if not template.cacheable:
+            logger.debug(
+                f"PromptRegistry.register() - 접두사가 짧아 공급자 캐시 대상 아님: "
+                f"{template.name}, prefix_tokens={template.prefix_tokens}"
+            )
+        return template
+
+    def get(self, name: str) -> PromptTemplate:
+        return self._templates[name]
+
+    def record(self, name: str, usage: Optional[TokenUsage]) -> None:
+        """템플릿으로 만든 호출 한 번의 토큰 사용량 기록"""
+        with self._lock:
+            stats = self._stats.setdefault(name, PromptStats())
+            stats.calls += 1
+            if usage is not None:
+                stats.prompt_tokens += usage.prompt_tokens
+                stats.cached_tokens += usage.cached_tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            templates: List[Dict[str, Any]] = []
+            for name, template in sorted(self._templates.items()):
+                stats = self._stats[name]
+                info = template._render_system.cache_info()
+                templates.append({
+                    "name": name,
+                    "prefix_tokens": template.prefix_tokens,
+                    "cacheable": template.cacheable,
+                    "calls": stats.calls,
+                    "prompt_tokens": stats.prompt_tokens,
+                    "cached_tokens": stats.cached_tokens,
+                    "cached_ratio": round(stats.cached_ratio, 3),
+                    "render_cache_hits": info.hits,
+                    "render_cache_misses": info.misses,
+                })
+            total = PromptStats(
+                calls=sum(s.calls for s in self._stats.values()),
+                prompt_tokens=sum(s.prompt_tokens for s in self._stats.values()),
+                cached_tokens=sum(s.cached_tokens for s in self._stats.values()),
+            )
+        return {
+            "min_cacheable_tokens": PROMPT_CACHE_MIN_TOKENS,
+            "cached_ratio": round(total.cached_ratio, 3),
+            "templates": templates,
+        }
+
+
+_default_registry: Optional[PromptRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """프로세스 공용 프롬프트 레지스트리"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = PromptRegistry()
+    return _default_registry
+
+
+def register_prompt(name: str, prefix: str, suffix: str = "", user: str = "{input}") -> PromptTemplate:
+    """공용 레지스트리에 템플릿 등록 (모듈 상수로 받아 두고 사용)"""
+    return get_prompt_registry().register(PromptTemplate(name, prefix, suffix, user))
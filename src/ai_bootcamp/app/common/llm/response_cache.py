@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+LLM 응답 캐시 - 정확 일치(exact) 계층 + 임베딩 유사도(semantic) 계층 (선택)
+
+- exact: (모델, 시스템 프롬프트, 메시지, 파라미터) 해시 키로 조회
+- semantic: 같은 (모델, 시스템 프롬프트, 이전 대화, 파라미터) 안에서 마지막 사용자 프롬프트 임베딩의
+  코사인 유사도가 임계값 이상이면 캐시된 응답 재사용 (embedder 가 있을 때만).
+  비교는 파티션별 numpy 행렬 곱 한 번으로 하고, 잠금 밖에서 계산한다.
+- 두 계층 모두 SQLite 영속화, TTL 만료, 크기 제한(LRU) 제거를 지원하고
+  적중률 / 절약한 토큰 수를 집계한다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_DB = os.getenv(
+    "LLM_CACHE_DB", str(Path(__file__).parent.parent.parent.parent / "resources" / "data" / "llm_cache.db")
+)
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_SEMANTIC_CACHE = os.getenv("LLM_SEMANTIC_CACHE", "false").lower() == "true"
+LLM_SEMANTIC_THRESHOLD = float(os.getenv("LLM_SEMANTIC_THRESHOLD", "0.95"))
+# 마지막 접근 시각은 이 간격(초)보다 자주 기록하지 않음 (적중마다 SQLite 쓰기 방지)
+LLM_CACHE_TOUCH_INTERVAL = float(os.getenv("LLM_CACHE_TOUCH_INTERVAL", "60"))
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+@dataclass
+class CachedCompletion:
+    """캐시된 LLM 응답"""
+
+    content: str
+    total_tokens: int
+    created_at: float
+    expires_at: float
+    # 조회 계층 ("exact" / "semantic")
+    tier: str = "exact"
+
+
+def make_cache_key(
+    model: str,
+    system_prompt: str,
+    messages: Sequence[Tuple[str, str]],
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """(모델, 시스템 프롬프트, 메시지, 파라미터) 정규화 JSON 의 해시"""
+    payload = json.dumps(
+        [model, system_prompt, [list(m) for m in messages], params or {}],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _partition_key(
+    model: str,
+    system_prompt: str,
+    messages: Sequence[Tuple[str, str]],
+    params: Optional[Dict[str, Any]],
+) -> str:
+    """semantic 계층 비교 범위 (모델 / 시스템 프롬프트 / 이전 대화 / 파라미터가 같은 항목끼리만 비교)
+
+    마지막 메시지만 임베딩하므로 이전 대화(messages[:-1])가 다르면 다른 파티션이다.
+    ("두 번째 것은?" 같은 후속 질문이 다른 대화의 응답에 적중하지 않도록)
+    """
+    return "semantic:" + make_cache_key(model, system_prompt, messages[:-1], params)
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(vector)) or 1.0
+    return vector / norm
+
+
+@dataclass
+class _Partition:
+    """한 파티션의 임베딩 (조회용 행렬은 변경 후 처음 조회할 때 다시 만듦)"""
+
+    vectors: Dict[str, np.ndarray] = field(default_factory=dict)
+    keys: List[str] = field(default_factory=list)
+    matrix: Optional[np.ndarray] = None
+
+    def snapshot(self) -> Tuple[List[str], Optional[np.ndarray]]:
+        # 만든 행렬은 수정하지 않고 교체만 하므로 잠금 밖에서 읽어도 안전
+        if self.matrix is None and self.vectors:
+            self.keys = list(self.vectors)
+            self.matrix = np.stack([self.vectors[key] for key in self.keys])
+        return self.keys, self.matrix
+
+
+class LLMResponseCache:
+    """exact + semantic 2계층 LLM 응답 캐시 (메모리 LRU + SQLite 영속화)"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = LLM_CACHE_DB,
+        ttl: float = LLM_CACHE_TTL,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        embedder: Optional[Embedder] = None,
+        similarity_threshold: float = LLM_SEMANTIC_THRESHOLD,
+    ):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+
+        self._entries: "OrderedDict[str, CachedCompletion]" = OrderedDict()
+        # semantic 계층: (partition, 차원) -> 임베딩 / key -> (partition, 차원)
+        self._partitions: Dict[Tuple[str, int], _Partition] = {}
+        self._vector_partitions: Dict[str, Tuple[str, int]] = {}
+        # key -> 마지막으로 last_access 를 기록한 시각
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+        if self.db_path:
+            self.init_database()
+            self._load()
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.embedder is not None
+
+    # ---------- 영속화 ----------
+    def init_database(self):
+        """캐시 테이블 초기화"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    partition_key TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    total_tokens INTEGER NOT NULL DEFAULT 0,
+                    embedding BLOB,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache (last_access)"
+            )
+            conn.commit()
+
+    def _load(self) -> None:
+        """만료되지 않은 최근 항목을 메모리로 적재"""
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+            rows = conn.execute(
+                """
+                SELECT cache_key, partition_key, content, total_tokens, embedding, created_at, expires_at
+                FROM llm_cache ORDER BY last_access DESC LIMIT ?
+            """,
+                (self.max_entries,),
+            ).fetchall()
+            conn.commit()
+
+        for key, partition, content, tokens, embedding, created_at, expires_at in reversed(rows):
+            self._entries[key] = CachedCompletion(content, tokens, created_at, expires_at)
+            if embedding:
+                self._add_vector(key, partition, np.frombuffer(embedding, dtype=np.float32))
+        logger.info(
+            f"LLMResponseCache._load() - 캐시 적재: entries={len(self._entries)}, vectors={len(self._vector_partitions)}"
+        )
+
+    def _persist(self, key: str, partition: str, entry: CachedCompletion, vector: Optional[np.ndarray]) -> None:
+        if not self.db_path:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache
+                (cache_key, partition_key, content, total_tokens, embedding, created_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    key,
+                    partition,
+                    entry.content,
+                    entry.total_tokens,
+                    vector.tobytes() if vector is not None else None,
+                    entry.created_at,
+                    entry.expires_at,
+                    entry.created_at,
+                ),
+            )
+            # 디스크도 max_entries 로 제한 (가장 오래 사용하지 않은 항목부터 삭제)
+            conn.execute(
+                """
+                DELETE FROM llm_cache WHERE last_access < (
+                    SELECT last_access FROM llm_cache ORDER BY last_access DESC LIMIT 1 OFFSET ?
+                )
+            """,
+                (self.max_entries - 1,),
+            )
+            conn.commit()
+
+    def _should_touch(self, key: str, entry: CachedCompletion, now: float) -> bool:
+        """last_access 를 기록할 차례인지 (잠금 안에서 호출)"""
+        if not self.db_path or now - self._touched.get(key, entry.created_at) < LLM_CACHE_TOUCH_INTERVAL:
+            return False
+        self._touched[key] = now
+        return True
+
+    def _touch(self, key: str, now: float) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE llm_cache SET last_access = ? WHERE cache_key = ?", (now, key))
+            conn.commit()
+
+    def _add_vector(self, key: str, partition: str, vector: np.ndarray) -> None:
+        self._remove_vector(key)
+        # 임베딩 모델이 바뀌어 차원이 다른 벡터는 같은 행렬에 섞지 않음
+        bucket_key = (partition, vector.shape[0])
+        bucket = self._partitions.setdefault(bucket_key, _Partition())
+        bucket.vectors[key] = vector
+        bucket.matrix = None
+        self._vector_partitions[key] = bucket_key
+
+    def _remove_vector(self, key: str) -> None:
+        bucket_key = self._vector_partitions.pop(key, None)
+        if bucket_key is None:
+            return
+        bucket = self._partitions[bucket_key]
+        bucket.vectors.pop(key, None)
+        bucket.matrix = None
+        if not bucket.vectors:
+            del self._partitions[bucket_key]
+
+    def _forget(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._remove_vector(key)
+        self._touched.pop(key, None)
+
+    def _delete(self, keys: List[str]) -> None:
+        for key in keys:
+            self._forget(key)
+        if self.db_path and keys:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "DELETE FROM llm_cache WHERE cache_key = ?", [(k,) for k in keys]
+                )
+                conn.commit()
+
+    # ---------- 조회 / 저장 ----------
+    def get(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: Sequence[Tuple[str, str]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[CachedCompletion]:
+        """exact -> semantic 순서로 캐시 조회"""
+        key = make_cache_key(model, system_prompt, messages, params)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at < now:
+                self._delete([key])
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.exact_hits += 1
+                self.tokens_saved += entry.total_tokens
+                touch = self._should_touch(key, entry, now)
+        if entry is not None:
+            if touch:
+                self._touch(key, now)
+            return entry
+
+        if self.semantic_enabled and messages:
+            hit = self._semantic_lookup(
+                _partition_key(model, system_prompt, messages, params), messages[-1][1], now
+            )
+            if hit is not None:
+                return hit
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _semantic_lookup(self, partition: str, prompt: str, now: float) -> Optional[CachedCompletion]:
+        try:
+            query = _normalize(self.embedder(prompt))
+        except Exception as e:
+            logger.warning(f"LLMResponseCache._semantic_lookup() - 임베딩 오류, semantic 계층 생략: {e}")
+            return None
+
+        with self._lock:
+            bucket = self._partitions.get((partition, query.shape[0]))
+            keys, matrix = bucket.snapshot() if bucket else ([], None)
+        if matrix is None:
+            return None
+
+        # 행렬 곱 한 번으로 파티션 전체 코사인 유사도 계산 (잠금 밖)
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        best_key, best_score = keys[best], float(scores[best])
+        if best_score < self.similarity_threshold:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(best_key)
+            if entry is None or entry.expires_at < now:
+                return None
+            self._entries.move_to_end(best_key)
+            self.semantic_hits += 1
+            self.tokens_saved += entry.total_tokens
+            touch = self._should_touch(best_key, entry, now)
+        if touch:
+            self._touch(best_key, now)
+        logger.info(f"LLMResponseCache._semantic_lookup() - semantic 적중: score={best_score:.3f}")
+        return CachedCompletion(
+            entry.content, entry.total_tokens, entry.created_at, entry.expires_at, tier="semantic"
+        )
+
+    def put(
+        self,
+        model: str,
+        system_prompt: str,
+        messages: Sequence[Tuple[str, str]],
+        content: str,
+        total_tokens: int = 0,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """응답 저장 (semantic 계층이 켜져 있으면 마지막 사용자 프롬프트 임베딩도 저장)"""
+        key = make_cache_key(model, system_prompt, messages, params)
+        partition = _partition_key(model, system_prompt, messages, params)
+        now = time.time()
+        entry = CachedCompletion(content, total_tokens, now, now + (ttl or self.ttl))
+
+        vector = None
+        if self.semantic_enabled and messages:
+            try:
+                vector = _normalize(self.embedder(messages[-1][1]))
+            except Exception as e:
+                logger.warning(f"LLMResponseCache.put() - 임베딩 오류, exact 계층만 저장: {e}")
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._touched.pop(key, None)
+            if vector is not None:
+                self._add_vector(key, partition, vector)
+            else:
+                self._remove_vector(key)
+            while len(self._entries) > self.max_entries:
+                self._forget(next(iter(self._entries)))
+            self._persist(key, partition, entry, vector)
+
+    async def aget(self, *args: Any, **kwargs: Any) -> Optional[CachedCompletion]:
+        """get() 의 비동기 버전 (임베딩 / 디스크 I/O 를 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get, *args, **kwargs)
+
+    async def aput(self, *args: Any, **kwargs: Any) -> None:
+        """put() 의 비동기 버전 (임베딩 / 디스크 I/O 를 스레드에서 실행)"""
+        await asyncio.to_thread(self.put, *args, **kwargs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._partitions.clear()
+            self._vector_partitions.clear()
+            self._touched.clear()
+            if self.db_path:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute("DELETE FROM llm_cache")
+                    conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        hits = self.exact_hits + self.semantic_hits
+        return {
+            "entries": len(self._entries),
+            "semantic_enabled": self.semantic_enabled,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "tokens_saved": self.tokens_saved,
+        }
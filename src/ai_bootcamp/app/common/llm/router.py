@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Model Router
+여러 LLM 백엔드(OpenAI 모델 / Azure OpenAI 배포 / Anthropic) 중 요청마다 하나를 고르는 라우터
+
+- 선택: 백엔드별 실시간 지연 시간(EWMA) 과 오류율(EWMA) 로 점수를 매겨 가장 빠른 백엔드부터 시도하고,
+  서킷이 열린 백엔드는 건너뛴다. 일부 요청(LLM_ROUTER_EXPLORE)은 다른 백엔드로 보내 통계를 갱신한다.
+- 헤징: 1순위 백엔드가 p95 지연 시간 안에 응답하지 않으면 2순위 백엔드에 같은 요청을 한 번 더 보내고
+  먼저 성공한 응답을 사용한다 (나머지는 취소).
+- 장애 전환: 백엔드 호출이 실패하면 (스케줄러 재시도 없이) 다음 백엔드로 바로 넘어간다.
+  마지막 후보만 스케줄러의 일반 재시도를 적용한다.
+
+백엔드는 LangChain 채팅 모델로 통일하므로 ChatDemo / LangChainChatDemo 모두 model="auto" 로 선택할 수 있다.
+OpenAI 백엔드는 공용 스케줄러(API 키 단위 한도)를, 그 외 공급자는 공급자별 스케줄러를 사용한다.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from .scheduler import (DEFAULT_COMPLETION_TOKENS, PRIORITY_DEFAULT, CircuitOpenError,
+                        LLMScheduler, get_scheduler)
+from .telemetry import langchain_usage
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ChatDemo / LangChainChatDemo 에서 라우터를 선택하는 모델 이름
+ROUTER_MODEL = "auto"
+
+# 백엔드 목록 ("공급자:모델" 쉼표 구분, 예: openai:gpt-4o-mini,azure:my-deployment,anthropic:claude-3-5-haiku-latest)
+LLM_ROUTER_BACKENDS = os.getenv("LLM_ROUTER_BACKENDS", "")
+LLM_ROUTER_HEDGING = os.getenv("LLM_ROUTER_HEDGING", "true").lower() == "true"
+# 통계가 부족할 때 쓰는 헤지 대기 시간 / 헤지 대기 시간 하한(초)
+LLM_ROUTER_HEDGE_DELAY = float(os.getenv("LLM_ROUTER_HEDGE_DELAY", "2.0"))
+LLM_ROUTER_HEDGE_MIN_DELAY = float(os.getenv("LLM_ROUTER_HEDGE_MIN_DELAY", "0.3"))
+# p95 를 신뢰하기 위한 최소 표본 수
+LLM_ROUTER_MIN_SAMPLES = int(os.getenv("LLM_ROUTER_MIN_SAMPLES", "20"))
+LLM_ROUTER_EXPLORE = float(os.getenv("LLM_ROUTER_EXPLORE", "0.05"))
+
+
+@dataclass
+class BackendStats:
+    """백엔드별 실시간 통계 (최근 지연 시간 창 + EWMA)"""
+
+    EWMA_ALPHA = 0.2
+    # 오류율 1.0 이면 지연 시간 점수를 (1 + ERROR_PENALTY) 배로 취급
+    ERROR_PENALTY = 4.0
+
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=200))
+    ewma_latency: float = 0.0
+    ewma_error: float = 0.0
+    calls: int = 0
+    errors: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+    def record(self, latency: Optional[float], ok: bool) -> None:
+        self.calls += 1
+        self.ewma_error += self.EWMA_ALPHA * ((0.0 if ok else 1.0) - self.ewma_error)
+        if not ok:
+            self.errors += 1
+            return
+        self.latencies.append(latency)
+        if len(self.latencies) == 1:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += self.EWMA_ALPHA * (latency - self.ewma_latency)
+
+    def p95(self) -> Optional[float]:
+        if len(self.latencies) < LLM_ROUTER_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def score(self, prior: float) -> float:
+        """낮을수록 우선 (표본이 없으면 prior 사용)"""
+        latency = self.ewma_latency if self.latencies else prior
+        return latency * (1.0 + self.ERROR_PENALTY * self.ewma_error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        p95 = self.p95()
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": round(self.ewma_error, 3),
+            "ewma_latency_ms": round(self.ewma_latency * 1000, 1),
+            "p95_latency_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+@dataclass
+class ModelBackend:
+    """라우팅 대상 백엔드 (LangChain 채팅 모델 + 호출 한도를 관리하는 스케줄러)"""
+
+    name: str
+    provider: str
+    model_name: str
+    chat_model: Any
+    scheduler: LLMScheduler
+    stats: BackendStats = field(default_factory=BackendStats)
+
+    @property
+    def available(self) -> bool:
+        return self.scheduler.breaker.available
+
+
+class ModelRouter:
+    """지연 시간 / 오류율 기반 백엔드 선택 + p95 헤징 + 장애 전환"""
+
+    def __init__(
+        self,
+        backends: List[ModelBackend],
+        hedging: bool = LLM_ROUTER_HEDGING,
+        hedge_delay: float = LLM_ROUTER_HEDGE_DELAY,
+        explore: float = LLM_ROUTER_EXPLORE,
+    ):
+        if not backends:
+            raise ValueError("라우팅할 LLM 백엔드가 없습니다.")
+        self.backends = backends
+        self.hedging = hedging
+        self.hedge_delay = hedge_delay
+        self.explore = explore
+        self._lock = threading.Lock()
+
+    # ---------- 후보 선택 ----------
+    def candidates(self) -> List[ModelBackend]:
+        """시도 순서 (서킷이 열린 백엔드 제외, 점수 낮은 순 / 동점이면 설정 순서)"""
+        available = [b for b in self.backends if b.available]
+        with self._lock:
+            ranked = sorted(
+                available,
+                key=lambda b: (b.stats.score(self.hedge_delay), self.backends.index(b)),
+            )
+        if len(ranked) > 1 and random.random() < self.explore:
+            # 탐색: 1순위가 아닌 백엔드를 앞으로 (통계가 오래되지 않도록)
+            ranked.insert(0, ranked.pop(random.randrange(1, len(ranked))))
+        return ranked
+
+    def pick(self) -> ModelBackend:
+        """스트리밍 등 단일 백엔드가 필요한 경우의 1순위 백엔드"""
+        ranked = self.candidates()
+        if not ranked:
+            raise CircuitOpenError(1.0)
+        return ranked[0]
+
+    def _hedge_after(self, backend: ModelBackend) -> float:
+        p95 = backend.stats.p95()
+        return max(LLM_ROUTER_HEDGE_MIN_DELAY, p95 if p95 is not None else self.hedge_delay)
+
+    def _record(self, backend: ModelBackend, latency: Optional[float], ok: bool) -> None:
+        with self._lock:
+            backend.stats.record(latency, ok)
+
+    # ---------- 호출 ----------
+    async def _attempt(
+        self,
+        backend: ModelBackend,
+        func: Callable[[ModelBackend], Awaitable[T]],
+        estimated_tokens: float,
+        priority: int,
+        usage_of: Callable[[T], Any],
+        last: bool,
+    ) -> T:
+        started = time.monotonic()
+        try:
+            result = await backend.scheduler.acall(
+                lambda: func(backend),
+                estimated_tokens=estimated_tokens,
+                priority=priority,
+                usage_of=usage_of,
+                model=backend.model_name,
+                # 다음 후보가 있으면 재시도하지 않고 바로 넘김
+                max_retries=None if last else 0,
+            )
+        except asyncio.CancelledError:
+            # 헤지 경쟁에서 진 호출 - 오류로 집계하지 않음
+            raise
+        except Exception:
+            self._record(backend, None, ok=False)
+            raise
+        self._record(backend, time.monotonic() - started, ok=True)
+        return result
+
+    async def acall(
+        self,
+        func: Callable[[ModelBackend], Awaitable[T]],
+        estimated_tokens: float = DEFAULT_COMPLETION_TOKENS,
+        priority: int = PRIORITY_DEFAULT,
+        usage_of: Callable[[T], Any] = langchain_usage,
+    ) -> T:
+        """func(backend) 를 라우팅해서 호출 (헤징 + 장애 전환)
+
+        func 는 백엔드를 받아 새 코루틴을 만드는 함수 (예: lambda b: b.chat_model.ainvoke(messages)).
+        """
+        queue = self.candidates()
+        if not queue:
+            raise CircuitOpenError(1.0)
+
+        pending: Dict[asyncio.Task, ModelBackend] = {}
+        hedged = False
+        last_error: Optional[BaseException] = None
+
+        def launch() -> ModelBackend:
+            backend = queue.pop(0)
+            task = asyncio.ensure_future(
+                self._attempt(backend, func, estimated_tokens, priority, usage_of, last=not queue)
+            )
+            pending[task] = backend
+            return backend
+
+        primary = launch()
+        deadline: Optional[float] = self._hedge_after(primary) if self.hedging and queue else None
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=deadline, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # p95 안에 응답이 없으면 다음 백엔드로 헤지 요청 (한 번만)
+                    deadline = None
+                    if queue:
+                        hedged = True
+                        with self._lock:
+                            primary.stats.hedges += 1
+                        backup = launch()
+                        logger.info(
+                            f"ModelRouter.acall() - 헤지 요청: {primary.name} 지연 -> {backup.name}"
+                        )
+                    continue
+
+                for task in done:
+                    backend = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        if hedged and backend is not primary:
+                            with self._lock:
+                                backend.stats.hedge_wins += 1
+                        return task.result()
+                    last_error = error
+                    logger.warning(
+                        f"ModelRouter.acall() - 백엔드 실패: {backend.name}, {type(error).__name__}: {error}"
+                    )
+                # 실행 중인 요청이 없으면 다음 백엔드로 장애 전환
+                if not pending and queue:
+                    primary = launch()
+                    deadline = self._hedge_after(primary) if self.hedging and queue and not hedged else None
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                # 진 헤지 요청은 대개 스케줄러 대기열에 있으므로, 취소 처리(시험 호출 / 허가 반환)가
+                # 끝난 뒤 반환해야 half_open 백엔드가 후보에서 빠진 채로 남지 않는다
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def call(
+        self,
+        func: Callable[[ModelBackend], T],
+        estimated_tokens: float = DEFAULT_COMPLETION_TOKENS,
+        priority: int = PRIORITY_DEFAULT,
+        usage_of: Callable[[T], Any] = langchain_usage,
+    ) -> T:
+        """동기 호출 (헤징 없이 장애 전환만)"""
+        queue = self.candidates()
+        if not queue:
+            raise CircuitOpenError(1.0)
+        last_error: Optional[BaseException] = None
+        for index, backend in enumerate(queue):
+            started = time.monotonic()
+            try:
+                result = backend.scheduler.call(
+                    lambda: func(backend),
+                    estimated_tokens=estimated_tokens,
+                    priority=priority,
+                    usage_of=usage_of,
+                    model=backend.model_name,
+                    max_retries=None if index == len(queue) - 1 else 0,
+                )
+            except Exception as e:
+                self._record(backend, None, ok=False)
+                logger.warning(f"ModelRouter.call() - 백엔드 실패: {backend.name}, {type(e).__name__}: {e}")
+                last_error = e
+                continue
+            self._record(backend, time.monotonic() - started, ok=True)
+            return result
+        raise last_error
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hedging": self.hedging,
+                "backends": [
+                    {
+                        "name": b.name,
+                        "available": b.available,
+                        "circuit": b.scheduler.breaker.state,
+                        **b.stats.to_dict(),
+                    }
+                    for b in self.backends
+                ],
+            }
+
+    # ---------- 환경 변수 기반 구성 ----------
+    @classmethod
+    def from_env(cls, registry=None) -> "ModelRouter":
+        """LLM_ROUTER_BACKENDS (없으면 기본 OpenAI 모델 + 설정된 Azure / Anthropic) 로 라우터 생성
+
+        registry(LLMClientRegistry) 가 있으면 OpenAI 백엔드는 풀링된 ChatOpenAI 를 재사용한다.
+        """
+        specs = [s.strip() for s in LLM_ROUTER_BACKENDS.split(",") if s.strip()]
+        if not specs:
+            specs = [f"openai:{os.getenv('OPENAI_MODEL', 'gpt-4o-mini')}"]
+            if os.getenv("AZURE_OPENAI_API_KEY") and os.getenv("AZURE_OPENAI_DEPLOYMENT"):
+                specs.append(f"azure:{os.environ['AZURE_OPENAI_DEPLOYMENT']}")
+            if os.getenv("ANTHROPIC_API_KEY"):
+                specs.append(f"anthropic:{os.getenv('ANTHROPIC_MODEL', 'claude-3-5-haiku-latest')}")
+
+        backends = []
+        for spec in specs:
+            provider, _, model = spec.partition(":")
+            try:
+                backends.append(_build_backend(provider.lower(), model, registry))
+            except Exception as e:
+                # 선택 의존성이 없거나 설정이 빠진 공급자는 제외
+                logger.warning(f"ModelRouter.from_env() - 백엔드 제외: {spec}, {e}")
+        logger.info(f"ModelRouter.from_env() - 라우터 생성: backends={[b.name for b in backends]}")
+        return cls(backends)
+
+
+# 공급자별 스케줄러 (API 한도는 공급자 / 키 단위)
+_provider_schedulers: Dict[str, LLMScheduler] = {}
+_provider_lock = threading.Lock()
+
+
+def _provider_scheduler(provider: str) -> LLMScheduler:
+    if provider == "openai":
+        return get_scheduler()
+    with _provider_lock:
+        if provider not in _provider_schedulers:
+            prefix = provider.upper()
+            _provider_schedulers[provider] = LLMScheduler(
+                rpm=float(os.getenv(f"{prefix}_RPM", "500")),
+                tpm=float(os.getenv(f"{prefix}_TPM", "200000")),
+            )
+        return _provider_schedulers[provider]
+
+
+def _build_backend(provider: str, model: str, registry=None) -> ModelBackend:
+    """공급자별 LangChain 채팅 모델 생성 (재시도는 스케줄러 / 라우터가 담당)"""
+    if provider == "openai":
+        if registry is not None:
+            chat_model = registry.get_chat_model(model)
+        else:
+            from langchain_openai import ChatOpenAI
+
+            chat_model = ChatOpenAI(
+                model=model,
+                api_key=os.getenv("OPENAI_API_KEY"),
+                max_retries=0,
+                stream_usage=True,
+            )
+    elif provider == "azure":
+        from langchain_openai import AzureChatOpenAI
+
+        chat_model = AzureChatOpenAI(
+            azure_deployment=model,
+            azure_endpoint=os.environ["AZURE_OPENAI_ENDPOINT"],
+            api_version=os.environ["AZURE_OPENAI_API_VERSION"],
+            api_key=os.environ["AZURE_OPENAI_API_KEY"],
+            max_retries=0,
+            stream_usage=True,
+        )
+    elif provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        chat_model = ChatAnthropic(
+            model=model, api_key=os.environ["ANTHROPIC_API_KEY"], max_retries=0
+        )
+    else:
+        raise ValueError(f"지원하지 않는 공급자: {provider}")
+    return ModelBackend(
+        name=f"{provider}:{model}",
+        provider=provider,
+        model_name=model,
+        chat_model=chat_model,
+        scheduler=_provider_scheduler(provider),
+    )
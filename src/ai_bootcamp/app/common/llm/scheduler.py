@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+LLM Call Scheduler
+OpenAI 호출 공용 스케줄러 - RPM / TPM 토큰 버킷 + 동시 호출 수 제한 + 우선순위 대기열
++ 429 / 5xx 지수 백오프(jitter) 재시도 + 서킷 브레이커
+
+ChatDemo, LangChainChatDemo, ChatImage, 멀티 에이전트 노드가 모두 프로세스 공용 스케줄러
+(get_scheduler()) 를 거쳐 호출하므로, 순간적으로 요청이 몰려도 API 한도를 넘기지 않고
+대기 / 재시도 / 빠른 실패로 완만하게 성능이 떨어진다.
+모든 호출 시도의 토큰 사용량 / 지연 시간은 텔레메트리(telemetry.py) 에 기록된다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+# 사용량 추출 함수(langchain_usage / openai_usage)는 호출자가 telemetry 에서 직접 import
+from .telemetry import LLMTelemetry, TokenUsage, get_telemetry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+OPENAI_RPM = float(os.getenv("OPENAI_RPM", "500"))
+OPENAI_TPM = float(os.getenv("OPENAI_TPM", "200000"))
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_BATCH = 10
+
+# 응답 토큰 기본 예상치 (max_tokens 를 모를 때)
+DEFAULT_COMPLETION_TOKENS = 256
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "ConnectError",
+    "ReadTimeout",
+    "RemoteProtocolError",
+}
+
+# 대기열 선두가 아닌 호출자의 상태 확인 주기(초)
+_POLL_INTERVAL = 0.05
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM API 서킷 브레이커 열림 - {retry_after:.1f}초 후 재시도")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """분당 한도(rate_per_minute) 토큰 버킷 (잠금은 호출자가 관리)"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount 를 쓸 수 있을 때까지 남은 시간(초)"""
+        self._refill()
+        # 버킷보다 큰 요청은 가득 찼을 때 허용 (영원히 대기하지 않도록)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= amount
+
+    def adjust(self, delta: float) -> None:
+        """예상치와 실제 사용량 차이 보정 (양수면 반환, 음수면 추가 차감)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + delta)
+
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 호출을 차단 (closed -> open -> half_open -> closed)"""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """호출 허용 여부 확인 (True = 이 호출이 half_open 시험 호출 자격을 가짐)
+
+        True 를 받은 호출자는 결과를 record_success() / record_failure() 로 알리거나,
+        판정 없이 끝나면 (취소 / 재시도 불가 오류 / 429) 반드시 release_trial() 을 호출해야 한다.
+        """
+        with self._lock:
+            if self.state == "open":
+                remaining = self.opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(remaining)
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self.state == "half_open":
+                # half_open 에서는 시험 호출 하나만 허용
+                if self._trial_in_flight:
+                    raise CircuitOpenError(1.0)
+                self._trial_in_flight = True
+                return True
+            return False
+
+    @property
+    def available(self) -> bool:
+        """지금 호출하면 허용되는지 (상태는 바꾸지 않음 - 라우터 후보 선택용)"""
+        with self._lock:
+            if self.state == "open":
+                return self.opened_at + self.reset_timeout <= time.monotonic()
+            return not (self.state == "half_open" and self._trial_in_flight)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != "closed":
+                logger.info("CircuitBreaker - 서킷 닫힘 (호출 정상화)")
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(
+                        f"CircuitBreaker - 서킷 열림: failures={self.failures}, reset_timeout={self.reset_timeout}s"
+                    )
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def release_trial(self) -> None:
+        """재시도 불가 오류 등으로 결과를 판정하지 않은 시험 호출 반환"""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: float = field(compare=False)
+
+
+@dataclass
+class Permit:
+    """acquire() 로 받은 호출 허가 (release() 로 반환)"""
+
+    tokens: float
+    acquired_at: float = field(default_factory=time.monotonic)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """429 (한도 초과) 여부 - 장애가 아니므로 서킷 브레이커 실패로 세지 않음"""
+    return _status_code(error) == 429
+
+
+def is_retryable(error: BaseException) -> bool:
+    """429 / 5xx / 연결 오류 여부"""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES or isinstance(
+        error, (ConnectionError, TimeoutError)
+    )
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class LLMScheduler:
+    """RPM / TPM / 동시성 한도 + 우선순위 대기열 + 재시도 + 서킷 브레이커"""
+
+    def __init__(
+        self,
+        rpm: float = OPENAI_RPM,
+        tpm: float = OPENAI_TPM,
+        max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+        max_retries: int = OPENAI_MAX_RETRIES,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        breaker: Optional[CircuitBreaker] = None,
+        telemetry: Optional[LLMTelemetry] = None,
+    ):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker or CircuitBreaker()
+        self.telemetry = telemetry or get_telemetry()
+
+        self.in_flight = 0
+        self._queue: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+
+    # ---------- 허가 획득 / 반환 ----------
+    def _try_grant(self, waiter: _Waiter) -> Optional[float]:
+        """대기열 선두이고 한도가 남아 있으면 허가 (None = 허가, 그 외 = 대기 시간)"""
+        if self._queue[0] is not waiter:
+            return _POLL_INTERVAL
+        if self.in_flight >= self.max_concurrency:
+            return _POLL_INTERVAL
+        wait = max(self.requests.wait_time(1), self.tokens.wait_time(waiter.tokens))
+        if wait > 0:
+            return wait
+        self.requests.consume(1)
+        self.tokens.consume(waiter.tokens)
+        self.in_flight += 1
+        heapq.heappop(self._queue)
+        self._cond.notify_all()
+        return None
+
+    def acquire(self, tokens: float, priority: int = PRIORITY_DEFAULT) -> Permit:
+        """동기 호출자용 허가 획득 (한도가 생길 때까지 스레드 대기)"""
+        with self._cond:
+            waiter = _Waiter(priority, next(self._seq), tokens)
+            heapq.heappush(self._queue, waiter)
+            while True:
+                wait = self._try_grant(waiter)
+                if wait is None:
+                    return Permit(tokens)
+                self._cond.wait(timeout=wait)
+
+    async def aacquire(self, tokens: float, priority: int = PRIORITY_DEFAULT) -> Permit:
+        """비동기 호출자용 허가 획득 (이벤트 루프를 막지 않음)"""
+        with self._cond:
+            waiter = _Waiter(priority, next(self._seq), tokens)
+            heapq.heappush(self._queue, waiter)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_grant(waiter)
+                if wait is None:
+                    return Permit(tokens)
+                await asyncio.sleep(min(wait, _POLL_INTERVAL * 4))
+        except BaseException:
+            # 취소되면 대기열에서 제거
+            with self._cond:
+                if waiter in self._queue:
+                    self._queue.remove(waiter)
+                    heapq.heapify(self._queue)
+                    self._cond.notify_all()
+            raise
+
+    def release(self, permit: Permit, used_tokens: Optional[float] = None) -> None:
+        """허가 반환 (실제 사용 토큰을 알면 TPM 예상치 보정)"""
+        with self._cond:
+            self.in_flight -= 1
+            if used_tokens is not None:
+                self.tokens.adjust(permit.tokens - used_tokens)
+            self._cond.notify_all()
+
+    def _finish(
+        self,
+        permit: Permit,
+        started: float,
+        model: Optional[str],
+        usage: Optional[TokenUsage] = None,
+        ok: bool = True,
+    ) -> None:
+        """허가 반환 + 텔레메트리 기록"""
+        self.release(permit, usage.total_tokens if usage is not None else None)
+        self.telemetry.record(model, usage, time.monotonic() - started, ok)
+
+    # ---------- 재시도 포함 호출 ----------
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        # full jitter
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def record_error(self, error: BaseException, trial: bool = False) -> None:
+        """호출 오류를 서킷 브레이커에 반영
+
+        429 는 한도 초과일 뿐 장애가 아니므로 서킷을 열지 않고, 재시도 불가 오류(4xx 등)는
+        요청 자체의 문제이므로 세지 않는다. 두 경우 모두 시험 호출 자격만 반환한다.
+        """
+        if is_retryable(error) and not is_rate_limited(error):
+            self.breaker.record_failure()
+        elif trial:
+            self.breaker.release_trial()
+
+    def _on_error(
+        self, attempt: int, error: BaseException, max_retries: Optional[int] = None, trial: bool = False
+    ) -> Optional[float]:
+        """오류 처리 - 재시도하면 대기 시간, 아니면 None"""
+        self.record_error(error, trial)
+        if not is_retryable(error):
+            return None
+        max_retries = self.max_retries if max_retries is None else max_retries
+        if attempt >= max_retries or self.breaker.state == "open":
+            self.failures += 1
+            return None
+        self.retries += 1
+        delay = self._backoff(attempt, error)
+        logger.warning(
+            f"LLMScheduler - 재시도 {attempt + 1}/{max_retries}: {type(error).__name__}, {delay:.2f}s 후"
+        )
+        return delay
+
+    def _before_call(self) -> bool:
+        try:
+            return self.breaker.before_call()
+        except CircuitOpenError:
+            self.rejected += 1
+            raise
+
+    async def aacquire_checked(self, tokens: float, priority: int = PRIORITY_DEFAULT) -> Tuple[Permit, bool]:
+        """서킷 확인 + 허가 획득 (반환: 허가, 시험 호출 여부)
+
+        서킷을 먼저 확인해 열려 있으면 대기열에 들어가지 않고 바로 실패한다.
+        대기 중 취소 / 타임아웃되면 시험 호출 자격을 반환한다 (안 그러면 half_open 에서
+        _trial_in_flight 가 남아 이후 모든 호출이 CircuitOpenError 로 거절된다).
+        """
+        trial = self._before_call()
+        try:
+            return await self.aacquire(tokens, priority), trial
+        except BaseException:
+            if trial:
+                self.breaker.release_trial()
+            raise
+
+    def call(
+        self,
+        func: Callable[[], T],
+        estimated_tokens: float = DEFAULT_COMPLETION_TOKENS,
+        priority: int = PRIORITY_DEFAULT,
+        usage_of: Optional[Callable[[T], Optional[TokenUsage]]] = None,
+        model: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> T:
+        """동기 호출 (허가 획득 -> 호출 -> 429/5xx 재시도)
+
+        usage_of 는 응답에서 TokenUsage 를 추출하는 함수 (langchain_usage / openai_usage),
+        model 은 응답에 모델명이 없을 때(오류 등) 텔레메트리에 기록할 모델명,
+        max_retries 는 이번 호출에만 적용할 재시도 횟수 (라우터가 다른 백엔드로 넘길 때 0).
+        """
+        attempt = 0
+        while True:
+            trial = self._before_call()
+            try:
+                permit = self.acquire(estimated_tokens, priority)
+            except BaseException:
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            self.calls += 1
+            started = time.monotonic()
+            try:
+                result = func()
+            except BaseException as e:
+                self._finish(permit, started, model, ok=False)
+                if not isinstance(e, Exception):
+                    if trial:
+                        self.breaker.release_trial()
+                    raise
+                delay = self._on_error(attempt, e, max_retries, trial)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self._finish(permit, started, model, usage_of(result) if usage_of else None)
+            self.breaker.record_success()
+            return result
+
+    async def acall(
+        self,
+        func: Callable[[], Awaitable[T]],
+        estimated_tokens: float = DEFAULT_COMPLETION_TOKENS,
+        priority: int = PRIORITY_DEFAULT,
+        usage_of: Optional[Callable[[T], Optional[TokenUsage]]] = None,
+        model: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> T:
+        """비동기 호출 (func 는 호출할 때마다 새 코루틴을 만드는 함수)"""
+        attempt = 0
+        while True:
+            permit, trial = await self.aacquire_checked(estimated_tokens, priority)
+            self.calls += 1
+            started = time.monotonic()
+            try:
+                result = await func()
+            except asyncio.CancelledError:
+                self._finish(permit, started, model, ok=False)
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            except Exception as e:
+                self._finish(permit, started, model, ok=False)
+                delay = self._on_error(attempt, e, max_retries, trial)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._finish(permit, started, model, usage_of(result) if usage_of else None)
+            self.breaker.record_success()
+            return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": len(self._queue),
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "circuit": self.breaker.state,
+            "rpm_available": round(self.requests.tokens, 1),
+            "tpm_available": round(self.tokens.tokens),
+        }
+
+
+_default_scheduler: Optional[LLMScheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """프로세스 공용 스케줄러 (API 한도는 API 키 단위이므로 모든 호출자가 공유)"""
+    global _default_scheduler
+    if _default_scheduler is None:
+        with _default_lock:
+            if _default_scheduler is None:
+                _default_scheduler = LLMScheduler()
+    return _default_scheduler
+
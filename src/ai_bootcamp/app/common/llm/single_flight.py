@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Single-flight LLM Calls
+같은 순간에 들어온 동일한 LLM 호출을 한 번만 실행하고 결과를 모든 대기자에게 나눠 주는 계층
+
+- 키는 (모델, 메시지 role/content, 구조화 출력 스키마 등) 을 정규화한 JSON 의 SHA-256.
+- 첫 요청(leader)만 실제 호출을 별도 태스크로 실행하고, 나머지(follower)는 그 결과를 기다린다.
+  실패하면 같은 예외가 모든 대기자에게 전파된다 (실패 결과는 보관하지 않으므로 다음 요청은 새로 호출).
+- 대기자마다 자기 timeout 으로 기다리며, 한 대기자가 타임아웃 / 취소돼도 공유 호출은 계속된다.
+  마지막 대기자까지 떠나면 공유 호출도 취소한다 (클라이언트 연결 종료 시 API 비용 절약).
+- 응답 캐시(response_cache.py) 는 완료된 응답을 재사용하고, 이 계층은 아직 진행 중인 호출을 재사용한다.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_SINGLE_FLIGHT = os.getenv("LLM_SINGLE_FLIGHT", "true").lower() == "true"
+
+
+def single_flight_key(model: str, messages: Iterable[Tuple[str, Any]], **extra: Any) -> str:
+    """호출 식별 키 (같은 모델 + 같은 메시지 + 같은 추가 옵션이면 같은 키)"""
+    payload = json.dumps(
+        [model, [[role, content] for role, content in messages], extra],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _AsyncFlight:
+    task: "asyncio.Task"
+    waiters: int = 0
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    abandoned: int = 0
+
+
+class SingleFlight:
+    """진행 중인 동일 호출 병합 (비동기 / 스레드 모두 지원)"""
+
+    def __init__(self, enabled: bool = LLM_SINGLE_FLIGHT):
+        self.enabled = enabled
+        self.stats = SingleFlightStats()
+        self._async: Dict[Tuple[int, str], _AsyncFlight] = {}
+        self._sync: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+    async def acall(
+        self, key: str, func: Callable[[], Awaitable[T]], timeout: Optional[float] = None
+    ) -> T:
+        """key 로 진행 중인 호출이 있으면 그 결과를, 없으면 func() 를 실행한 결과를 반환
+
+        Raises:
+            asyncio.TimeoutError: 이 대기자의 timeout 초 안에 공유 호출이 끝나지 않음
+        """
+        if not self.enabled:
+            return await asyncio.wait_for(func(), timeout)
+
+        # 이벤트 루프가 다르면 태스크를 공유할 수 없으므로 루프별로 구분
+        flight_key = (id(asyncio.get_running_loop()), key)
+        flight = self._async.get(flight_key)
+        if flight is None:
+            flight = _AsyncFlight(asyncio.ensure_future(func()))
+            self._async[flight_key] = flight
+            flight.task.add_done_callback(lambda task: self._finish_async(flight_key, task))
+            self.stats.calls += 1
+        else:
+            self.stats.coalesced += 1
+            logger.info(f"SingleFlight.acall() - 진행 중인 호출에 합류: waiters={flight.waiters + 1}")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight.task), timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # 기다리는 요청이 없으면 공유 호출 취소. 취소가 끝나기 전에 들어온 요청이
+                # 죽어 가는 호출에 합류해 CancelledError 를 받지 않도록 먼저 목록에서 뺀다.
+                if self._async.get(flight_key) is flight:
+                    del self._async[flight_key]
+                self.stats.abandoned += 1
+                flight.task.cancel()
+
+    def _finish_async(self, flight_key: Tuple[int, str], task: "asyncio.Task") -> None:
+        if self._async.get(flight_key) is not None and self._async[flight_key].task is task:
+            del self._async[flight_key]
+        if not task.cancelled() and task.exception() is not None:
+            self.stats.errors += 1
+
+    def call(self, key: str, func: Callable[[], T], timeout: Optional[float] = None) -> T:
+        """동기 버전 (스레드풀에서 실행되는 호출용) - leader 스레드가 직접 실행
+
+        Raises:
+            concurrent.futures.TimeoutError: follower 가 timeout 초 안에 결과를 받지 못함
+        """
+        if not self.enabled:
+            return func()
+
+        with self._lock:
+            future = self._sync.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._sync[key] = future
+                self.stats.calls += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            try:
+                return future.result(timeout)
+            except concurrent.futures.TimeoutError:
+                self.stats.timeouts += 1
+                raise
+
+        try:
+            result = func()
+        except BaseException as e:
+            self.stats.errors += 1
+            self._release_sync(key)
+            future.set_exception(e)
+            raise
+        self._release_sync(key)
+        future.set_result(result)
+        return result
+
+    def _release_sync(self, key: str) -> None:
+        # 결과를 알리기 전에 먼저 빼야 이후 요청이 끝난 호출에 합류하지 않음
+        with self._lock:
+            self._sync.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.stats
+        requests = stats.calls + stats.coalesced
+        return {
+            "enabled": self.enabled,
+            "calls": stats.calls,
+            "coalesced": stats.coalesced,
+            "coalesced_ratio": round(stats.coalesced / requests, 3) if requests else 0.0,
+            "errors": stats.errors,
+            "timeouts": stats.timeouts,
+            "abandoned": stats.abandoned,
+            "in_flight": len(self._async) + len(self._sync),
+        }
+
+
+_default_single_flight: Optional[SingleFlight] = None
+_default_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """프로세스 공용 single-flight (스케줄러 / 텔레메트리와 마찬가지로 모든 호출자가 공유)"""
+    global _default_single_flight
+    if _default_single_flight is None:
+        with _default_lock:
+            if _default_single_flight is None:
+                _default_single_flight = SingleFlight()
+    return _default_single_flight
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+LLM Streaming
+LLM 토큰 스트림을 Server-Sent Events(SSE) 응답으로 전달하는 유틸리티 + 오프라인 테스트용 Mock 스트리머
+
+백프레셔: StreamingResponse 는 청크를 하나 보낼 때마다 send() 를 await 하고,
+서버(uvicorn)는 전송 버퍼가 차면 send() 를 대기시킨다. 제너레이터는 그때까지 다음 토큰을
+당겨오지 않으므로 느린 클라이언트에 맞춰 LLM 스트림 소비 속도도 함께 늦춰진다.
+"""
+
+import asyncio
+import logging
+import os
+import re
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from fastapi.responses import StreamingResponse
+
+from ..core.fast_json import dumps
+from .invocation import LLM_CALL_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+MOCK_STREAM_DELAY = float(os.getenv("MOCK_STREAM_DELAY", "0.03"))
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    # nginx 등 프록시 버퍼링 비활성화
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(data: Any, event: Optional[str] = None) -> bytes:
+    """SSE 이벤트 한 개를 바이트로 인코딩 (data 는 JSON 직렬화)"""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + dumps(data) + b"\n\n"
+
+
+async def mock_stream(text: str, delay: float = MOCK_STREAM_DELAY) -> AsyncIterator[str]:
+    """USE_MOCK=true 용 - 고정 응답을 단어 단위 토큰으로 나눠 지연을 두고 전달"""
+    for token in re.findall(r"\S+\s*", text):
+        await asyncio.sleep(delay)
+        yield token
+
+
+async def iterate_with_timeout(
+    chunks: AsyncIterator[str], timeout: Optional[float] = LLM_CALL_TIMEOUT
+) -> AsyncIterator[str]:
+    """다음 토큰을 timeout 초 안에 받지 못하면 asyncio.TimeoutError"""
+    iterator = chunks.__aiter__()
+    while True:
+        try:
+            chunk = await asyncio.wait_for(iterator.__anext__(), timeout)
+        except StopAsyncIteration:
+            return
+        yield chunk
+
+
+def sse_response(
+    chunks: AsyncIterator[str],
+    on_complete: Callable[[str], Dict[str, Any]],
+    timeout: Optional[float] = LLM_CALL_TIMEOUT,
+) -> StreamingResponse:
+    """토큰 스트림을 SSE 응답으로 변환
+
+    이벤트:
+        (기본) data: {"delta": "..."}   - 토큰 조각
+        event: done  data: on_complete(전체 텍스트)
+        event: error data: {"detail": "..."}
+    """
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        parts = []
+        try:
+            async for chunk in iterate_with_timeout(chunks, timeout):
+                if not chunk:
+                    continue
+                parts.append(chunk)
+                yield sse_event({"delta": chunk})
+            yield sse_event(on_complete("".join(parts)), event="done")
+        except asyncio.TimeoutError:
+            logger.error(f"sse_response() - 스트림 토큰 대기 시간 초과: {timeout}s")
+            yield sse_event({"detail": "응답 시간이 초과되었습니다."}, event="error")
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 - 상위 LLM 스트림도 함께 정리됨
+            logger.info("sse_response() - 클라이언트 연결 종료로 스트림 취소")
+            raise
+        except Exception as e:
+            logger.error(f"sse_response() - 스트림 오류: {e}")
+            yield sse_event({"detail": f"스트리밍 중 오류가 발생했습니다: {e}"}, event="error")
+
+    return StreamingResponse(
+        event_stream(), media_type="text/event-stream", headers=SSE_HEADERS
+    )
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+LLM Telemetry
+LLM 호출별 토큰 사용량 / 지연 시간 / 모델 집계 + 주기적 SQLite 롤업
+
+- 모든 호출은 공용 스케줄러(scheduler.py) 를 거치므로 스케줄러가 호출 결과를 record() 한다.
+- 집계 키는 (엔드포인트, 모델) 이며, 엔드포인트는 LLMTelemetryMiddleware 가 요청마다
+  contextvar 에 넣어 둔 ASGI scope 의 라우트 경로(/conversations/{conversation_id} 형태)로 정한다.
+- record() 는 잠금 한 번 + 카운터 덧셈만 하므로 호출 경로 부담이 작다.
+  디스크 쓰기는 백그라운드 스레드가 LLM_TELEMETRY_FLUSH_INTERVAL 초마다 분 단위 버킷으로 모아 한 번에 수행한다.
+"""
+
+import bisect
+import contextvars
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+LLM_TELEMETRY_DB = os.getenv(
+    "LLM_TELEMETRY_DB", str(Path(__file__).parent.parent.parent.parent / "resources" / "data" / "llm_telemetry.db")
+)
+LLM_TELEMETRY_FLUSH_INTERVAL = float(os.getenv("LLM_TELEMETRY_FLUSH_INTERVAL", "60"))
+LLM_TELEMETRY_BUCKET_SECONDS = int(os.getenv("LLM_TELEMETRY_BUCKET_SECONDS", "60"))
+
+# 요청 밖(스크립트, 백그라운드 작업)에서 호출된 경우의 엔드포인트 이름
+NO_ENDPOINT = "-"
+
+# 지연 시간 히스토그램 상한(초) - 백분위 추정 / Prometheus 히스토그램에 사용
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, float("inf"))
+
+_current_scope: contextvars.ContextVar[Optional[Scope]] = contextvars.ContextVar(
+    "llm_telemetry_scope", default=None
+)
+
+
+class TokenUsage(NamedTuple):
+    """LLM 응답 한 개의 토큰 사용량 (응답에 모델명이 있으면 함께 보관)
+
+    cached_tokens 는 prompt_tokens 중 공급자 측 프롬프트 캐시에서 재사용된 입력 토큰 수.
+    """
+
+    prompt_tokens: int
+    completion_tokens: int
+    model: Optional[str] = None
+    cached_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+@dataclass
+class UsageAggregate:
+    """(엔드포인트, 모델) 별 누적 집계"""
+
+    calls: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    latency_counts: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    def add(self, usage: Optional[TokenUsage], latency: float, ok: bool) -> None:
+        self.calls += 1
+        if not ok:
+            self.errors += 1
+        if usage is not None:
+            self.prompt_tokens += usage.prompt_tokens
+            self.completion_tokens += usage.completion_tokens
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_counts[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def percentile(self, q: float) -> float:
+        """히스토그램 기반 백분위 근사 (해당 버킷 상한, 마지막 버킷은 최대값)"""
+        if not self.calls:
+            return 0.0
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.latency_counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.prompt_tokens + self.completion_tokens,
+            "avg_latency_ms": round(self.latency_sum / self.calls * 1000, 1) if self.calls else 0.0,
+            "p50_latency_ms": round(self.percentile(0.5) * 1000, 1),
+            "p95_latency_ms": round(self.percentile(0.95) * 1000, 1),
+            "max_latency_ms": round(self.latency_max * 1000, 1),
+        }
+
+
+def current_endpoint() -> str:
+    """현재 요청의 라우트 경로 (라우팅 전이면 실제 경로, 요청 밖이면 NO_ENDPOINT)"""
+    scope = _current_scope.get()
+    if scope is None:
+        return NO_ENDPOINT
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", NO_ENDPOINT)
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+class LLMTelemetryMiddleware:
+    """요청의 ASGI scope 를 contextvar 에 넣어 LLM 호출을 엔드포인트별로 집계할 수 있게 함
+
+    Starlette 라우터가 같은 scope 에 매칭된 route 를 기록하므로,
+    호출 시점에 scope["route"].path 로 경로 템플릿을 얻을 수 있다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
+
+
+class LLMTelemetry:
+    """LLM 호출 텔레메트리 (메모리 누적 집계 + 분 단위 SQLite 롤업)"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = LLM_TELEMETRY_DB,
+        flush_interval: float = LLM_TELEMETRY_FLUSH_INTERVAL,
+        bucket_seconds: int = LLM_TELEMETRY_BUCKET_SECONDS,
+    ):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.bucket_seconds = bucket_seconds
+        self.started_at = time.time()
+
+        # 프로세스 시작 이후 누적 (메트릭 노출용)
+        self._totals: Dict[Tuple[str, str], UsageAggregate] = {}
+        # 아직 디스크에 쓰지 않은 (버킷 시작 시각, 엔드포인트, 모델) 별 집계
+        self._pending: Dict[Tuple[int, str, str], UsageAggregate] = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._db_ready = False
+
+    # ---------- 기록 ----------
+    def record(
+        self,
+        model: Optional[str],
+        usage: Optional[TokenUsage],
+        latency: float,
+        ok: bool = True,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """LLM 호출 한 번 기록 (usage 에 모델명이 있으면 우선 사용)"""
+        model = (usage.model if usage is not None and usage.model else model) or "unknown"
+        endpoint = endpoint or current_endpoint()
+        bucket = int(time.time()) // self.bucket_seconds * self.bucket_seconds
+        with self._lock:
+            total = self._totals.get((endpoint, model))
+            if total is None:
+                total = self._totals[(endpoint, model)] = UsageAggregate()
+            total.add(usage, latency, ok)
+            pending = self._pending.get((bucket, endpoint, model))
+            if pending is None:
+                pending = self._pending[(bucket, endpoint, model)] = UsageAggregate()
+            pending.add(usage, latency, ok)
+
+    # ---------- SQLite 롤업 ----------
+    def init_database(self) -> None:
+        """롤업 테이블 초기화"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_usage_rollup (
+                    bucket_start INTEGER NOT NULL,
+                    endpoint TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    calls INTEGER NOT NULL DEFAULT 0,
+                    errors INTEGER NOT NULL DEFAULT 0,
+                    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                    completion_tokens INTEGER NOT NULL DEFAULT 0,
+                    latency_ms_sum REAL NOT NULL DEFAULT 0,
+                    latency_ms_max REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (bucket_start, endpoint, model)
+                )
+            """
+            )
+            conn.commit()
+        self._db_ready = True
+
+    def flush(self) -> int:
+        """대기 중인 집계를 롤업 테이블에 합산 (같은 버킷이 이미 있으면 더함)"""
+        if not self.db_path:
+            return 0
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        rows = [
+            (
+                bucket,
+                endpoint,
+                model,
+                agg.calls,
+                agg.errors,
+                agg.prompt_tokens,
+                agg.completion_tokens,
+                agg.latency_sum * 1000,
+                agg.latency_max * 1000,
+            )
+            for (bucket, endpoint, model), agg in pending.items()
+        ]
+        try:
+            with self._db_lock:
+                if not self._db_ready:
+                    self.init_database()
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO llm_usage_rollup
+                        (bucket_start, endpoint, model, calls, errors, prompt_tokens,
+                         completion_tokens, latency_ms_sum, latency_ms_max)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (bucket_start, endpoint, model) DO UPDATE SET
+                            calls = calls + excluded.calls,
+                            errors = errors + excluded.errors,
+                            prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+                            completion_tokens = completion_tokens + excluded.completion_tokens,
+                            latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+                            latency_ms_max = MAX(latency_ms_max, excluded.latency_ms_max)
+                    """,
+                        rows,
+                    )
+                    conn.commit()
+        except Exception as e:
+            # 다음 주기에 다시 시도하도록 되돌려 놓음
+            logger.error(f"LLMTelemetry.flush() - 롤업 저장 오류: {e}")
+            with self._lock:
+                for key, agg in pending.items():
+                    current = self._pending.setdefault(key, UsageAggregate())
+                    _merge(current, agg)
+            return 0
+        return len(rows)
+
+    def query_rollup(self, since_seconds: float = 24 * 3600) -> List[Dict[str, Any]]:
+        """최근 since_seconds 동안의 롤업을 (엔드포인트, 모델) 별로 합산 (토큰 많은 순)"""
+        if not self.db_path:
+            return []
+        self.flush()
+        with self._db_lock:
+            if not self._db_ready:
+                self.init_database()
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT endpoint, model, SUM(calls), SUM(errors), SUM(prompt_tokens),
+                       SUM(completion_tokens), SUM(latency_ms_sum), MAX(latency_ms_max)
+                FROM llm_usage_rollup
+                WHERE bucket_start >= ?
+                GROUP BY endpoint, model
+                ORDER BY SUM(prompt_tokens) + SUM(completion_tokens) DESC
+            """,
+                (time.time() - since_seconds,),
+            ).fetchall()
+        return [
+            {
+                "endpoint": endpoint,
+                "model": model,
+                "calls": calls,
+                "errors": errors,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "avg_latency_ms": round(latency_sum / calls, 1) if calls else 0.0,
+                "max_latency_ms": round(latency_max, 1),
+            }
+            for endpoint, model, calls, errors, prompt_tokens, completion_tokens, latency_sum, latency_max in rows
+        ]
+
+    # ---------- 백그라운드 롤업 스레드 ----------
+    def start(self) -> None:
+        """주기적 롤업 스레드 시작 (이미 실행 중이면 무시)"""
+        if not self.db_path or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="llm-telemetry-rollup", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"LLMTelemetry.start() - 롤업 스레드 시작: db={self.db_path}, interval={self.flush_interval}s"
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def stop(self) -> None:
+        """롤업 스레드 종료 + 남은 집계 저장"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    # ---------- 메트릭 ----------
+    def get_stats(self) -> Dict[str, Any]:
+        """(엔드포인트, 모델) 별 누적 집계 + 전체 합계"""
+        with self._lock:
+            items = sorted(
+                ((key, agg.to_dict()) for key, agg in self._totals.items()),
+                key=lambda item: item[1]["total_tokens"],
+                reverse=True,
+            )
+        overall = {"calls": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        for _, stats in items:
+            for name in overall:
+                overall[name] += stats[name]
+        overall["total_tokens"] = overall["prompt_tokens"] + overall["completion_tokens"]
+        return {
+            "since": self.started_at,
+            "overall": overall,
+            "by_endpoint": [
+                {"endpoint": endpoint, "model": model, **stats}
+                for (endpoint, model), stats in items
+            ],
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 메트릭 (메트릭 이름별로 묶어서 출력)"""
+        with self._lock:
+            totals = [(key, _copy(agg)) for key, agg in self._totals.items()]
+        calls = ["# TYPE llm_calls_total counter"]
+        errors = ["# TYPE llm_errors_total counter"]
+        tokens = ["# TYPE llm_tokens_total counter"]
+        latency = ["# TYPE llm_latency_seconds histogram"]
+        for (endpoint, model), agg in totals:
+            labels = f'endpoint="{_escape(endpoint)}",model="{_escape(model)}"'
+            calls.append(f"llm_calls_total{{{labels}}} {agg.calls}")
+            errors.append(f"llm_errors_total{{{labels}}} {agg.errors}")
+            tokens.append(f'llm_tokens_total{{{labels},type="prompt"}} {agg.prompt_tokens}')
+            tokens.append(f'llm_tokens_total{{{labels},type="completion"}} {agg.completion_tokens}')
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, agg.latency_counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                latency.append(f'llm_latency_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            latency.append(f"llm_latency_seconds_sum{{{labels}}} {agg.latency_sum:.6f}")
+            latency.append(f"llm_latency_seconds_count{{{labels}}} {agg.calls}")
+        return "\n".join(calls + errors + tokens + latency) + "\n"
+
+
+def _merge(target: UsageAggregate, source: UsageAggregate) -> None:
+    target.calls += source.calls
+    target.errors += source.errors
+    target.prompt_tokens += source.prompt_tokens
+    target.completion_tokens += source.completion_tokens
+    target.latency_sum += source.latency_sum
+    target.latency_max = max(target.latency_max, source.latency_max)
+    target.latency_counts = [a + b for a, b in zip(target.latency_counts, source.latency_counts)]
+
+
+def _copy(agg: UsageAggregate) -> UsageAggregate:
+    copied = UsageAggregate()
+    _merge(copied, agg)
+    return copied
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+_default_telemetry: Optional[LLMTelemetry] = None
+_default_lock = threading.Lock()
+
+
+def get_telemetry() -> LLMTelemetry:
+    """프로세스 공용 텔레메트리 (스케줄러와 마찬가지로 모든 호출자가 공유)"""
+    global _default_telemetry
+    if _default_telemetry is None:
+        with _default_lock:
+            if _default_telemetry is None:
+                _default_telemetry = LLMTelemetry()
+    return _default_telemetry
+
+
+def langchain_usage(response: Any) -> Optional[TokenUsage]:
+    """LangChain 응답(AIMessage 또는 include_raw 결과)의 토큰 사용량"""
+    if isinstance(response, dict):
+        response = response.get("raw")
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return None
+    metadata = getattr(response, "response_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    return TokenUsage(
+        usage.get("input_tokens", 0),
+        usage.get("output_tokens", 0),
+        metadata.get("model_name"),
+        details.get("cache_read", 0) or 0,
+    )
+
+
+def openai_usage(response: Any) -> Optional[TokenUsage]:
+    """OpenAI SDK 응답의 토큰 사용량 (이미지 생성 응답은 usage 가 없음)"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    return TokenUsage(
+        getattr(usage, "prompt_tokens", 0) or 0,
+        getattr(usage, "completion_tokens", 0) or 0,
+        getattr(response, "model", None),
+        getattr(details, "cached_tokens", 0) or 0,
+    )
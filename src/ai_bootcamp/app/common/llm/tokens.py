@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Token Estimation
+프롬프트 토큰 수 추정 + 토큰 예산 단위 청크 분할
+
+기본은 네트워크 없이 동작하는 문자 기반 근사치를 사용한다.
+LLM_TOKENIZER=tiktoken 이면 tiktoken 으로 정확히 센다 (인코딩 파일 다운로드가 필요할 수 있음).
+"""
+
+import logging
+import math
+import os
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_TOKENIZER = os.getenv("LLM_TOKENIZER", "approx").lower()
+# 채팅 메시지 한 개당 role / 구분자 오버헤드
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _approx_tokens(text: str) -> int:
+    """문자 기반 근사 (영문 약 4자 / 한글 등 비 ASCII 약 2자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / 4) + math.ceil(other_chars / 2)
+
+
+def estimate_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """텍스트의 토큰 수 추정"""
+    if not text:
+        return 0
+    if LLM_TOKENIZER == "tiktoken":
+        try:
+            return len(_get_encoding(model).encode(text))
+        except Exception as e:
+            logger.warning(f"estimate_tokens() - tiktoken 사용 불가, 근사치 사용: {e}")
+    return _approx_tokens(text)
+
+
+def estimate_message_tokens(
+    messages: Iterable[Tuple[str, str]], model: str = "gpt-4o-mini"
+) -> int:
+    """(role, content) 메시지 목록의 프롬프트 토큰 수 추정"""
+    return sum(
+        estimate_tokens(content, model) + MESSAGE_OVERHEAD_TOKENS
+        for _, content in messages
+    )
+
+
+def chunk_by_token_budget(
+    items: Sequence[T],
+    budget: int,
+    max_items: int,
+    size_of=lambda item: estimate_tokens(str(item)),
+) -> List[List[Tuple[int, T]]]:
+    """순서를 유지하며 (원래 인덱스, 항목) 청크로 분할
+
+    각 청크의 토큰 합은 budget 이하, 항목 수는 max_items 이하가 되도록 채운다.
+    (단일 항목이 budget 을 넘으면 그 항목만으로 청크를 만든다)
+    """
+    chunks: List[List[Tuple[int, T]]] = []
+    current: List[Tuple[int, T]] = []
+    used = 0
+    for index, item in enumerate(items):
+        size = size_of(item)
+        if current and (used + size > budget or len(current) >= max_items):
+            chunks.append(current)
+            current, used = [], 0
+        current.append((index, item))
+        used += size
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1 @@
+# RAG 패키지 - 벡터 인덱스 / 임베딩 공통 인프라 (인덱스 영속화, 증분 갱신)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache
+청크 내용 해시 기반 임베딩 캐시 - 같은 청크는 실행 / 문서가 달라도 한 번만 임베딩
+
+- 키는 (임베딩 모델 이름, 청크 해시). 청크 해시는 index_manager.chunk_hash() 와 같은 SHA-256 이므로
+  FAISS 인덱스의 docstore id 와 캐시 키가 일치한다.
+- 벡터는 SQLite 에 float32 BLOB 으로 저장하고, 임베딩할 때 청크 하나에 걸린 시간도 같이 기록해
+  캐시 적중 시 절약한 시간을 그 값의 합으로 집계한다.
+- CachedEmbeddings 는 LangChain Embeddings 래퍼로, embed_documents() 에서 캐시를 먼저 조회하고
+  없는 청크만 (한 배치 안의 중복은 한 번만) 원래 임베딩 모델로 계산한다.
+  질의(embed_query)는 청크가 아니므로 캐시하지 않는다.
+
+langchain_core 가 필요하다 (RAG 스크립트에서만 사용).
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+from .index_manager import chunk_hash, embedding_model_name
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_DB = os.getenv(
+    "EMBEDDING_CACHE_DB",
+    str(Path(__file__).parent.parent.parent.parent / "resources" / "data" / "embedding_cache.db"),
+)
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+
+# SQLite 변수 개수 제한보다 작게 IN 조회를 나눔
+_LOOKUP_BATCH = 500
+
+
+class EmbeddingCache:
+    """(모델, 청크 해시) -> 임베딩 벡터 SQLite 캐시"""
+
+    def __init__(self, db_path: str = EMBEDDING_CACHE_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.embed_seconds = 0.0
+        self.seconds_saved = 0.0
+
+        self.init_database()
+
+    def init_database(self):
+        """캐시 테이블 초기화"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    model TEXT NOT NULL,
+                    chunk_hash TEXT NOT NULL,
+                    dimensions INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    embed_seconds REAL NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (model, chunk_hash)
+                ) WITHOUT ROWID
+            """
+            )
+            conn.commit()
+
+    def get_many(self, model: str, hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """캐시된 벡터 조회 (없는 해시는 결과에 없음)"""
+        hashes = list(dict.fromkeys(hashes))
+        found: Dict[str, List[float]] = {}
+        saved = 0.0
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(hashes), _LOOKUP_BATCH):
+                batch = hashes[start:start + _LOOKUP_BATCH]
+                rows = conn.execute(
+                    f"""
+                    SELECT chunk_hash, vector, embed_seconds FROM embedding_cache
+                    WHERE model = ? AND chunk_hash IN ({",".join("?" * len(batch))})
+                """,
+                    (model, *batch),
+                ).fetchall()
+                for digest, blob, seconds in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[digest] = vector.tolist()
+                    saved += seconds
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(hashes) - len(found)
+            self.seconds_saved += saved
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, Sequence[float]], embed_seconds: float = 0.0) -> None:
+        """새로 계산한 벡터 저장 (embed_seconds: 이 벡터들을 계산하는 데 걸린 전체 시간)"""
+        if not vectors:
+            return
+        per_chunk = embed_seconds / len(vectors)
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO embedding_cache
+                (model, chunk_hash, dimensions, vector, embed_seconds, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (model, digest, len(vector), array("f", vector).tobytes(), per_chunk, now)
+                    for digest, vector in vectors.items()
+                ],
+            )
+            conn.commit()
+        with self._lock:
+            self.embed_seconds += embed_seconds
+
+    def clear(self, model: Optional[str] = None) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            if model is None:
+                conn.execute("DELETE FROM embedding_cache")
+            else:
+                conn.execute("DELETE FROM embedding_cache WHERE model = ?", (model,))
+            conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            entries = dict(conn.execute("SELECT model, COUNT(*) FROM embedding_cache GROUP BY model").fetchall())
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "embed_seconds": round(self.embed_seconds, 3),
+            "seconds_saved": round(self.seconds_saved, 3),
+        }
+
+
+class CachedEmbeddings(Embeddings):
+    """EmbeddingCache 를 먼저 조회하는 Embeddings 래퍼"""
+
+    def __init__(self, embeddings: Embeddings, cache: Optional[EmbeddingCache] = None, model: Optional[str] = None):
+        self.embeddings = embeddings
+        self.cache = cache or get_embedding_cache()
+        # FaissIndexManager 도 이 이름으로 임베딩 모델 변경을 감지한다
+        self.model = model or embedding_model_name(embeddings)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        hashes = [chunk_hash(text) for text in texts]
+        vectors = self.cache.get_many(self.model, hashes)
+
+        # 캐시에 없는 청크만 (중복 제거 후) 계산
+        missing: Dict[str, str] = {}
+        for digest, text in zip(hashes, texts):
+            if digest not in vectors:
+                missing.setdefault(digest, text)
+        if missing:
+            started = time.perf_counter()
+            computed = self.embeddings.embed_documents(list(missing.values()))
+            elapsed = time.perf_counter() - started
+            new_vectors = dict(zip(missing, computed))
+            self.cache.put_many(self.model, new_vectors, elapsed)
+            vectors.update(new_vectors)
+        logger.info(
+            f"CachedEmbeddings.embed_documents() - model={self.model}, "
+            f"texts={len(texts)}, cached={len(texts) - len(missing)}, embedded={len(missing)}"
+        )
+        return [list(vectors[digest]) for digest in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.embeddings.aembed_query(text)
+
+
+def cached_embeddings(embeddings: Embeddings) -> Embeddings:
+    """EMBEDDING_CACHE_ENABLED 면 공용 캐시로 감싼 임베딩, 아니면 그대로"""
+    if not EMBEDDING_CACHE_ENABLED or isinstance(embeddings, CachedEmbeddings):
+        return embeddings
+    return CachedEmbeddings(embeddings)
+
+
+_default_cache: Optional[EmbeddingCache] = None
+_default_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """프로세스 공용 임베딩 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = EmbeddingCache()
+    return _default_cache
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+FAISS Index Manager
+FAISS 인덱스를 디스크에 저장 / 재사용하고 바뀐 청크만 다시 임베딩하는 인덱스 관리 계층
+
+- 인덱스마다 디렉토리 하나: {RAG_INDEX_DIR}/{name}/ 에 manifest.db (SQLite) 와 세대별 인덱스 파일
+  (index.{generation}.faiss / .pkl) 을 둔다. 새 세대 파일을 다 쓴 뒤 manifest 의 세대 번호를
+  트랜잭션으로 바꾸므로 중간에 죽어도 이전 세대가 그대로 남는다.
+- 청크 id 는 내용(page_content)의 SHA-256. manifest 는 원본(source)별 지문(파일 내용 + 분할 설정)과
+  원본 -> 청크 해시 목록을 기록한다.
+  * is_current(): 원본 지문이 모두 같으면 문서 로드 / 분할 / 임베딩 없이 load() 만 하면 된다.
+  * sync(): 새 청크만 임베딩해서 추가하고, 더 이상 어떤 원본에도 없는 청크는 인덱스에서 지운다.
+  * 임베딩 모델이 바뀌면 벡터를 섞을 수 없으므로 전체를 다시 만든다.
+- load() 는 기본으로 faiss.IO_FLAG_MMAP 로 읽어 시작 시 인덱스 전체를 메모리로 복사하지 않는다
+  (mmap 을 지원하지 않는 인덱스 형식이면 일반 읽기로 대체). 갱신할 때는 쓰기 가능한 사본으로 읽는다.
+
+faiss / langchain_community 는 이 모듈을 쓸 때만 필요하다 (함수 안에서 import).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+RAG_INDEX_DIR = os.getenv("RAG_INDEX_DIR", "rag_index")
+# 한 번에 임베딩해서 추가할 청크 수
+RAG_INDEX_BATCH_SIZE = int(os.getenv("RAG_INDEX_BATCH_SIZE", "256"))
+RAG_INDEX_MMAP = os.getenv("RAG_INDEX_MMAP", "true").lower() == "true"
+
+_FILE_CHUNK_SIZE = 1024 * 1024
+
+
+def chunk_hash(text: str) -> str:
+    """청크 내용 해시 (인덱스 docstore id 로 사용)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def embedding_model_name(embeddings: Any) -> str:
+    """임베딩 객체의 모델 이름 (OpenAIEmbeddings.model / HuggingFaceEmbeddings.model_name)"""
+    for attribute in ("model", "model_name", "model_id"):
+        value = getattr(embeddings, attribute, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(embeddings).__name__
+
+
+@dataclass
+class SyncStats:
+    added: int = 0
+    removed: int = 0
+    reused: int = 0
+    sources: int = 0
+    rebuilt: bool = False
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class FaissIndexManager:
+    """디스크에 영속화되는 FAISS 인덱스 (원본 지문 + 청크 해시로 증분 갱신)"""
+
+    def __init__(
+        self,
+        name: str,
+        embeddings: Any,
+        index_dir: Union[str, Path] = RAG_INDEX_DIR,
+        settings: Optional[Dict[str, Any]] = None,
+        batch_size: int = RAG_INDEX_BATCH_SIZE,
+    ):
+        """
+        Args:
+            name: 인덱스 이름 (디렉토리 이름)
+            embeddings: LangChain Embeddings 객체
+            settings: 청크 결과에 영향을 주는 설정 (분할 크기 / 오버랩 등) - 원본 지문에 포함
+        """
+        self.name = name
+        self.embeddings = embeddings
+        self.model = embedding_model_name(embeddings)
+        self.settings = settings or {}
+        self.batch_size = batch_size
+        self.path = Path(index_dir) / name
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(self.path / "manifest.db")
+        self._lock = threading.Lock()
+        self.last_sync: Optional[SyncStats] = None
+        self.init_database()
+
+    # ---------- manifest ----------
+    def init_database(self):
+        """manifest 테이블 초기화"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sources (
+                    source TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    chunks INTEGER NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS source_chunks (
+                    source TEXT NOT NULL,
+                    chunk_hash TEXT NOT NULL,
+                    PRIMARY KEY (source, chunk_hash)
+                )
+            """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_source_chunks_hash ON source_chunks (chunk_hash)")
+            conn.commit()
+
+    def _meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _generation(self, conn: sqlite3.Connection) -> Optional[int]:
+        value = self._meta(conn, "generation")
+        return int(value) if value is not None else None
+
+    def _files(self, generation: int) -> Tuple[Path, Path]:
+        return self.path / f"index.{generation}.faiss", self.path / f"index.{generation}.pkl"
+
+    def source_fingerprint(self, source: Union[str, Path]) -> str:
+        """원본 파일 내용 + 분할 설정의 해시 (파일이 아니면 경로 문자열 + 설정)"""
+        digest = hashlib.sha256(json.dumps(self.settings, sort_keys=True, default=str).encode("utf-8"))
+        path = Path(source)
+        if path.is_file():
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_FILE_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        else:
+            digest.update(str(source).encode("utf-8"))
+        return digest.hexdigest()
+
+    def is_current(self, sources: Iterable[Union[str, Path]]) -> bool:
+        """인덱스가 sources 의 현재 내용 / 설정 / 임베딩 모델로 만들어졌는지 (True 면 load() 만 하면 됨)"""
+        sources = [str(source) for source in sources]
+        with sqlite3.connect(self.db_path) as conn:
+            generation = self._generation(conn)
+            if generation is None or self._meta(conn, "model") != self.model:
+                return False
+            if not all(path.exists() for path in self._files(generation)):
+                return False
+            recorded = dict(conn.execute("SELECT source, fingerprint FROM sources").fetchall())
+        if set(recorded) != set(sources):
+            return False
+        return all(recorded[source] == self.source_fingerprint(source) for source in sources)
+
+    # ---------- 인덱스 파일 ----------
+    def load(self, mmap: bool = RAG_INDEX_MMAP):
+        """저장된 인덱스를 FAISS 벡터스토어로 로드 (없으면 None)"""
+        with sqlite3.connect(self.db_path) as conn:
+            generation = self._generation(conn)
+        if generation is None:
+            return None
+        index_file, store_file = self._files(generation)
+        if not index_file.exists() or not store_file.exists():
+            logger.warning(f"FaissIndexManager.load() - 인덱스 파일 없음: {self.name} gen={generation}")
+            return None
+
+        from langchain_community.vectorstores import FAISS
+
+        index = self._read_index(index_file, mmap)
+        # 직접 저장한 파일만 읽음 (FAISS.load_local 과 같은 pickle 형식)
+        with open(store_file, "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+        logger.info(
+            f"FaissIndexManager.load() - 인덱스 로드: {self.name} gen={generation}, "
+            f"vectors={index.ntotal}, mmap={mmap}"
+        )
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=index_to_docstore_id,
+        )
+
+    @staticmethod
+    def _read_index(index_file: Path, mmap: bool):
+        import faiss
+
+        if mmap:
+            try:
+                return faiss.read_index(str(index_file), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            except RuntimeError as e:
+                logger.warning(f"FaissIndexManager._read_index() - mmap 미지원, 일반 읽기로 대체: {e}")
+        return faiss.read_index(str(index_file))
+
+    def _save(self, vectorstore, generation: int) -> None:
+        import faiss
+
+        index_file, store_file = self._files(generation)
+        faiss.write_index(vectorstore.index, str(index_file))
+        with open(store_file, "wb") as f:
+            pickle.dump((vectorstore.docstore, vectorstore.index_to_docstore_id), f)
+
+    def _remove_generation(self, generation: Optional[int]) -> None:
+        if generation is None:
+            return
+        for path in self._files(generation):
+            path.unlink(missing_ok=True)
+
+    # ---------- 증분 갱신 ----------
+    def sync(self, documents: Sequence[Any], sources: Optional[Iterable[Union[str, Path]]] = None):
+        """분할된 문서로 인덱스를 갱신하고 벡터스토어 반환
+
+        Args:
+            documents: 분할된 LangChain Document 목록 (metadata["source"] 로 원본 구분)
+            sources: 이 인덱스에 들어갈 원본 전체 (지문 기록용). 없으면 documents 의 source 값.
+                목록에 없는 원본의 청크는 인덱스에서 제거된다.
+        """
+        started = time.perf_counter()
+        stats = SyncStats()
+        source_list = [str(source) for source in sources] if sources is not None else []
+
+        # 원본별 청크 해시 (같은 원본 안의 중복 청크는 하나로)
+        by_source: Dict[str, Dict[str, Any]] = {source: {} for source in source_list}
+        for document in documents:
+            source = str(document.metadata.get("source", ""))
+            by_source.setdefault(source, {}).setdefault(chunk_hash(document.page_content), document)
+        stats.sources = len(by_source)
+
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            generation = self._generation(conn)
+            rebuild = generation is None or self._meta(conn, "model") != self.model
+            if rebuild:
+                conn.execute("DELETE FROM source_chunks")
+                conn.execute("DELETE FROM sources")
+            existing: Set[str] = {
+                row[0] for row in conn.execute("SELECT DISTINCT chunk_hash FROM source_chunks")
+            }
+            wanted: Dict[str, Any] = {}
+            for chunks in by_source.values():
+                for digest, document in chunks.items():
+                    wanted.setdefault(digest, document)
+
+            to_add = [digest for digest in wanted if digest not in existing]
+            to_remove = [digest for digest in existing if digest not in wanted]
+            stats.reused = len(wanted) - len(to_add)
+            stats.rebuilt = rebuild
+
+            vectorstore = None if rebuild else self.load(mmap=False)
+            if vectorstore is None and generation is not None and not rebuild:
+                # 파일이 사라진 manifest - 처음부터 다시
+                stats.rebuilt = True
+                to_add, to_remove, stats.reused = list(wanted), [], 0
+            if to_remove and vectorstore is not None:
+                vectorstore.delete(ids=to_remove)
+                stats.removed = len(to_remove)
+            for start in range(0, len(to_add), self.batch_size):
+                batch = to_add[start:start + self.batch_size]
+                batch_documents = [wanted[digest] for digest in batch]
+                if vectorstore is None:
+                    from langchain_community.vectorstores import FAISS
+
+                    vectorstore = FAISS.from_documents(batch_documents, self.embeddings, ids=batch)
+                else:
+                    vectorstore.add_documents(batch_documents, ids=batch)
+                stats.added += len(batch)
+                logger.info(
+                    f"FaissIndexManager.sync() - 임베딩 추가: {self.name} "
+                    f"{min(start + len(batch), len(to_add))}/{len(to_add)}"
+                )
+            if vectorstore is None:
+                raise ValueError(f"인덱싱할 문서가 없습니다: {self.name}")
+
+            changed = bool(stats.added or stats.removed or stats.rebuilt)
+            new_generation = (generation or 0) + 1 if changed else generation
+            if changed:
+                self._save(vectorstore, new_generation)
+
+            now = time.time()
+            conn.execute("DELETE FROM source_chunks")
+            conn.execute("DELETE FROM sources")
+            conn.executemany(
+                "INSERT INTO source_chunks (source, chunk_hash) VALUES (?, ?)",
+                [(source, digest) for source, chunks in by_source.items() for digest in chunks],
+            )
+            conn.executemany(
+                "INSERT INTO sources (source, fingerprint, chunks, updated_at) VALUES (?, ?, ?, ?)",
+                [
+                    (source, self.source_fingerprint(source), len(chunks), now)
+                    for source, chunks in by_source.items()
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('model', ?), ('generation', ?)",
+                (self.model, str(new_generation)),
+            )
+            conn.commit()
+            if changed and generation != new_generation:
+                self._remove_generation(generation)
+
+        stats.seconds = round(time.perf_counter() - started, 3)
+        self.last_sync = stats
+        logger.info(f"FaissIndexManager.sync() - 인덱스 갱신 완료: {self.name} {stats.to_dict()}")
+        return vectorstore
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            generation = self._generation(conn)
+            sources = conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+            chunks = conn.execute("SELECT COUNT(DISTINCT chunk_hash) FROM source_chunks").fetchone()[0]
+        return {
+            "name": self.name,
+            "model": self.model,
+            "generation": generation,
+            "sources": sources,
+            "chunks": chunks,
+            "last_sync": self.last_sync.to_dict() if self.last_sync else None,
+        }
@@ -1,11 +1,14 @@
 import logging
-from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import HTMLResponse
 
-from ..business.aps.account_service import account_service
-from ..transfer.account_dto import (AccountCreateRequestDto, AccountDto,
+from ..business.aps.account_service import AccountService
+from ..core.container import get_account_service, get_template_cache
+from ..core.fast_json import FastJSONResponse
+from ..core.http_cache import TemplateCache
+from ..transfer.account_dto import (AccountCreateRequestDto,
+                                    AccountDetailResponseDto, AccountDto,
                                     AccountListResponseDto, AccountResponseDto,
                                     AccountUpdateRequestDto)
 
@@ -17,21 +20,17 @@ router = APIRouter(prefix="/api/accounts", tags=["계정 관리"])
 class AccountController:
     """계정 관련 웹 컨트롤러"""
 
-    def __init__(self):
-        self.templates_path = (
-            Path(__file__).parent.parent.parent.parent / "resources" / "templates"
-        )
-
-    @router.get("/")
-    async def get_accounts(self) -> AccountListResponseDto:
-        """모든 계정 목록 조회"""
+    async def get_accounts(
+        self, account_service: AccountService = Depends(get_account_service)
+    ) -> FastJSONResponse:
+        """모든 계정 목록 조회 (AccountListResponseDto 스키마, 재검증 없이 직렬화)"""
         logger.info("IN: AccountController.get_accounts() - 계정 목록 조회 요청")
         try:
-            response = await account_service.get_account_list()
+            payload = await account_service.get_account_list_payload()
+            response = FastJSONResponse(payload)
             logger.info(
-                f"OUT: AccountController.get_accounts() - 계정 목록 조회 완료: count={response.total_count}, response_type={type(response)}"
+                f"OUT: AccountController.get_accounts() - 계정 목록 조회 완료: count={payload['total_count']}"
             )
-            logger.info(f"OUT: AccountController.get_accounts() - response data: {response}")
             return response
         except Exception as e:
             logger.error(
@@ -41,8 +40,11 @@ class AccountController:
             logger.error(f"OUT: AccountController.get_accounts() - 오류 상세: {traceback.format_exc()}")
             raise
 
-    @router.get("/{account_id}")
-    async def get_account(self, account_id: str) -> AccountResponseDto:
+    async def get_account(
+        self,
+        account_id: str,
+        account_service: AccountService = Depends(get_account_service),
+    ) -> AccountDetailResponseDto:
         """특정 계정 조회"""
         logger.info(
             f"IN: AccountController.get_account() - 계정 조회 요청: account_id={account_id}"
@@ -59,8 +61,11 @@ class AccountController:
             )
             raise
 
-    @router.post("/")
-    async def create_account(self, request: AccountCreateRequestDto) -> AccountResponseDto:
+    async def create_account(
+        self,
+        request: AccountCreateRequestDto,
+        account_service: AccountService = Depends(get_account_service),
+    ) -> AccountResponseDto:
         """새 계정 생성"""
         logger.info(
             f"IN: AccountController.create_account() - 계정 생성 요청: name={request.name}"
@@ -77,9 +82,11 @@ class AccountController:
             )
             raise
 
-    @router.put("/{account_id}")
     async def update_account(
-        self, account_id: str, request: AccountUpdateRequestDto
+        self,
+        account_id: str,
+        request: AccountUpdateRequestDto,
+        account_service: AccountService = Depends(get_account_service),
     ) -> AccountResponseDto:
         """계정 정보 수정"""
         logger.info(
@@ -97,8 +104,11 @@ class AccountController:
             )
             raise
 
-    @router.delete("/{account_id}")
-    async def delete_account(self, account_id: str) -> AccountResponseDto:
+    async def delete_account(
+        self,
+        account_id: str,
+        account_service: AccountService = Depends(get_account_service),
+    ) -> AccountResponseDto:
         """계정 삭제"""
         logger.info(
             f"IN: AccountController.delete_account() - 계정 삭제 요청: account_id={account_id}"
@@ -116,13 +126,15 @@ class AccountController:
             raise
 
 
-    async def accounts_page(self):
+    async def accounts_page(
+        self,
+        request: Request,
+        template_cache: TemplateCache = Depends(get_template_cache),
+    ):
         """계정 관리 페이지"""
         logger.info("IN: AccountController.accounts_page() - 계정 관리 페이지 요청")
         try:
-            response = FileResponse(
-                str(self.templates_path / "accounts" / "index.html")
-            )
+            response = template_cache.response(request, "accounts/index.html")
             logger.info("OUT: AccountController.accounts_page() - 계정 관리 페이지 반환 성공")
             return response
         except Exception as e:
@@ -132,4 +144,20 @@ class AccountController:
 
 # 컨트롤러 인스턴스 생성
 account_controller = AccountController()
+
+# 라우터에 컨트롤러 메서드 등록 (서비스는 컨테이너에서 Depends 로 주입)
+router.add_api_route(
+    "/",
+    account_controller.get_accounts,
+    methods=["GET"],
+    response_model=AccountListResponseDto,
+)
+router.add_api_route("/{account_id}", account_controller.get_account, methods=["GET"])
+router.add_api_route("/", account_controller.create_account, methods=["POST"])
+router.add_api_route(
+    "/{account_id}", account_controller.update_account, methods=["PUT"]
+)
+router.add_api_route(
+    "/{account_id}", account_controller.delete_account, methods=["DELETE"]
+)
  
\ No newline at end of file
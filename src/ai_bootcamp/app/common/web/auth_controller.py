@@ -1,10 +1,11 @@
 import logging
-from pathlib import Path
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import HTMLResponse
 
 from ..business.aps.auth_service import AuthService
+from ..core.container import get_auth_service, get_template_cache
+from ..core.http_cache import TemplateCache
 from ..transfer.auth_dto import (LoginRequestDto, LoginResponseDto,
                                  LogoutResponseDto)
 
@@ -16,32 +17,32 @@ router = APIRouter(prefix="/auth", tags=["인증"])
 class AuthController:
     """인증 관련 웹 컨트롤러"""
 
-    def __init__(self):
-        self.auth_service = AuthService()
-        self.templates_path = (
-            Path(__file__).parent.parent.parent.parent / "resources" / "templates"
-        )
-
-    @router.get("/login", response_class=HTMLResponse)
-    async def login_page(self):
+    async def login_page(
+        self,
+        request: Request,
+        template_cache: TemplateCache = Depends(get_template_cache),
+    ):
         """로그인 페이지"""
         logger.info("IN: AuthController.login_page() - 로그인 페이지 요청")
         try:
-            response = FileResponse(str(self.templates_path / "login" / "index.html"))
+            response = template_cache.response(request, "login/index.html")
             logger.info("OUT: AuthController.login_page() - 로그인 페이지 반환 성공")
             return response
         except Exception as e:
             logger.error(f"OUT: AuthController.login_page() - 오류 발생: {e}")
             raise
 
-    @router.post("/login")
-    async def login(self, request: LoginRequestDto) -> LoginResponseDto:
+    async def login(
+        self,
+        request: LoginRequestDto,
+        auth_service: AuthService = Depends(get_auth_service),
+    ) -> LoginResponseDto:
         """로그인 처리"""
         logger.info(
             f"IN: AuthController.login() - 로그인 요청: username={request.username}"
         )
         try:
-            response = self.auth_service.login(request)
+            response = auth_service.login(request)
             logger.info(
                 f"OUT: AuthController.login() - 로그인 처리 완료: username={request.username}"
             )
@@ -52,26 +53,28 @@ class AuthController:
             )
             raise
 
-    @router.post("/logout")
-    async def logout(self) -> LogoutResponseDto:
+    async def logout(
+        self, auth_service: AuthService = Depends(get_auth_service)
+    ) -> LogoutResponseDto:
         """로그아웃 처리"""
         logger.info("IN: AuthController.logout() - 로그아웃 요청")
         try:
-            response = self.auth_service.logout()
+            response = auth_service.logout()
             logger.info("OUT: AuthController.logout() - 로그아웃 처리 완료")
             return response
         except Exception as e:
             logger.error(f"OUT: AuthController.logout() - 로그아웃 오류 발생: {e}")
             raise
 
-    @router.get("/dashboard", response_class=HTMLResponse)
-    async def dashboard(self):
+    async def dashboard(
+        self,
+        request: Request,
+        template_cache: TemplateCache = Depends(get_template_cache),
+    ):
         """대시보드 페이지"""
         logger.info("IN: AuthController.dashboard() - 대시보드 페이지 요청")
         try:
-            response = FileResponse(
-                str(self.templates_path / "dashboard" / "index.html")
-            )
+            response = template_cache.response(request, "dashboard/index.html")
             logger.info("OUT: AuthController.dashboard() - 대시보드 페이지 반환 성공")
             return response
         except Exception as e:
@@ -81,3 +84,13 @@ class AuthController:
 
 # 컨트롤러 인스턴스 생성
 auth_controller = AuthController()
+
+# 라우터에 컨트롤러 메서드 등록 (서비스는 컨테이너에서 Depends 로 주입)
+router.add_api_route(
+    "/login", auth_controller.login_page, methods=["GET"], response_class=HTMLResponse
+)
+router.add_api_route("/login", auth_controller.login, methods=["POST"])
+router.add_api_route("/logout", auth_controller.logout, methods=["POST"])
+router.add_api_route(
+    "/dashboard", auth_controller.dashboard, methods=["GET"], response_class=HTMLResponse
+)
@@ -0,0 +1,65 @@
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+from ..core.image_store import UnsupportedVariantError, get_image_store
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/images", tags=["이미지"])
+
+# 해시 이름이라 내용이 바뀌지 않으므로 브라우저 / CDN 이 영구 캐시해도 됨
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImageController:
+    """해시 이름 이미지 저장소 서빙 컨트롤러"""
+
+    async def get_image(self, request: Request, digest: str, w: Optional[int] = None):
+        """이미지 원본 또는 폭 w 축소본 (축소본은 처음 요청 시 생성)"""
+        logger.info(f"IN: ImageController.get_image() - 이미지 요청: digest={digest[:12]}, w={w}")
+        store = get_image_store()
+        etag = f'"{digest}-w{w}"' if w else f'"{digest}"'
+        if request.headers.get("if-none-match") == etag and (not w or w in store.variant_widths):
+            # 저장소에 남아 있는 이미지만 304 (정리됐거나 모르는 digest 는 아래에서 404).
+            # 축소본은 원본에서 다시 만들 수 있으므로 원본 존재만 확인한다.
+            if await run_in_threadpool(store.get, digest) is not None:
+                logger.info("OUT: ImageController.get_image() - 304 Not Modified")
+                return Response(
+                    status_code=304, headers={"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+                )
+        try:
+            if w:
+                image = await run_in_threadpool(store.variant, digest, w)
+            else:
+                image = await run_in_threadpool(store.get, digest)
+        except UnsupportedVariantError as e:
+            logger.warning(f"OUT: ImageController.get_image() - 잘못된 축소본 요청: {e}")
+            return JSONResponse(status_code=400, content={"error": str(e)})
+        if image is None:
+            logger.info(f"OUT: ImageController.get_image() - 이미지 없음: digest={digest[:12]}")
+            return JSONResponse(status_code=404, content={"error": "이미지를 찾을 수 없습니다."})
+        logger.info(f"OUT: ImageController.get_image() - 이미지 반환: {image.filename}")
+        return FileResponse(
+            store.path_of(image),
+            media_type=image.mime,
+            headers={"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL},
+        )
+
+    async def get_stats(self):
+        """이미지 저장소 통계"""
+        logger.info("IN: ImageController.get_stats() - 저장소 통계 조회")
+        stats = await run_in_threadpool(get_image_store().get_stats)
+        logger.info("OUT: ImageController.get_stats() - 저장소 통계 조회 완료")
+        return stats
+
+
+# 컨트롤러 인스턴스 생성
+image_controller = ImageController()
+
+# 라우터에 컨트롤러 메서드 등록 (/stats 를 먼저 등록해야 digest 경로에 가려지지 않음)
+router.add_api_route("/stats", image_controller.get_stats, methods=["GET"])
+router.add_api_route("/{digest}", image_controller.get_image, methods=["GET"])
@@ -1,8 +1,11 @@
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
 
 from ..business.aps.predict_service import PredictService
+from ..core.container import get_json_cache, get_predict_service
+from ..core.fast_json import FastJSONResponse
+from ..core.http_cache import TTLCache, cached_json_response
 from ..transfer.predict_dto import PredictRequestDto, PredictResponseDto
 
 logger = logging.getLogger(__name__)
@@ -13,27 +16,33 @@ router = APIRouter(prefix="/predict", tags=["예측"])
 class PredictController:
     """예측 관련 웹 컨트롤러"""
 
-    def __init__(self):
-        self.predict_service = PredictService()
-
-    @router.post("/text")
-    async def predict_text(self, request: PredictRequestDto) -> PredictResponseDto:
-        """텍스트 예측"""
+    async def predict_text(
+        self,
+        request: PredictRequestDto,
+        predict_service: PredictService = Depends(get_predict_service),
+    ) -> FastJSONResponse:
+        """텍스트 예측 (PredictResponseDto 스키마)"""
         logger.info(f"IN: PredictController.predict_text() - 예측 요청: {request}")
         try:
-            response = self.predict_service.predict_text(request)
+            response = FastJSONResponse(predict_service.predict_text(request))
             logger.info("OUT: PredictController.predict_text() - 예측 처리 완료")
             return response
         except Exception as e:
             logger.error(f"OUT: PredictController.predict_text() - 예측 오류 발생: {e}")
             raise
 
-    @router.get("/model-info")
-    async def get_model_info(self):
+    async def get_model_info(
+        self,
+        request: Request,
+        predict_service: PredictService = Depends(get_predict_service),
+        json_cache: TTLCache = Depends(get_json_cache),
+    ):
         """모델 정보 조회"""
         logger.info("IN: PredictController.get_model_info() - 모델 정보 조회 요청")
         try:
-            response = self.predict_service.get_model_info()
+            response = cached_json_response(
+                request, json_cache, "predict:model-info", predict_service.get_model_info
+            )
             logger.info("OUT: PredictController.get_model_info() - 모델 정보 조회 완료")
             return response
         except Exception as e:
@@ -42,12 +51,18 @@ class PredictController:
             )
             raise
 
-    @router.get("/config")
-    async def get_system_config(self):
+    async def get_system_config(
+        self,
+        request: Request,
+        predict_service: PredictService = Depends(get_predict_service),
+        json_cache: TTLCache = Depends(get_json_cache),
+    ):
         """시스템 설정 정보 조회"""
         logger.info("IN: PredictController.get_system_config() - 시스템 설정 조회 요청")
         try:
-            response = self.predict_service.get_system_config()
+            response = cached_json_response(
+                request, json_cache, "predict:config", predict_service.get_system_config
+            )
             logger.info(
                 "OUT: PredictController.get_system_config() - 시스템 설정 조회 완료"
             )
@@ -61,3 +76,14 @@ class PredictController:
 
 # 컨트롤러 인스턴스 생성
 predict_controller = PredictController()
+
+# 라우터에 컨트롤러 메서드 등록 (서비스는 컨테이너에서 Depends 로 주입)
+router.add_api_route(
+    "/text",
+    predict_controller.predict_text,
+    methods=["POST"],
+    response_model=PredictResponseDto,
+)
+router.add_api_route("/model-info", predict_controller.get_model_info, methods=["GET"])
+router.add_api_route("/config", predict_controller.get_system_config, methods=["GET"])
+
@@ -1,11 +1,24 @@
+import hashlib
+import os
+import sys
 from abc import ABC, abstractmethod
 from operator import itemgetter
+from pathlib import Path
 
 from langchain import hub
 from langchain_community.vectorstores import FAISS
 from langchain_core.output_parsers import StrOutputParser
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
+try:
+    from ai_bootcamp.app.common.rag.embedding_cache import cached_embeddings
+    from ai_bootcamp.app.common.rag.index_manager import FaissIndexManager
+except ImportError:
+    # 패키지를 설치하지 않고 실행하는 경우 src 를 경로에 추가
+    sys.path.insert(0, str(Path(__file__).resolve().parents[7]))
+    from ai_bootcamp.app.common.rag.embedding_cache import cached_embeddings
+    from ai_bootcamp.app.common.rag.index_manager import FaissIndexManager
+
 
 class RetrievalChain(ABC):
     def __init__(self):
@@ -27,13 +40,39 @@ class RetrievalChain(ABC):
         return text_splitter.split_documents(docs)
 
     def create_embedding(self):
-        return OpenAIEmbeddings(model="text-embedding-3-small")
+        return cached_embeddings(OpenAIEmbeddings(model="text-embedding-3-small"))
 
-    def create_vectorstore(self, split_docs):
-        return FAISS.from_documents(
-            documents=split_docs, embedding=self.create_embedding()
+    def source_list(self):
+        source_uri = self.source_uri
+        if isinstance(source_uri, (str, Path)):
+            source_uri = [source_uri]
+        return [str(uri) for uri in source_uri or []]
+
+    def create_index_manager(self):
+        """디스크에 저장되는 FAISS 인덱스 (체인 클래스 + 원본 목록마다 하나)"""
+        sources = self.source_list()
+        key = hashlib.sha256("\0".join(sorted(sources)).encode("utf-8")).hexdigest()[:8]
+        splitter = self.create_text_splitter()
+        settings = {
+            "splitter": type(splitter).__name__,
+            "chunk_size": getattr(splitter, "_chunk_size", None),
+            "chunk_overlap": getattr(splitter, "_chunk_overlap", None),
+        }
+        return FaissIndexManager(
+            f"{type(self).__name__}-{key}",
+            self.create_embedding(),
+            index_dir=os.getenv("RAG_INDEX_DIR", "rag_index"),
+            settings=settings,
         )
 
+    def create_vectorstore(self, split_docs):
+        if getattr(self, "index_manager", None) is None:
+            return FAISS.from_documents(
+                documents=split_docs, embedding=self.create_embedding()
+            )
+        # 새로 생기거나 바뀐 청크만 임베딩
+        return self.index_manager.sync(split_docs, sources=self.source_list())
+
     def create_retriever(self, vectorstore):
         # MMR을 사용하여 검색을 수행하는 retriever를 생성합니다.
         dense_retriever = vectorstore.as_retriever(
@@ -52,10 +91,16 @@ class RetrievalChain(ABC):
         return "\n".join(docs)
 
     def create_chain(self):
-        docs = self.load_documents(self.source_uri)
-        text_splitter = self.create_text_splitter()
-        split_docs = self.split_documents(docs, text_splitter)
-        self.vectorstore = self.create_vectorstore(split_docs)
+        self.index_manager = self.create_index_manager()
+        self.vectorstore = None
+        if self.index_manager.is_current(self.source_list()):
+            # 원본이 그대로면 로드 / 분할 / 임베딩 없이 저장된 인덱스 사용
+            self.vectorstore = self.index_manager.load()
+        if self.vectorstore is None:
+            docs = self.load_documents(self.source_uri)
+            text_splitter = self.create_text_splitter()
+            split_docs = self.split_documents(docs, text_splitter)
+            self.vectorstore = self.create_vectorstore(split_docs)
         self.retriever = self.create_retriever(self.vectorstore)
         model = self.create_model()
         prompt = self.create_prompt()
@@ -12,6 +12,11 @@ from langgraph.graph import StateGraph
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 
+from ...common.llm.prompts import PromptTemplate, get_prompt_registry, register_prompt
+from ...common.llm.scheduler import get_scheduler
+from ...common.llm.telemetry import langchain_usage
+from ...common.llm.tokens import estimate_message_tokens
+
 # 환경변수 로드
 load_dotenv()
 
@@ -30,11 +35,75 @@ if not USE_MOCK:
     llm = ChatOpenAI(
         model="gpt-4o", 
         temperature=0,
-        api_key=os.getenv("OPENAI_API_KEY")
+        api_key=os.getenv("OPENAI_API_KEY"),
+        # 재시도는 공용 스케줄러가 담당
+        max_retries=0
     )
 else:
     llm = None
 
+
+# ---------- 노드 프롬프트 (고정 지시문은 시스템 메시지 맨 앞, 근거 / 요약 등 변수는 사용자 메시지) ----------
+SUMMARIZER_PROMPT = register_prompt(
+    "multiagent.summarizer",
+    prefix="주어진 근거만으로 정책 핵심을 10줄 이내로 요약하라. 추측 금지. 객관적 사실만 포함.",
+    user="근거:\n{docs}",
+)
+ACTION_PROMPT = register_prompt(
+    "multiagent.action",
+    prefix="""정책 요약을 바탕으로 부서별 액션아이템을 도출하라.
+
+팀: 보안, 개발, 운영, 준법감시
+SMART 규칙 적용: 구체적/측정가능/달성가능/현실적/기한설정
+
+각 항목은 다음 형식으로 JSON 배열로만 출력:
+[
+  {
+    "team": "팀명",
+    "action": "구체적 액션",
+    "due": "YYYY-MM-DD",
+    "type": "Policy/Process/Tech",
+    "evidence": "근거조항"
+  }
+]
+
+최대 8개 액션아이템까지 생성하라.""",
+    user="요약:\n{summary}\n\n근거:\n{docs}",
+)
+COMPLIANCE_PROMPT = register_prompt(
+    "multiagent.compliance",
+    prefix="""액션아이템과 근거 간 충돌/위험을 점검하고 보완책을 제시하라.
+
+간결하게 요약 보고서 섹션 형태로 작성:
+1. 주요 리스크
+2. 규정 준수 여부
+3. 보완책 제안
+
+한국어로 작성하라.""",
+    user="액션아이템:\n{actions}\n\n근거:\n{docs}",
+)
+TRANSLATE_REPORT_PROMPT = register_prompt(
+    "multiagent.translate",
+    prefix=(
+        "Translate the following Korean business report to English. "
+        "Maintain professional business report tone and format."
+    ),
+    user="{report}",
+)
+
+
+def invoke_llm(prompt: PromptTemplate, **values) -> str:
+    """공용 스케줄러(RPM/TPM 한도, 재시도, 서킷 브레이커)를 거쳐 LLM 호출"""
+    messages = prompt.messages(**values)
+    response = get_scheduler().call(
+        lambda: llm.invoke(messages),
+        estimated_tokens=estimate_message_tokens((m.type, m.content) for m in messages) + 512,
+        usage_of=langchain_usage,
+        model="gpt-4o",
+    )
+    get_prompt_registry().record(prompt.name, langchain_usage(response))
+    return response.content
+
 # ---------- 상태(전역 컨텍스트) ----------
 class State(TypedDict, total=False):
     query: str                    # 사용자 질문
@@ -85,11 +154,6 @@ def summarizer_node(state: State) -> State:
             logger.warning("OUT: summarizer_node() - 검색된 문서 없음")
             return {"summary": "문서를 찾을 수 없습니다.", "needs_more_evidence": True}
         
-        prompt = f"""다음 근거만으로 정책 핵심을 10줄 이내로 요약하라.
-근거:
-{chr(10).join(docs)}
-추측 금지. 객관적 사실만 포함."""
-        
         if USE_MOCK:
             # Mock 응답
             summary = f"""정책 핵심 요약 (Mock 모드):
@@ -104,7 +168,7 @@ def summarizer_node(state: State) -> State:
 9. 외부 접속 시 VPN 사용을 의무화
 10. 다중인증(MFA) 적용으로 보안 강화"""
         else:
-            summary = llm.invoke(prompt).content
+            summary = invoke_llm(SUMMARIZER_PROMPT, docs="\n".join(docs))
         
         # 간단 기준: 요약이 2줄 이하이면 근거 부족으로 재검색
         needs_more = len(summary.splitlines()) < 3
@@ -129,30 +193,6 @@ def action_node(state: State) -> State:
             logger.warning("OUT: action_node() - 요약 정보 부족")
             return {"actions": []}
         
-        prompt = f"""정책 요약을 바탕으로 부서별 액션아이템을 도출하라.
-
-팀: 보안, 개발, 운영, 준법감시
-SMART 규칙 적용: 구체적/측정가능/달성가능/현실적/기한설정
-
-각 항목은 다음 형식으로 JSON 배열로만 출력:
-[
-  {{
-    "team": "팀명",
-    "action": "구체적 액션",
-    "due": "YYYY-MM-DD",
-    "type": "Policy/Process/Tech",
-    "evidence": "근거조항"
-  }}
-]
-
-요약:
-{summary}
-
-근거:
-{chr(10).join(docs)}
-
-최대 8개 액션아이템까지 생성하라."""
-
         if USE_MOCK:
             # Mock 응답
             actions_json = """[
@@ -193,7 +233,7 @@ SMART 규칙 적용: 구체적/측정가능/달성가능/현실적/기한설정
   }
 ]"""
         else:
-            actions_json = llm.invoke(prompt).content
+            actions_json = invoke_llm(ACTION_PROMPT, summary=summary, docs="\n".join(docs))
         
         # JSON 파싱 시도
         try:
@@ -245,21 +285,6 @@ def compliance_node(state: State) -> State:
             logger.warning("OUT: compliance_node() - 액션아이템 없음")
             return {"compliance": "액션아이템이 없어 준수성 검토를 수행할 수 없습니다."}
         
-        prompt = f"""액션아이템과 근거 간 충돌/위험을 점검하고 보완책을 제시하라.
-
-간결하게 요약 보고서 섹션 형태로 작성:
-1. 주요 리스크
-2. 규정 준수 여부
-3. 보완책 제안
-
-액션아이템:
-{json.dumps(actions, ensure_ascii=False, indent=2)}
-
-근거:
-{chr(10).join(docs)}
-
-한국어로 작성하라."""
-
         if USE_MOCK:
             # Mock 응답
             compliance = """준수성 검토 결과 (Mock 모드):
@@ -281,7 +306,11 @@ def compliance_node(state: State) -> State:
 - 로그 관리 시스템 구축 및 모니터링
 - 보안 교육 및 인식 제고 프로그램 운영"""
         else:
-            compliance = llm.invoke(prompt).content
+            compliance = invoke_llm(
+                COMPLIANCE_PROMPT,
+                actions=json.dumps(actions, ensure_ascii=False, indent=2),
+                docs="\n".join(docs),
+            )
         
         logger.info("OUT: compliance_node() - 준수성 검토 완료")
         return {"compliance": compliance}
@@ -334,12 +363,7 @@ def translate_node(state: State) -> State:
 [Evidence Clauses]
 {chr(10).join(state.get('docs', []))}"""
         else:
-            translate_prompt = f"""Translate the following Korean business report to English. 
-Maintain professional business report tone and format:
-
-{report_ko}"""
-
-            report_en = llm.invoke(translate_prompt).content
+            report_en = invoke_llm(TRANSLATE_REPORT_PROMPT, report=report_ko)
         
         logger.info("OUT: translate_node() - 번역 완료")
         return {"report_ko": report_ko, "report_en": report_en}
@@ -1,7 +1,14 @@
 import os
+import asyncio
 import logging
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from ...common.llm.router import ROUTER_MODEL, ModelRouter
+from ...common.llm.scheduler import PRIORITY_INTERACTIVE, get_scheduler
+from ...common.llm.single_flight import get_single_flight, single_flight_key
+from ...common.llm.telemetry import openai_usage
+from ...common.llm.tokens import estimate_message_tokens
 
 # .env 파일 로드
 load_dotenv()
@@ -20,16 +27,37 @@ OPENAI_MODEL_GPT4O_MINI = os.getenv("OPENAI_MODEL_GPT4O_MINI", "gpt-4o-mini")
 class ChatDemo:
     """OpenAI 채팅 데모 클래스"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(
+        self,
+        client: OpenAI | None = None,
+        async_client: AsyncOpenAI | None = None,
+        cache=None,
+        router: ModelRouter | None = None,
+    ):
+        """초기화
+        
+        Args:
+            client: 공유 동기 OpenAI 클라이언트 (없으면 새로 생성)
+            async_client: 공유 비동기 OpenAI 클라이언트 (없으면 처음 사용할 때 생성)
+            cache: 반복 프롬프트 응답을 재사용할 LLMResponseCache (없으면 캐시하지 않음)
+            router: model="auto" 요청에 사용할 ModelRouter (없으면 처음 사용할 때 환경 변수로 생성)
+        """
         logger.info("IN: ChatDemo.__init__() - ChatDemo 초기화")
         
-        if not OPENAI_API_KEY:
+        if not OPENAI_API_KEY and client is None:
             logger.error("OUT: ChatDemo.__init__() - OPENAI_API_KEY가 설정되지 않음")
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. .env 파일을 확인해주세요.")
         
         try:
-            self.client = OpenAI(api_key=OPENAI_API_KEY)
+            # 재시도는 LLMScheduler 가 담당하므로 SDK 자체 재시도는 끔
+            self.client = client or OpenAI(api_key=OPENAI_API_KEY, max_retries=0)
+            self._async_client = async_client
+            self._router = router
+            self.cache = cache
+            # 프로세스 공용 호출 스케줄러 (RPM/TPM 한도, 재시도, 서킷 브레이커)
+            self.scheduler = get_scheduler()
+            # 동시에 들어온 동일 호출은 한 번만 실행
+            self.single_flight = get_single_flight()
             logger.info("OUT: ChatDemo.__init__() - OpenAI 클라이언트 초기화 성공")
         except Exception as e:
             logger.error(f"OUT: ChatDemo.__init__() - OpenAI 클라이언트 초기화 실패: {e}")
@@ -42,66 +70,174 @@ class ChatDemo:
         logger.info(f"IN: ChatDemo.chat_completion() - 채팅 요청: model={model}, message={user_message[:50]}...")
         
         try:
-            # 기본 모델 설정
-            if not model:
-                model = OPENAI_MODEL_GPT4O_MINI
+            model = model or OPENAI_MODEL_GPT4O_MINI
+            messages = self._build_messages(user_message, system_message)
+            cache_args = (model, messages[0]["content"], [("user", user_message)])
             
-            # 기본 시스템 메시지 설정
-            if not system_message:
-                system_message = "You are a helpful assistant."
-            
-            # 메시지 구성
-            messages = [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_message}
-            ]
+            cached = self.cache.get(*cache_args) if self.cache else None
+            if cached is not None:
+                logger.info(f"OUT: ChatDemo.chat_completion() - 캐시 적중({cached.tier})")
+                return self._cached_result(cached, model)
             
             logger.info(f"ChatDemo.chat_completion() - API 호출 시작: model={model}")
             
-            try:
-                # OpenAI API 호출
-                response = self.client.chat.completions.create(
+            def call():
+                if model == ROUTER_MODEL:
+                    # 모델 라우터가 백엔드 선택 / 장애 전환 담당
+                    return self.router.call(
+                        lambda backend: backend.chat_model.invoke(messages),
+                        estimated_tokens=self._estimate_tokens(messages),
+                        priority=PRIORITY_INTERACTIVE,
+                    )
+                # OpenAI API 호출 (스케줄러가 한도 대기 / 429·5xx 재시도 담당)
+                return self.scheduler.call(
+                    lambda: self.client.chat.completions.create(model=model, messages=messages),
+                    estimated_tokens=self._estimate_tokens(messages),
+                    usage_of=openai_usage,
                     model=model,
-                    messages=messages
                 )
-                
-                # 응답 데이터 구성
-                result = {
-                    "content": response.choices[0].message.content,
-                    "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens
-                    },
-                    "model": response.model,
-                    "finish_reason": response.choices[0].finish_reason
-                }
-                
-                logger.info(f"OUT: ChatDemo.chat_completion() - 채팅 완료: tokens={result['usage']['total_tokens']}")
-                return result
-                
-            except Exception as api_error:
-                # API 오류 시 모의 응답 반환
-                logger.warning(f"API 호출 실패, 모의 응답 사용: {api_error}")
-                
-                mock_response = {
-                    "content": f"[모의 응답] {user_message}에 대한 답변입니다. (API 할당량 초과로 인한 테스트 응답)",
-                    "usage": {
-                        "prompt_tokens": len(user_message),
-                        "completion_tokens": 50,
-                        "total_tokens": len(user_message) + 50
-                    },
-                    "model": model or "gpt-4o-mini",
-                    "finish_reason": "stop"
-                }
-                
-                logger.info(f"OUT: ChatDemo.chat_completion() - 모의 응답 완료")
-                return mock_response
+            
+            # 진행 중인 동일 호출이 있으면 합류
+            # (CircuitOpenError / 재시도 소진 등 스케줄러 오류는 호출자에게 그대로 전파)
+            response = self.single_flight.call(self._flight_key(model, messages), call)
+            result = self._routed_result(response) if model == ROUTER_MODEL else self._to_result(response)
+            
+            if self.cache:
+                self.cache.put(*cache_args, result["content"], result["usage"]["total_tokens"])
+            logger.info(f"OUT: ChatDemo.chat_completion() - 채팅 완료: tokens={result['usage']['total_tokens']}")
+            return result
             
         except Exception as e:
             logger.error(f"OUT: ChatDemo.chat_completion() - 채팅 오류 발생: {e}")
             raise
     
+    @property
+    def router(self) -> ModelRouter:
+        """model="auto" 용 모델 라우터 (처음 사용할 때 생성)"""
+        if self._router is None:
+            self._router = ModelRouter.from_env()
+        return self._router
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """비동기 OpenAI 클라이언트 (처음 사용할 때 생성)"""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=0)
+        return self._async_client
+    
+    async def achat_completion(
+        self,
+        user_message: str,
+        model: str | None = None,
+        system_message: str | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """채팅 완성 API 비동기 호출 (이벤트 루프를 막지 않음)
+        
+        timeout 초과 시 asyncio.TimeoutError, 취소 시 CancelledError 를 그대로 전파한다.
+        """
+        logger.info(f"IN: ChatDemo.achat_completion() - 채팅 요청: model={model}, message={user_message[:50]}...")
+        
+        model = model or OPENAI_MODEL_GPT4O_MINI
+        messages = self._build_messages(user_message, system_message)
+        cache_args = (model, messages[0]["content"], [("user", user_message)])
+        
+        cached = await self.cache.aget(*cache_args) if self.cache else None
+        if cached is not None:
+            logger.info(f"OUT: ChatDemo.achat_completion() - 캐시 적중({cached.tier})")
+            return self._cached_result(cached, model)
+        
+        def call():
+            if model == ROUTER_MODEL:
+                # 모델 라우터가 백엔드 선택 / p95 초과 시 헤지 / 장애 전환 담당
+                return self.router.acall(
+                    lambda backend: backend.chat_model.ainvoke(messages),
+                    estimated_tokens=self._estimate_tokens(messages),
+                    priority=PRIORITY_INTERACTIVE,
+                )
+            return self.scheduler.acall(
+                lambda: self.async_client.chat.completions.create(model=model, messages=messages),
+                estimated_tokens=self._estimate_tokens(messages),
+                priority=PRIORITY_INTERACTIVE,
+                usage_of=openai_usage,
+                model=model,
+            )
+        
+        try:
+            # 진행 중인 동일 호출이 있으면 합류 (timeout 은 이 요청의 대기 시간)
+            response = await self.single_flight.acall(self._flight_key(model, messages), call, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            logger.warning(f"OUT: ChatDemo.achat_completion() - 채팅 시간 초과 또는 취소: model={model}")
+            raise
+        except Exception as e:
+            logger.error(f"OUT: ChatDemo.achat_completion() - 채팅 오류 발생: {e}")
+            raise
+        
+        result = self._routed_result(response) if model == ROUTER_MODEL else self._to_result(response)
+        if self.cache:
+            await self.cache.aput(*cache_args, result["content"], result["usage"]["total_tokens"])
+        logger.info(f"OUT: ChatDemo.achat_completion() - 채팅 완료: tokens={result['usage']['total_tokens']}")
+        return result
+    
+    @staticmethod
+    def _flight_key(model: str, messages: list) -> str:
+        """single-flight 키 (모델 + 메시지)"""
+        return single_flight_key(model, ((m["role"], m["content"]) for m in messages))
+    
+    @staticmethod
+    def _estimate_tokens(messages: list, completion_tokens: int = 256) -> int:
+        """스케줄러 TPM 예산용 토큰 예상치 (프롬프트 + 응답)"""
+        return estimate_message_tokens((m["role"], m["content"]) for m in messages) + completion_tokens
+    
+    @staticmethod
+    def _build_messages(user_message: str, system_message: str | None) -> list:
+        """시스템 / 사용자 메시지 구성 (기본 시스템 메시지 포함)"""
+        return [
+            {"role": "system", "content": system_message or "You are a helpful assistant."},
+            {"role": "user", "content": user_message}
+        ]
+    
+    @staticmethod
+    def _to_result(response) -> dict:
+        """OpenAI 응답을 결과 dict 로 변환"""
+        return {
+            "content": response.choices[0].message.content,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens
+            },
+            "model": response.model,
+            "finish_reason": response.choices[0].finish_reason
+        }
+    
+    @staticmethod
+    def _routed_result(message) -> dict:
+        """라우터가 반환한 LangChain AIMessage 를 결과 dict 로 변환"""
+        usage = message.usage_metadata or {}
+        metadata = message.response_metadata or {}
+        return {
+            "content": message.content,
+            "usage": {
+                "prompt_tokens": usage.get("input_tokens", 0),
+                "completion_tokens": usage.get("output_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0)
+            },
+            "model": metadata.get("model_name") or metadata.get("model") or ROUTER_MODEL,
+            "finish_reason": metadata.get("finish_reason") or metadata.get("stop_reason") or "stop"
+        }
+
+    @staticmethod
+    def _cached_result(cached, model: str) -> dict:
+        """캐시된 응답을 결과 dict 로 변환 (API 를 호출하지 않았으므로 사용량은 0)"""
+        return {
+            "content": cached.content,
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            "model": model,
+            "finish_reason": "stop",
+            "cached": cached.tier
+        }
+    
     def get_available_models(self) -> list:
         """사용 가능한 모델 목록 조회"""
         logger.info("IN: ChatDemo.get_available_models() - 모델 목록 조회")
@@ -1,8 +1,10 @@
 import logging
-from pathlib import Path
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import HTMLResponse
+
+from ...common.core.container import get_template_cache
+from ...common.core.http_cache import TemplateCache
 
 logger = logging.getLogger(__name__)
 
@@ -12,18 +14,15 @@ router = APIRouter(prefix="/demo/prac01", tags=["데모 - 실습01"])
 class DemoController:
     """데모 실습01 컨트롤러"""
 
-    def __init__(self):
-        self.templates_path = (
-            Path(__file__).parent.parent.parent.parent / "resources" / "templates"
-        )
-
-    async def demo_page(self):
+    async def demo_page(
+        self,
+        request: Request,
+        template_cache: TemplateCache = Depends(get_template_cache),
+    ):
         """데모 페이지"""
         logger.info("IN: DemoController.demo_page() - 데모 페이지 요청")
         try:
-            response = FileResponse(
-                str(self.templates_path / "demo" / "prac01" / "index.html")
-            )
+            response = template_cache.response(request, "demo/prac01/index.html")
             logger.info("OUT: DemoController.demo_page() - 데모 페이지 반환 성공")
             return response
         except Exception as e:
@@ -1,12 +1,18 @@
 import os
 import logging
+import time
+from typing import Optional
 import requests
 from dotenv import load_dotenv
-from openai import OpenAI
-import base64
+from openai import NOT_GIVEN, OpenAI
+import uuid
 from PIL import Image
 import io
 
+from ...common.llm.image_io import iter_data_url_json
+from ...common.llm.scheduler import get_scheduler
+from ...common.llm.telemetry import openai_usage
+
 # .env 파일 로드
 load_dotenv()
 
@@ -18,6 +24,7 @@ logger = logging.getLogger(__name__)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL_DALLE = os.getenv("OPENAI_MODEL_DALLE", "dall-e-3")
 OPENAI_MODEL_GPT4V = os.getenv("OPENAI_MODEL_GPT4V", "gpt-4o")
+OPENAI_VISION_TIMEOUT = float(os.getenv("OPENAI_VISION_TIMEOUT", "120"))
 
 # 기본 이미지 URL
 DEFAULT_IMAGE_URL = "https://img.animalplanet.co.kr/news/2019/11/28/700/f9in35p5660ce423x290.jpg"
@@ -34,23 +41,48 @@ class ChatImage:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. .env 파일을 확인해주세요.")
         
         try:
-            self.client = OpenAI(api_key=OPENAI_API_KEY)
+            # 재시도는 공용 스케줄러가 담당하므로 SDK 자체 재시도는 끔
+            self.client = OpenAI(api_key=OPENAI_API_KEY, max_retries=0)
+            # 이미지 스트리밍 업로드용 (처음 사용할 때 생성)
+            self._http_client = None
+            # 프로세스 공용 호출 스케줄러 (RPM/TPM 한도, 재시도, 서킷 브레이커)
+            self.scheduler = get_scheduler()
             logger.info("OUT: ChatImage.__init__() - OpenAI 클라이언트 초기화 성공")
         except Exception as e:
             logger.error(f"OUT: ChatImage.__init__() - OpenAI 클라이언트 초기화 실패: {e}")
             raise
     
-    def generate_image(self, prompt: str, size: str = "1024x1024", quality: str = "standard") -> str:
-        """이미지 생성"""
+    def generate_image(
+        self, prompt: str, size: str = "1024x1024", quality: str = "standard", timeout: Optional[float] = None
+    ) -> str:
+        """이미지 생성
+
+        timeout 을 주면 재시도를 포함한 전체 호출이 그 시간 안에 끝난다 (각 요청에 남은 시간을 HTTP 타임아웃으로 전달).
+        스레드에서 실행할 때 호출자가 먼저 포기해도 스레드가 계속 API 응답을 기다리지 않도록 한다.
+        """
         logger.info(f"IN: ChatImage.generate_image() - 이미지 생성: prompt={prompt[:50]}...")
-        
-        try:
-            response = self.client.images.generate(
+        deadline = time.monotonic() + timeout if timeout else None
+
+        def request():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                # 재시도 대상이 아닌 오류로 끝내 스케줄러가 다시 시도하지 않게 함
+                raise RuntimeError(f"이미지 생성 시간 초과 ({timeout:.0f}초)")
+            return self.client.images.generate(
                 model=OPENAI_MODEL_DALLE,
                 prompt=prompt,
                 size=size,
                 quality=quality,
-                n=1
+                n=1,
+                # None 은 "타임아웃 없음" 이므로 기한이 없으면 클라이언트 기본값 사용
+                timeout=NOT_GIVEN if remaining is None else remaining,
+            )
+
+        try:
+            response = self.scheduler.call(
+                request,
+                estimated_tokens=0,
+                model=OPENAI_MODEL_DALLE,
             )
             
             image_url = response.data[0].url
@@ -66,28 +98,13 @@ class ChatImage:
         logger.info(f"IN: ChatImage.analyze_image() - 이미지 분석: image_path={image_path}")
         
         try:
-            # 이미지 파일 읽기
-            with open(image_path, "rb") as image_file:
-                image_data = image_file.read()
-            
-            # 이미지 분석 요청
-            response = self.client.chat.completions.create(
+            # 이미지 분석 요청 (파일을 청크 단위로 base64 인코딩하며 전송)
+            response = self.scheduler.call(
+                lambda: self._post_streamed_image(image_path, prompt, max_tokens=300),
+                # 이미지 입력 토큰 + 텍스트 + 응답(max_tokens) 예상치
+                estimated_tokens=1100,
+                usage_of=openai_usage,
                 model=OPENAI_MODEL_GPT4V,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64.b64encode(image_data).decode('utf-8')}"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=300
             )
             
             analysis = response.choices[0].message.content
@@ -98,29 +115,77 @@ class ChatImage:
             logger.error(f"OUT: ChatImage.analyze_image() - 이미지 분석 오류: {e}")
             raise
     
-    def analyze_image_url(self, image_url: str, prompt: str = "이 이미지를 분석해주세요.") -> str:
-        """이미지 분석 (URL)"""
-        logger.info(f"IN: ChatImage.analyze_image_url() - 이미지 분석: image_url={image_url}")
+    def _post_streamed_image(self, image_path: str, prompt: str, max_tokens: int):
+        """이미지 분석 요청 본문을 스트리밍으로 전송 (이미지 전체 / base64 문자열을 메모리에 올리지 않음)
         
-        try:
-            # 이미지 분석 요청 (URL 직접 사용)
-            response = self.client.chat.completions.create(
-                model=OPENAI_MODEL_GPT4V,
-                messages=[
+        SDK 는 요청 본문을 한 번에 직렬화하므로 같은 엔드포인트에 httpx 로 직접 보내고
+        응답만 SDK 타입(ChatCompletion)으로 변환한다. 재시도 시에는 본문 스트림을 새로 만든다.
+        """
+        import httpx
+        from openai.types.chat import ChatCompletion
+        
+        placeholder = f"__image_{uuid.uuid4().hex}__"
+        length, body = iter_data_url_json(
+            {
+                "model": OPENAI_MODEL_GPT4V,
+                "messages": [
                     {
                         "role": "user",
                         "content": [
                             {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url
-                                }
-                            }
+                            {"type": "image_url", "image_url": {"url": placeholder}}
                         ]
                     }
                 ],
-                max_tokens=300
+                "max_tokens": max_tokens
+            },
+            placeholder,
+            image_path,
+        )
+        if self._http_client is None:
+            self._http_client = httpx.Client(timeout=httpx.Timeout(OPENAI_VISION_TIMEOUT, connect=5.0))
+        response = self._http_client.post(
+            f"{str(self.client.base_url).rstrip('/')}/chat/completions",
+            content=body,
+            headers={
+                "Authorization": f"Bearer {self.client.api_key}",
+                "Content-Type": "application/json",
+                "Content-Length": str(length),
+            },
+        )
+        # 429 / 5xx 는 HTTPStatusError 로 올려 스케줄러가 Retry-After 를 보고 재시도
+        response.raise_for_status()
+        return ChatCompletion.model_validate(response.json())
+    
+    def analyze_image_url(self, image_url: str, prompt: str = "이 이미지를 분석해주세요.") -> str:
+        """이미지 분석 (URL)"""
+        logger.info(f"IN: ChatImage.analyze_image_url() - 이미지 분석: image_url={image_url}")
+        
+        try:
+            # 이미지 분석 요청 (URL 직접 사용)
+            response = self.scheduler.call(
+                lambda: self.client.chat.completions.create(
+                    model=OPENAI_MODEL_GPT4V,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": [
+                                {"type": "text", "text": prompt},
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": image_url
+                                    }
+                                }
+                            ]
+                        }
+                    ],
+                    max_tokens=300
+                ),
+                # 이미지 입력 토큰 + 텍스트 + 응답(max_tokens) 예상치
+                estimated_tokens=1100,
+                usage_of=openai_usage,
+                model=OPENAI_MODEL_GPT4V,
             )
             
             analysis = response.choices[0].message.content
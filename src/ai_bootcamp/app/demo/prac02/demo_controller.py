@@ -4,20 +4,29 @@ Demo Controller for Prac02 (Image Demo)
 Prac02 이미지 데모를 위한 웹 컨트롤러
 """
 
+import asyncio
 import logging
 import os
-import requests
-import uuid
-from pathlib import Path
-from typing import Optional
-from PIL import Image, ImageDraw, ImageFont
+from typing import List, Optional
 import io
 
-from fastapi import APIRouter, File, Form, UploadFile
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
+from ...common.core.container import get_job_queue, get_llm_cache, get_template_cache
+from ...common.core.http_cache import TemplateCache
+from ...common.core.image_store import get_image_store
+from ...common.core.jobs import (FAILED, JOB_TIMEOUT, SUCCEEDED, CallbackURLError, JobQueue,
+                                 JobQueueFullError, check_callback_url, job_handler)
+from ...common.llm.image_io import download_to_file
+from ...common.llm.response_cache import LLMResponseCache
+from ...common.llm.streaming import SSE_HEADERS, sse_event
+from .chatimage import ChatImage
+from .image_analysis import IMAGE_ANALYSIS_MAX_FILES, ImageAnalysisPipeline
+from .mock_images import MockImageRenderer
+
 load_dotenv()
 
 # 로깅 설정
@@ -29,11 +38,16 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/demo/prac02", tags=["demo"])
 
+# 이미지 생성 작업 종류 (common/core/jobs.py 작업 큐)
+IMAGE_JOB_KIND = "image.generate"
+
 
 class ImageGenerationRequest(BaseModel):
     prompt: str
     size: str = "1024x1024"
     quality: str = "standard"
+    # 작업 완료 시 결과를 POST 받을 URL (선택)
+    callback_url: Optional[str] = None
 
 
 class ImageAnalysisRequest(BaseModel):
@@ -44,22 +58,22 @@ class DemoController:
     """Prac02 데모 컨트롤러"""
 
     def __init__(self):
-        self.templates_path = (
-            Path(__file__).parent.parent.parent.parent / "resources" / "templates"
-        )
-        self.images_path = (
-            Path(__file__).parent.parent.parent.parent / "resources" / "static" / "images"
-        )
-        # 이미지 저장 디렉토리 생성
-        self.images_path.mkdir(parents=True, exist_ok=True)
-
-    async def demo_page(self):
+        # Mock 모드 / 다운로드 실패 대체 이미지 렌더링 (프로세스 풀은 처음 렌더링할 때 생성)
+        self.mock_renderer = MockImageRenderer()
+        # 업로드 이미지 분석 (축소 + 해시 캐시 + 동시 분석)
+        self.analysis_pipeline = ImageAnalysisPipeline()
+        # 실제 API 모드에서 처음 사용할 때 생성
+        self._chat_image: Optional[ChatImage] = None
+
+    async def demo_page(
+        self,
+        request: Request,
+        template_cache: TemplateCache = Depends(get_template_cache),
+    ):
         """이미지 데모 페이지"""
         logger.info("IN: DemoController.demo_page() - 이미지 데모 페이지 요청")
         try:
-            response = FileResponse(
-                str(self.templates_path / "demo" / "prac02" / "index.html")
-            )
+            response = template_cache.response(request, "demo/prac02/index.html")
             logger.info("OUT: DemoController.demo_page() - 이미지 데모 페이지 반환 성공")
             return response
         except Exception as e:
@@ -77,119 +91,42 @@ class DemoController:
             logger.error(f"OUT: DemoController.hello() - 오류 발생: {e}")
             raise
 
-    async def generate_image(self, request: ImageGenerationRequest):
-        """이미지 생성 API"""
+    async def generate_image(
+        self,
+        request: ImageGenerationRequest,
+        job_queue: JobQueue = Depends(get_job_queue),
+    ):
+        """이미지 생성 API - 작업을 등록하고 바로 job id 반환 (생성 / 다운로드는 작업 워커가 수행)"""
         logger.info(f"IN: DemoController.generate_image() - 이미지 생성 요청: prompt={request.prompt}")
         try:
-            use_mock = os.getenv("USE_MOCK", "false").lower() == "true"
-            
-            if use_mock:
-                # Mock 모드: 로컬에서 이미지 생성
-                logger.info("generate_image() - Mock 모드로 이미지 생성")
-                
-                # 고유한 파일명 생성
-                image_filename = f"generated_mock_{uuid.uuid4().hex[:8]}.png"
-                image_path = self.images_path / image_filename
-                
-                # Mock 이미지 생성 (PIL 사용)
-                width, height = map(int, request.size.split('x'))
-                img = Image.new('RGB', (width, height), color='#007bff')
-                draw = ImageDraw.Draw(img)
-                
-                # 텍스트 추가
+            if request.callback_url:
                 try:
-                    # 기본 폰트 사용 (폰트가 없을 경우를 대비)
-                    font_size = min(width, height) // 20
-                    font = ImageFont.load_default()
-                except:
-                    font = None
-                
-                text = f"Mock Image\nPrompt: {request.prompt[:50]}..."
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                
-                x = (width - text_width) // 2
-                y = (height - text_height) // 2
-                
-                draw.text((x, y), text, fill='white', font=font)
-                
-                # 이미지 저장
-                img.save(image_path, 'PNG')
-                
-                local_image_url = f"/static/images/{image_filename}"
-                logger.info(f"generate_image() - Mock 이미지 생성 완료: {image_path}")
-                
-            else:
-                # 실제 OpenAI API 호출
-                logger.info("generate_image() - OpenAI API 호출 시작")
-                openai_api_key = os.getenv("OPENAI_API_KEY")
-                
-                if not openai_api_key:
-                    raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
-                
-                from openai import OpenAI
-                client = OpenAI(api_key=openai_api_key)
-                
-                # 이미지 생성 요청
-                dalle_response = client.images.generate(
-                    model="dall-e-3",
-                    prompt=request.prompt,
-                    size=request.size,
-                    quality=request.quality,
-                    n=1
-                )
-                
-                generated_image_url = dalle_response.data[0].url
-                logger.info(f"generate_image() - OpenAI 이미지 생성 성공: {generated_image_url}")
-                
-                # 생성된 이미지 다운로드
-                image_filename = f"generated_{uuid.uuid4().hex[:8]}.png"
-                image_path = self.images_path / image_filename
-                
-                try:
-                    response_img = requests.get(generated_image_url, timeout=30)
-                    response_img.raise_for_status()
-                    
-                    with open(image_path, 'wb') as f:
-                        f.write(response_img.content)
-                    
-                    local_image_url = f"/static/images/{image_filename}"
-                    logger.info(f"generate_image() - 이미지 다운로드 완료: {image_path}")
-                except Exception as download_error:
-                    logger.warning(f"generate_image() - 이미지 다운로드 실패, Mock 이미지로 대체: {download_error}")
-                    # 다운로드 실패 시 Mock 이미지 생성
-                    width, height = map(int, request.size.split('x'))
-                    img = Image.new('RGB', (width, height), color='#28a745')
-                    draw = ImageDraw.Draw(img)
-                    
-                    text = f"OpenAI Generated\nPrompt: {request.prompt[:50]}...\n(Download failed, using mock)"
-                    bbox = draw.textbbox((0, 0), text, font=None)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-                    
-                    x = (width - text_width) // 2
-                    y = (height - text_height) // 2
-                    
-                    draw.text((x, y), text, fill='white', font=None)
-                    img.save(image_path, 'PNG')
-                    
-                    local_image_url = f"/static/images/{image_filename}"
+                    await check_callback_url(request.callback_url)
+                except CallbackURLError as e:
+                    logger.warning(f"OUT: DemoController.generate_image() - 잘못된 콜백 URL: {request.callback_url}")
+                    return JSONResponse(status_code=400, content={"error": str(e)})
             
+            job = await job_queue.submit(
+                IMAGE_JOB_KIND,
+                request.model_dump(exclude={"callback_url"}),
+                callback_url=request.callback_url,
+            )
             response = {
-                "image_url": local_image_url,
-                "local_path": str(image_path),
-                "filename": image_filename,
-                "prompt": request.prompt,
-                "size": request.size,
-                "quality": request.quality,
-                "mock_mode": use_mock,
-                "status": "success"
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": f"{router.prefix}/image-jobs/{job.id}",
+                "events_url": f"{router.prefix}/image-jobs/{job.id}/events",
             }
-            
-            logger.info(f"OUT: DemoController.generate_image() - 이미지 생성 및 저장 성공: {local_image_url}")
-            return JSONResponse(content=response)
-            
+            logger.info(f"OUT: DemoController.generate_image() - 이미지 생성 작업 등록: job_id={job.id}")
+            return JSONResponse(status_code=202, content=response)
+        
+        except JobQueueFullError as e:
+            logger.warning("OUT: DemoController.generate_image() - 작업 대기열 초과")
+            return JSONResponse(
+                status_code=503,
+                content={"error": str(e)},
+                headers={"Retry-After": str(int(e.retry_after + 0.5))},
+            )
         except Exception as e:
             logger.error(f"OUT: DemoController.generate_image() - 오류 발생: {e}")
             return JSONResponse(
@@ -197,21 +134,153 @@ class DemoController:
                 content={"error": f"이미지 생성 중 오류가 발생했습니다: {str(e)}"}
             )
 
-    async def analyze_image(self, image: UploadFile = File(...), prompt: str = Form(...)):
-        """이미지 분석 API"""
-        logger.info(f"IN: DemoController.analyze_image() - 이미지 분석 요청: filename={image.filename}, prompt={prompt}")
+    async def get_image_job(self, job_id: str, job_queue: JobQueue = Depends(get_job_queue)):
+        """이미지 생성 작업 상태 조회 (폴링)"""
+        logger.info(f"IN: DemoController.get_image_job() - 작업 조회: job_id={job_id}")
+        job = await job_queue.get(job_id)
+        if job is None:
+            logger.info(f"OUT: DemoController.get_image_job() - 작업 없음: job_id={job_id}")
+            return JSONResponse(status_code=404, content={"error": "작업을 찾을 수 없습니다."})
+        logger.info(f"OUT: DemoController.get_image_job() - 작업 상태: {job.status}")
+        return JSONResponse(content=job.to_dict())
+
+    async def image_job_events(self, job_id: str, job_queue: JobQueue = Depends(get_job_queue)):
+        """이미지 생성 작업 상태 스트림 (SSE)
+
+        이벤트:
+            event: status data: 작업 (queued / running)
+            event: done   data: 작업 (succeeded, result 포함)
+            event: error  data: 작업 (failed, error 포함)
+        """
+        logger.info(f"IN: DemoController.image_job_events() - 작업 구독: job_id={job_id}")
+        if await job_queue.get(job_id) is None:
+            logger.info(f"OUT: DemoController.image_job_events() - 작업 없음: job_id={job_id}")
+            return JSONResponse(status_code=404, content={"error": "작업을 찾을 수 없습니다."})
+
+        async def event_stream():
+            async for job in job_queue.subscribe(job_id):
+                event = {SUCCEEDED: "done", FAILED: "error"}.get(job.status, "status")
+                yield sse_event(job.to_dict(), event=event)
+
+        logger.info(f"OUT: DemoController.image_job_events() - 작업 구독 시작: job_id={job_id}")
+        return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+    async def create_image(self, request: ImageGenerationRequest) -> dict:
+        """이미지 생성 + 저장 (작업 워커에서 실행, 블로킹 API 호출은 스레드 / PIL 렌더링은 프로세스 풀에서)"""
+        logger.info(f"IN: DemoController.create_image() - 이미지 생성: prompt={request.prompt}")
+        use_mock = os.getenv("USE_MOCK", "false").lower() == "true"
+        store = get_image_store()
+        
+        if use_mock:
+            # Mock 모드: 로컬에서 이미지 생성
+            logger.info("create_image() - Mock 모드로 이미지 생성")
+            
+            # Mock 이미지 (같은 prompt / size / quality 면 저장된 이미지 재사용, 렌더링은 프로세스 풀)
+            image = await self.mock_renderer.mock_image(request.prompt, request.size, request.quality)
+            logger.info(f"create_image() - Mock 이미지 생성 완료: {image.digest[:12]}")
+            
+        else:
+            # 실제 OpenAI API 호출 (공용 스케줄러 경유)
+            logger.info("create_image() - OpenAI API 호출 시작")
+            if self._chat_image is None:
+                self._chat_image = ChatImage()
+            
+            generated_image_url = await asyncio.to_thread(
+                self._chat_image.generate_image,
+                request.prompt, size=request.size, quality=request.quality,
+                # 작업 시간 제한을 넘기면 스레드 안의 API 호출도 끝나도록 같은 시간을 전달
+                timeout=JOB_TIMEOUT,
+            )
+            logger.info(f"create_image() - OpenAI 이미지 생성 성공: {generated_image_url}")
+            
+            # 생성된 이미지 다운로드 (청크 단위로 디스크에 바로 기록)
+            image_path = store.temp_path(".png")
+            try:
+                await download_to_file(generated_image_url, image_path)
+                image = await asyncio.to_thread(store.put_file, image_path)
+                logger.info(f"create_image() - 이미지 다운로드 완료: {image.digest[:12]}")
+            except Exception as download_error:
+                logger.warning(f"create_image() - 이미지 다운로드 실패, Mock 이미지로 대체: {download_error}")
+                # 다운로드 실패 시 Mock 이미지 생성
+                image = await self.mock_renderer.render(
+                    request.size, '#28a745',
+                    f"OpenAI Generated\nPrompt: {request.prompt[:50]}...\n(Download failed, using mock)"
+                )
+        
+        # 해시 이름 URL (같은 이미지는 같은 URL, 축소본은 ?w= 로 요청 시 생성)
+        local_image_url = f"/images/{image.digest}"
+        result = {
+            "image_url": local_image_url,
+            "thumbnail_url": f"{local_image_url}?w=256",
+            "local_path": str(store.path_of(image)),
+            "filename": image.filename,
+            "digest": image.digest,
+            "bytes": image.size,
+            "prompt": request.prompt,
+            "size": request.size,
+            "quality": request.quality,
+            "mock_mode": use_mock,
+            "status": "success"
+        }
+        logger.info(f"OUT: DemoController.create_image() - 이미지 생성 및 저장 성공: {local_image_url}")
+        return result
+
+    async def mock_render_stats(self):
+        """Mock 이미지 렌더 캐시 통계"""
+        logger.info("IN: DemoController.mock_render_stats() - 렌더 캐시 통계 조회")
+        stats = self.mock_renderer.get_stats()
+        logger.info("OUT: DemoController.mock_render_stats() - 렌더 캐시 통계 조회 완료")
+        return stats
+
+    async def analyze_image(
+        self,
+        image: List[UploadFile] = File(...),
+        prompt: str = Form(...),
+        llm_cache: LLMResponseCache = Depends(get_llm_cache),
+    ):
+        """이미지 분석 API (같은 필드로 여러 장 업로드 가능, 결과는 이미지 내용 해시로 캐시)"""
+        filenames = [upload.filename for upload in image]
+        logger.info(f"IN: DemoController.analyze_image() - 이미지 분석 요청: filenames={filenames}, prompt={prompt}")
+        if len(image) > IMAGE_ANALYSIS_MAX_FILES:
+            logger.warning(f"OUT: DemoController.analyze_image() - 이미지 수 초과: {len(image)}")
+            return JSONResponse(
+                status_code=400,
+                content={"error": f"한 번에 최대 {IMAGE_ANALYSIS_MAX_FILES}장까지 분석할 수 있습니다."}
+            )
         try:
-            # Mock 응답 (실제 OpenAI API 호출 대신)
-            mock_analysis = f"이미지 '{image.filename}'에 대한 분석 결과입니다. 요청하신 프롬프트 '{prompt}'에 따라 분석한 결과: 이 이미지는 테스트용 이미지로 보이며, 실제 분석 기능은 Mock 모드에서 제공됩니다."
+            results = await self.analysis_pipeline.analyze_many(image, prompt, llm_cache)
+            failed = [result for result in results if result.error]
+            if len(failed) == len(results):
+                # 모두 실패 - 업로드 문제(크기 / 형식)뿐이면 클라이언트 오류로 응답
+                statuses = {result.error_status for result in failed}
+                if any(status >= 500 for status in statuses):
+                    raise RuntimeError(failed[0].error)
+                status_code = 413 if statuses == {413} else 400
+                logger.warning(
+                    f"OUT: DemoController.analyze_image() - 분석할 수 있는 이미지 없음: status={status_code}"
+                )
+                return JSONResponse(
+                    status_code=status_code,
+                    content={"error": failed[0].error, "results": [result.to_dict() for result in results]}
+                )
             
+            succeeded = [result for result in results if not result.error]
+            if len(results) == 1:
+                analysis = succeeded[0].analysis
+            else:
+                analysis = "\n\n".join(f"[{result.filename}] {result.analysis}" for result in succeeded)
             response = {
-                "analysis": mock_analysis,
-                "filename": image.filename,
+                "analysis": analysis,
+                "filename": filenames[0],
                 "prompt": prompt,
-                "status": "success"
+                "results": [result.to_dict() for result in results],
+                "status": "partial" if failed else "success"
             }
             
-            logger.info(f"OUT: DemoController.analyze_image() - 이미지 분석 성공")
+            logger.info(
+                f"OUT: DemoController.analyze_image() - 이미지 분석 성공: "
+                f"images={len(results)}, cached={sum(result.cached for result in results)}, failed={len(failed)}"
+            )
             return JSONResponse(content=response)
         except Exception as e:
             logger.error(f"OUT: DemoController.analyze_image() - 오류 발생: {e}")
@@ -228,4 +297,12 @@ demo_controller = DemoController()
 router.add_api_route("/", demo_controller.demo_page, methods=["GET"], response_class=HTMLResponse)
 router.add_api_route("/hello", demo_controller.hello, methods=["GET"])
 router.add_api_route("/generate-image", demo_controller.generate_image, methods=["POST"])
-router.add_api_route("/analyze-image", demo_controller.analyze_image, methods=["POST"]) 
\ No newline at end of file
+router.add_api_route("/image-jobs/{job_id}", demo_controller.get_image_job, methods=["GET"])
+router.add_api_route("/image-jobs/{job_id}/events", demo_controller.image_job_events, methods=["GET"])
+router.add_api_route("/mock-images/stats", demo_controller.mock_render_stats, methods=["GET"])
+router.add_api_route("/analyze-image", demo_controller.analyze_image, methods=["POST"]) 
+
+@job_handler(IMAGE_JOB_KIND)
+async def run_image_job(payload: dict) -> dict:
+    """이미지 생성 작업 실행"""
+    return await demo_controller.create_image(ImageGenerationRequest(**payload))
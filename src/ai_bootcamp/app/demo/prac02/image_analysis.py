@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Image Analysis Pipeline
+업로드 이미지 분석 파이프라인 (스트리밍 저장 -> 내용 해시 캐시 조회 -> 축소 -> 비전 모델 호출)
+
+- 업로드는 common/core/uploads.py 로 크기 제한을 걸어 디스크에 스풀하면서 SHA-256 을 계산하고,
+  축소 단계는 스풀 파일을 mmap 으로 읽는다 (파일 전체를 메모리에 올리지 않음).
+- 결과는 LLM 응답 캐시(response_cache.py)에 (모델, 프롬프트, 이미지 해시, 축소 설정) 키로 저장한다.
+  이미지 해시는 params 에 넣으므로 semantic 계층도 같은 이미지 안에서만 프롬프트를 비교한다.
+- 비전 모델은 큰 이미지를 어차피 긴 변 2048 / 짧은 변 768 이하로 줄여서 보므로 보내기 전에
+  그 크기로 줄이고 JPEG 으로 다시 인코딩한다 (공용 프로세스 풀에서 실행).
+- 여러 장은 IMAGE_ANALYSIS_CONCURRENCY 개까지 동시에 분석하고, 같은 이미지 + 같은 프롬프트의
+  동시 요청은 SingleFlight 로 한 번만 호출한다. 공유 호출은 스풀 파일의 하드 링크(자기 사본)로 실행하므로
+  leader 요청이 먼저 끊겨 자기 스풀 파일을 지워도 기다리는 다른 요청에는 영향이 없다.
+  한 장이 실패해도 나머지 결과는 돌려준다.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from fastapi import UploadFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from ...common.core.process_pool import run_in_process
+from ...common.core.uploads import UploadTooLargeError, mmap_file, spool_upload
+from ...common.llm.response_cache import LLMResponseCache
+from ...common.llm.single_flight import SingleFlight
+from .chatimage import OPENAI_MODEL_GPT4V, ChatImage
+
+logger = logging.getLogger(__name__)
+
+VISION_MAX_LONG_SIDE = int(os.getenv("VISION_MAX_LONG_SIDE", "2048"))
+VISION_MAX_SHORT_SIDE = int(os.getenv("VISION_MAX_SHORT_SIDE", "768"))
+VISION_JPEG_QUALITY = int(os.getenv("VISION_JPEG_QUALITY", "85"))
+IMAGE_ANALYSIS_CONCURRENCY = int(os.getenv("IMAGE_ANALYSIS_CONCURRENCY", "4"))
+IMAGE_ANALYSIS_MAX_FILES = int(os.getenv("IMAGE_ANALYSIS_MAX_FILES", "8"))
+
+# 응답 캐시에서 다른 LLM 호출과 구분하기 위한 시스템 프롬프트 자리 값
+ANALYSIS_CACHE_NAMESPACE = "prac02:image-analysis"
+
+
+def vision_size(width: int, height: int, long_side: int, short_side: int) -> Tuple[int, int]:
+    """비전 모델이 실제로 보는 해상도 (긴 변 long_side, 짧은 변 short_side 이하, 확대는 안 함)"""
+    scale = min(1.0, long_side / max(width, height), short_side / min(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def preprocess_image(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+    long_side: int = VISION_MAX_LONG_SIDE,
+    short_side: int = VISION_MAX_SHORT_SIDE,
+    quality: int = VISION_JPEG_QUALITY,
+) -> Dict[str, int]:
+    """EXIF 회전 적용 + 축소 + JPEG 재인코딩 (프로세스 풀에서 실행)"""
+    with mmap_file(source) as data:
+        try:
+            img = Image.open(data)
+        except ValueError as e:
+            # mmap 은 끝을 넘는 seek 에서 ValueError 를 내므로 (파일 객체와 달리) 형식 오류로 통일
+            raise UnidentifiedImageError(f"cannot identify image file {Path(source).name}") from e
+        original_width, original_height = img.size
+        img = ImageOps.exif_transpose(img)
+        if img.mode in ("RGBA", "LA", "P"):
+            # 투명 영역은 흰 배경으로 (JPEG 는 알파 채널 없음)
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, "white")
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+        size = vision_size(*img.size, long_side, short_side)
+        if size != img.size:
+            img = img.resize(size, Image.LANCZOS)
+        img.save(destination, "JPEG", quality=quality, optimize=True)
+    return {
+        "original_width": original_width,
+        "original_height": original_height,
+        "width": size[0],
+        "height": size[1],
+    }
+
+
+@dataclass
+class AnalysisResult:
+    filename: str
+    digest: Optional[str] = None
+    bytes: int = 0
+    analysis: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None
+    # 실패 원인에 맞는 HTTP 상태 (413 크기 초과 / 400 이미지 아님 / 500 분석 실패)
+    error_status: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ImageAnalysisPipeline:
+    """업로드 이미지 분석 (해시 캐시 + 축소 + 동시 분석)"""
+
+    def __init__(self, concurrency: int = IMAGE_ANALYSIS_CONCURRENCY):
+        self.concurrency = concurrency
+        self._flight = SingleFlight(enabled=True)
+        # 실제 API 모드에서 처음 사용할 때 생성
+        self._chat_image: Optional[ChatImage] = None
+
+    async def _analyze_file(self, path: Path, filename: str, prompt: str, use_mock: bool) -> str:
+        """축소 후 비전 모델 호출 (Mock 모드면 축소 결과만 설명)"""
+        prepared = path.with_name(f"{path.stem}.vision.jpg")
+        try:
+            meta = await run_in_process(preprocess_image, path, prepared)
+            if use_mock:
+                return (
+                    f"이미지 '{filename}'에 대한 분석 결과입니다. 요청하신 프롬프트 '{prompt}'에 따라 분석한 결과: "
+                    f"원본 {meta['original_width']}x{meta['original_height']} 이미지를 "
+                    f"{meta['width']}x{meta['height']} 로 축소해 분석했습니다. "
+                    f"실제 분석 기능은 USE_MOCK=false 일 때 제공됩니다."
+                )
+            if self._chat_image is None:
+                self._chat_image = ChatImage()
+            return await asyncio.to_thread(self._chat_image.analyze_image, str(prepared), prompt)
+        finally:
+            prepared.unlink(missing_ok=True)
+
+    def _start_shared(self, path: Path, filename: str, prompt: str, use_mock: bool) -> "asyncio.Task":
+        """공유(single-flight) 분석 태스크 시작 - 자기 사본 파일로 실행하고 끝나면(취소 포함) 삭제"""
+        shared = path.with_name(f"flight-{uuid.uuid4().hex}{path.suffix}")
+        try:
+            os.link(path, shared)
+        except OSError:
+            # 하드 링크를 지원하지 않는 파일 시스템
+            shutil.copyfile(path, shared)
+        task = asyncio.ensure_future(self._analyze_file(shared, filename, prompt, use_mock))
+        # 시작 전에 취소돼도 done 콜백은 실행되므로 사본이 남지 않음
+        task.add_done_callback(lambda _: shared.unlink(missing_ok=True))
+        return task
+
+    async def analyze_upload(
+        self, upload: UploadFile, prompt: str, cache: Optional[LLMResponseCache] = None
+    ) -> AnalysisResult:
+        """이미지 한 장 분석 (오류는 결과의 error 로 반환)"""
+        result = AnalysisResult(filename=upload.filename or "image")
+        use_mock = os.getenv("USE_MOCK", "false").lower() == "true"
+        spooled = None
+        try:
+            spooled = await spool_upload(upload)
+            path, result.digest, result.bytes = spooled.path, spooled.digest, spooled.size
+            params = {
+                "image": result.digest,
+                "long_side": VISION_MAX_LONG_SIDE,
+                "short_side": VISION_MAX_SHORT_SIDE,
+                "mock": use_mock,
+            }
+            messages = [("user", prompt)]
+            if cache is not None:
+                cached = await cache.aget(OPENAI_MODEL_GPT4V, ANALYSIS_CACHE_NAMESPACE, messages, params)
+                if cached is not None:
+                    result.analysis, result.cached = cached.content, True
+                    return result
+
+            result.analysis = await self._flight.acall(
+                f"{result.digest}\0{prompt}\0{use_mock}",
+                lambda: self._start_shared(path, result.filename, prompt, use_mock),
+            )
+            if cache is not None:
+                await cache.aput(
+                    OPENAI_MODEL_GPT4V, ANALYSIS_CACHE_NAMESPACE, messages, result.analysis, params=params
+                )
+        except UploadTooLargeError as e:
+            logger.warning(f"ImageAnalysisPipeline.analyze_upload() - 업로드 크기 초과: {result.filename}: {e}")
+            result.error, result.error_status = str(e), 413
+        except UnidentifiedImageError:
+            logger.warning(f"ImageAnalysisPipeline.analyze_upload() - 이미지 형식 아님: {result.filename}")
+            result.error, result.error_status = "이미지 파일이 아니거나 지원하지 않는 형식입니다.", 400
+        except Exception as e:
+            logger.error(f"ImageAnalysisPipeline.analyze_upload() - 분석 실패: {result.filename}: {e}")
+            result.error, result.error_status = str(e), 500
+        finally:
+            if spooled is not None:
+                spooled.unlink()
+        return result
+
+    async def analyze_many(
+        self, uploads: Sequence[UploadFile], prompt: str, cache: Optional[LLMResponseCache] = None
+    ) -> List[AnalysisResult]:
+        """여러 장을 concurrency 개까지 동시에 분석 (결과는 업로드 순서대로)"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def analyze(upload: UploadFile) -> AnalysisResult:
+            async with semaphore:
+                return await self.analyze_upload(upload, prompt, cache)
+
+        return list(await asyncio.gather(*(analyze(upload) for upload in uploads)))
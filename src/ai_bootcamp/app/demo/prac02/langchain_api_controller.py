@@ -4,10 +4,27 @@ LangChain API Controller
 LangChain 기능을 위한 API 컨트롤러
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import os
+from functools import partial
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import BaseModel, Field
+
+from ...common.core.container import (get_conversation_store, get_llm_cache,
+                                      get_llm_registry, get_llm_telemetry)
+from ...common.core.fast_json import FastJSONResponse
+from ...common.llm.client_registry import LLMClientRegistry
+from ...common.llm.conversation import ConversationStore, truncating_summarizer
+from ...common.llm.invocation import (LLM_CALL_TIMEOUT, ClientDisconnectedError,
+                                      run_until_disconnected)
+from ...common.llm.prompts import get_prompt_registry
+from ...common.llm.response_cache import LLMResponseCache
+from ...common.llm.scheduler import CircuitOpenError, get_scheduler
+from ...common.llm.single_flight import get_single_flight
+from ...common.llm.telemetry import LLMTelemetry
+from ...common.llm.streaming import mock_stream, sse_response
 
 # 로깅 설정
 logging.basicConfig(
@@ -33,6 +50,20 @@ class TranslationResponse(BaseModel):
     target_language: str
 
 
+class BatchTranslationRequest(BaseModel):
+    """일괄 번역 요청 DTO"""
+    texts: List[str] = Field(..., min_length=1, max_length=500)
+    target_language: str = "Korean"
+
+
+class BatchTranslationResponse(BaseModel):
+    """일괄 번역 응답 DTO (입력 순서 유지)"""
+    translations: List[str]
+    target_language: str
+    count: int
+    llm_calls: int
+
+
 class ChatMessage(BaseModel):
     """채팅 메시지 DTO"""
     role: str
@@ -50,13 +81,83 @@ class ChatResponse(BaseModel):
     conversation_length: int
 
 
+class ConversationCreateRequest(BaseModel):
+    """대화 생성 요청 DTO"""
+    system_prompt: Optional[str] = None
+
+
+class ConversationCreateResponse(BaseModel):
+    """대화 생성 응답 DTO"""
+    conversation_id: str
+
+
+class ConversationMessageRequest(BaseModel):
+    """대화 메시지 요청 DTO (새 메시지만 전송)"""
+    content: str
+
+
+class ConversationMessageResponse(BaseModel):
+    """대화 메시지 응답 DTO"""
+    conversation_id: str
+    response: str
+    turn_count: int
+    context_tokens: int
+    summarized: bool
+
+
+MOCK_TRANSLATIONS = {
+    "I love programming.": "저는 프로그래밍을 사랑합니다.",
+    "Hello, world!": "안녕하세요, 세계!",
+    "Python is amazing.": "파이썬은 놀라워요.",
+    "Machine learning is fun.": "머신러닝은 재미있어요."
+}
+
+MOCK_CHAT_RESPONSES = [
+    "안녕하세요! 무엇을 도와드릴까요?",
+    "프로그래밍에 대해 질문하시는군요. 어떤 부분이 궁금하신가요?",
+    "파이썬은 매우 유연하고 강력한 프로그래밍 언어입니다.",
+    "머신러닝과 AI에 관심이 있으시군요. 좋은 선택입니다!",
+    "코딩을 배우는 것은 정말 재미있고 유용한 기술입니다.",
+    "AI 기술은 앞으로 더욱 발전할 것으로 예상됩니다."
+]
+
+
+def _circuit_open_exception(error: CircuitOpenError) -> HTTPException:
+    """서킷 브레이커가 열려 있을 때 응답 (503 + Retry-After)"""
+    return HTTPException(
+        status_code=503,
+        detail="LLM API 가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": str(max(1, int(error.retry_after + 0.5)))},
+    )
+
+
+def _is_mock_mode() -> bool:
+    """USE_MOCK 환경 변수 확인 (요청마다 확인)"""
+    return os.getenv("USE_MOCK", "false").lower() == "true"
+
+
+def _mock_translation(text: str, target_language: str) -> str:
+    return MOCK_TRANSLATIONS.get(text, f"[Mock] '{text}'를 {target_language}로 번역")
+
+
+def _mock_chat_response(message_count: int) -> str:
+    response_index = min(message_count - 1, len(MOCK_CHAT_RESPONSES) - 1)
+    return MOCK_CHAT_RESPONSES[response_index] if response_index >= 0 else MOCK_CHAT_RESPONSES[0]
+
+
 @router.post("/translate", response_model=TranslationResponse)
-async def translate_text(request: TranslationRequest):
+async def translate_text(
+    request: TranslationRequest,
+    http_request: Request,
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+):
     """
     텍스트 번역 API
     
     Args:
         request (TranslationRequest): 번역 요청
+        http_request (Request): 클라이언트 연결 종료 감지용 원본 요청
+        llm_registry (LLMClientRegistry): 워커 공유 LLM 클라이언트 레지스트리
         
     Returns:
         TranslationResponse: 번역 결과
@@ -64,58 +165,64 @@ async def translate_text(request: TranslationRequest):
     logger.info(f"IN: translate_text() - 번역 요청: text={request.text}, target_language={request.target_language}")
     
     try:
-        # Mock 모드 확인
-        import os
-        use_mock = os.getenv("USE_MOCK", "false").lower() == "true"
-        
-        if use_mock:
+        if _is_mock_mode():
             # Mock 응답
-            mock_translations = {
-                "I love programming.": "저는 프로그래밍을 사랑합니다.",
-                "Hello, world!": "안녕하세요, 세계!",
-                "Python is amazing.": "파이썬은 놀라워요.",
-                "Machine learning is fun.": "머신러닝은 재미있어요."
-            }
-            translation = mock_translations.get(request.text, f"[Mock] '{request.text}'를 {request.target_language}로 번역")
+            translation = _mock_translation(request.text, request.target_language)
             
-            response = TranslationResponse(
+            response = TranslationResponse.model_construct(
                 translation=translation,
                 original_text=request.text,
                 target_language=request.target_language
             )
             
             logger.info(f"OUT: translate_text() - Mock 번역 성공: {translation}")
-            return response
+            return FastJSONResponse(response)
         else:
-            # 실제 LangChain 데모 인스턴스 생성
-            from .langchainchat import LangChainChatDemo
+            # 워커 공유 클라이언트(커넥션 풀 재사용) 조회
+            chat_demo = llm_registry.get_chat_demo()
             
-            chat_demo = LangChainChatDemo(use_mock=False)
-            
-            # 번역 실행
-            translation = chat_demo.translate_text(request.text, request.target_language)
+            # 번역 실행 (비동기 - 타임아웃 / 연결 종료 시 취소)
+            translation = await run_until_disconnected(
+                http_request,
+                chat_demo.atranslate_text(request.text, request.target_language),
+            )
             
-            response = TranslationResponse(
+            response = TranslationResponse.model_construct(
                 translation=translation,
                 original_text=request.text,
                 target_language=request.target_language
             )
             
             logger.info(f"OUT: translate_text() - 실제 번역 성공: {translation}")
-            return response
+            return FastJSONResponse(response)
         
+    except asyncio.TimeoutError:
+        logger.error("OUT: translate_text() - 번역 시간 초과")
+        raise HTTPException(status_code=504, detail="번역 응답 시간이 초과되었습니다.")
+    except ClientDisconnectedError:
+        logger.info("OUT: translate_text() - 클라이언트 연결 종료로 번역 취소")
+        return Response(status_code=499)
+    except CircuitOpenError as e:
+        logger.error("OUT: translate_text() - LLM API 서킷 열림")
+        raise _circuit_open_exception(e)
     except Exception as e:
         logger.error(f"OUT: translate_text() - 번역 오류: {e}")
         raise HTTPException(status_code=500, detail=f"번역 중 오류가 발생했습니다: {str(e)}")
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat_conversation(request: ChatRequest):
+async def chat_conversation(
+    request: ChatRequest,
+    http_request: Request,
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+):
     """
     대화형 채팅 API
     
     Args:
         request (ChatRequest): 채팅 요청
+        http_request (Request): 클라이언트 연결 종료 감지용 원본 요청
+        llm_registry (LLMClientRegistry): 워커 공유 LLM 클라이언트 레지스트리
         
     Returns:
         ChatResponse: AI 응답
@@ -123,60 +230,413 @@ async def chat_conversation(request: ChatRequest):
     logger.info(f"IN: chat_conversation() - 채팅 요청: messages_count={len(request.messages)}")
     
     try:
-        # Mock 모드 확인
-        import os
-        use_mock = os.getenv("USE_MOCK", "false").lower() == "true"
-        
-        if use_mock:
-            # Mock 응답
-            mock_responses = [
-                "안녕하세요! 무엇을 도와드릴까요?",
-                "프로그래밍에 대해 질문하시는군요. 어떤 부분이 궁금하신가요?",
-                "파이썬은 매우 유연하고 강력한 프로그래밍 언어입니다.",
-                "머신러닝과 AI에 관심이 있으시군요. 좋은 선택입니다!",
-                "코딩을 배우는 것은 정말 재미있고 유용한 기술입니다.",
-                "AI 기술은 앞으로 더욱 발전할 것으로 예상됩니다."
-            ]
+        if _is_mock_mode():
+            # Mock 응답 (메시지 개수에 따라 다른 응답 반환)
+            ai_response = _mock_chat_response(len(request.messages))
             
-            # 메시지 개수에 따라 다른 응답 반환
-            response_index = min(len(request.messages) - 1, len(mock_responses) - 1)
-            ai_response = mock_responses[response_index] if response_index >= 0 else mock_responses[0]
-            
-            response = ChatResponse(
+            response = ChatResponse.model_construct(
                 response=ai_response,
                 conversation_length=len(request.messages)
             )
             
             logger.info(f"OUT: chat_conversation() - Mock 채팅 성공: {ai_response}")
-            return response
+            return FastJSONResponse(response)
         else:
-            # 실제 LangChain 데모 인스턴스 생성
-            from .langchainchat import LangChainChatDemo
-            
-            chat_demo = LangChainChatDemo(use_mock=False)
+            # 워커 공유 클라이언트(커넥션 풀 재사용) 조회
+            chat_demo = llm_registry.get_chat_demo()
             
             # 메시지 형식 변환
             messages = [(msg.role, msg.content) for msg in request.messages]
             
-            # 채팅 실행
-            responses = chat_demo.chat_conversation(messages)
+            # 채팅 실행 (비동기 - 타임아웃 / 연결 종료 시 취소)
+            responses = await run_until_disconnected(
+                http_request, chat_demo.achat_conversation(messages)
+            )
             
             # 마지막 응답 반환
             ai_response = responses[-1] if responses else "죄송합니다. 응답을 생성할 수 없습니다."
             
-            response = ChatResponse(
+            response = ChatResponse.model_construct(
                 response=ai_response,
                 conversation_length=len(request.messages)
             )
             
             logger.info(f"OUT: chat_conversation() - 실제 채팅 성공: {ai_response}")
-            return response
+            return FastJSONResponse(response)
         
+    except asyncio.TimeoutError:
+        logger.error("OUT: chat_conversation() - 채팅 시간 초과")
+        raise HTTPException(status_code=504, detail="채팅 응답 시간이 초과되었습니다.")
+    except ClientDisconnectedError:
+        logger.info("OUT: chat_conversation() - 클라이언트 연결 종료로 채팅 취소")
+        return Response(status_code=499)
+    except CircuitOpenError as e:
+        logger.error("OUT: chat_conversation() - LLM API 서킷 열림")
+        raise _circuit_open_exception(e)
     except Exception as e:
         logger.error(f"OUT: chat_conversation() - 채팅 오류: {e}")
         raise HTTPException(status_code=500, detail=f"채팅 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.post("/translate/batch", response_model=BatchTranslationResponse)
+async def translate_batch(
+    request: BatchTranslationRequest,
+    http_request: Request,
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+):
+    """
+    일괄 번역 API
+    
+    여러 문장을 토큰 예산 단위로 묶어 적은 수의 LLM 호출로 번역한다.
+    
+    Args:
+        request (BatchTranslationRequest): 일괄 번역 요청
+        http_request (Request): 클라이언트 연결 종료 감지용 원본 요청
+        llm_registry (LLMClientRegistry): 워커 공유 LLM 클라이언트 레지스트리
+        
+    Returns:
+        BatchTranslationResponse: 입력 순서의 번역 결과
+    """
+    logger.info(f"IN: translate_batch() - 일괄 번역 요청: count={len(request.texts)}, target_language={request.target_language}")
+    
+    try:
+        if _is_mock_mode():
+            translations = [_mock_translation(text, request.target_language) for text in request.texts]
+            llm_calls = 0
+        else:
+            chat_demo = llm_registry.get_chat_demo()
+            # 청크별 타임아웃은 atranslate_batch 에서, 여기서는 연결 종료만 감시
+            translations, llm_calls = await run_until_disconnected(
+                http_request,
+                chat_demo.atranslate_batch(
+                    request.texts, request.target_language, timeout=LLM_CALL_TIMEOUT
+                ),
+                timeout=None,
+            )
+        
+        response = BatchTranslationResponse.model_construct(
+            translations=translations,
+            target_language=request.target_language,
+            count=len(translations),
+            llm_calls=llm_calls
+        )
+        
+        logger.info(f"OUT: translate_batch() - 일괄 번역 성공: count={len(translations)}, llm_calls={llm_calls}")
+        return FastJSONResponse(response)
+        
+    except asyncio.TimeoutError:
+        logger.error("OUT: translate_batch() - 일괄 번역 시간 초과")
+        raise HTTPException(status_code=504, detail="번역 응답 시간이 초과되었습니다.")
+    except ClientDisconnectedError:
+        logger.info("OUT: translate_batch() - 클라이언트 연결 종료로 일괄 번역 취소")
+        return Response(status_code=499)
+    except CircuitOpenError as e:
+        logger.error("OUT: translate_batch() - LLM API 서킷 열림")
+        raise _circuit_open_exception(e)
+    except Exception as e:
+        logger.error(f"OUT: translate_batch() - 일괄 번역 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"번역 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/translate/stream")
+async def translate_text_stream(
+    request: TranslationRequest,
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+):
+    """
+    텍스트 번역 스트리밍 API (Server-Sent Events)
+    
+    토큰이 생성되는 즉시 `data: {"delta": ...}` 이벤트로 전달하고,
+    마지막에 `event: done` 으로 TranslationResponse 와 같은 형태의 결과를 보낸다.
+    
+    Args:
+        request (TranslationRequest): 번역 요청
+        llm_registry (LLMClientRegistry): 워커 공유 LLM 클라이언트 레지스트리
+        
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+    logger.info(f"IN: translate_text_stream() - 스트리밍 번역 요청: text={request.text}, target_language={request.target_language}")
+    
+    try:
+        if _is_mock_mode():
+            chunks = mock_stream(_mock_translation(request.text, request.target_language))
+        else:
+            chunks = llm_registry.get_chat_demo().astream_translate(request.text, request.target_language)
+        
+        def on_complete(translation: str) -> Dict[str, Any]:
+            logger.info(f"OUT: translate_text_stream() - 스트리밍 번역 완료: {translation}")
+            return {
+                "translation": translation,
+                "original_text": request.text,
+                "target_language": request.target_language
+            }
+        
+        return sse_response(chunks, on_complete)
+        
+    except Exception as e:
+        logger.error(f"OUT: translate_text_stream() - 번역 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"번역 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/chat/stream")
+async def chat_conversation_stream(
+    request: ChatRequest,
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+):
+    """
+    대화형 채팅 스트리밍 API (Server-Sent Events)
+    
+    토큰이 생성되는 즉시 `data: {"delta": ...}` 이벤트로 전달하고,
+    마지막에 `event: done` 으로 ChatResponse 와 같은 형태의 결과를 보낸다.
+    
+    Args:
+        request (ChatRequest): 채팅 요청
+        llm_registry (LLMClientRegistry): 워커 공유 LLM 클라이언트 레지스트리
+        
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+    logger.info(f"IN: chat_conversation_stream() - 스트리밍 채팅 요청: messages_count={len(request.messages)}")
+    
+    try:
+        if _is_mock_mode():
+            chunks = mock_stream(_mock_chat_response(len(request.messages)))
+        else:
+            messages = [(msg.role, msg.content) for msg in request.messages]
+            chunks = llm_registry.get_chat_demo().astream_chat(messages)
+        
+        def on_complete(ai_response: str) -> Dict[str, Any]:
+            logger.info(f"OUT: chat_conversation_stream() - 스트리밍 채팅 완료: {ai_response}")
+            return {
+                "response": ai_response or "죄송합니다. 응답을 생성할 수 없습니다.",
+                "conversation_length": len(request.messages)
+            }
+        
+        return sse_response(chunks, on_complete)
+        
+    except Exception as e:
+        logger.error(f"OUT: chat_conversation_stream() - 채팅 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"채팅 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/conversations", response_model=ConversationCreateResponse)
+async def create_conversation(
+    request: ConversationCreateRequest,
+    conversation_store: ConversationStore = Depends(get_conversation_store),
+):
+    """
+    서버 측 대화 세션 생성
+    
+    Args:
+        request (ConversationCreateRequest): 대화 생성 요청 (시스템 프롬프트 선택)
+        conversation_store (ConversationStore): 대화 세션 저장소
+        
+    Returns:
+        ConversationCreateResponse: 생성된 대화 ID
+    """
+    session = conversation_store.create(request.system_prompt)
+    logger.info(f"OUT: create_conversation() - 대화 생성: id={session.conversation_id}")
+    return ConversationCreateResponse(conversation_id=session.conversation_id)
+
+
+@router.post("/conversations/{conversation_id}/messages", response_model=ConversationMessageResponse)
+async def send_conversation_message(
+    conversation_id: str,
+    request: ConversationMessageRequest,
+    http_request: Request,
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+    conversation_store: ConversationStore = Depends(get_conversation_store),
+):
+    """
+    대화 메시지 전송 API
+    
+    서버에 저장된 (누적 요약 + 최근 턴) 으로 프롬프트를 구성하고, 컨텍스트가 임계값을 넘으면
+    오래된 턴을 요약으로 흡수한다. 클라이언트는 매 턴 새 메시지만 보낸다.
+    
+    Args:
+        conversation_id (str): 대화 ID
+        request (ConversationMessageRequest): 새 사용자 메시지
+        http_request (Request): 클라이언트 연결 종료 감지용 원본 요청
+        llm_registry (LLMClientRegistry): 워커 공유 LLM 클라이언트 레지스트리
+        conversation_store (ConversationStore): 대화 세션 저장소
+        
+    Returns:
+        ConversationMessageResponse: AI 응답 및 컨텍스트 상태
+    """
+    logger.info(f"IN: send_conversation_message() - 대화 메시지: id={conversation_id}")
+    
+    session = conversation_store.get(conversation_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다.")
+    
+    # 같은 대화의 턴은 순서대로 처리
+    async with session.lock:
+        conversation_store.append(session, "human", request.content)
+        try:
+            if _is_mock_mode():
+                human_turns = sum(1 for turn in session.turns if turn.role == "human")
+                ai_response = _mock_chat_response(session.summarized_turns // 2 + human_turns)
+                summarizer = truncating_summarizer
+            else:
+                chat_demo = llm_registry.get_chat_demo()
+                responses = await run_until_disconnected(
+                    http_request, chat_demo.achat_conversation(session.to_messages())
+                )
+                ai_response = responses[-1] if responses else "죄송합니다. 응답을 생성할 수 없습니다."
+                summarizer = partial(chat_demo.asummarize_conversation, timeout=LLM_CALL_TIMEOUT)
+        except BaseException as e:
+            # 응답을 받지 못한 사용자 턴은 기록에서 제거
+            session.turns.pop()
+            if isinstance(e, asyncio.TimeoutError):
+                logger.error("OUT: send_conversation_message() - 대화 시간 초과")
+                raise HTTPException(status_code=504, detail="채팅 응답 시간이 초과되었습니다.")
+            if isinstance(e, ClientDisconnectedError):
+                logger.info("OUT: send_conversation_message() - 클라이언트 연결 종료로 대화 취소")
+                return Response(status_code=499)
+            if isinstance(e, CircuitOpenError):
+                logger.error("OUT: send_conversation_message() - LLM API 서킷 열림")
+                raise _circuit_open_exception(e)
+            if isinstance(e, Exception):
+                logger.error(f"OUT: send_conversation_message() - 대화 오류: {e}")
+                raise HTTPException(status_code=500, detail=f"채팅 중 오류가 발생했습니다: {str(e)}")
+            raise
+        
+        conversation_store.append(session, "ai", ai_response)
+        summarized = await conversation_store.compact(session, summarizer)
+    
+    response = ConversationMessageResponse.model_construct(
+        conversation_id=conversation_id,
+        response=ai_response,
+        turn_count=session.turn_count,
+        context_tokens=session.context_tokens,
+        summarized=summarized
+    )
+    logger.info(
+        f"OUT: send_conversation_message() - 대화 성공: turns={session.turn_count}, context_tokens={session.context_tokens}"
+    )
+    return FastJSONResponse(response)
+
+
+@router.get("/conversations/{conversation_id}")
+async def get_conversation(
+    conversation_id: str,
+    conversation_store: ConversationStore = Depends(get_conversation_store),
+):
+    """
+    대화 세션 조회 (누적 요약 + 요약되지 않은 최근 턴)
+    
+    Returns:
+        Dict[str, Any]: 대화 세션 정보
+    """
+    session = conversation_store.get(conversation_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다.")
+    return session.to_dict()
+
+
+@router.delete("/conversations/{conversation_id}")
+async def delete_conversation(
+    conversation_id: str,
+    conversation_store: ConversationStore = Depends(get_conversation_store),
+):
+    """
+    대화 세션 삭제
+    
+    Returns:
+        Dict[str, Any]: 삭제 결과
+    """
+    if not conversation_store.delete(conversation_id):
+        raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다.")
+    logger.info(f"OUT: delete_conversation() - 대화 삭제: id={conversation_id}")
+    return {"status": "success", "conversation_id": conversation_id}
+
+
+@router.get("/cache/stats")
+async def cache_stats(llm_cache: LLMResponseCache = Depends(get_llm_cache)):
+    """
+    LLM 응답 캐시 통계 (적중률, 절약한 토큰 수)
+    
+    Returns:
+        Dict[str, Any]: 캐시 통계
+    """
+    return llm_cache.get_stats()
+
+
+@router.get("/scheduler/stats")
+async def scheduler_stats():
+    """
+    LLM 호출 스케줄러 통계 (대기열, 재시도, 서킷 상태, 남은 RPM/TPM)
+    
+    Returns:
+        Dict[str, Any]: 스케줄러 통계
+    """
+    return get_scheduler().get_stats()
+
+
+@router.get("/single-flight/stats")
+async def single_flight_stats():
+    """
+    동일 호출 병합 통계 (실제 호출 수, 합류한 요청 수, 오류 / 타임아웃)
+    
+    Returns:
+        Dict[str, Any]: single-flight 통계
+    """
+    return get_single_flight().get_stats()
+
+
+@router.get("/router/stats")
+async def router_stats(llm_registry: LLMClientRegistry = Depends(get_llm_registry)):
+    """
+    모델 라우터 통계 (백엔드별 EWMA 지연 시간, 오류율, p95, 헤지 횟수)
+
+    Returns:
+        Dict[str, Any]: 라우터 통계 (API 키가 없으면 enabled=False)
+    """
+    if not llm_registry.enabled:
+        return {"enabled": False}
+    return {"enabled": True, **llm_registry.get_router().get_stats()}
+
+
+@router.get("/prompts/stats")
+async def prompt_stats():
+    """
+    프롬프트 템플릿별 통계 (호출 수, 입력 토큰, 공급자 프롬프트 캐시 적중 토큰 비율)
+    
+    Returns:
+        Dict[str, Any]: 프롬프트 레지스트리 통계
+    """
+    return get_prompt_registry().get_stats()
+
+
+@router.get("/telemetry")
+async def telemetry_stats(telemetry: LLMTelemetry = Depends(get_llm_telemetry)):
+    """
+    LLM 호출 텔레메트리 (프로세스 시작 이후 엔드포인트 / 모델별 토큰, 지연 시간)
+    
+    Returns:
+        Dict[str, Any]: 텔레메트리 집계
+    """
+    return FastJSONResponse(telemetry.get_stats())
+
+
+@router.get("/telemetry/rollup")
+async def telemetry_rollup(
+    hours: float = 24, telemetry: LLMTelemetry = Depends(get_llm_telemetry)
+):
+    """
+    SQLite 롤업 기준 최근 N 시간 엔드포인트 / 모델별 사용량 (토큰 많은 순)
+    
+    Args:
+        hours (float): 조회 기간(시간)
+        
+    Returns:
+        Dict[str, Any]: 기간 내 사용량
+    """
+    rows = await asyncio.to_thread(telemetry.query_rollup, hours * 3600)
+    return FastJSONResponse({"hours": hours, "usage": rows})
+
+
 @router.get("/health")
 async def health_check():
     """
@@ -5,9 +5,11 @@ LangChain 데모 페이지를 위한 웹 컨트롤러
 """
 
 import logging
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+
+from ...common.core.container import get_template_cache
+from ...common.core.http_cache import TemplateCache
 
 # 로깅 설정
 logging.basicConfig(
@@ -19,17 +21,17 @@ logger = logging.getLogger(__name__)
 # 라우터 생성
 router = APIRouter(prefix="/demo/prac02", tags=["demo"])
 
-# 템플릿 설정
-templates = Jinja2Templates(directory="src/ai_bootcamp/resources/templates")
-
 
 @router.get("/langchain", response_class=HTMLResponse)
-async def langchain_demo_page(request: Request):
+async def langchain_demo_page(
+    request: Request, template_cache: TemplateCache = Depends(get_template_cache)
+):
     """
     LangChain 데모 페이지 렌더링
     
     Args:
         request (Request): FastAPI 요청 객체
+        template_cache (TemplateCache): 메모리 템플릿 캐시 (ETag / 304 처리)
         
     Returns:
         HTMLResponse: LangChain 데모 페이지
@@ -37,10 +39,7 @@ async def langchain_demo_page(request: Request):
     logger.info("IN: langchain_demo_page() - LangChain 데모 페이지 요청")
     
     try:
-        response = templates.TemplateResponse(
-            "demo/prac02/langchain.html",
-            {"request": request}
-        )
+        response = template_cache.response(request, "demo/prac02/langchain.html")
         logger.info("OUT: langchain_demo_page() - LangChain 데모 페이지 렌더링 성공")
         return response
         
@@ -5,13 +5,59 @@ Azure OpenAI에서 OpenAI API로 변환된 LangChain 채팅 데모
 """
 
 import os
+import json
+import asyncio
 import logging
-from typing import List, Tuple, Optional
+from typing import AsyncIterator, List, Tuple, Optional
 from dotenv import load_dotenv
+from pydantic import BaseModel
+
+from ...common.llm.prompts import PromptTemplate, get_prompt_registry, register_prompt
+from ...common.llm.scheduler import (DEFAULT_COMPLETION_TOKENS, PRIORITY_BATCH, PRIORITY_DEFAULT,
+                                     PRIORITY_INTERACTIVE, get_scheduler)
+from ...common.llm.router import ROUTER_MODEL, ModelRouter
+from ...common.llm.single_flight import get_single_flight, single_flight_key
+from ...common.llm.telemetry import langchain_usage
+from ...common.llm.tokens import chunk_by_token_budget, estimate_message_tokens
 
 # 환경 변수 로드
 load_dotenv()
 
+# 일괄 번역 설정 (청크당 토큰 예산 / 청크당 최대 문장 수 / 동시 LLM 호출 수)
+BATCH_MAX_CHUNK_TOKENS = int(os.getenv("BATCH_MAX_CHUNK_TOKENS", "1500"))
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "40"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
+# 프롬프트 템플릿 (고정 지시문을 맨 앞에 두고 목표 언어 등 변수는 뒤에 붙여 공급자 프롬프트 캐시 적중률 유지)
+TRANSLATE_PROMPT = register_prompt(
+    "translate",
+    prefix=(
+        "You are a helpful assistant that translates English into the target language given below. "
+        "Translate the user sentence."
+    ),
+    suffix="Target language: {target_language}",
+    user="{text}",
+)
+TRANSLATE_BATCH_PROMPT = register_prompt(
+    "translate.batch",
+    prefix=(
+        "You are a helpful assistant that translates English into the target language given below. "
+        "The user sends a JSON object with a `sentences` array. Translate each sentence independently "
+        "and return exactly one translation per sentence, in the same order."
+    ),
+    suffix="Target language: {target_language}",
+    user="{sentences}",
+)
+SUMMARY_PROMPT = register_prompt(
+    "conversation.summary",
+    prefix=(
+        "You maintain a running summary of a conversation. Merge the previous summary and the new "
+        "turns into one concise summary that keeps facts, names, decisions and open questions. "
+        "Write it in the conversation's language."
+    ),
+    user="Previous summary:\n{previous_summary}\n\nNew turns:\n{transcript}",
+)
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -20,23 +66,59 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class BatchTranslation(BaseModel):
+    """일괄 번역 구조화 출력 (입력 문장과 같은 순서)"""
+    translations: List[str]
+
+
 class LangChainChatDemo:
     """LangChain을 사용한 OpenAI 채팅 데모 클래스"""
     
-    def __init__(self, use_mock: bool = False):
+    def __init__(
+        self,
+        use_mock: bool = False,
+        model=None,
+        model_name: Optional[str] = None,
+        cache=None,
+        router: Optional[ModelRouter] = None,
+    ):
         """
         LangChainChatDemo 초기화
         
         Args:
             use_mock (bool): Mock 모드 사용 여부 (API 할당량 초과 시 테스트용)
+            model: 미리 생성된(커넥션 풀을 공유하는) ChatOpenAI 인스턴스 (없으면 새로 생성)
+            model_name (Optional[str]): 모델 이름 (기본값: OPENAI_MODEL 환경 변수, "auto" 면 모델 라우터 사용)
+            cache: 번역 결과를 재사용할 LLMResponseCache (없으면 캐시하지 않음)
+            router (Optional[ModelRouter]): 여러 백엔드 중 요청마다 고르는 라우터 (model_name="auto" 일 때)
         """
         logger.info("IN: LangChainChatDemo.__init__() - LangChainChatDemo 초기화")
         
         self.use_mock = use_mock
+        self.cache = cache
+        # 프로세스 공용 호출 스케줄러 (RPM/TPM 한도, 재시도, 서킷 브레이커)
+        self.scheduler = get_scheduler()
+        # 동시에 들어온 동일 호출은 한 번만 실행
+        self.single_flight = get_single_flight()
+        self.router = None
         
         # OpenAI 환경 변수
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.openai_model = model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        
+        if not self.use_mock and (router is not None or self.openai_model == ROUTER_MODEL):
+            # 모델 라우터 사용 (지연 시간 / 오류율 기반 백엔드 선택 + 헤징 + 장애 전환)
+            self.openai_model = ROUTER_MODEL
+            self.router = router or ModelRouter.from_env()
+            self.model = None
+            logger.info("OUT: LangChainChatDemo.__init__() - 모델 라우터 사용")
+            return
+        
+        if model is not None:
+            # LLMClientRegistry 가 관리하는 클라이언트 재사용
+            self.model = model
+            logger.info("OUT: LangChainChatDemo.__init__() - 공유 LangChain OpenAI 클라이언트 사용")
+            return
         
         if not self.openai_api_key and not self.use_mock:
             logger.error("OUT: LangChainChatDemo.__init__() - OPENAI_API_KEY가 설정되지 않음")
@@ -49,7 +131,9 @@ class LangChainChatDemo:
                 
                 self.model = ChatOpenAI(
                     model=self.openai_model,
-                    api_key=self.openai_api_key
+                    api_key=self.openai_api_key,
+                    max_retries=0,
+                    stream_usage=True
                 )
                 logger.info("OUT: LangChainChatDemo.__init__() - LangChain OpenAI 클라이언트 초기화 성공")
             except ImportError as e:
@@ -87,19 +171,20 @@ class LangChainChatDemo:
             return result
         
         try:
-            from langchain_core.messages import HumanMessage, SystemMessage
-            
-            system_prompt = f"You are a helpful assistant that translates English to {target_language}. Translate the user sentence."
+            messages = self._build_translation_messages(text, target_language)
+            cache_args = (self.openai_model, messages[0].content, [("human", text)])
             
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=text)
-            ]
+            cached = self.cache.get(*cache_args) if self.cache else None
+            if cached is not None:
+                logger.info(f"OUT: translate_text() - 캐시 적중({cached.tier}): {cached.content}")
+                return cached.content
             
             logger.info(f"translate_text() - API 호출 시작: model={self.openai_model}")
-            response = self.model.invoke(messages)
+            response = self._invoke(messages, TRANSLATE_PROMPT)
             
             result = response.content
+            if self.cache:
+                self.cache.put(*cache_args, result, self._total_tokens(response))
             logger.info(f"OUT: translate_text() - 번역 성공: {result}")
             return result
             
@@ -132,21 +217,11 @@ class LangChainChatDemo:
             return responses
         
         try:
-            from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-            
-            langchain_messages = []
+            langchain_messages = self._to_langchain_messages(messages)
             responses = []
             
-            for role, content in messages:
-                if role.lower() == "system":
-                    langchain_messages.append(SystemMessage(content=content))
-                elif role.lower() == "human":
-                    langchain_messages.append(HumanMessage(content=content))
-                elif role.lower() == "ai":
-                    langchain_messages.append(AIMessage(content=content))
-            
             logger.info(f"chat_conversation() - API 호출 시작: model={self.openai_model}")
-            response = self.model.invoke(langchain_messages)
+            response = self._invoke(langchain_messages)
             
             responses.append(response.content)
             logger.info(f"OUT: chat_conversation() - 대화 성공: {responses}")
@@ -156,6 +231,416 @@ class LangChainChatDemo:
             logger.error(f"OUT: chat_conversation() - 대화 오류: {e}")
             raise
     
+    async def atranslate_text(
+        self, text: str, target_language: str = "Korean", timeout: Optional[float] = None
+    ) -> str:
+        """
+        텍스트 번역 (비동기 - 이벤트 루프를 막지 않음)
+        
+        Args:
+            text (str): 번역할 텍스트
+            target_language (str): 목표 언어
+            timeout (Optional[float]): 호출 타임아웃(초), None 이면 제한 없음
+            
+        Returns:
+            str: 번역된 텍스트
+        """
+        if self.use_mock:
+            return self.translate_text(text, target_language)
+        
+        logger.info(f"IN: atranslate_text() - 번역 요청: text={text}, target_language={target_language}")
+        try:
+            messages = self._build_translation_messages(text, target_language)
+            cache_args = (self.openai_model, messages[0].content, [("human", text)])
+            
+            cached = await self.cache.aget(*cache_args) if self.cache else None
+            if cached is not None:
+                logger.info(f"OUT: atranslate_text() - 캐시 적중({cached.tier}): {cached.content}")
+                return cached.content
+            
+            logger.info(f"atranslate_text() - API 호출 시작: model={self.openai_model}")
+            response = await asyncio.wait_for(
+                self._ainvoke(messages, PRIORITY_INTERACTIVE, prompt=TRANSLATE_PROMPT), timeout
+            )
+            
+            result = response.content
+            if self.cache:
+                await self.cache.aput(*cache_args, result, self._total_tokens(response))
+            logger.info(f"OUT: atranslate_text() - 번역 성공: {result}")
+            return result
+            
+        except asyncio.CancelledError:
+            logger.info("OUT: atranslate_text() - 번역 호출 취소")
+            raise
+        except Exception as e:
+            logger.error(f"OUT: atranslate_text() - 번역 오류: {e!r}")
+            raise
+    
+    async def achat_conversation(
+        self, messages: List[Tuple[str, str]], timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        대화형 채팅 (비동기 - 이벤트 루프를 막지 않음)
+        
+        Args:
+            messages (List[Tuple[str, str]]): 메시지 리스트 (role, content)
+            timeout (Optional[float]): 호출 타임아웃(초), None 이면 제한 없음
+            
+        Returns:
+            List[str]: AI 응답 리스트
+        """
+        if self.use_mock:
+            return self.chat_conversation(messages)
+        
+        logger.info(f"IN: achat_conversation() - 대화 요청: messages_count={len(messages)}")
+        try:
+            langchain_messages = self._to_langchain_messages(messages)
+            
+            logger.info(f"achat_conversation() - API 호출 시작: model={self.openai_model}")
+            response = await asyncio.wait_for(
+                self._ainvoke(langchain_messages, PRIORITY_INTERACTIVE), timeout
+            )
+            
+            responses = [response.content]
+            logger.info(f"OUT: achat_conversation() - 대화 성공: {responses}")
+            return responses
+            
+        except asyncio.CancelledError:
+            logger.info("OUT: achat_conversation() - 대화 호출 취소")
+            raise
+        except Exception as e:
+            logger.error(f"OUT: achat_conversation() - 대화 오류: {e!r}")
+            raise
+    
+    async def asummarize_conversation(
+        self, previous_summary: str, turns: List[Tuple[str, str]], timeout: Optional[float] = None
+    ) -> str:
+        """
+        대화 요약 (ConversationStore 의 요약기로 사용)
+        
+        Args:
+            previous_summary (str): 지금까지의 요약
+            turns (List[Tuple[str, str]]): 요약에 새로 흡수할 (role, content) 턴
+            timeout (Optional[float]): 호출 타임아웃(초)
+            
+        Returns:
+            str: 갱신된 요약
+        """
+        logger.info(f"IN: asummarize_conversation() - 대화 요약 요청: turns={len(turns)}")
+        messages = SUMMARY_PROMPT.messages(
+            previous_summary=previous_summary or "(none)",
+            transcript="\n".join(f"{role}: {content}" for role, content in turns),
+        )
+        response = await asyncio.wait_for(
+            self._ainvoke(messages, PRIORITY_DEFAULT, prompt=SUMMARY_PROMPT), timeout
+        )
+        logger.info("OUT: asummarize_conversation() - 대화 요약 완료")
+        return response.content
+    
+    async def atranslate_batch(
+        self,
+        texts: List[str],
+        target_language: str = "Korean",
+        max_chunk_tokens: int = BATCH_MAX_CHUNK_TOKENS,
+        max_items: int = BATCH_MAX_ITEMS,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
+    ) -> Tuple[List[str], int]:
+        """
+        여러 문장 일괄 번역 - 토큰 예산 단위로 묶어 적은 수의 LLM 호출로 번역
+        
+        캐시에 있는 문장과 중복 문장은 호출에서 제외하고, 청크는 max_concurrency 개까지 동시에 실행한다.
+        
+        Args:
+            texts (List[str]): 번역할 문장 목록
+            target_language (str): 목표 언어
+            max_chunk_tokens (int): 청크당 입력 토큰 예산
+            max_items (int): 청크당 최대 문장 수
+            max_concurrency (int): 동시 LLM 호출 수
+            timeout (Optional[float]): 청크별 호출 타임아웃(초)
+            
+        Returns:
+            Tuple[List[str], int]: (입력 순서의 번역 결과, LLM 호출 수)
+        """
+        logger.info(f"IN: atranslate_batch() - 일괄 번역 요청: count={len(texts)}, target_language={target_language}")
+        
+        if self.use_mock:
+            results = [self.translate_text(text, target_language) for text in texts]
+            logger.info(f"OUT: atranslate_batch() - Mock 일괄 번역 완료: count={len(results)}")
+            return results, 0
+        
+        system_prompt = TRANSLATE_PROMPT.system(target_language=target_language)
+        translated = {}
+        
+        # 캐시 적중 문장은 제외, 중복 문장은 한 번만 번역
+        pending = []
+        for text in dict.fromkeys(texts):
+            cached = await self.cache.aget(self.openai_model, system_prompt, [("human", text)]) if self.cache else None
+            if cached is not None:
+                translated[text] = cached.content
+            else:
+                pending.append(text)
+        
+        chunks = chunk_by_token_budget(pending, max_chunk_tokens, max_items)
+        # 청크 호출과 대체(문장별) 호출이 함께 쓰는 동시 호출 한도
+        semaphore = asyncio.Semaphore(max_concurrency)
+        llm_calls = 0
+        
+        async def run_chunk(chunk: List[Tuple[int, str]]) -> None:
+            nonlocal llm_calls
+            sentences = [text for _, text in chunk]
+            translations, total_tokens, calls = await self._atranslate_chunk(
+                sentences, target_language, timeout, semaphore
+            )
+            llm_calls += calls
+            for text, translation in zip(sentences, translations):
+                translated[text] = translation
+                if self.cache:
+                    await self.cache.aput(
+                        self.openai_model, system_prompt, [("human", text)],
+                        translation, total_tokens // len(sentences)
+                    )
+        
+        await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+        
+        results = [translated[text] for text in texts]
+        logger.info(
+            f"OUT: atranslate_batch() - 일괄 번역 완료: count={len(texts)}, unique_pending={len(pending)}, llm_calls={llm_calls}"
+        )
+        return results, llm_calls
+    
+    async def _atranslate_chunk(
+        self, sentences: List[str], target_language: str, timeout: Optional[float], semaphore: asyncio.Semaphore
+    ) -> Tuple[List[str], int, int]:
+        """문장 묶음을 구조화 출력 한 번으로 번역 (개수가 맞지 않으면 문장별 번역으로 대체)
+        
+        모든 호출은 semaphore 슬롯 하나씩을 잡고 PRIORITY_BATCH 로 실행한다
+        (대체 호출이 청크 슬롯 안에서 한꺼번에 나가 동시 호출 한도를 넘지 않도록).
+        
+        Returns:
+            Tuple[List[str], int, int]: (번역 결과, 총 토큰 수, 실제 LLM 호출 수)
+        """
+        messages = TRANSLATE_BATCH_PROMPT.messages(
+            target_language=target_language,
+            sentences=json.dumps({"sentences": sentences}, ensure_ascii=False),
+        )
+        
+        async with semaphore:
+            result = await asyncio.wait_for(
+                self._ainvoke(
+                    messages, PRIORITY_BATCH, completion_tokens=len(sentences) * 64,
+                    structured=BatchTranslation, prompt=TRANSLATE_BATCH_PROMPT
+                ),
+                timeout,
+            )
+        parsed = result.get("parsed")
+        total_tokens = self._total_tokens(result.get("raw"))
+        
+        if parsed is not None and len(parsed.translations) == len(sentences):
+            return parsed.translations, total_tokens, 1
+        
+        logger.warning(
+            f"_atranslate_chunk() - 구조화 출력 불일치, 문장별 번역으로 대체: expected={len(sentences)}, error={result.get('parsing_error')}"
+        )
+        
+        async def translate_one(sentence: str):
+            async with semaphore:
+                return await asyncio.wait_for(
+                    self._ainvoke(
+                        self._build_translation_messages(sentence, target_language),
+                        PRIORITY_BATCH, prompt=TRANSLATE_PROMPT
+                    ),
+                    timeout,
+                )
+        
+        responses = await asyncio.gather(*(translate_one(sentence) for sentence in sentences))
+        total_tokens += sum(self._total_tokens(response) for response in responses)
+        return [response.content for response in responses], total_tokens, 1 + len(sentences)
+    
+    async def astream_translate(self, text: str, target_language: str = "Korean") -> AsyncIterator[str]:
+        """
+        텍스트 번역 토큰 스트림 (ChatOpenAI.astream)
+        
+        Args:
+            text (str): 번역할 텍스트
+            target_language (str): 목표 언어
+            
+        Yields:
+            str: 번역 결과 토큰 조각
+        """
+        if self.use_mock:
+            yield self.translate_text(text, target_language)
+            return
+        
+        logger.info(f"IN: astream_translate() - 스트리밍 번역 요청: text={text}, target_language={target_language}")
+        messages = self._build_translation_messages(text, target_language)
+        async for chunk in self._astream(messages, TRANSLATE_PROMPT):
+            yield chunk.content
+        logger.info("OUT: astream_translate() - 스트리밍 번역 완료")
+    
+    async def astream_chat(self, messages: List[Tuple[str, str]]) -> AsyncIterator[str]:
+        """
+        대화형 채팅 토큰 스트림 (ChatOpenAI.astream)
+        
+        Args:
+            messages (List[Tuple[str, str]]): 메시지 리스트 (role, content)
+            
+        Yields:
+            str: AI 응답 토큰 조각
+        """
+        if self.use_mock:
+            for response in self.chat_conversation(messages)[-1:]:
+                yield response
+            return
+        
+        logger.info(f"IN: astream_chat() - 스트리밍 대화 요청: messages_count={len(messages)}")
+        langchain_messages = self._to_langchain_messages(messages)
+        async for chunk in self._astream(langchain_messages):
+            yield chunk.content
+        logger.info("OUT: astream_chat() - 스트리밍 대화 완료")
+    
+    @staticmethod
+    def _estimate_tokens(messages: list, completion_tokens: int = DEFAULT_COMPLETION_TOKENS) -> int:
+        """스케줄러 TPM 예산용 토큰 예상치 (프롬프트 + 응답)"""
+        return estimate_message_tokens((m.type, str(m.content)) for m in messages) + completion_tokens
+    
+    @staticmethod
+    def _record_prompt(prompt: Optional[PromptTemplate], response) -> None:
+        """템플릿별 입력 / 캐시 적중 토큰 집계"""
+        if prompt is not None:
+            get_prompt_registry().record(prompt.name, langchain_usage(response))
+    
+    def _flight_key(self, messages: list, structured: Optional[type] = None) -> str:
+        """single-flight 키 (모델 + 메시지 + 구조화 출력 스키마)"""
+        return single_flight_key(
+            self.openai_model,
+            ((m.type, m.content) for m in messages),
+            structured=structured.__name__ if structured else None,
+        )
+    
+    def _invoke(self, messages: list, prompt: Optional[PromptTemplate] = None):
+        """스케줄러(또는 모델 라우터)를 거친 동기 호출 (진행 중인 동일 호출이 있으면 합류)"""
+        def invoke():
+            if self.router is not None:
+                response = self.router.call(
+                    lambda backend: backend.chat_model.invoke(messages),
+                    estimated_tokens=self._estimate_tokens(messages),
+                    priority=PRIORITY_INTERACTIVE,
+                )
+            else:
+                response = self.scheduler.call(
+                    lambda: self.model.invoke(messages),
+                    estimated_tokens=self._estimate_tokens(messages),
+                    usage_of=langchain_usage,
+                    model=self.openai_model,
+                )
+            self._record_prompt(prompt, response)
+            return response
+        
+        return self.single_flight.call(self._flight_key(messages), invoke)
+    
+    async def _ainvoke(
+        self,
+        messages: list,
+        priority: int,
+        completion_tokens: int = DEFAULT_COMPLETION_TOKENS,
+        structured: Optional[type] = None,
+        prompt: Optional[PromptTemplate] = None,
+    ):
+        """스케줄러(또는 모델 라우터)를 거친 비동기 호출 (structured 가 있으면 include_raw 구조화 출력)
+        
+        진행 중인 동일 호출이 있으면 새로 호출하지 않고 그 결과를 함께 받는다.
+        """
+        def runnable(chat_model):
+            if structured is None:
+                return chat_model
+            return chat_model.with_structured_output(structured, include_raw=True)
+        
+        estimated_tokens = self._estimate_tokens(messages, completion_tokens)
+        
+        async def invoke():
+            if self.router is not None:
+                response = await self.router.acall(
+                    lambda backend: runnable(backend.chat_model).ainvoke(messages),
+                    estimated_tokens=estimated_tokens,
+                    priority=priority,
+                )
+            else:
+                response = await self.scheduler.acall(
+                    lambda: runnable(self.model).ainvoke(messages),
+                    estimated_tokens=estimated_tokens,
+                    priority=priority,
+                    usage_of=langchain_usage,
+                    model=self.openai_model,
+                )
+            self._record_prompt(prompt, response)
+            return response
+        
+        return await self.single_flight.acall(self._flight_key(messages, structured), invoke)
+    
+    async def _astream(self, messages: list, prompt: Optional[PromptTemplate] = None) -> AsyncIterator:
+        """스케줄러 허가를 받은 뒤 토큰 스트림 전달 (스트림 도중에는 재시도하지 않음)
+        
+        라우터 사용 시 1순위 백엔드로 스트리밍한다 (첫 토큰 이후에는 헤징 / 전환하지 않음).
+        """
+        if self.router is not None:
+            backend = self.router.pick()
+            chat_model, scheduler, model_name = backend.chat_model, backend.scheduler, backend.model_name
+        else:
+            chat_model, scheduler, model_name = self.model, self.scheduler, self.openai_model
+        # 대기 중 취소되면 aacquire_checked 가 시험 호출 자격을 반환
+        permit, trial = await scheduler.aacquire_checked(self._estimate_tokens(messages), PRIORITY_INTERACTIVE)
+        started = asyncio.get_running_loop().time()
+        usage, ok = None, False
+        try:
+            async for chunk in chat_model.astream(messages):
+                # stream_usage=True 이면 마지막 청크에 사용량이 실려 옴
+                if getattr(chunk, "usage_metadata", None):
+                    usage = langchain_usage(chunk)
+                yield chunk
+            ok = True
+            scheduler.breaker.record_success()
+        except Exception as e:
+            # 429 / 재시도 불가 오류는 서킷 실패로 세지 않음 (acall 과 같은 규칙)
+            scheduler.record_error(e, trial)
+            raise
+        finally:
+            if trial and not ok:
+                # 클라이언트 연결 종료 등으로 판정 없이 끝난 시험 호출
+                scheduler.breaker.release_trial()
+            scheduler.release(permit, usage.total_tokens if usage else None)
+            scheduler.telemetry.record(
+                model_name, usage, asyncio.get_running_loop().time() - started, ok
+            )
+            if prompt is not None and ok:
+                get_prompt_registry().record(prompt.name, usage)
+    
+    @staticmethod
+    def _total_tokens(response) -> int:
+        """LangChain 응답의 총 토큰 수 (usage_metadata 가 없으면 0)"""
+        usage = getattr(response, "usage_metadata", None) or {}
+        return usage.get("total_tokens", 0)
+    
+    @staticmethod
+    def _build_translation_messages(text: str, target_language: str) -> list:
+        """번역용 LangChain 메시지 구성 (사전 컴파일된 TRANSLATE_PROMPT 사용)"""
+        return TRANSLATE_PROMPT.messages(text=text, target_language=target_language)
+    
+    @staticmethod
+    def _to_langchain_messages(messages: List[Tuple[str, str]]) -> list:
+        """(role, content) 리스트를 LangChain 메시지로 변환"""
+        from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+        
+        langchain_messages = []
+        for role, content in messages:
+            if role.lower() == "system":
+                langchain_messages.append(SystemMessage(content=content))
+            elif role.lower() == "human":
+                langchain_messages.append(HumanMessage(content=content))
+            elif role.lower() == "ai":
+                langchain_messages.append(AIMessage(content=content))
+        return langchain_messages
+    
     def test_translation(self) -> None:
         """번역 기능 테스트"""
         logger.info("IN: test_translation() - 번역 테스트 시작")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Mock Image Renderer
+Mock 모드 이미지 생성 (PIL 렌더링 + PNG 인코딩) 을 프로세스 풀에서 실행하고 결과를 재사용
+
+- 같은 (prompt, size, quality) 는 같은 이미지이므로 이미지 저장소의 digest 를 기억해 두고 다시 그리지 않는다.
+  저장소에서 LRU 로 지워졌으면 다시 렌더링한다.
+- 동시에 들어온 같은 요청은 SingleFlight 로 한 번만 렌더링한다.
+- 렌더링 / PNG 압축은 CPU 작업이라 공용 프로세스 풀(common/core/process_pool.py)에서 실행한다.
+  부하 테스트가 PNG 압축이 아니라 서버를 측정하도록.
+"""
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from PIL import Image, ImageDraw, ImageFont
+
+from ...common.core.image_store import ImageStore, StoredImage, get_image_store
+from ...common.core.process_pool import PROCESS_POOL_WORKERS, run_in_process
+from ...common.llm.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+MOCK_RENDER_CACHE_SIZE = int(os.getenv("MOCK_RENDER_CACHE_SIZE", "256"))
+
+RenderKey = Tuple[str, str, str]
+
+
+def render_placeholder(image_path: Union[str, Path], size: str, color: str, text: str) -> None:
+    """텍스트가 들어간 단색 PNG 생성 (Mock 모드 / 다운로드 실패 대체용, 프로세스 풀에서 실행 가능)"""
+    width, height = map(int, size.split('x'))
+    img = Image.new('RGB', (width, height), color=color)
+    draw = ImageDraw.Draw(img)
+
+    # 기본 폰트 사용 (폰트가 없을 경우를 대비)
+    try:
+        font = ImageFont.load_default()
+    except Exception:
+        font = None
+
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    x = (width - text_width) // 2
+    y = (height - text_height) // 2
+
+    draw.text((x, y), text, fill='white', font=font)
+    img.save(image_path, 'PNG')
+
+
+class MockImageRenderer:
+    """Mock 이미지 렌더링 (프로세스 풀) + (prompt, size, quality) 결과 캐시"""
+
+    def __init__(self, store: Optional[ImageStore] = None, cache_size: int = MOCK_RENDER_CACHE_SIZE):
+        self._store = store
+        self.cache_size = cache_size
+        self._digests: "OrderedDict[RenderKey, str]" = OrderedDict()
+        self._flight = SingleFlight(enabled=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.rendered = 0
+
+    @property
+    def store(self) -> ImageStore:
+        return self._store or get_image_store()
+
+    async def render(self, size: str, color: str, text: str) -> StoredImage:
+        """이미지를 렌더링해 저장소에 넣음 (캐시 없이 항상 렌더링)"""
+        store = self.store
+        image_path = store.temp_path(".png")
+        await run_in_process(render_placeholder, image_path, size, color, text)
+        self.rendered += 1
+        return await asyncio.to_thread(store.put_file, image_path)
+
+    async def mock_image(self, prompt: str, size: str, quality: str) -> StoredImage:
+        """Mock 모드 생성 이미지 (같은 요청이면 저장된 이미지를 재사용)"""
+        key: RenderKey = (prompt, size, quality)
+        digest = self._digests.get(key)
+        if digest is not None:
+            image = await asyncio.to_thread(self.store.get, digest)
+            if image is not None:
+                self._digests.move_to_end(key)
+                self.hits += 1
+                return image
+            # 저장소에서 정리됨 - 다시 렌더링
+            self._digests.pop(key, None)
+
+        self.misses += 1
+        image = await self._flight.acall(
+            "\0".join(key),
+            lambda: self.render(size, '#007bff', f"Mock Image\nPrompt: {prompt[:50]}..."),
+        )
+        self._digests[key] = image.digest
+        self._digests.move_to_end(key)
+        while len(self._digests) > self.cache_size:
+            self._digests.popitem(last=False)
+        return image
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "workers": PROCESS_POOL_WORKERS,
+            "cache_size": self.cache_size,
+            "cached": len(self._digests),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "rendered": self.rendered,
+            "coalesced": self._flight.stats.coalesced,
+        }
@@ -18,6 +18,8 @@ RAG 기본 구조 이해하기 - 텍스트 문서 기반 RAG 시스템 (로컬 
 """
 
 import os
+import sys
+from pathlib import Path
 
 from dotenv import load_dotenv
 from langchain_community.document_loaders import TextLoader
@@ -29,6 +31,15 @@ from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_openai import ChatOpenAI
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+try:
+    from ai_bootcamp.app.common.rag.embedding_cache import cached_embeddings, get_embedding_cache
+    from ai_bootcamp.app.common.rag.index_manager import FaissIndexManager
+except ImportError:
+    # 패키지를 설치하지 않고 스크립트로 실행하는 경우 src 를 경로에 추가
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from ai_bootcamp.app.common.rag.embedding_cache import cached_embeddings, get_embedding_cache
+    from ai_bootcamp.app.common.rag.index_manager import FaissIndexManager
+
 # LangSmith 추적 설정 (선택사항)
 try:
     from langchain_teddynote import logging
@@ -37,6 +48,9 @@ try:
 except ImportError:
     print("LangSmith 추적을 사용하려면 'pip install langchain-teddynote'를 실행하세요.")
 
+# 문서 분할 설정 - split_documents() 와 인덱스 지문(create_index_manager())이 함께 사용
+SPLIT_SETTINGS = {"chunk_size": 1000, "chunk_overlap": 50}
+
 
 def setup_environment():
     """환경 설정 및 API 키 로드"""
@@ -62,14 +76,12 @@ def load_documents(text_path):
     return docs
 
 
-def split_documents(docs, chunk_size=1000, chunk_overlap=50):
+def split_documents(docs, split_settings=SPLIT_SETTINGS):
     """단계 2: 문서 분할"""
     print("\n=== 단계 2: 문서 분할 ===")
-    print(f"청크 크기: {chunk_size}, 오버랩: {chunk_overlap}")
+    print(f"청크 크기: {split_settings['chunk_size']}, 오버랩: {split_settings['chunk_overlap']}")
 
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size, chunk_overlap=chunk_overlap
-    )
+    text_splitter = RecursiveCharacterTextSplitter(**split_settings)
     split_documents = text_splitter.split_documents(docs)
     print(f"분할된 청크의 수: {len(split_documents)}")
 
@@ -92,15 +104,53 @@ def create_embeddings():
         model_kwargs={"device": "cpu"},
     )
     print("HuggingFace 임베딩 모델 초기화 완료")
-    return embeddings
+    # 이미 임베딩한 청크는 디스크 캐시에서 재사용
+    return cached_embeddings(embeddings)
+
+
+def create_index_manager(embeddings, script_dir, split_settings=SPLIT_SETTINGS):
+    """디스크에 저장되는 FAISS 인덱스 관리자 (분할 설정이 바뀌면 다시 인덱싱)
+
+    split_settings 는 split_documents() 에 넘기는 것과 같은 객체를 넘겨야
+    분할 설정이 바뀌었을 때 원본 지문이 달라져 오래된 인덱스를 쓰지 않는다.
+    """
+    index_dir = os.getenv("RAG_INDEX_DIR", os.path.join(script_dir, "rag_index"))
+    return FaissIndexManager(
+        Path(__file__).stem,
+        embeddings,
+        index_dir=index_dir,
+        settings=dict(split_settings),
+    )
+
+
+def load_vectorstore(index_manager):
+    """단계 1~4 생략: 저장된 인덱스를 그대로 로드"""
+    print("\n=== 단계 1~4: 저장된 벡터DB 로드 ===")
+    vectorstore = index_manager.load()
+    if vectorstore is not None:
+        print(f"저장된 FAISS 인덱스 사용 (벡터 수: {vectorstore.index.ntotal})")
+    return vectorstore
 
 
-def create_vectorstore(split_documents, embeddings):
+def create_vectorstore(split_documents, embeddings, index_manager=None, sources=None):
     """단계 4: 벡터DB 생성 및 저장"""
     print("\n=== 단계 4: 벡터DB 생성 및 저장 ===")
 
-    vectorstore = FAISS.from_documents(documents=split_documents, embedding=embeddings)
-    print("FAISS 벡터스토어 생성 완료")
+    if index_manager is None:
+        vectorstore = FAISS.from_documents(documents=split_documents, embedding=embeddings)
+        print("FAISS 벡터스토어 생성 완료")
+    else:
+        # 새로 생기거나 바뀐 청크만 임베딩하고 디스크에 저장
+        vectorstore = index_manager.sync(split_documents, sources=sources)
+        stats = index_manager.last_sync
+        print(
+            f"FAISS 벡터스토어 갱신 완료 (추가 {stats.added}, 삭제 {stats.removed}, 재사용 {stats.reused})"
+        )
+        cache_stats = get_embedding_cache().get_stats()
+        print(
+            f"임베딩 캐시: 적중 {cache_stats['hits']}, 미적중 {cache_stats['misses']}, "
+            f"절약한 임베딩 시간 {cache_stats['seconds_saved']}초"
+        )
 
     # 테스트 검색
     print("테스트 검색 수행 중...")
@@ -222,10 +272,15 @@ def main():
 
     try:
         # RAG 파이프라인 실행
-        docs = load_documents(text_path)
-        split_docs = split_documents(docs)
         embeddings = create_embeddings()
-        vectorstore = create_vectorstore(split_docs, embeddings)
+        index_manager = create_index_manager(embeddings, script_dir, SPLIT_SETTINGS)
+        vectorstore = None
+        if index_manager.is_current([text_path]):
+            vectorstore = load_vectorstore(index_manager)
+        if vectorstore is None:
+            docs = load_documents(text_path)
+            split_docs = split_documents(docs, SPLIT_SETTINGS)
+            vectorstore = create_vectorstore(split_docs, embeddings, index_manager, [text_path])
         retriever = create_retriever(vectorstore)
         prompt = create_prompt()
         llm = create_llm()
@@ -0,0 +1,177 @@
+"""AdmissionMiddleware / AdaptiveLimiter 테스트"""
+
+import asyncio
+
+from ai_bootcamp.app.common.core.admission import (DEFAULT_ROUTE_LIMITS, AdaptiveLimiter, AdmissionController,
+                                                   AdmissionMiddleware, RouteLimit)
+
+
+def http_scope(path: str):
+    return {"type": "http", "path": path, "method": "POST", "headers": []}
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def request(middleware: AdmissionMiddleware, path: str) -> int:
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await middleware(http_scope(path), receive, send)
+    return statuses[0]
+
+
+def test_open_streams_do_not_block_other_langchain_routes():
+    async def scenario():
+        finish_streams = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            if scope["path"].endswith("/stream"):
+                # 스트림은 끝날 때까지 슬롯을 잡고 있음
+                await finish_streams.wait()
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = AdmissionMiddleware(app, AdmissionController(DEFAULT_ROUTE_LIMITS))
+        streams = [
+            asyncio.create_task(request(middleware, path))
+            for path in ["/api/langchain/chat/stream"] * 8 + ["/api/langchain/translate/stream"] * 8
+        ]
+        await asyncio.sleep(0.01)
+
+        for path in ("/api/langchain/translate", "/api/langchain/conversations", "/api/langchain/cache/stats"):
+            assert await request(middleware, path) == 200
+
+        finish_streams.set()
+        assert await asyncio.gather(*streams) == [200] * 16
+
+    asyncio.run(scenario())
+
+
+def make_limiter(**overrides) -> AdaptiveLimiter:
+    policy = dict(prefix="/api", max_concurrency=2, max_queue=2, queue_timeout=0.2, target_latency=1.0)
+    policy.update(overrides)
+    return AdaptiveLimiter(RouteLimit(**policy))
+
+
+def test_waiter_gets_released_slot_in_order():
+    async def scenario():
+        limiter = make_limiter()
+        assert await limiter.acquire() and await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 2
+
+        limiter.release(0.01)
+        assert await first is True
+        assert not second.done()
+        limiter.release(0.01)
+        assert await second is True
+        assert (limiter.in_flight, limiter.queued, limiter.admitted, limiter.shed) == (2, 0, 4, 0)
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout_and_full_queue_are_shed():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=1, max_queue=1, queue_timeout=0.05)
+        assert await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        # 대기열이 가득 차면 기다리지 않고 거절
+        assert await limiter.acquire() is False
+        # 대기 예산을 넘기면 거절하고 대기열에서 빠짐
+        assert await waiting is False
+        assert (limiter.in_flight, limiter.queued, limiter.shed) == (1, 0, 2)
+        assert limiter.retry_after() >= 1
+
+    asyncio.run(scenario())
+
+
+def test_expected_wait_over_budget_is_shed_immediately():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=1, queue_timeout=0.5)
+        limiter.ewma_latency = 2.0
+        assert await limiter.acquire()
+        assert await asyncio.wait_for(limiter.acquire(), timeout=0.05) is False
+        assert limiter.queued == 0 and limiter.shed == 1
+        assert limiter.retry_after() == 2
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_leaves_queue_without_taking_a_slot():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=1)
+        assert await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert (limiter.in_flight, limiter.queued) == (1, 0)
+
+        limiter.release(0.01)
+        assert limiter.in_flight == 0
+        assert await limiter.acquire()
+
+    asyncio.run(scenario())
+
+
+def test_slot_handed_to_cancelled_waiter_goes_to_next_waiter():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=1, max_queue=4)
+        assert await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        # 슬롯을 넘겨받은 직후(재개 전)에 연결이 끊긴 경우
+        limiter.release(0.01)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+
+        assert await second is True
+        assert (limiter.in_flight, limiter.queued) == (1, 0)
+
+    asyncio.run(scenario())
+
+
+def test_limit_decreases_when_slow_and_recovers_when_fast():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=4, min_concurrency=2, target_latency=1.0)
+        for _ in range(20):
+            assert await limiter.acquire()
+            limiter.release(5.0)
+        assert limiter.limit == 2.0
+
+        for _ in range(200):
+            assert await limiter.acquire()
+            limiter.release(0.01)
+        assert limiter.limit == 4.0
+        assert limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_reduced_limit_holds_new_requests_until_in_flight_drops():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=2, min_concurrency=1, queue_timeout=1.0, target_latency=0.1)
+        assert await limiter.acquire() and await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        # 느린 응답으로 한도가 1 로 줄어 in_flight 가 1 이어도 대기 유지
+        limiter.release(1.0)
+        await asyncio.sleep(0.01)
+        assert int(limiter.limit) == 1 and not waiting.done()
+
+        limiter.release(1.0)
+        assert await waiting is True
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
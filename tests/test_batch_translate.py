@@ -0,0 +1,39 @@
+"""LangChainChatDemo.atranslate_batch 테스트 (문장별 대체 호출의 동시성 / 우선순위 / 호출 수)"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from ai_bootcamp.app.common.llm.scheduler import PRIORITY_BATCH  # noqa: E402
+from ai_bootcamp.app.demo.prac02.langchainchat import LangChainChatDemo  # noqa: E402
+
+
+def test_fallback_respects_concurrency_and_counts_calls():
+    demo = LangChainChatDemo(use_mock=False, model=object(), model_name="test-model", cache=None)
+    active = peak = 0
+    priorities = []
+
+    async def fake_ainvoke(messages, priority, completion_tokens=0, structured=None, prompt=None):
+        nonlocal active, peak
+        priorities.append(priority)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if structured is not None:
+            # 구조화 출력 실패 -> 문장별 대체
+            return {"parsed": None, "raw": None, "parsing_error": "mismatch"}
+        return SimpleNamespace(content=f"T:{messages[-1].content}", usage_metadata={"total_tokens": 5})
+
+    demo._ainvoke = fake_ainvoke
+    texts = [f"sentence {i}" for i in range(12)]
+    results, llm_calls = asyncio.run(demo.atranslate_batch(texts, max_items=4, max_concurrency=2))
+
+    assert results == [f"T:{text}" for text in texts]
+    # 청크 3개 + 문장별 12개
+    assert llm_calls == 15
+    assert peak <= 2
+    assert set(priorities) == {PRIORITY_BATCH}
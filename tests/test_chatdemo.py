@@ -0,0 +1,89 @@
+"""ChatDemo 테스트 (스케줄러 오류는 모의 응답으로 바꾸지 않고 호출자에게 전파)"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("dotenv")
+
+from ai_bootcamp.app.common.llm.scheduler import CircuitBreaker, CircuitOpenError, LLMScheduler
+from ai_bootcamp.app.common.llm.single_flight import SingleFlight
+from ai_bootcamp.app.common.llm.telemetry import LLMTelemetry
+from ai_bootcamp.app.demo.prac01 import chatdemo
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FailingCompletions:
+    def __init__(self, error: Exception):
+        self.error = error
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        raise self.error
+
+
+class AsyncFailingCompletions(FailingCompletions):
+    async def create(self, **kwargs):
+        return super().create(**kwargs)
+
+
+def make_demo(monkeypatch, completions, max_retries: int = 2):
+    scheduler = LLMScheduler(
+        rpm=60000,
+        tpm=10_000_000,
+        max_retries=max_retries,
+        base_delay=0.0,
+        max_delay=0.0,
+        breaker=CircuitBreaker(failure_threshold=100, reset_timeout=60),
+        telemetry=LLMTelemetry(db_path=None),
+    )
+    monkeypatch.setattr(chatdemo, "get_scheduler", lambda: scheduler)
+    monkeypatch.setattr(chatdemo, "get_single_flight", SingleFlight)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return chatdemo.ChatDemo(client=client, async_client=client)
+
+
+def test_exhausted_retries_propagate(monkeypatch):
+    completions = FailingCompletions(StatusError(503))
+    demo = make_demo(monkeypatch, completions)
+
+    with pytest.raises(StatusError):
+        demo.chat_completion("hello")
+    assert completions.calls == 3
+
+
+def test_open_circuit_propagates(monkeypatch):
+    completions = FailingCompletions(StatusError(503))
+    demo = make_demo(monkeypatch, completions)
+    demo.scheduler.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    demo.scheduler.breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        demo.chat_completion("hello")
+    assert completions.calls == 0
+
+
+def test_async_error_propagates(monkeypatch):
+    completions = AsyncFailingCompletions(StatusError(503))
+    demo = make_demo(monkeypatch, completions, max_retries=0)
+
+    with pytest.raises(StatusError):
+        asyncio.run(demo.achat_completion("hello"))
+    assert completions.calls == 1
+
+
+def test_default_clients_disable_sdk_retries(monkeypatch):
+    monkeypatch.setattr(chatdemo, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(chatdemo, "get_scheduler", lambda: None)
+    demo = chatdemo.ChatDemo()
+
+    assert demo.client.max_retries == 0
+    assert demo.async_client.max_retries == 0
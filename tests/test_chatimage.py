@@ -0,0 +1,71 @@
+"""ChatImage.generate_image 테스트 (작업 시간 제한을 API 요청 타임아웃으로 전달)"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("PIL")
+
+from openai import NOT_GIVEN  # noqa: E402
+
+from ai_bootcamp.app.common.llm.scheduler import CircuitBreaker, LLMScheduler  # noqa: E402
+from ai_bootcamp.app.common.llm.telemetry import LLMTelemetry  # noqa: E402
+from ai_bootcamp.app.demo.prac02 import chatimage  # noqa: E402
+
+
+class APITimeoutError(Exception):
+    """재시도 대상 오류 (이름으로 판별)"""
+
+
+class RecordingImages:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.timeouts = []
+
+    def generate(self, **kwargs):
+        self.timeouts.append(kwargs["timeout"])
+        if len(self.timeouts) <= self.failures:
+            raise APITimeoutError("timed out")
+        return SimpleNamespace(data=[SimpleNamespace(url="https://example.com/image.png")])
+
+
+def make_chat_image(images, retry_delay: float = 0.0):
+    chat_image = chatimage.ChatImage.__new__(chatimage.ChatImage)
+    chat_image.client = SimpleNamespace(images=images)
+    chat_image.scheduler = LLMScheduler(
+        rpm=60000,
+        tpm=10_000_000,
+        max_retries=5,
+        base_delay=0.0,
+        max_delay=0.0,
+        breaker=CircuitBreaker(failure_threshold=100, reset_timeout=60),
+        telemetry=LLMTelemetry(db_path=None),
+    )
+    # 지터 없이 고정 대기
+    chat_image.scheduler._backoff = lambda attempt, error: retry_delay
+    return chat_image
+
+
+def test_remaining_time_is_passed_as_request_timeout():
+    images = RecordingImages()
+    url = make_chat_image(images).generate_image("cat", timeout=30)
+
+    assert url == "https://example.com/image.png"
+    assert 29 < images.timeouts[0] <= 30
+
+
+def test_without_timeout_client_default_is_kept():
+    images = RecordingImages()
+    make_chat_image(images).generate_image("cat")
+
+    assert images.timeouts == [NOT_GIVEN]
+
+
+def test_retries_stop_at_deadline():
+    # 재시도 대기(0.05초)가 기한(0.01초)을 넘기므로 두 번째 요청은 보내지 않음
+    images = RecordingImages(failures=10)
+    with pytest.raises(RuntimeError, match="시간 초과"):
+        make_chat_image(images, retry_delay=0.05).generate_image("cat", timeout=0.01)
+
+    assert len(images.timeouts) == 1
@@ -0,0 +1,44 @@
+"""LLMClientRegistry 연결 워밍업 테스트 (공유 커넥션 풀로 GET /models 전송)"""
+
+import asyncio
+
+import httpx
+
+from ai_bootcamp.app.common.llm.client_registry import LLMClientRegistry
+
+
+def make_registry(handler, use_mock=False):
+    registry = LLMClientRegistry(api_key="test-key", use_mock=use_mock)
+    # 공유 풀의 전송 계층만 바꿔 실제 네트워크 없이 요청을 기록
+    registry._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    registry._http_async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return registry
+
+
+def test_warm_connections_sends_models_requests_through_shared_pools(monkeypatch):
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path))
+        return httpx.Response(200, json={"object": "list", "data": []})
+
+    registry = make_registry(handler)
+    assert asyncio.run(registry.warm_connections(connections=2)) == 3
+    assert seen == [("GET", "/v1/models")] * 3
+
+
+def test_warm_connections_errors_do_not_raise():
+    def handler(request):
+        raise httpx.ConnectError("unreachable", request=request)
+
+    registry = make_registry(handler)
+    assert asyncio.run(registry.warm_connections(connections=1)) == 0
+
+
+def test_warm_connections_skipped_in_mock_mode():
+    seen = []
+    registry = make_registry(lambda request: seen.append(request) or httpx.Response(200), use_mock=True)
+
+    assert asyncio.run(registry.warm_connections()) == 0
+    assert seen == []
@@ -0,0 +1,146 @@
+"""CompressionMiddleware / PrecompressedStaticFiles / 사전 압축 테스트"""
+
+import gzip
+import os
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+
+from ai_bootcamp.app.common.core.compression import (CompressionMiddleware, PrecompressedStaticFiles,
+                                                     precompress_directory, select_encoding)
+from ai_bootcamp.app.common.core.http_cache import TTLCache, cached_json_response
+
+LARGE = "hello compression " * 200
+
+
+def make_client(static_dir=None) -> TestClient:
+    json_cache = TTLCache(ttl=60)
+
+    async def large(request):
+        return PlainTextResponse(LARGE, headers={"ETag": '"large"'})
+
+    async def small(request):
+        return PlainTextResponse("tiny")
+
+    async def events(request):
+        return Response(LARGE, media_type="text/event-stream")
+
+    async def encoded(request):
+        return Response(gzip.compress(LARGE.encode()), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    async def stream(request):
+        async def chunks():
+            for _ in range(3):
+                yield LARGE
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def cached(request: Request):
+        return cached_json_response(request, json_cache, "items", lambda: {"items": [LARGE]})
+
+    routes = [
+        Route("/large", large),
+        Route("/small", small),
+        Route("/events", events),
+        Route("/encoded", encoded),
+        Route("/stream", stream),
+        Route("/cached", cached),
+    ]
+    if static_dir is not None:
+        routes.append(Mount("/static", PrecompressedStaticFiles(directory=static_dir)))
+    app = Starlette(routes=routes)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [("gzip, deflate", "gzip"), ("gzip;q=0, identity", None), ("", None), ("deflate", None)],
+)
+def test_select_encoding(accept, expected):
+    assert select_encoding(accept) == expected
+
+
+def test_large_body_is_gzipped_with_weak_etag():
+    response = make_client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(LARGE)
+    assert response.text == LARGE
+    # 압축본은 원본과 바이트가 다르므로 strong ETag 를 그대로 쓰지 않음
+    assert response.headers["etag"] == 'W/"large"'
+
+
+def test_identity_response_keeps_strong_etag():
+    response = make_client().get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"large"'
+
+
+@pytest.mark.parametrize("path", ["/small", "/events", "/encoded"])
+def test_small_streaming_and_encoded_bodies_pass_through(path):
+    response = make_client().get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.text in (LARGE, "tiny")
+    if path != "/encoded":
+        assert "content-encoding" not in response.headers
+
+
+def test_streaming_body_is_compressed_chunk_by_chunk():
+    client = make_client()
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert zlib.decompress(raw, 31).decode() == LARGE * 3
+
+
+def test_weak_etag_of_compressed_json_revalidates():
+    client = make_client()
+    first = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["etag"].startswith('W/"')
+
+    second = client.get("/cached", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+
+
+def test_precompressed_static_files(tmp_path):
+    (tmp_path / "app.js").write_text(LARGE)
+    (tmp_path / "logo.png").write_bytes(os.urandom(2048))
+    stats = precompress_directory(tmp_path)
+
+    assert (tmp_path / "app.js.gz").exists()
+    # 압축해도 줄지 않는 파일은 사전 압축본을 만들지 않음
+    assert not (tmp_path / "logo.png.gz").exists()
+    assert stats["files"] == 2 and stats["skipped"] >= 1
+
+    client = make_client(static_dir=tmp_path)
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == LARGE
+
+    cached = client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_stale_precompressed_file_is_ignored(tmp_path):
+    source = tmp_path / "app.js"
+    source.write_text(LARGE)
+    precompress_directory(tmp_path)
+    source.write_text("updated " * 100)
+    stale = (tmp_path / "app.js.gz").stat().st_mtime
+    os.utime(source, (stale + 10, stale + 10))
+
+    response = make_client(static_dir=tmp_path).get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.text == "updated " * 100
@@ -0,0 +1,108 @@
+"""ConversationStore 테스트 (세션 수명, 토큰 추적, 오래된 턴 요약)"""
+
+import asyncio
+import time
+
+from ai_bootcamp.app.common.llm.conversation import DEFAULT_SYSTEM_PROMPT, ConversationStore, truncating_summarizer
+
+
+def fill(store: ConversationStore, session, turns: int, words: int = 50) -> None:
+    for index in range(turns):
+        role = "user" if index % 2 == 0 else "assistant"
+        store.append(session, role, f"turn {index} " + "word " * words)
+
+
+def test_create_get_delete():
+    store = ConversationStore()
+    session = store.create()
+
+    assert session.system_prompt == DEFAULT_SYSTEM_PROMPT
+    assert store.get(session.conversation_id) is session
+    assert store.delete(session.conversation_id) is True
+    assert store.get(session.conversation_id) is None
+    assert store.delete(session.conversation_id) is False
+
+
+def test_expired_session_is_dropped():
+    store = ConversationStore(ttl=0.01)
+    session = store.create()
+    time.sleep(0.02)
+
+    assert store.get(session.conversation_id) is None
+    assert store.get_stats()["sessions"] == 0
+
+
+def test_least_recently_used_session_is_evicted():
+    store = ConversationStore(max_sessions=2)
+    first, second = store.create(), store.create()
+    store.get(first.conversation_id)
+    third = store.create()
+
+    assert store.get(second.conversation_id) is None
+    assert store.get(first.conversation_id) is first
+    assert store.get(third.conversation_id) is third
+
+
+def test_context_tokens_grow_with_turns():
+    store = ConversationStore()
+    session = store.create(system_prompt="Be brief.")
+    empty = session.context_tokens
+    store.append(session, "user", "hello there")
+
+    assert session.context_tokens > empty
+    assert session.to_messages() == [("system", "Be brief."), ("user", "hello there")]
+    assert session.to_dict()["turn_count"] == 1
+
+
+def test_compact_summarizes_old_turns_and_keeps_recent():
+    store = ConversationStore(max_context_tokens=200, keep_recent_turns=2)
+    session = store.create()
+    fill(store, session, 6)
+    before = session.context_tokens
+    seen = {}
+
+    async def summarizer(previous, turns):
+        seen["previous"], seen["turns"] = previous, turns
+        return "summary of early turns"
+
+    assert asyncio.run(store.compact(session, summarizer)) is True
+    assert len(seen["turns"]) == 4 and seen["previous"] == ""
+    assert [turn.content.split()[1] for turn in session.turns] == ["4", "5"]
+    assert session.turn_count == 6 and session.summarized_turns == 4
+    assert session.context_tokens < before
+    system = session.to_messages()[0][1]
+    assert "summary of early turns" in system
+    assert store.get_stats()["summarizations"] == 1
+
+
+def test_compact_is_noop_under_budget_or_with_few_turns():
+    store = ConversationStore(max_context_tokens=10_000, keep_recent_turns=2)
+    session = store.create()
+    fill(store, session, 6)
+    assert asyncio.run(store.compact(session)) is False
+
+    store = ConversationStore(max_context_tokens=10, keep_recent_turns=6)
+    session = store.create()
+    fill(store, session, 6)
+    assert asyncio.run(store.compact(session)) is False
+    assert len(session.turns) == 6
+
+
+def test_failed_summarizer_falls_back_to_truncation():
+    store = ConversationStore(max_context_tokens=100, keep_recent_turns=1)
+    session = store.create()
+    fill(store, session, 3)
+
+    async def broken(previous, turns):
+        raise RuntimeError("LLM down")
+
+    assert asyncio.run(store.compact(session, broken)) is True
+    assert session.summary.startswith("user: turn 0")
+    assert len(session.turns) == 1
+
+
+def test_truncating_summarizer_is_bounded():
+    summary = asyncio.run(truncating_summarizer("x" * 1990, [("user", "y" * 500)]))
+
+    assert len(summary) == 2000
+    assert summary.endswith("y" * 80)
@@ -0,0 +1,108 @@
+"""EmbeddingCache / CachedEmbeddings 테스트 (청크 해시 키, 중복 제거, 모델 분리, 통계)"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from langchain_core.embeddings import Embeddings  # noqa: E402
+
+from ai_bootcamp.app.common.rag import embedding_cache  # noqa: E402
+from ai_bootcamp.app.common.rag.embedding_cache import CachedEmbeddings, EmbeddingCache  # noqa: E402
+from ai_bootcamp.app.common.rag.index_manager import chunk_hash  # noqa: E402
+
+
+class RecordingEmbeddings(Embeddings):
+    def __init__(self, model: str = "fake-embedding"):
+        self.model = model
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5, -1.25] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text)), 0.0, 0.0]
+
+
+def test_put_and_get_round_trip_float32(tmp_path):
+    cache = EmbeddingCache(db_path=str(tmp_path / "cache.db"))
+    cache.put_many("m", {"h1": [0.5, -1.25], "h2": [1.0, 2.0]}, embed_seconds=2.0)
+
+    found = cache.get_many("m", ["h1", "h2", "h3", "h1"])
+    assert found == {"h1": [0.5, -1.25], "h2": [1.0, 2.0]}
+    assert cache.get_many("other-model", ["h1"]) == {}
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert stats["entries"] == {"m": 2}
+    # 적중한 청크의 임베딩 시간(청크당 1초)만큼 절약
+    assert (stats["embed_seconds"], stats["seconds_saved"]) == (2.0, 2.0)
+
+
+def test_clear_by_model(tmp_path):
+    cache = EmbeddingCache(db_path=str(tmp_path / "cache.db"))
+    cache.put_many("a", {"h": [1.0]})
+    cache.put_many("b", {"h": [2.0]})
+    cache.clear("a")
+
+    assert cache.get_stats()["entries"] == {"b": 1}
+    cache.clear()
+    assert cache.get_stats()["entries"] == {}
+
+
+def test_cached_embeddings_only_embeds_new_unique_chunks(tmp_path):
+    cache = EmbeddingCache(db_path=str(tmp_path / "cache.db"))
+    inner = RecordingEmbeddings()
+    embeddings = CachedEmbeddings(inner, cache=cache)
+
+    first = embeddings.embed_documents(["alpha", "beta", "alpha"])
+    assert inner.calls == [["alpha", "beta"]]
+    assert first == [[5.0, 0.5, -1.25], [4.0, 0.5, -1.25], [5.0, 0.5, -1.25]]
+
+    second = embeddings.embed_documents(["beta", "gamma"])
+    assert inner.calls[-1] == ["gamma"]
+    assert second[0] == first[1]
+    assert set(cache.get_many("fake-embedding", [chunk_hash("alpha"), chunk_hash("gamma")])) == {
+        chunk_hash("alpha"),
+        chunk_hash("gamma"),
+    }
+
+    # 다른 프로세스(새 캐시 객체)에서도 디스크에서 재사용
+    reopened = CachedEmbeddings(RecordingEmbeddings(), cache=EmbeddingCache(db_path=str(tmp_path / "cache.db")))
+    reopened.embed_documents(["alpha", "beta", "gamma"])
+    assert reopened.embeddings.calls == []
+
+
+def test_models_do_not_share_vectors(tmp_path):
+    cache = EmbeddingCache(db_path=str(tmp_path / "cache.db"))
+    CachedEmbeddings(RecordingEmbeddings("model-a"), cache=cache).embed_documents(["alpha"])
+    other = RecordingEmbeddings("model-b")
+    CachedEmbeddings(other, cache=cache).embed_documents(["alpha"])
+
+    assert other.calls == [["alpha"]]
+
+
+def test_queries_are_not_cached_and_async_path_uses_cache(tmp_path):
+    cache = EmbeddingCache(db_path=str(tmp_path / "cache.db"))
+    inner = RecordingEmbeddings()
+    embeddings = CachedEmbeddings(inner, cache=cache)
+
+    assert embeddings.embed_query("alpha") == [5.0, 0.0, 0.0]
+    assert cache.get_stats()["entries"] == {}
+    asyncio.run(embeddings.aembed_documents(["alpha"]))
+    asyncio.run(embeddings.aembed_documents(["alpha"]))
+    assert inner.calls == [["alpha"]]
+
+
+def test_cached_embeddings_wrapper_respects_flag(monkeypatch, tmp_path):
+    monkeypatch.setattr(embedding_cache, "_default_cache", EmbeddingCache(db_path=str(tmp_path / "cache.db")))
+    inner = RecordingEmbeddings()
+
+    wrapped = embedding_cache.cached_embeddings(inner)
+    assert isinstance(wrapped, CachedEmbeddings) and wrapped.model == "fake-embedding"
+    assert embedding_cache.cached_embeddings(wrapped) is wrapped
+
+    monkeypatch.setattr(embedding_cache, "EMBEDDING_CACHE_ENABLED", False)
+    assert embedding_cache.cached_embeddings(inner) is inner
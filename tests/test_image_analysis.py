@@ -0,0 +1,76 @@
+"""ImageAnalysisPipeline 테스트 (공유 분석 파일 수명, 실패 상태 코드)"""
+
+import asyncio
+import functools
+import io
+
+import pytest
+from fastapi import UploadFile
+from PIL import Image
+
+from ai_bootcamp.app.demo.prac02 import image_analysis
+from ai_bootcamp.app.demo.prac02.image_analysis import ImageAnalysisPipeline
+
+
+def png_upload(name: str = "a.png") -> UploadFile:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), "red").save(buffer, "PNG")
+    buffer.seek(0)
+    return UploadFile(buffer, filename=name)
+
+
+@pytest.fixture
+def slow_preprocess(monkeypatch, tmp_path):
+    """프로세스 풀 대신 스레드에서, 잠깐 기다린 뒤 원본 파일을 읽도록 함"""
+    monkeypatch.setenv("USE_MOCK", "true")
+    monkeypatch.setattr(
+        image_analysis, "spool_upload", functools.partial(image_analysis.spool_upload, directory=tmp_path)
+    )
+
+    async def run_in_thread(func, *args):
+        await asyncio.sleep(0.05)
+        return await asyncio.to_thread(func, *args)
+
+    monkeypatch.setattr(image_analysis, "run_in_process", run_in_thread)
+    return tmp_path
+
+
+def test_follower_survives_leader_disconnect(slow_preprocess):
+    pipeline = ImageAnalysisPipeline()
+
+    async def scenario():
+        leader = asyncio.ensure_future(pipeline.analyze_upload(png_upload("leader.png"), "describe"))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(pipeline.analyze_upload(png_upload("follower.png"), "describe"))
+        await asyncio.sleep(0.01)
+        # leader 연결 종료 -> leader 의 스풀 파일 삭제
+        leader.cancel()
+        return await follower
+
+    result = asyncio.run(scenario())
+    assert result.error is None, result.error
+    assert "64x48" in result.analysis
+    # 스풀 파일 / 공유 사본 / 축소본 모두 정리됨
+    assert list(slow_preprocess.iterdir()) == []
+
+
+def test_error_status_by_failure_kind(slow_preprocess, monkeypatch):
+    pipeline = ImageAnalysisPipeline()
+    not_image = UploadFile(io.BytesIO(b"not an image"), filename="a.txt")
+    result = asyncio.run(pipeline.analyze_upload(not_image, "describe"))
+    assert result.error_status == 400
+
+    monkeypatch.setattr(
+        image_analysis, "spool_upload", functools.partial(image_analysis.spool_upload, max_bytes=1024)
+    )
+    too_large = UploadFile(io.BytesIO(b"x" * 2048), filename="big.png")
+    result = asyncio.run(pipeline.analyze_upload(too_large, "describe"))
+    assert result.error_status == 413
+
+
+def test_controller_returns_client_error_when_all_uploads_invalid(slow_preprocess):
+    from ai_bootcamp.app.demo.prac02.demo_controller import demo_controller
+
+    uploads = [UploadFile(io.BytesIO(b"not an image"), filename=f"{i}.txt") for i in range(2)]
+    response = asyncio.run(demo_controller.analyze_image(image=uploads, prompt="describe", llm_cache=None))
+    assert response.status_code == 400
@@ -0,0 +1,57 @@
+"""이미지 서빙 테스트 (조건부 요청은 저장소에 있는 이미지만 304)"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from ai_bootcamp.app.common.core.image_store import ImageStore
+from ai_bootcamp.app.common.web import image_controller
+
+
+@pytest.fixture
+def client_and_store(tmp_path, monkeypatch):
+    store = ImageStore(root=tmp_path / "store", db_path=str(tmp_path / "images.db"), variant_widths=(16,))
+    monkeypatch.setattr(image_controller, "get_image_store", lambda: store)
+    app = FastAPI()
+    app.include_router(image_controller.router)
+    return TestClient(app), store
+
+
+def put_image(store: ImageStore, tmp_path) -> str:
+    source = tmp_path / "source.png"
+    Image.new("RGB", (32, 32), "blue").save(source)
+    return store.put_file(source).digest
+
+
+def test_conditional_request_for_stored_image_is_304(client_and_store, tmp_path):
+    client, store = client_and_store
+    digest = put_image(store, tmp_path)
+    response = client.get(f"/images/{digest}", headers={"If-None-Match": f'"{digest}"'})
+    assert response.status_code == 304
+    response = client.get(f"/images/{digest}?w=16", headers={"If-None-Match": f'"{digest}-w16"'})
+    assert response.status_code == 304
+
+
+def test_conditional_request_for_missing_image_is_404(client_and_store):
+    client, _ = client_and_store
+    unknown = "0" * 64
+    response = client.get(f"/images/{unknown}", headers={"If-None-Match": f'"{unknown}"'})
+    assert response.status_code == 404
+    response = client.get("/images/not-a-digest", headers={"If-None-Match": '"not-a-digest"'})
+    assert response.status_code == 404
+
+
+def test_conditional_request_with_unsupported_width_is_400(client_and_store, tmp_path):
+    client, store = client_and_store
+    digest = put_image(store, tmp_path)
+    response = client.get(f"/images/{digest}?w=999", headers={"If-None-Match": f'"{digest}-w999"'})
+    assert response.status_code == 400
+
+
+def test_store_database_defaults_to_store_root(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = ImageStore(root=tmp_path / "nested" / "store")
+
+    assert store.db_path == str(tmp_path / "nested" / "store" / "image_store.db")
+    assert not list(tmp_path.glob("*.db"))
@@ -0,0 +1,141 @@
+"""FaissIndexManager 테스트 (영속화, 원본 지문, 증분 갱신, 세대 파일)"""
+
+import pytest
+
+pytest.importorskip("faiss")
+pytest.importorskip("langchain_community")
+
+from langchain_core.documents import Document  # noqa: E402
+from langchain_core.embeddings import Embeddings  # noqa: E402
+
+from ai_bootcamp.app.common.rag.index_manager import FaissIndexManager, chunk_hash  # noqa: E402
+
+
+class CountingEmbeddings(Embeddings):
+    """텍스트 해시로 만든 결정적 임베딩 (임베딩한 텍스트를 기록)"""
+
+    def __init__(self, model: str = "fake-embedding", dimensions: int = 8):
+        self.model = model
+        self.dimensions = dimensions
+        self.embedded = []
+
+    def _vector(self, text):
+        digest = chunk_hash(text)
+        return [int(digest[i:i + 2], 16) / 255 for i in range(0, self.dimensions * 2, 2)]
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def write_source(path, chunks):
+    path.write_text("\n".join(chunks), encoding="utf-8")
+    return [Document(page_content=chunk, metadata={"source": str(path)}) for chunk in chunks]
+
+
+def make_manager(tmp_path, embeddings=None, settings=None):
+    return FaissIndexManager(
+        "test-index",
+        embeddings or CountingEmbeddings(),
+        index_dir=tmp_path / "index",
+        settings=settings or {"chunk_size": 100},
+        batch_size=2,
+    )
+
+
+def test_first_sync_persists_and_loads(tmp_path):
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    documents = write_source(a, ["alpha", "beta", "gamma"]) + write_source(b, ["delta", "alpha"])
+    manager = make_manager(tmp_path)
+    assert not manager.is_current([a, b])
+
+    vectorstore = manager.sync(documents, sources=[a, b])
+    # 원본이 달라도 같은 내용의 청크는 한 번만 임베딩
+    assert sorted(manager.embeddings.embedded) == ["alpha", "beta", "delta", "gamma"]
+    assert manager.last_sync.added == 4 and manager.last_sync.rebuilt
+    assert vectorstore.index.ntotal == 4
+
+    reopened = make_manager(tmp_path)
+    assert reopened.is_current([a, b])
+    loaded = reopened.load()
+    assert loaded.index.ntotal == 4
+    assert loaded.similarity_search("gamma", k=1)[0].page_content == "gamma"
+    assert reopened.get_stats()["chunks"] == 4
+
+
+def test_changed_source_only_embeds_new_chunks(tmp_path):
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    manager = make_manager(tmp_path)
+    manager.sync(write_source(a, ["alpha", "beta"]) + write_source(b, ["gamma"]), sources=[a, b])
+    manager.embeddings.embedded.clear()
+
+    documents = write_source(a, ["alpha", "beta-2"]) + write_source(b, ["gamma"])
+    assert not manager.is_current([a, b])
+    vectorstore = manager.sync(documents, sources=[a, b])
+
+    assert manager.embeddings.embedded == ["beta-2"]
+    stats = manager.last_sync
+    assert (stats.added, stats.removed, stats.reused, stats.rebuilt) == (1, 1, 2, False)
+    assert sorted(doc.page_content for doc in vectorstore.docstore._dict.values()) == ["alpha", "beta-2", "gamma"]
+    assert manager.is_current([a, b])
+
+
+def test_dropped_source_removes_its_chunks(tmp_path):
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    manager = make_manager(tmp_path)
+    documents_a = write_source(a, ["alpha"])
+    manager.sync(documents_a + write_source(b, ["beta"]), sources=[a, b])
+
+    vectorstore = manager.sync(documents_a, sources=[a])
+    assert manager.last_sync.removed == 1
+    assert vectorstore.index.ntotal == 1
+    assert manager.is_current([a]) and not manager.is_current([a, b])
+
+
+def test_unchanged_sync_keeps_generation_and_old_generations_are_deleted(tmp_path):
+    a = tmp_path / "a.txt"
+    manager = make_manager(tmp_path)
+    documents = write_source(a, ["alpha"])
+    manager.sync(documents, sources=[a])
+    manager.sync(documents, sources=[a])
+    assert manager.get_stats()["generation"] == 1
+    assert manager.last_sync.added == 0
+
+    manager.sync(write_source(a, ["beta"]), sources=[a])
+    files = sorted(path.name for path in manager.path.glob("index.*"))
+    assert files == ["index.2.faiss", "index.2.pkl"]
+
+
+def test_settings_or_model_change_invalidates_index(tmp_path):
+    a = tmp_path / "a.txt"
+    documents = write_source(a, ["alpha", "beta"])
+    make_manager(tmp_path).sync(documents, sources=[a])
+
+    assert not make_manager(tmp_path, settings={"chunk_size": 200}).is_current([a])
+
+    other_model = make_manager(tmp_path, embeddings=CountingEmbeddings(model="other-embedding"))
+    assert not other_model.is_current([a])
+    other_model.sync(documents, sources=[a])
+    assert other_model.last_sync.rebuilt and other_model.last_sync.added == 2
+
+
+def test_missing_index_files_force_rebuild(tmp_path):
+    a = tmp_path / "a.txt"
+    documents = write_source(a, ["alpha", "beta"])
+    manager = make_manager(tmp_path)
+    manager.sync(documents, sources=[a])
+    for path in manager.path.glob("index.*"):
+        path.unlink()
+
+    assert not manager.is_current([a])
+    assert manager.load() is None
+    vectorstore = manager.sync(documents, sources=[a])
+    assert manager.last_sync.rebuilt and vectorstore.index.ntotal == 2
+
+
+def test_sync_without_documents_raises(tmp_path):
+    with pytest.raises(ValueError):
+        make_manager(tmp_path).sync([], sources=[])
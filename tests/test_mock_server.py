@@ -0,0 +1,45 @@
+"""모의 OpenAI 서버 테스트 (잘못된 이미지 키 / 설정 값은 500 이 아닌 4xx)"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ai_bootcamp.app.common.llm.mock_server import MockOpenAIServer, MockServerConfig, create_mock_app
+
+
+def make_client():
+    server = MockOpenAIServer(MockServerConfig())
+    return server, TestClient(create_mock_app(server))
+
+
+def test_mock_image_key_must_be_hex():
+    _, client = make_client()
+    assert client.get("/mock-images/0123456789abcdef.png").status_code == 200
+
+    for key in ["not-hex-at-all", "abc", "0123456789ABCDEF"]:
+        response = client.get(f"/mock-images/{key}.png")
+        assert response.status_code == 404
+        assert response.json()["error"]["type"] == "invalid_request_error"
+
+
+def test_mock_config_update_and_bad_values():
+    server, client = make_client()
+    response = client.post("/mock/config", json={"rpm": "100", "error_rate_429": 0.5, "unknown": 1})
+    assert response.status_code == 200
+    assert (server.config.rpm, server.config.error_rate_429) == (100, 0.5)
+
+    # 하나라도 잘못되면 아무것도 바뀌지 않음
+    response = client.post("/mock/config", json={"rpm": 5, "ttft": "fast"})
+    assert response.status_code == 400
+    assert "ttft" in response.json()["error"]["message"]
+    assert server.config.rpm == 100
+
+    assert client.post("/mock/config", json=[1, 2]).status_code == 400
+    assert client.post("/mock/config", content=b"{not json").status_code == 400
+    assert client.post("/mock/config", json={"rpm": None}).status_code == 400
+
+
+def test_config_update_rejects_bad_values():
+    config = MockServerConfig()
+    with pytest.raises(ValueError, match="seed"):
+        config.update({"seed": "x"})
+    assert config.seed == 42
@@ -0,0 +1,91 @@
+"""PromptTemplate / PromptRegistry 테스트 (고정 접두사 배치, 필드 검증, 렌더 캐시, 캐시 토큰 집계)"""
+
+import pytest
+
+from ai_bootcamp.app.common.llm import prompts
+from ai_bootcamp.app.common.llm.prompts import PromptRegistry, PromptTemplate
+from ai_bootcamp.app.common.llm.telemetry import TokenUsage
+
+
+def make_template() -> PromptTemplate:
+    return PromptTemplate(
+        "translate",
+        prefix="  You are a translator. Keep {braces} in the prefix literal.  ",
+        suffix="Translate into {target_language}.",
+        user="Text: {text}",
+    )
+
+
+def test_prefix_stays_first_and_literal():
+    template = make_template()
+    system = template.system(target_language="Korean", text="ignored")
+
+    assert system == "You are a translator. Keep {braces} in the prefix literal.\n\nTranslate into Korean."
+    assert template.system_fields == {"target_language"}
+    assert template.user_fields == {"text"}
+    assert template.user_text(text="hello", target_language="Korean") == "Text: hello"
+
+
+def test_prefix_only_template():
+    template = PromptTemplate("plain", prefix="Be brief.")
+    assert template.system() == "Be brief."
+    assert template.user_text(input="hi") == "hi"
+
+
+def test_missing_values_raise_key_error():
+    template = make_template()
+    with pytest.raises(KeyError, match="target_language"):
+        template.system(text="hello")
+    with pytest.raises(KeyError, match="text"):
+        template.user_text(target_language="Korean")
+
+
+@pytest.mark.parametrize("suffix", ["Answer in {}.", "Answer in {0}.", "Answer in {lang.name}."])
+def test_unnamed_or_nested_fields_are_rejected(suffix):
+    with pytest.raises(ValueError):
+        PromptTemplate("bad", prefix="p", suffix=suffix)
+
+
+def test_rendered_system_message_is_cached_per_value_set():
+    template = make_template()
+    first = template.system(target_language="Korean")
+    again = template.system(target_language="Korean")
+    template.system(target_language="Japanese")
+
+    assert first is again
+    info = template._render_system.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_cacheable_depends_on_prefix_tokens(monkeypatch):
+    template = make_template()
+    monkeypatch.setattr(prompts, "PROMPT_CACHE_MIN_TOKENS", template.prefix_tokens)
+    assert template.cacheable
+    monkeypatch.setattr(prompts, "PROMPT_CACHE_MIN_TOKENS", template.prefix_tokens + 1)
+    assert not template.cacheable
+
+
+def test_registry_records_cached_token_ratio():
+    registry = PromptRegistry()
+    template = registry.register(make_template())
+    assert registry.get("translate") is template
+
+    registry.record("translate", TokenUsage(2000, 50, cached_tokens=1500))
+    registry.record("translate", TokenUsage(2000, 50, cached_tokens=500))
+    registry.record("translate", None)
+    template.system(target_language="Korean")
+
+    stats = registry.get_stats()
+    entry = stats["templates"][0]
+    assert (entry["calls"], entry["prompt_tokens"], entry["cached_tokens"]) == (3, 4000, 2000)
+    assert entry["cached_ratio"] == 0.5 and stats["cached_ratio"] == 0.5
+    assert entry["render_cache_misses"] == 1
+
+
+def test_re_registering_keeps_stats():
+    registry = PromptRegistry()
+    registry.register(make_template())
+    registry.record("translate", TokenUsage(100, 1, cached_tokens=0))
+    registry.register(make_template())
+
+    assert registry.get_stats()["templates"][0]["calls"] == 1
@@ -0,0 +1,133 @@
+"""LLMResponseCache 테스트 (exact / semantic 적중, TTL 만료, 제거, semantic 파티션, last_access 기록 간격)"""
+
+import sqlite3
+import time
+
+import pytest
+
+from ai_bootcamp.app.common.llm import response_cache
+from ai_bootcamp.app.common.llm.response_cache import LLMResponseCache
+
+MODEL = "gpt-test"
+SYSTEM = "You are a helpful assistant."
+
+
+def embed(text: str):
+    """단어 가방 임베딩 (같은 단어 집합이면 유사도 1.0)"""
+    vocabulary = ["first", "second", "python", "java", "list", "item"]
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(word)) for word in vocabulary] or [0.0] * len(vocabulary)
+
+
+def test_exact_hit_and_miss(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"))
+    messages = [("user", "hello")]
+
+    assert cache.get(MODEL, SYSTEM, messages) is None
+    cache.put(MODEL, SYSTEM, messages, "hi!", total_tokens=12)
+
+    hit = cache.get(MODEL, SYSTEM, messages)
+    assert hit.content == "hi!" and hit.tier == "exact"
+    assert cache.get("other-model", SYSTEM, messages) is None
+    assert cache.get(MODEL, SYSTEM, messages, params={"temperature": 1}) is None
+
+    stats = cache.get_stats()
+    assert (stats["exact_hits"], stats["misses"], stats["tokens_saved"]) == (1, 3, 12)
+
+    # 디스크에서 다시 적재해도 적중
+    reloaded = LLMResponseCache(db_path=str(tmp_path / "cache.db"))
+    assert reloaded.get(MODEL, SYSTEM, messages).content == "hi!"
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"))
+    messages = [("user", "hello")]
+    cache.put(MODEL, SYSTEM, messages, "hi!", ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get(MODEL, SYSTEM, messages) is None
+    assert cache.get_stats()["entries"] == 0
+    assert LLMResponseCache(db_path=str(tmp_path / "cache.db")).get_stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"), max_entries=2, embedder=embed)
+    for name in ("python", "java"):
+        cache.put(MODEL, SYSTEM, [("user", name)], name)
+    assert cache.get(MODEL, SYSTEM, [("user", "python")]) is not None
+    cache.put(MODEL, SYSTEM, [("user", "list")], "list")
+
+    assert cache.get(MODEL, SYSTEM, [("user", "java")]) is None
+    assert cache.get(MODEL, SYSTEM, [("user", "python")]).content == "python"
+    assert cache.get_stats()["entries"] == 2
+    # 제거된 항목의 임베딩도 semantic 계층에서 빠짐
+    assert sum(len(bucket.vectors) for bucket in cache._partitions.values()) == 2
+
+
+def test_semantic_hit_within_same_conversation(tmp_path):
+    cache = LLMResponseCache(db_path=None, embedder=embed)
+    cache.put(MODEL, SYSTEM, [("user", "python list item")], "answer")
+
+    hit = cache.get(MODEL, SYSTEM, [("user", "item list python?")])
+    assert hit.content == "answer" and hit.tier == "semantic"
+    assert cache.get(MODEL, SYSTEM, [("user", "java")]) is None
+
+
+def test_semantic_partition_includes_earlier_turns(tmp_path):
+    cache = LLMResponseCache(db_path=None, embedder=embed)
+    python_turns = [("user", "list python features"), ("assistant", "1. ... 2. ...")]
+    java_turns = [("user", "list java features"), ("assistant", "1. ... 2. ...")]
+    follow_up = ("user", "what about the second item?")
+    cache.put(MODEL, SYSTEM, python_turns + [follow_up], "python answer")
+
+    # 같은 후속 질문이라도 이전 대화가 다르면 적중하지 않음
+    assert cache.get(MODEL, SYSTEM, java_turns + [("user", "the second item?")]) is None
+    hit = cache.get(MODEL, SYSTEM, python_turns + [("user", "the second item?")])
+    assert hit.content == "python answer" and hit.tier == "semantic"
+
+
+def test_vectors_of_different_dimensions_are_not_compared():
+    dims = {"value": 6}
+    cache = LLMResponseCache(db_path=None, embedder=lambda text: embed(text)[: dims["value"]])
+    cache.put(MODEL, SYSTEM, [("user", "python")], "six")
+    dims["value"] = 4
+    cache.put(MODEL, SYSTEM, [("user", "python list")], "four")
+
+    assert cache.get(MODEL, SYSTEM, [("user", "python python")]).content == "four"
+
+
+def test_touch_is_throttled(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "LLM_CACHE_TOUCH_INTERVAL", 60.0)
+    db_path = str(tmp_path / "cache.db")
+    cache = LLMResponseCache(db_path=db_path)
+    messages = [("user", "hello")]
+    cache.put(MODEL, SYSTEM, messages, "hi!")
+
+    def last_access():
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute("SELECT last_access FROM llm_cache").fetchone()[0]
+
+    written = last_access()
+    for _ in range(5):
+        cache.get(MODEL, SYSTEM, messages)
+    assert last_access() == written
+
+    monkeypatch.setattr(response_cache, "LLM_CACHE_TOUCH_INTERVAL", 0.0)
+    cache.get(MODEL, SYSTEM, messages)
+    assert last_access() > written
+
+
+@pytest.mark.parametrize("failing", ["get", "put"])
+def test_embedding_errors_fall_back_to_exact_tier(failing):
+    calls = {"n": 0}
+
+    def flaky(text):
+        calls["n"] += 1
+        if failing == "put" and calls["n"] == 1 or failing == "get" and calls["n"] == 2:
+            raise RuntimeError("embedding down")
+        return embed(text)
+
+    cache = LLMResponseCache(db_path=None, embedder=flaky)
+    cache.put(MODEL, SYSTEM, [("user", "python")], "answer")
+    assert cache.get(MODEL, SYSTEM, [("user", "python")]).tier == "exact"
+    assert cache.get(MODEL, SYSTEM, [("user", "python python")]) is None
@@ -0,0 +1,47 @@
+"""ModelRouter 테스트 (헤지 취소 시 half_open 시험 호출 반환)"""
+
+import asyncio
+import time
+
+from ai_bootcamp.app.common.llm.router import ModelBackend, ModelRouter
+from ai_bootcamp.app.common.llm.scheduler import CircuitBreaker, LLMScheduler
+from ai_bootcamp.app.common.llm.telemetry import LLMTelemetry
+
+
+def make_backend(name: str, max_concurrency: int = 4) -> ModelBackend:
+    scheduler = LLMScheduler(
+        rpm=60000,
+        tpm=10_000_000,
+        max_concurrency=max_concurrency,
+        max_retries=0,
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.05),
+        telemetry=LLMTelemetry(db_path=None),
+    )
+    return ModelBackend(name=name, provider="test", model_name=name, chat_model=None, scheduler=scheduler)
+
+
+def test_cancelled_queued_hedge_releases_half_open_trial():
+    primary = make_backend("primary")
+    backup = make_backend("backup", max_concurrency=1)
+    # backup: half_open + 동시성 한도가 차 있어 헤지 요청이 대기열에 머묾
+    backup.scheduler.breaker.record_failure()
+    time.sleep(0.06)
+    router = ModelRouter([primary, backup], hedging=True, hedge_delay=0.0, explore=0.0)
+
+    async def func(backend):
+        await asyncio.sleep(0.5)
+        return backend.name
+
+    async def scenario():
+        held = await backup.scheduler.aacquire(1)
+        try:
+            return await router.acall(func, usage_of=lambda result: None)
+        finally:
+            backup.scheduler.release(held)
+
+    assert asyncio.run(scenario()) == "primary"
+    assert primary.stats.hedges == 1
+    assert backup.scheduler.breaker.state == "half_open"
+    assert backup.available
+    assert backup in router.candidates()
+    assert backup.scheduler.get_stats()["queued"] == 0
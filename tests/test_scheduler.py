@@ -0,0 +1,142 @@
+"""LLMScheduler / CircuitBreaker 테스트 (시험 호출 반환, 429 규칙, 재시도 횟수)"""
+
+import asyncio
+import time
+
+import pytest
+
+from ai_bootcamp.app.common.llm.scheduler import CircuitBreaker, CircuitOpenError, LLMScheduler
+from ai_bootcamp.app.common.llm.telemetry import LLMTelemetry
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def make_scheduler(failure_threshold: int = 1, max_concurrency: int = 4, max_retries: int = 0) -> LLMScheduler:
+    return LLMScheduler(
+        rpm=60000,
+        tpm=10_000_000,
+        max_concurrency=max_concurrency,
+        max_retries=max_retries,
+        base_delay=0.0,
+        max_delay=0.0,
+        breaker=CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=0.05),
+        telemetry=LLMTelemetry(db_path=None),
+    )
+
+
+def open_then_half_open(scheduler: LLMScheduler) -> None:
+    scheduler.breaker.record_failure()
+    assert scheduler.breaker.state == "open"
+    time.sleep(0.06)
+
+
+async def ok():
+    return "ok"
+
+
+def test_cancelled_queued_call_releases_half_open_trial():
+    scheduler = make_scheduler(max_concurrency=1)
+    open_then_half_open(scheduler)
+
+    async def scenario():
+        # 동시성 한도를 채워 다음 호출이 대기열에 머물게 함
+        held = await scheduler.aacquire(1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scheduler.acall(ok), timeout=0.05)
+        scheduler.release(held)
+        assert scheduler.breaker.available
+        assert await scheduler.acall(ok) == "ok"
+
+    asyncio.run(scenario())
+    assert scheduler.breaker.state == "closed"
+    assert scheduler.get_stats()["queued"] == 0
+
+
+def test_cancelled_call_does_not_release_another_callers_trial():
+    scheduler = make_scheduler()
+    # closed 상태에서 들어온 호출은 시험 호출이 아님
+    assert scheduler.breaker.before_call() is False
+    open_then_half_open(scheduler)
+    assert scheduler.breaker.before_call() is True
+    with pytest.raises(CircuitOpenError):
+        scheduler.breaker.before_call()
+    scheduler.breaker.release_trial()
+    assert scheduler.breaker.available
+
+
+@pytest.mark.parametrize("status, state", [(429, "closed"), (400, "closed"), (500, "open"), (503, "open")])
+def test_only_server_errors_trip_breaker(status, state):
+    scheduler = make_scheduler()
+
+    async def fail():
+        raise StatusError(status)
+
+    with pytest.raises(StatusError):
+        asyncio.run(scheduler.acall(fail))
+    assert scheduler.breaker.state == state
+
+
+def test_rate_limited_trial_is_released_without_opening():
+    scheduler = make_scheduler()
+    open_then_half_open(scheduler)
+    assert scheduler.breaker.before_call() is True
+    scheduler.record_error(StatusError(429), trial=True)
+    assert scheduler.breaker.state == "half_open"
+    assert scheduler.breaker.available
+
+
+def test_retry_budget_is_respected():
+    scheduler = make_scheduler(failure_threshold=100, max_retries=2)
+    attempts = []
+
+    async def fail():
+        attempts.append(1)
+        raise StatusError(503)
+
+    with pytest.raises(StatusError):
+        asyncio.run(scheduler.acall(fail))
+    assert len(attempts) == 3
+    assert scheduler.retries == 2
+    assert scheduler.failures == 1
+
+    # 호출별 max_retries (라우터가 다음 백엔드로 넘길 때 0)
+    attempts.clear()
+    with pytest.raises(StatusError):
+        asyncio.run(scheduler.acall(fail, max_retries=0))
+    assert len(attempts) == 1
+
+
+def test_retries_stop_when_breaker_opens():
+    scheduler = make_scheduler(failure_threshold=2, max_retries=5)
+    attempts = []
+
+    def fail():
+        attempts.append(1)
+        raise StatusError(502)
+
+    with pytest.raises(StatusError):
+        scheduler.call(fail)
+    assert len(attempts) == 2
+    assert scheduler.breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        scheduler.call(lambda: "ok")
+    assert scheduler.rejected == 1
+
+
+def test_rate_limit_retries_do_not_open_breaker():
+    scheduler = make_scheduler(failure_threshold=1, max_retries=3)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise StatusError(429)
+        return "ok"
+
+    assert asyncio.run(scheduler.acall(flaky)) == "ok"
+    assert len(attempts) == 3
+    assert scheduler.breaker.state == "closed"
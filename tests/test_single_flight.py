@@ -0,0 +1,43 @@
+"""SingleFlight 테스트 (병합, 마지막 대기자 이탈 시 취소)"""
+
+import asyncio
+
+import pytest
+
+from ai_bootcamp.app.common.llm.single_flight import SingleFlight
+
+
+def test_concurrent_calls_are_coalesced():
+    flight = SingleFlight(enabled=True)
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        return await asyncio.gather(*(flight.acall("k", work) for _ in range(5)))
+
+    assert asyncio.run(scenario()) == ["done"] * 5
+    assert len(calls) == 1
+    assert flight.stats.coalesced == 4
+
+
+def test_caller_after_abandoned_flight_starts_fresh_call():
+    flight = SingleFlight(enabled=True)
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await flight.acall("k", work, timeout=0.01)
+        # 첫 호출은 취소 중 (아직 끝나지 않음) - 새 요청은 새 호출을 시작해야 함
+        return await flight.acall("k", work)
+
+    assert asyncio.run(scenario()) == 2
+    assert flight.stats.abandoned == 1
@@ -0,0 +1,131 @@
+"""LLMTelemetry 테스트 (엔드포인트별 집계, 백분위, SQLite 롤업, Prometheus 출력)"""
+
+import asyncio
+from types import SimpleNamespace
+
+from ai_bootcamp.app.common.llm.telemetry import (NO_ENDPOINT, LLMTelemetry, LLMTelemetryMiddleware, TokenUsage,
+                                                  UsageAggregate, current_endpoint, langchain_usage, openai_usage)
+
+
+def test_record_aggregates_by_endpoint_and_model():
+    telemetry = LLMTelemetry(db_path=None)
+    telemetry.record("gpt-a", TokenUsage(10, 5), 0.2, endpoint="POST /chat")
+    telemetry.record("gpt-a", TokenUsage(20, 5), 0.4, endpoint="POST /chat")
+    telemetry.record("gpt-a", None, 1.0, ok=False, endpoint="POST /chat")
+    # 응답의 모델명이 요청한 모델명보다 우선
+    telemetry.record("gpt-b", TokenUsage(1, 1, model="gpt-b-2024"), 0.1)
+
+    stats = telemetry.get_stats()
+    assert stats["overall"] == {
+        "calls": 4,
+        "errors": 1,
+        "prompt_tokens": 31,
+        "completion_tokens": 11,
+        "total_tokens": 42,
+    }
+    chat, other = stats["by_endpoint"]
+    assert (chat["endpoint"], chat["model"], chat["calls"], chat["errors"]) == ("POST /chat", "gpt-a", 3, 1)
+    assert (other["endpoint"], other["model"]) == (NO_ENDPOINT, "gpt-b-2024")
+
+
+def test_percentile_uses_histogram_bucket_bounds():
+    aggregate = UsageAggregate()
+    for latency in [0.05] * 90 + [3.0] * 9 + [42.0]:
+        aggregate.add(None, latency, True)
+
+    assert aggregate.percentile(0.5) == 0.1
+    assert aggregate.percentile(0.95) == 5.0
+    assert aggregate.percentile(1.0) == 42.0
+    assert UsageAggregate().percentile(0.5) == 0.0
+
+
+def test_flush_rolls_up_into_sqlite(tmp_path):
+    telemetry = LLMTelemetry(db_path=str(tmp_path / "telemetry.db"))
+    telemetry.record("gpt-a", TokenUsage(10, 5), 0.2, endpoint="POST /chat")
+    assert telemetry.flush() == 1
+    assert telemetry.flush() == 0
+
+    telemetry.record("gpt-a", TokenUsage(10, 5), 0.6, endpoint="POST /chat")
+    telemetry.record("gpt-b", TokenUsage(1, 1), 0.1, endpoint="GET /x")
+    rows = telemetry.query_rollup()
+
+    assert rows[0] == {
+        "endpoint": "POST /chat",
+        "model": "gpt-a",
+        "calls": 2,
+        "errors": 0,
+        "prompt_tokens": 20,
+        "completion_tokens": 10,
+        "total_tokens": 30,
+        "avg_latency_ms": 400.0,
+        "max_latency_ms": 600.0,
+    }
+    assert rows[1]["model"] == "gpt-b"
+
+
+def test_failed_flush_keeps_pending_aggregates(tmp_path):
+    # 상위 경로가 파일이라 디렉토리를 만들 수 없음
+    (tmp_path / "not-a-dir").write_text("")
+    telemetry = LLMTelemetry(db_path=str(tmp_path / "not-a-dir" / "telemetry.db"))
+    telemetry.record("gpt-a", TokenUsage(10, 5), 0.2, endpoint="POST /chat")
+    assert telemetry.flush() == 0
+
+    telemetry.db_path = str(tmp_path / "telemetry.db")
+    telemetry._db_ready = False
+    assert telemetry.flush() == 1
+    assert telemetry.query_rollup()[0]["calls"] == 1
+
+
+def test_background_thread_flushes_on_stop(tmp_path):
+    telemetry = LLMTelemetry(db_path=str(tmp_path / "telemetry.db"), flush_interval=60)
+    telemetry.start()
+    telemetry.record("gpt-a", TokenUsage(3, 4), 0.2, endpoint="POST /chat")
+    telemetry.stop()
+
+    assert telemetry._pending == {}
+    assert telemetry.query_rollup()[0]["total_tokens"] == 7
+
+
+def test_prometheus_output():
+    telemetry = LLMTelemetry(db_path=None)
+    telemetry.record("gpt-a", TokenUsage(10, 5), 0.3, endpoint='GET /a"b')
+    text = telemetry.render_prometheus()
+
+    labels = 'endpoint="GET /a\\"b",model="gpt-a"'
+    assert f"llm_calls_total{{{labels}}} 1" in text
+    assert f'llm_tokens_total{{{labels},type="prompt"}} 10' in text
+    assert f'llm_latency_seconds_bucket{{{labels},le="0.25"}} 0' in text
+    assert f'llm_latency_seconds_bucket{{{labels},le="0.5"}} 1' in text
+    assert f'llm_latency_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert text.index("# TYPE llm_errors_total") < text.index("# TYPE llm_tokens_total")
+
+
+def test_middleware_exposes_route_template_as_endpoint():
+    seen = []
+
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path="/conversations/{conversation_id}")
+        seen.append(current_endpoint())
+
+    scope = {"type": "http", "method": "GET", "path": "/conversations/abc"}
+    asyncio.run(LLMTelemetryMiddleware(app)(scope, None, None))
+
+    assert seen == ["GET /conversations/{conversation_id}"]
+    assert current_endpoint() == NO_ENDPOINT
+
+
+def test_usage_extractors():
+    message = SimpleNamespace(
+        usage_metadata={"input_tokens": 12, "output_tokens": 3, "input_token_details": {"cache_read": 8}},
+        response_metadata={"model_name": "gpt-a"},
+    )
+    assert langchain_usage(message) == TokenUsage(12, 3, "gpt-a", 8)
+    assert langchain_usage({"raw": message}).total_tokens == 15
+    assert langchain_usage(SimpleNamespace(usage_metadata=None)) is None
+
+    response = SimpleNamespace(
+        model="gpt-b",
+        usage=SimpleNamespace(prompt_tokens=7, completion_tokens=2, prompt_tokens_details=None),
+    )
+    assert openai_usage(response) == TokenUsage(7, 2, "gpt-b", 0)
+    assert openai_usage(SimpleNamespace()) is None
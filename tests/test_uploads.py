@@ -0,0 +1,115 @@
+"""업로드 크기 제한 / 디스크 스풀링 테스트"""
+
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from ai_bootcamp.app.common.core.uploads import UploadLimitMiddleware, UploadTooLargeError, mmap_file, spool_upload
+
+
+def make_upload(data: bytes, size=None, filename: str = "photo.png") -> UploadFile:
+    return UploadFile(
+        io.BytesIO(data), size=size, filename=filename, headers=Headers({"content-type": "image/png"})
+    )
+
+
+def test_spool_upload_copies_and_hashes(tmp_path):
+    data = b"x" * 10_000
+    spooled = asyncio.run(spool_upload(make_upload(data), directory=tmp_path, max_bytes=20_000, chunk_size=1024))
+
+    assert spooled.path.parent == tmp_path and spooled.path.suffix == ".png"
+    assert spooled.path.read_bytes() == data
+    assert (spooled.size, spooled.digest) == (len(data), hashlib.sha256(data).hexdigest())
+    assert (spooled.filename, spooled.content_type) == ("photo.png", "image/png")
+    with mmap_file(spooled.path) as mapped:
+        assert mapped[:3] == b"xxx"
+    spooled.unlink()
+    assert not spooled.path.exists()
+
+
+@pytest.mark.parametrize("declared_size", [None, 100])
+def test_oversized_upload_is_rejected_and_removed(tmp_path, declared_size):
+    # 크기를 모르거나 실제보다 작게 알려진 경우 복사하면서 거절
+    upload = make_upload(b"x" * 5000, size=declared_size)
+
+    with pytest.raises(UploadTooLargeError) as error:
+        asyncio.run(spool_upload(upload, directory=tmp_path, max_bytes=4096, chunk_size=1024))
+    assert error.value.limit == 4096
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_declared_size_over_limit_is_rejected_before_reading(tmp_path):
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(spool_upload(make_upload(b"", size=10_000), directory=tmp_path, max_bytes=4096))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_mmap_of_empty_file(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    with mmap_file(path) as mapped:
+        assert mapped.read() == b""
+
+
+async def run_middleware(middleware, path: str, chunks, content_length=None):
+    headers = [(b"content-length", str(content_length).encode())] if content_length is not None else []
+    scope = {"type": "http", "method": "POST", "path": path, "headers": headers}
+    pending = [{"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1} for i, chunk in enumerate(chunks)]
+    sent = []
+
+    async def receive():
+        return pending.pop(0) if pending else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware(scope, receive, send)
+    return sent
+
+
+def make_middleware(seen):
+    async def app(scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                seen.append("disconnect")
+                break
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        seen.append(len(body))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return UploadLimitMiddleware(app, {"/upload": 1000, "/upload/big": 10_000})
+
+
+def test_declared_content_length_over_limit_is_rejected_without_reading():
+    seen = []
+    sent = asyncio.run(run_middleware(make_middleware(seen), "/upload", [b"x" * 2000], content_length=2000))
+
+    assert sent[0]["status"] == 413
+    assert seen == []
+
+
+def test_undeclared_body_is_cut_off_at_limit():
+    seen = []
+    middleware = make_middleware(seen)
+    sent = asyncio.run(run_middleware(middleware, "/upload", [b"x" * 600, b"x" * 600, b"x" * 600]))
+
+    assert [m["status"] for m in sent if m["type"] == "http.response.start"] == [413]
+    assert seen == ["disconnect", 600]
+    assert middleware.rejected == 1
+
+
+def test_longest_prefix_and_unlimited_paths():
+    seen = []
+    middleware = make_middleware(seen)
+    assert asyncio.run(run_middleware(middleware, "/upload/big", [b"x" * 5000]))[0]["status"] == 200
+    assert asyncio.run(run_middleware(middleware, "/other", [b"x" * 50_000]))[0]["status"] == 200
+    assert seen == [5000, 50_000]